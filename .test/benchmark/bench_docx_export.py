@@ -0,0 +1,89 @@
+"""
+@TEST:docx-export-benchmark
+DOCX 내보내기 성능 비교 벤치마크 (빈 문서에서 생성 vs 양식 보존 내보내기)
+
+Related:
+- @SPEC:FEAT-003-REQ-002 - Template-Preserving Export
+- @CODE:docx-template-export-service
+
+- legacy: DocxGenerator.create_business_plan (Document() 에서 양식 문단을 하나씩 다시 추가, 표는 유실)
+- template(cold): 양식 원본을 읽고 분석한 뒤 내보내기 (양식별 첫 요청)
+- template(warm): 메모리에 보관한 양식 패키지로 내보내기 (모든 표 셀 채움)
+
+Usage:
+    python .test/benchmark/bench_docx_export.py [--tables 100] [--paragraphs 600] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+
+from bench_docx_parser import build_template  # noqa: E402
+from app.services.docx_generator import DocxGenerator  # noqa: E402
+from app.services.docx_parser import DocxParser, PARSE_MODE_STREAM  # noqa: E402
+from app.services.docx_template_export import TemplatePackage  # noqa: E402
+
+
+def measure(func, repeat: int):
+    """평균/최소 실행 시간(초)과 마지막 결과 크기(KB)"""
+    durations = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+        size = len(result.getvalue())
+    return sum(durations) / len(durations), min(durations), size / 1024
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--tables", type=int, default=100)
+    arg_parser.add_argument("--paragraphs", type=int, default=600)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "template.docx")
+        print(f"양식 생성 중: 표 {args.tables}개, 문단 {args.paragraphs}개")
+        build_template(path, args.tables, args.paragraphs)
+        with open(path, "rb") as f:
+            template = f.read()
+        print(f"파일 크기: {len(template) / 1024:.1f} KB\n")
+
+        structure = DocxParser.parse_document(path, mode=PARSE_MODE_STREAM)
+        content = {
+            "market_analysis": "국내 시장 규모는 연 1조원이며 연평균 12% 성장하고 있습니다.\n" * 20,
+            "competitive_analysis": "주요 경쟁사 3곳 대비 가격 경쟁력을 확보하였습니다.\n" * 20,
+            "financial_plan": "3개년 매출 목표는 10억, 30억, 60억원입니다.\n" * 20,
+            "tables": [
+                {"table_index": idx, "rows": [[f"{idx}-{row}-{col}" for col in range(6)] for row in range(11)]}
+                for idx in range(args.tables)
+            ]
+        }
+        business_info = {"title": "벤치마크 사업계획서", "description": "양식 보존 내보내기 성능 측정"}
+        package = TemplatePackage.load(template)
+
+        cases = [
+            ("legacy", lambda: DocxGenerator.create_business_plan(structure, content, business_info)),
+            ("template(cold)", lambda: TemplatePackage.load(template).render(content, business_info)),
+            ("template(warm)", lambda: package.render(content, business_info)),
+        ]
+
+        print(f"{'mode':<16} {'avg(ms)':>10} {'best(ms)':>10} {'size(KB)':>10}")
+        results = {}
+        for name, func in cases:
+            avg, best, size = measure(func, args.repeat)
+            results[name] = avg
+            print(f"{name:<16} {avg * 1000:>10.1f} {best * 1000:>10.1f} {size:>10.1f}")
+
+        print(f"\nspeedup (warm vs legacy): {results['legacy'] / results['template(warm)']:.1f}x")
+        print(f"speedup (cold vs legacy): {results['legacy'] / results['template(cold)']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
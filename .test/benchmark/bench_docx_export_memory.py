@@ -0,0 +1,145 @@
+"""
+@TEST:docx-export-memory-benchmark
+동시 DOCX 내보내기 메모리 벤치마크 (BytesIO 버퍼 응답 vs 스트리밍 응답)
+
+Related:
+- @SPEC:FEAT-003-REQ-003 - Streamed Export
+- @CODE:docx-generator-service
+- @CODE:docx-template-export-service
+
+동시에 --concurrency 개의 내보내기를 시작하고, 느린 클라이언트처럼 조각마다 잠시 쉬며
+응답 본문을 끝까지 읽습니다. 모드마다 새 프로세스에서 실행하여 최대 RSS(VmHWM) 증가량을
+비교합니다 (lxml 트리는 tracemalloc 에 잡히지 않으므로 RSS 사용).
+
+- buffered: create_business_plan → BytesIO 를 StreamingResponse 처럼 줄 단위로 전송 (기존 방식)
+- streamed: create_business_plan_entries → aiter_zip 조각 전송
+- template: 100개 표 양식 복제 내보내기 → aiter_zip 조각 전송
+
+Usage:
+    python .test/benchmark/bench_docx_export_memory.py [--concurrency 50] [--workers 4] [--client-delay 0.005]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+
+from bench_docx_parser import build_template  # noqa: E402
+from app.services.docx_generator import DocxGenerator  # noqa: E402
+from app.services.docx_template_export import TemplatePackage  # noqa: E402
+from app.utils.raw_zip import aiter_zip  # noqa: E402
+
+MODES = ("buffered", "streamed", "template")
+
+
+def rss_kb(field: str) -> int:
+    """/proc/self/status 의 메모리 항목 (kB)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+def build_content(table_count: int):
+    line = "국내 시장 규모는 연 1조원이며 주요 고객은 중소기업입니다. " * 4
+    table = {
+        "headers": ["구분", "1차년도", "2차년도", "3차년도", "비고"],
+        "rows": [{"cells": [{"value": f"{row}-{col}"} for col in range(5)]} for row in range(12)]
+    }
+    return {
+        "market_analysis": "\n".join([line] * 200),
+        "competitive_analysis": "\n".join([line] * 200),
+        "financial_plan": "\n".join([line] * 100),
+        "financial_tables": [table] * table_count,
+        "tables": [
+            {"table_index": idx, "rows": [[f"{idx}-{row}-{col}" for col in range(6)] for row in range(11)]}
+            for idx in range(100)
+        ]
+    }
+
+
+async def run_worker(mode: str, concurrency: int, workers: int, client_delay: float, chunk_bytes: int):
+    business_info = {"title": "메모리 벤치마크", "description": "동시 내보내기"}
+    content = build_content(table_count=10)
+    package = None
+    if mode == "template":
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "template.docx")
+            build_template(path, 100, 600)
+            package = TemplatePackage.load(path)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    loop = asyncio.get_running_loop()
+    baseline = rss_kb("VmRSS")
+
+    async def export_once():
+        if mode == "buffered":
+            stream = await loop.run_in_executor(pool, DocxGenerator.create_business_plan, {}, content, business_info)
+            # StreamingResponse 는 동기 이터레이터(BytesIO 는 줄 단위)를 스레드 풀에서 순회
+            body = iter(stream)
+            while True:
+                chunk = await loop.run_in_executor(None, next, body, None)
+                if chunk is None:
+                    break
+                await asyncio.sleep(client_delay)
+            return stream.getbuffer().nbytes
+        if mode == "streamed":
+            entries = await loop.run_in_executor(pool, DocxGenerator.create_business_plan_entries, {}, content, business_info)
+        else:
+            entries = await loop.run_in_executor(pool, package.render_entries, content, business_info)
+        size = 0
+        async for chunk in aiter_zip(entries, chunk_bytes):
+            size += len(chunk)
+            await asyncio.sleep(client_delay)
+        return size
+
+    started = time.perf_counter()
+    sizes = await asyncio.gather(*(export_once() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    pool.shutdown()
+
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "peak_mb": (rss_kb("VmHWM") - baseline) / 1024,
+        "file_kb": sizes[0] / 1024
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--concurrency", type=int, default=50)
+    arg_parser.add_argument("--workers", type=int, default=4)
+    arg_parser.add_argument("--client-delay", type=float, default=0.005)
+    arg_parser.add_argument("--chunk-bytes", type=int, default=64 * 1024)
+    arg_parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.worker:
+        result = asyncio.run(run_worker(args.worker, args.concurrency, args.workers, args.client_delay, args.chunk_bytes))
+        print(json.dumps(result))
+        return
+
+    print(f"동시 내보내기 {args.concurrency}개, 워커 {args.workers}개, 조각당 지연 {args.client_delay * 1000:.0f}ms\n")
+    print(f"{'mode':<10} {'peak RSS +MB':>13} {'elapsed(s)':>11} {'file(KB)':>10}")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", mode,
+             "--concurrency", str(args.concurrency), "--workers", str(args.workers),
+             "--client-delay", str(args.client_delay), "--chunk-bytes", str(args.chunk_bytes)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:<10} {result['peak_mb']:>13.1f} {result['elapsed_s']:>11.2f} {result['file_kb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+@TEST:docx-parser-benchmark
+DOCX 파서 성능 비교 벤치마크 (python-docx 모드 vs 스트리밍 모드)
+
+Related:
+- @SPEC:FEAT-001-REQ-005 - Streaming Parse Mode
+- @CODE:docx-stream-parser-service
+
+Usage:
+    python .test/benchmark/bench_docx_parser.py [--tables 200] [--paragraphs 1200] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+
+from docx import Document  # noqa: E402
+from app.services.docx_parser import DocxParser, PARSE_MODE_DOCX, PARSE_MODE_STREAM  # noqa: E402
+
+
+def build_template(path: str, table_count: int, paragraph_count: int, rows: int = 12, cols: int = 6):
+    """대형 정부 양식과 비슷한 구조(문단 + 다수의 표)의 DOCX 생성"""
+    doc = Document()
+    doc.add_heading('벤치마크 사업계획서 양식', 0)
+
+    paragraphs_per_table = max(1, paragraph_count // max(1, table_count))
+    for table_idx in range(table_count):
+        doc.add_heading(f'{table_idx + 1}. 시장 분석 및 재무 계획', 1)
+        for para_idx in range(paragraphs_per_table):
+            doc.add_paragraph(f'항목 {table_idx}-{para_idx}: 사업 추진 배경과 필요성을 기술합니다. ' * 3)
+
+        table = doc.add_table(rows=rows, cols=cols)
+        for row_idx, row in enumerate(table.rows):
+            for col_idx, cell in enumerate(row.cells):
+                cell.text = '구분' if row_idx == 0 else f'{row_idx * col_idx:,}백만원'
+
+    doc.save(path)
+
+
+def measure(path: str, mode: str, repeat: int):
+    """평균 실행 시간(초)과 최대 메모리 사용량(MB) 측정"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        DocxParser.parse_document(path, mode=mode)
+        durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    DocxParser.parse_document(path, mode=mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return sum(durations) / len(durations), min(durations), peak / (1024 * 1024)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--tables", type=int, default=200)
+    arg_parser.add_argument("--paragraphs", type=int, default=1200)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "template.docx")
+        print(f"양식 생성 중: 표 {args.tables}개, 문단 {args.paragraphs}개")
+        build_template(path, args.tables, args.paragraphs)
+        print(f"파일 크기: {os.path.getsize(path) / 1024:.1f} KB\n")
+
+        assert DocxParser.parse_document(path, mode=PARSE_MODE_DOCX) == \
+            DocxParser.parse_document(path, mode=PARSE_MODE_STREAM), "모드 간 결과 불일치"
+
+        print(f"{'mode':<8} {'avg(s)':>10} {'best(s)':>10} {'peak(MB)':>10}")
+        results = {}
+        for mode in (PARSE_MODE_DOCX, PARSE_MODE_STREAM):
+            avg, best, peak = measure(path, mode, args.repeat)
+            results[mode] = avg
+            print(f"{mode:<8} {avg:>10.3f} {best:>10.3f} {peak:>10.1f}")
+
+        print(f"\nspeedup: {results[PARSE_MODE_DOCX] / results[PARSE_MODE_STREAM]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+@TEST:docx-table-builder-benchmark
+대형 재무 표 생성 성능 비교 벤치마크 (python-docx 셀 단위 채우기 vs 일괄 XML 생성)
+
+Related:
+- @SPEC:FEAT-003-REQ-004 - Bulk Table Builder
+- @CODE:docx-table-builder-service
+
+- cell-by-cell: 기존 DocxGenerator._add_table 방식 (doc.add_table 후 rows[i].cells 로 한 칸씩 채움)
+- builder(rows): 행 단위 표 데이터 → DocxGenerator._add_table (DocxTableBuilder)
+- builder(numpy): NumPy 열 배열 → DocxTableBuilder (numpy 가 설치된 경우만)
+
+Usage:
+    python .test/benchmark/bench_docx_table_builder.py [--rows 60] [--cols 20] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+
+from docx import Document  # noqa: E402
+from app.services.docx_generator import DocxGenerator  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택 의존성
+    np = None
+
+
+def add_table_cell_by_cell(doc, table_data):
+    """기존 _add_table 구현 (비교 기준)"""
+    headers = table_data.get('headers', [])
+    rows = table_data.get('rows', [])
+
+    table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
+    table.style = 'Light Grid Accent 1'
+
+    header_cells = table.rows[0].cells
+    for idx, header in enumerate(headers):
+        header_cells[idx].text = str(header)
+        for paragraph in header_cells[idx].paragraphs:
+            for run in paragraph.runs:
+                run.font.bold = True
+
+    for row_idx, row_data in enumerate(rows, start=1):
+        cells = table.rows[row_idx].cells
+        for col_idx, cell_data in enumerate(row_data.get('cells', [])):
+            if col_idx < len(cells):
+                cells[col_idx].text = str(cell_data.get('value', ''))
+
+    doc.add_paragraph()
+
+
+def build_cash_flow(row_count: int, col_count: int):
+    """월별 현금흐름 형태의 표 (첫 열은 항목명, 나머지는 금액)"""
+    rng = random.Random(42)
+    headers = ["항목"] + [f"{month}월" for month in range(1, col_count)]
+    columns = [[f"계정 {row + 1}" for row in range(row_count)]]
+    columns += [[rng.randint(-50_000_000, 500_000_000) for _ in range(row_count)] for _ in range(col_count - 1)]
+    rows = [{"cells": [{"value": column[row]} for column in columns]} for row in range(row_count)]
+    return headers, columns, rows
+
+
+def measure(func, repeat: int):
+    """평균/최소 실행 시간(초)"""
+    durations = []
+    for _ in range(repeat):
+        doc = Document()
+        start = time.perf_counter()
+        func(doc)
+        durations.append(time.perf_counter() - start)
+    return sum(durations) / len(durations), min(durations)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--rows", type=int, default=60)
+    arg_parser.add_argument("--cols", type=int, default=20)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    headers, columns, rows = build_cash_flow(args.rows, args.cols)
+    row_table = {"headers": headers, "rows": rows}
+    cases = [
+        ("cell-by-cell", lambda doc: add_table_cell_by_cell(doc, row_table)),
+        ("builder(rows)", lambda doc: DocxGenerator._add_table(doc, row_table)),
+    ]
+    if np is not None:
+        numpy_table = {"headers": headers, "columns": [columns[0]] + [np.array(column) for column in columns[1:]]}
+        cases.append(("builder(numpy)", lambda doc: DocxGenerator._add_table(doc, numpy_table)))
+    else:
+        print("numpy 미설치: builder(numpy) 생략")
+
+    print(f"표 크기: {args.rows}행 x {args.cols}열 (셀 {args.rows * args.cols}개)\n")
+    print(f"{'mode':<16} {'avg(ms)':>10} {'best(ms)':>10}")
+    results = {}
+    for name, func in cases:
+        avg, best = measure(func, args.repeat)
+        results[name] = avg
+        print(f"{name:<16} {avg * 1000:>10.1f} {best * 1000:>10.1f}")
+
+    print(f"\nspeedup (builder vs cell-by-cell): {results['cell-by-cell'] / results['builder(rows)']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+@TEST:financial-tables-benchmark
+재무 표 추출 처리 시간이 출력 길이에 선형인지 확인하는 벤치마크
+
+Related:
+- @SPEC:FEAT-002-REQ-009 - Financial Table Extraction
+- @CODE:financial-table-extractor
+
+표 개수를 두 배씩 늘리며 추출 시간을 측정합니다. 선형이면 글자당 처리 시간(us/KB)이
+크기와 관계없이 거의 일정합니다.
+
+Usage:
+    python .test/benchmark/bench_financial_tables.py [--rows 30] [--steps 6] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+
+from app.services.financial_tables import extract_financial_tables  # noqa: E402
+
+
+def build_output(table_count: int, row_count: int) -> str:
+    """재무 계획 모델 출력 형태의 텍스트 (문단 + 단위 표기 + 합계 행이 있는 표)"""
+    blocks = []
+    for idx in range(table_count):
+        rows = [f"| 항목 {row} | {row * 10:,} | {row * 25:,} | {row}억 {row * 100:,}만원 | {row % 40}.5% |"
+                for row in range(1, row_count + 1)]
+        total = sum(row * 10 for row in range(1, row_count + 1))
+        blocks.append(
+            f"{idx + 1}차 사업 영역의 재무 전망은 다음과 같습니다. 보수적인 가정을 사용하였습니다.\n\n"
+            f"### 표 {idx + 1}. 손익 예측 (단위: 백만원)\n\n"
+            "| 구분 | 1차년도 | 2차년도 | 누적 투자 | 이익률 |\n|---|---:|---:|---:|---:|\n"
+            + "\n".join(rows)
+            + f"\n| 합계 | {total:,} | {total * 25 // 10:,} | - | - |\n"
+        )
+    return "\n".join(blocks)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--rows", type=int, default=30)
+    arg_parser.add_argument("--steps", type=int, default=6)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'tables':>8} {'size(KB)':>10} {'best(ms)':>10} {'us/KB':>10}")
+    for step in range(args.steps):
+        table_count = 4 * 2 ** step
+        output = build_output(table_count, args.rows)
+        size_kb = len(output.encode("utf-8")) / 1024
+        best = min(_timed(output) for _ in range(args.repeat))
+        print(f"{table_count:>8} {size_kb:>10.1f} {best * 1000:>10.1f} {best * 1e6 / size_kb:>10.1f}")
+
+
+def _timed(output: str) -> float:
+    started = time.perf_counter()
+    extract_financial_tables(output)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+@TEST:ai-generator-benchmark
+섹션 생성 응답 대기 시간 비교 벤치마크 (일반 응답 vs SSE 스트리밍의 첫 토큰 시간)
+
+로컬 가짜 OpenAI 서버가 첫 토큰 지연 후 일정 간격으로 조각을 내보내므로,
+일반 엔드포인트는 전체 생성 시간을, 스트리밍 엔드포인트는 첫 토큰 시간을 기다리게 됩니다.
+
+Related:
+- @SPEC:FEAT-002-REQ-006 - Token Streaming
+- @CODE:ai-generator-service
+
+Usage:
+    python .test/benchmark/bench_generation_ttft.py [--first-token 0.5] [--interval 0.02] [--chars 800] [--repeat 3]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from openai import AsyncOpenAI  # noqa: E402
+from app.main import app  # noqa: E402
+from app.api import generation  # noqa: E402
+from app.services.ai_generator import AIGenerator  # noqa: E402
+from fake_openai_server import FakeOpenAIServer  # noqa: E402
+
+PAYLOAD = {"title": "AI 물류 플랫폼", "description": "중소 화주 대상 배차 최적화"}
+
+
+def start_app_server() -> str:
+    """앱을 실제 uvicorn 서버로 실행 (TestClient 는 응답 본문을 모아서 반환하므로 사용하지 않음)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def measure_blocking(client: httpx.Client) -> float:
+    """일반 엔드포인트: 응답 본문을 받을 때까지의 시간(ms)"""
+    started = time.perf_counter()
+    response = client.post("/api/generation/market-analysis", json=PAYLOAD)
+    response.raise_for_status()
+    return (time.perf_counter() - started) * 1000
+
+
+def measure_streaming(client: httpx.Client):
+    """스트리밍 엔드포인트: (첫 token 이벤트까지의 시간, 전체 시간) ms"""
+    started = time.perf_counter()
+    first_token = None
+    with client.stream("POST", "/api/generation/market-analysis/stream", json=PAYLOAD) as response:
+        for line in response.iter_lines():
+            if first_token is None and line == "event: token":
+                first_token = (time.perf_counter() - started) * 1000
+    return first_token, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--first-token", type=float, default=0.5, help="첫 토큰 지연(초)")
+    parser.add_argument("--interval", type=float, default=0.02, help="조각 간격(초)")
+    parser.add_argument("--chars", type=int, default=800, help="응답 글자 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    reply = ("시장 규모와 성장률, 주요 트렌드를 분석합니다. " * (args.chars // 20 + 1))[:args.chars]
+
+    with FakeOpenAIServer(latency=args.first_token, token_interval=args.interval, reply=lambda p: reply) as server:
+        generation.ai_generator = AIGenerator(
+            client=AsyncOpenAI(api_key="bench", base_url=server.base_url, max_retries=0)
+        )
+        with httpx.Client(base_url=start_app_server(), timeout=60) as client:
+            blocking = [measure_blocking(client) for _ in range(args.repeat)]
+            streaming = [measure_streaming(client) for _ in range(args.repeat)]
+
+    print(f"응답 {args.chars}자, 첫 토큰 지연 {args.first_token * 1000:.0f}ms, 조각 간격 {args.interval * 1000:.0f}ms")
+    print(f"{'mode':<12}{'first byte(ms)':>16}{'total(ms)':>12}")
+    print(f"{'blocking':<12}{statistics.median(blocking):>16.1f}{statistics.median(blocking):>12.1f}")
+    print(
+        f"{'sse':<12}{statistics.median(t for t, _ in streaming):>16.1f}"
+        f"{statistics.median(total for _, total in streaming):>12.1f}"
+    )
+    print(f"서버 측 통계: {generation.ai_generator.stats()['ttft_ms']}")
+
+
+if __name__ == "__main__":
+    main()
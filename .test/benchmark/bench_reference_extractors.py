@@ -0,0 +1,110 @@
+"""
+@TEST:reference-extractors-benchmark
+참고 문서 형식별 추출 처리량 벤치마크
+
+Related:
+- @SPEC:FEAT-001-REQ-010 - Reference Extractor Registry
+- @CODE:reference-extractors
+
+로컬 말뭉치 디렉터리(--corpus)의 파일을 내용으로 형식 판별한 뒤 형식별로 추출
+처리량(파일/초, MB/초, 페이지/초)을 잽니다. 말뭉치를 주지 않으면 형식마다 같은 문단을
+담은 문서를 생성하여 씁니다. 형식의 첫 추출 시간(백엔드 지연 import 포함)은 따로 표시합니다.
+
+Usage:
+    python .test/benchmark/bench_reference_extractors.py [--corpus DIR] [--pages 20] [--files 10] [--repeat 3]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+TEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(TEST_DIR, "..", "backend"))
+sys.path.insert(0, TEST_DIR)
+
+from docx import Document  # noqa: E402
+from app.services.extractors import extractor_registry  # noqa: E402
+from document_builders import build_hwp, build_hwpx, build_pdf  # noqa: E402
+
+PARAGRAPH = "Domestic logistics market grows 8 percent a year driven by same-day delivery demand."
+KOREAN_PARAGRAPH = "국내 물류 시장은 당일 배송 수요 증가로 연평균 8% 성장하고 있습니다."
+
+
+def synthetic_corpus(pages: int, files: int, lines: int = 30):
+    """형식별 (이름, 데이터) 목록: 페이지(구역)마다 lines 문단"""
+    korean = [[f"{page}-{line}. {KOREAN_PARAGRAPH}" for line in range(lines)] for page in range(pages)]
+    ascii_pages = [[f"{page}-{line}. {PARAGRAPH}" for line in range(lines)] for page in range(pages)]
+
+    doc = Document()
+    for section in korean:
+        for text in section:
+            doc.add_paragraph(text)
+    docx_stream = io.BytesIO()
+    doc.save(docx_stream)
+
+    samples = {
+        "pdf": build_pdf(ascii_pages),
+        "hwp": build_hwp(korean),
+        "hwpx": build_hwpx(korean),
+        "docx": docx_stream.getvalue(),
+        "txt": "\n\n".join("\n".join(section) for section in korean).encode("utf-8"),
+    }
+    return [(f"{index}.{suffix}", data) for suffix, data in samples.items() for index in range(files)]
+
+
+def load_corpus(directory: str):
+    corpus = []
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            with open(os.path.join(root, name), "rb") as f:
+                corpus.append((os.path.relpath(os.path.join(root, name), directory), f.read()))
+    return corpus
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--corpus", help="참고 문서 디렉터리 (없으면 생성한 문서 사용)")
+    arg_parser.add_argument("--pages", type=int, default=20, help="생성 문서의 페이지(구역) 수")
+    arg_parser.add_argument("--files", type=int, default=10, help="생성 문서의 형식별 파일 수")
+    arg_parser.add_argument("--max-pages", type=int, default=200)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages, args.files)
+    by_format = defaultdict(list)
+    for name, data in corpus:
+        kind = extractor_registry.detect(data)
+        by_format[kind or "unsupported"].append((name, data))
+
+    print(f"{'format':<12} {'files':>5} {'MB':>7} {'first(ms)':>10} {'files/s':>9} {'MB/s':>7} {'pages/s':>9}")
+    for kind, items in sorted(by_format.items()):
+        megabytes = sum(len(data) for _, data in items) / (1024 * 1024)
+        if kind == "unsupported":
+            print(f"{kind:<12} {len(items):>5} {megabytes:>7.2f}")
+            continue
+
+        # 첫 추출: 백엔드 모듈/의존성 import 포함
+        started = time.perf_counter()
+        extractor_registry.extract(kind, items[0][1], args.max_pages)
+        first_ms = (time.perf_counter() - started) * 1000
+
+        samples, pages = [], 0
+        for _ in range(args.repeat):
+            pages = 0
+            started = time.perf_counter()
+            for _, data in items:
+                pages += extractor_registry.extract(kind, data, args.max_pages).pages
+            samples.append(time.perf_counter() - started)
+        seconds = statistics.median(samples)
+        print(
+            f"{kind:<12} {len(items):>5} {megabytes:>7.2f} {first_ms:>10.1f} "
+            f"{len(items) / seconds:>9.1f} {megabytes / seconds:>7.2f} {pages / seconds:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
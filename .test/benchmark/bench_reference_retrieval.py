@@ -0,0 +1,96 @@
+"""
+@TEST:reference-index-benchmark
+참고 문서 전체 삽입 vs BM25 청크 검색의 프롬프트 토큰 비교 벤치마크
+
+Related:
+- @SPEC:FEAT-002-REQ-008 - Reference Retrieval
+- @CODE:reference-index-service
+
+Usage:
+    python .test/benchmark/bench_reference_retrieval.py [--docs 5] [--paragraphs 400] [--top-k 8] [--budget 1500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend"))
+
+from app.services.ai_generator import AIGenerator, SECTION_MARKET_ANALYSIS, SECTION_COMPETITIVE_ANALYSIS  # noqa: E402
+from app.services.reference_index import ReferenceIndex  # noqa: E402
+from app.utils.tokens import estimate_tokens  # noqa: E402
+
+TOPICS = [
+    "국내 물류 시장 규모는 {n}조원이며 연평균 {p}% 성장할 것으로 전망됩니다.",
+    "경쟁사 {c}사는 시장 점유율 {p}%를 차지하며 가격 경쟁력이 강점입니다.",
+    "타겟 고객인 중소 화주는 배차 비용 절감과 실시간 추적 수요가 큽니다.",
+    "정부의 스마트 물류 지원 사업 예산은 {n}억원 규모로 확대되었습니다.",
+    "본 조사는 {n}개 기업을 대상으로 설문과 인터뷰를 병행하여 수행되었습니다.",
+    "부록 {n}: 조사 방법, 표본 설계, 응답률 및 통계적 유의성 검토 결과를 정리합니다.",
+    "인력 채용 계획과 조직 구성은 {n}명 규모로 단계적으로 확대합니다.",
+]
+
+BUSINESS_INFO = {
+    "title": "AI 기반 중소 화주 배차 최적화 플랫폼",
+    "description": "중소 화주와 운송사를 연결하고 배차를 자동화하는 SaaS",
+    "requirements": ""
+}
+
+
+def build_documents(count: int, paragraphs: int, seed: int = 7):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(count):
+        lines = [
+            rng.choice(TOPICS).format(n=rng.randint(1, 500), p=rng.randint(1, 60), c=chr(65 + rng.randint(0, 25)))
+            for _ in range(paragraphs)
+        ]
+        docs.append("\n".join(lines))
+    return docs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=5)
+    parser.add_argument("--paragraphs", type=int, default=400)
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--budget", type=int, default=1500)
+    args = parser.parse_args()
+
+    docs = build_documents(args.docs, args.paragraphs)
+    baseline = AIGenerator(client=None)
+    index = ReferenceIndex()
+    retrieval = AIGenerator(
+        client=None,
+        reference_index=index,
+        reference_top_k=args.top_k,
+        reference_budget_tokens=args.budget
+    )
+
+    started = time.perf_counter()
+    index.add_many(docs)
+    index_ms = (time.perf_counter() - started) * 1000
+
+    print(f"참고 문서 {args.docs}개 x {args.paragraphs}문단, 색인 {index.stats()['chunks']}청크 ({index_ms:.1f}ms)")
+    print(f"{'section':<24}{'full(tokens)':>14}{'retrieval(tokens)':>19}{'reduction':>11}{'search(ms)':>12}")
+
+    for section in (SECTION_MARKET_ANALYSIS, SECTION_COMPETITIVE_ANALYSIS):
+        full_prompt = baseline._section_request(section, BUSINESS_INFO, docs, {})["messages"][1]["content"]
+
+        started = time.perf_counter()
+        selected = retrieval.select_references(section, BUSINESS_INFO, docs)
+        search_ms = (time.perf_counter() - started) * 1000
+        retrieval_prompt = retrieval._section_request(section, BUSINESS_INFO, selected, {})["messages"][1]["content"]
+
+        full_tokens = estimate_tokens(full_prompt)
+        retrieval_tokens = estimate_tokens(retrieval_prompt)
+        print(
+            f"{section:<24}{full_tokens:>14,}{retrieval_tokens:>19,}"
+            f"{1 - retrieval_tokens / full_tokens:>10.1%}{search_ms:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
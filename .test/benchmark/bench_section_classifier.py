@@ -0,0 +1,116 @@
+"""
+@TEST:section-classifier-benchmark
+섹션 분류 정확도 + 처리량 벤치마크 (기존 키워드 순차 검사 vs 컴파일된 분류기)
+
+Related:
+- @SPEC:FEAT-001-REQ-003 - Section Type Identification
+- @CODE:section-classifier-service
+
+- 정확도: `.test/fixtures/section_labels.json` (사업계획서 양식 제목 + 정답 섹션)
+- 처리량: --templates 로 지정한 DOCX 양식(파일 또는 디렉터리)의 모든 문단,
+  지정하지 않으면 bench_docx_parser.build_template 으로 만든 대형 양식
+
+- legacy: 기존 identify_section_type (소문자 변환 후 섹션 순서대로 any(keyword in text))
+- classify: SectionClassifier.classify 를 문단마다 호출
+- batch: SectionClassifier.classify_many 로 전체 문단을 한 번에 분류
+
+Usage:
+    python .test/benchmark/bench_section_classifier.py [--templates path ...] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "..", "backend"))
+
+from bench_docx_parser import build_template  # noqa: E402
+from app.services.docx_parser import DocxParser, PARSE_MODE_STREAM  # noqa: E402
+from app.services.section_classifier import section_classifier  # noqa: E402
+
+LABELS_PATH = os.path.join(BENCH_DIR, "..", "fixtures", "section_labels.json")
+
+
+def legacy_identify_section_type(text: str) -> str:
+    """기존 구현 (비교 기준)"""
+    text_lower = text.lower()
+    if any(keyword in text_lower for keyword in ["시장", "분석", "market"]):
+        return "market_analysis"
+    elif any(keyword in text_lower for keyword in ["경쟁", "competitor", "차별"]):
+        return "competitive_analysis"
+    elif any(keyword in text_lower for keyword in ["재무", "financial", "손익", "현금"]):
+        return "financial_plan"
+    elif any(keyword in text_lower for keyword in ["사업", "개요", "summary"]):
+        return "business_overview"
+    elif any(keyword in text_lower for keyword in ["swot"]):
+        return "swot_analysis"
+    else:
+        return "general"
+
+
+def template_paragraphs(paths):
+    """양식 파일들의 문단 텍스트 (디렉터리는 하위 .docx 전체)"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(root, name)
+                for root, _, names in os.walk(path) for name in names if name.lower().endswith(".docx")
+            )
+        else:
+            files.append(path)
+    texts = []
+    for path in files:
+        texts.extend(p["text"] for p in DocxParser.parse_document(path, mode=PARSE_MODE_STREAM)["paragraphs"])
+    return files, texts
+
+
+def best_time(func, repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--templates", nargs="*", default=[])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with open(LABELS_PATH, encoding="utf-8") as f:
+        labels = json.load(f)
+    print(f"정확도 ({len(labels)}개 양식 제목)")
+    for name, classify in (("legacy", legacy_identify_section_type), ("classifier", section_classifier.classify)):
+        correct = sum(classify(item["text"]) == item["section"] for item in labels)
+        print(f"  {name:<12} {correct / len(labels):>7.1%}  ({correct}/{len(labels)})")
+
+    if args.templates:
+        files, texts = template_paragraphs(args.templates)
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "template.docx")
+            build_template(path, 200, 5000)
+            files, texts = template_paragraphs([path])
+    texts += [item["text"] for item in labels]
+
+    print(f"\n처리량 (양식 {len(files)}개, 문단 {len(texts):,}개)")
+    cases = [
+        ("legacy", lambda: [legacy_identify_section_type(text) for text in texts]),
+        ("classify", lambda: [section_classifier.classify(text) for text in texts]),
+        ("batch", lambda: section_classifier.classify_many(texts)),
+    ]
+    print(f"  {'mode':<12} {'best(ms)':>10} {'paragraphs/s':>14}")
+    for name, func in cases:
+        elapsed = best_time(func, args.repeat)
+        print(f"  {name:<12} {elapsed * 1000:>10.1f} {len(texts) / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+@TEST:startup-warmup-benchmark
+새 프로세스의 첫 요청 지연 비교 벤치마크 (시작 준비 없음 vs lifespan 시작 준비)
+
+배포/오토스케일 직후와 같도록 매 실행마다 새 파이썬 프로세스에서 앱을 import 하고
+첫 DOCX 내보내기 요청과 두 번째 요청 시간을 잽니다.
+
+Related:
+- @SPEC:FEAT-003-REQ-005 - Startup Warmup
+- @CODE:startup-warmup-service
+
+- cold: STARTUP_WARMUP_ENABLED=false, lifespan 없이 TestClient 로 첫 요청
+- warm: lifespan 실행 (시작 준비 단계 시간 포함) 후 첫 요청
+
+Usage:
+    python .test/benchmark/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend")
+
+# 자식 프로세스에서 실행: 결과를 JSON 한 줄로 출력
+CHILD = r"""
+import json, sys, time
+started = time.perf_counter()
+from fastapi.testclient import TestClient
+from app.main import app
+import_ms = (time.perf_counter() - started) * 1000
+
+body = {
+    "generated_content": {
+        "market_analysis": "국내 시장 규모는 1조원입니다.",
+        "financial_plan": "3개년 재무 계획",
+        "financial_tables": [{"headers": ["항목", "1차년도"], "columns": [["매출"], [120000000]]}]
+    },
+    "business_info": {"title": "벤치마크", "description": "사업 개요"}
+}
+
+def timed(client):
+    started = time.perf_counter()
+    client.post("/api/export/export-docx", json=body).raise_for_status()
+    return (time.perf_counter() - started) * 1000
+
+client = TestClient(app)
+startup_ms = 0.0
+if sys.argv[1] == "warm":
+    started = time.perf_counter()
+    client.__enter__()
+    startup_ms = (time.perf_counter() - started) * 1000
+first, second = timed(client), timed(client)
+print(json.dumps({"import_ms": import_ms, "startup_ms": startup_ms, "first_ms": first, "second_ms": second}))
+"""
+
+
+def run_child(mode: str) -> dict:
+    env = dict(os.environ, STARTUP_WARMUP_ENABLED="true" if mode == "warm" else "false", OPENAI_API_KEY="")
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, mode], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f"{'mode':<6} {'import(ms)':>11} {'startup(ms)':>12} {'first(ms)':>10} {'second(ms)':>11}")
+    for mode in ("cold", "warm"):
+        samples = [run_child(mode) for _ in range(args.repeat)]
+        median = {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+        print(
+            f"{mode:<6} {median['import_ms']:>11.1f} {median['startup_ms']:>12.1f} "
+            f"{median['first_ms']:>10.1f} {median['second_ms']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
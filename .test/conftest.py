@@ -0,0 +1,18 @@
+"""
+공통 pytest 설정
+
+백엔드는 backend/ 디렉터리에서 `app` 패키지로 실행되므로 (uvicorn app.main:app)
+서비스 간 `app.*` 절대 import 가 테스트에서도 해석되도록 경로를 추가합니다.
+"""
+
+import os
+import tempfile
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# 테스트 중 캐시/저장소 파일이 작업 트리에 생성되지 않도록 임시 디렉터리 사용
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="modu-ai-test-"))
@@ -0,0 +1,226 @@
+"""
+테스트/벤치마크용 참고 문서 생성기 (PDF, HWP 5.x, HWPX)
+
+외부 도구 없이 각 형식의 최소 구조를 직접 만듭니다.
+
+- PDF: 페이지마다 Helvetica 텍스트 줄을 그리는 내용 스트림 (ASCII 텍스트)
+- HWP: OLE 복합 파일(CFB v3) 안에 FileHeader, BodyText/Section{N}, PrvText 스트림.
+  미니 스트림을 쓰지 않도록 모든 스트림을 4096 바이트 이상으로 채웁니다
+  (FileHeader 는 뒤를 0 으로, 본문 레코드 뒤의 0 은 빈 레코드 헤더로 읽힘).
+- HWPX: Contents/section{N}.xml 에 hp:p/hp:run/hp:t 문단
+"""
+
+from typing import Dict, List, Sequence
+import io
+import struct
+import zipfile
+import zlib
+
+
+def build_pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """페이지별 텍스트 줄 목록 → PDF"""
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")
+    pages_id = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    kids = []
+    for lines in pages:
+        commands = [b"BT /F1 12 Tf 14 TL 72 720 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            commands.append(f"({escaped}) Tj T*".encode("latin-1"))
+        commands.append(b"ET")
+        content = b"\n".join(commands)
+        stream = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages_id, font, stream)
+        ))
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog, xref
+    ))
+    return output.getvalue()
+
+
+# ---- HWP 5.x (OLE 복합 파일) ----
+
+_SECTOR = 512
+_MIN_STREAM = 4096
+_FREE, _END_OF_CHAIN, _FAT_SECTOR = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD
+_NO_STREAM = 0xFFFFFFFF
+
+
+def _hwp_record(tag: int, payload: bytes, level: int = 0) -> bytes:
+    size = len(payload)
+    if size >= 0xFFF:
+        return struct.pack("<II", tag | (level << 10) | (0xFFF << 20), size) + payload
+    return struct.pack("<I", tag | (level << 10) | (size << 20)) + payload
+
+
+def hwp_section(paragraphs: Sequence[str]) -> bytes:
+    """문단 목록 → 본문 구역 레코드 (문단 머리 + 문단 텍스트, 표 컨트롤 포함 예시)"""
+    data = b""
+    for text in paragraphs:
+        data += _hwp_record(0x42, b"\x00" * 22)  # HWPTAG_PARA_HEADER
+        # 문단 앞에 확장 컨트롤(구역 정의, 8 WCHAR)을 넣어 컨트롤 건너뛰기를 검증
+        control = struct.pack("<8H", 2, 0x6473, 0x6365, 0, 0, 0, 0, 2)
+        data += _hwp_record(0x43, control + (text + "\r").encode("utf-16-le"), level=1)
+    return data
+
+
+def _directory_entry(name: str, entry_type: int, child: int, right: int, start: int, size: int) -> bytes:
+    encoded = (name + "\x00").encode("utf-16-le")
+    return (
+        encoded.ljust(64, b"\x00")
+        + struct.pack("<HBB", len(encoded), entry_type, 1)  # 1 = black
+        + struct.pack("<III", _NO_STREAM, right, child)  # left, right, child
+        + b"\x00" * 16 + struct.pack("<I", 0) + b"\x00" * 16
+        + struct.pack("<IQ", start, size)
+    )
+
+
+def build_cfb(streams: Dict[str, bytes]) -> bytes:
+    """
+    경로 → 데이터 사전으로 최소 OLE 복합 파일 생성
+
+    최상위와 한 단계 저장소("BodyText/Section0")만 지원하며, 형제 항목은 오른쪽 링크로 잇습니다.
+    """
+    data_sectors: List[bytes] = []
+    starts: Dict[str, int] = {}
+    for path, data in streams.items():
+        assert len(data) >= _MIN_STREAM, "미니 스트림을 쓰지 않도록 4096 바이트 이상이어야 함"
+        starts[path] = len(data_sectors)
+        padded = data + b"\x00" * (-len(data) % _SECTOR)
+        data_sectors.extend(padded[i:i + _SECTOR] for i in range(0, len(padded), _SECTOR))
+
+    # 디렉터리 항목: 0 = Root, 이후 최상위 항목, 저장소의 하위 항목
+    top: List[str] = []
+    children: Dict[str, List[str]] = {}
+    for path in streams:
+        if "/" in path:
+            storage, name = path.split("/", 1)
+            if storage not in children:
+                children[storage] = []
+                top.append(storage)
+            children[storage].append(name)
+        else:
+            top.append(path)
+    order = ["Root Entry"] + top + [f"{storage}/{name}" for storage in children for name in children[storage]]
+    ids = {path: index for index, path in enumerate(order)}
+
+    def sibling(items: List[str], position: int, prefix: str = "") -> int:
+        return ids[prefix + items[position + 1]] if position + 1 < len(items) else _NO_STREAM
+
+    directory_sectors_count = -(-len(order) // 4)
+    data_start = 0
+    directory_start = len(data_sectors)
+    sector_count = len(data_sectors) + directory_sectors_count
+    fat_sectors = -(-(sector_count + 1) // (_SECTOR // 4))
+    while -(-(sector_count + fat_sectors) // (_SECTOR // 4)) > fat_sectors:
+        fat_sectors += 1
+    fat_start = sector_count
+
+    entries = [_directory_entry("Root Entry", 5, ids[top[0]], _NO_STREAM, _END_OF_CHAIN, 0)]
+    for position, name in enumerate(top):
+        if name in children:
+            entries.append(_directory_entry(
+                name, 1, ids[f"{name}/{children[name][0]}"], sibling(top, position), 0, 0
+            ))
+        else:
+            entries.append(_directory_entry(
+                name, 2, _NO_STREAM, sibling(top, position), data_start + starts[name], len(streams[name])
+            ))
+    for storage in children:
+        for position, name in enumerate(children[storage]):
+            path = f"{storage}/{name}"
+            entries.append(_directory_entry(
+                name, 2, _NO_STREAM, sibling(children[storage], position, f"{storage}/"),
+                data_start + starts[path], len(streams[path])
+            ))
+    directory = b"".join(entries)
+    directory += b"\x00" * (directory_sectors_count * _SECTOR - len(directory))
+
+    fat = [_FREE] * (fat_sectors * _SECTOR // 4)
+    for path, data in streams.items():
+        count = -(-len(data) // _SECTOR)
+        for offset in range(count):
+            sector = starts[path] + offset
+            fat[sector] = sector + 1 if offset + 1 < count else _END_OF_CHAIN
+    for offset in range(directory_sectors_count):
+        sector = directory_start + offset
+        fat[sector] = sector + 1 if offset + 1 < directory_sectors_count else _END_OF_CHAIN
+    for offset in range(fat_sectors):
+        fat[fat_start + offset] = _FAT_SECTOR
+
+    difat = [fat_start + offset for offset in range(fat_sectors)] + [_FREE] * (109 - fat_sectors)
+    header = (
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 16
+        + struct.pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6) + b"\x00" * 6
+        + struct.pack("<IIIIIIIII", 0, fat_sectors, directory_start, 0, _MIN_STREAM,
+                      _END_OF_CHAIN, 0, _END_OF_CHAIN, 0)
+        + struct.pack("<109I", *difat)
+    )
+    return header + b"".join(data_sectors) + directory + struct.pack(f"<{len(fat)}I", *fat)
+
+
+def build_hwp(
+    sections: Sequence[Sequence[str]],
+    compressed: bool = True,
+    distribution: bool = False,
+    preview: str = ""
+) -> bytes:
+    """구역별 문단 목록 → HWP 5.x 파일"""
+    flags = (0x01 if compressed else 0) | (0x04 if distribution else 0)
+    file_header = b"HWP Document File".ljust(32, b"\x00") + struct.pack("<II", 0x05000300, flags)
+    streams = {"FileHeader": file_header.ljust(_MIN_STREAM, b"\x00")}
+    if preview:
+        streams["PrvText"] = preview.encode("utf-16-le").ljust(_MIN_STREAM, b"\x00")
+    for number, paragraphs in enumerate(sections):
+        data = hwp_section(paragraphs)
+        if compressed:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+            data = compressor.compress(data) + compressor.flush()
+        streams[f"BodyText/Section{number}"] = data.ljust(_MIN_STREAM, b"\x00")
+    return build_cfb(streams)
+
+
+def build_hwpx(sections: Sequence[Sequence[str]], table_cells: Sequence[str] = ()) -> bytes:
+    """구역별 문단 목록 → HWPX (첫 구역 끝에 table_cells 를 담은 한 줄 표)"""
+    ns = 'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph" xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"'
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("mimetype", "application/hwp+zip")
+        archive.writestr("Contents/header.xml", "<hh:head xmlns:hh=\"urn:head\"/>")
+        for number, paragraphs in enumerate(sections):
+            body = "".join(f"<hp:p><hp:run><hp:t>{text}</hp:t></hp:run></hp:p>" for text in paragraphs)
+            if number == 0 and table_cells:
+                cells = "".join(
+                    f"<hp:tc><hp:subList><hp:p><hp:run><hp:t>{cell}</hp:t></hp:run></hp:p></hp:subList></hp:tc>"
+                    for cell in table_cells
+                )
+                body += f"<hp:p><hp:run><hp:tbl><hp:tr>{cells}</hp:tr></hp:tbl><hp:t>표 아래</hp:t></hp:run></hp:p>"
+            archive.writestr(
+                f"Contents/section{number}.xml",
+                f'<?xml version="1.0" encoding="UTF-8"?><hs:sec {ns}>{body}</hs:sec>'
+            )
+    return stream.getvalue()
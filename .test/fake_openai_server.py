@@ -0,0 +1,173 @@
+"""
+테스트용 로컬 가짜 OpenAI 서버
+
+실제 HTTP 소켓으로 `/v1/chat/completions` 를 제공하므로 AsyncOpenAI 클라이언트를
+수정 없이 base_url 만 바꿔 연결할 수 있습니다. 요청별 지연, 오류 주입, 응답 내용을
+콜백으로 제어하며 받은 요청은 `requests` 에 기록합니다. `stream=True` 요청에는
+chat.completion.chunk SSE 를 chunk_chars 글자씩 token_interval 간격으로 보냅니다.
+rate_limit 을 주면 rate_window 초 동안 그보다 많은 요청에 Retry-After 를 담은 429 로 응답합니다.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+Payload = Dict[str, Any]
+
+
+def _user_prompt(payload: Payload) -> str:
+    return "\n".join(m.get("content", "") for m in payload.get("messages", []) if m.get("role") == "user")
+
+
+class FakeOpenAIServer:
+    """
+    Args:
+        latency: 응답(스트리밍은 첫 조각) 지연(초) 또는 payload → 지연 함수
+        fail_status: payload → HTTP 오류 코드 (None 이면 정상 응답)
+        reply: payload → 응답 텍스트
+        token_interval: 스트리밍 조각 사이 간격(초)
+        chunk_chars: 스트리밍 조각당 글자 수
+        retry_after: 주입한 오류 응답의 Retry-After(초, None 이면 헤더 없음)
+        rate_limit: rate_window 초 동안 받는 요청 수 (0 이면 제한 없음)
+        rate_window: 속도 제한 구간(초)
+    """
+
+    def __init__(
+        self,
+        latency: Any = 0.0,
+        fail_status: Optional[Callable[[Payload], Optional[int]]] = None,
+        reply: Optional[Callable[[Payload], str]] = None,
+        token_interval: float = 0.0,
+        chunk_chars: int = 4,
+        retry_after: Optional[float] = None,
+        rate_limit: int = 0,
+        rate_window: float = 1.0
+    ):
+        self.latency = latency
+        self.token_interval = token_interval
+        self.chunk_chars = max(1, chunk_chars)
+        self.fail_status = fail_status or (lambda payload: None)
+        self.reply = reply or (lambda payload: f"생성 결과: {_user_prompt(payload)[:40]}")
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.requests: List[Payload] = []
+        self.rate_limited = 0
+        self._accepted: List[float] = []
+
+        self._app = Starlette(routes=[Route("/v1/chat/completions", self._chat_completions, methods=["POST"])])
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.port = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+
+        config = uvicorn.Config(self._app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+
+        deadline = time.time() + 10
+        while not self._server.started:
+            if time.time() > deadline:
+                raise RuntimeError("fake OpenAI server did not start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+    async def _chat_completions(self, request: Request):
+        payload = await request.json()
+        self.requests.append(payload)
+
+        if self.rate_limit:
+            now = time.monotonic()
+            self._accepted = [t for t in self._accepted if t > now - self.rate_window]
+            if len(self._accepted) >= self.rate_limit:
+                self.rate_limited += 1
+                return JSONResponse(
+                    {"error": {"message": "Rate limit reached", "type": "requests"}},
+                    status_code=429,
+                    headers={"retry-after": f"{self._accepted[0] + self.rate_window - now:.3f}"}
+                )
+            self._accepted.append(now)
+
+        latency = self.latency(payload) if callable(self.latency) else self.latency
+        if latency:
+            await asyncio.sleep(latency)
+
+        status = self.fail_status(payload)
+        if status:
+            headers = {"retry-after": str(self.retry_after)} if self.retry_after is not None else None
+            return JSONResponse(
+                {"error": {"message": "injected failure", "type": "server_error"}}, status_code=status, headers=headers
+            )
+
+        content = self.reply(payload)
+        if payload.get("stream"):
+            return StreamingResponse(self._stream(payload, content), media_type="text/event-stream")
+        return JSONResponse(self._completion(payload, content))
+
+    async def _stream(self, payload: Payload, content: str):
+        pieces = [content[i:i + self.chunk_chars] for i in range(0, len(content), self.chunk_chars)]
+        yield self._sse(self._chunk(payload, {"role": "assistant", "content": ""}))
+        for i, piece in enumerate(pieces):
+            if i and self.token_interval:
+                await asyncio.sleep(self.token_interval)
+            yield self._sse(self._chunk(payload, {"content": piece}))
+        yield self._sse(self._chunk(payload, {}, finish_reason="stop"))
+        yield "data: [DONE]\n\n"
+
+    @staticmethod
+    def _sse(data: Payload) -> str:
+        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    @staticmethod
+    def _chunk(payload: Payload, delta: Payload, finish_reason: Optional[str] = None) -> Payload:
+        return {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": payload.get("model", "fake"),
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }
+
+    @staticmethod
+    def _completion(payload: Payload, content: str) -> Payload:
+        prompt_tokens = sum(len(m.get("content", "")) for m in payload.get("messages", [])) // 2
+        completion_tokens = max(1, len(content) // 2)
+        return {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
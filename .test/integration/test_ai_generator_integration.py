@@ -0,0 +1,762 @@
+"""
+@TEST:ai-generator-integration
+Integration tests for AIGenerator against a local fake OpenAI server
+
+Related:
+- @SPEC:FEAT-002 - AI-Powered Content Generation
+- @CODE:ai-generator-service
+"""
+
+import asyncio
+import io
+import json
+import time
+import pytest
+from docx import Document
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
+from app.main import app
+from app.api import generation
+from app.services.ai_generator import AIGenerator
+from app.services.response_cache import ResponseCache, MemoryResponseBackend
+from app.services.reference_index import ReferenceIndex
+from app.services.token_budget import TokenBudget
+from app.services.llm_transport import AdaptiveRateLimiter, LLMTransport
+from app.services.model_router import ModelRouter
+from app.services.fake_llm import FakeLLMBackend
+from app.utils.tokens import EstimateTokenizer, estimate_tokens
+from fake_openai_server import FakeOpenAIServer
+
+SECTION_LATENCY = 0.4
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+BUSINESS_INFO = {"title": "AI 물류 플랫폼", "description": "중소 화주 대상 배차 최적화", "requirements": ""}
+
+
+def _system_prompt(payload) -> str:
+    return payload["messages"][0]["content"]
+
+
+def make_generator(server: FakeOpenAIServer, max_concurrency: int = 3) -> AIGenerator:
+    client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+    return AIGenerator(client=client, max_concurrency=max_concurrency)
+
+
+class TestFullPlanGeneration:
+    """@TEST:ai-generator-integration - 전체 사업계획서 동시 생성"""
+
+    def test_wall_time_is_max_not_sum(self):
+        """
+        @TEST:ai-generator-integration-001
+        세 섹션을 동시에 생성하여 전체 시간이 섹션 시간의 합이 아닌 최댓값에 가까움
+        """
+        with FakeOpenAIServer(latency=SECTION_LATENCY) as server:
+            generator = make_generator(server)
+            result = asyncio.run(generator.generate_full_plan(BUSINESS_INFO, [], {}))
+
+        assert len(server.requests) == 3
+        assert result["failed_sections"] == []
+        assert [s["section_name"] for s in result["sections"]] == [
+            "market_analysis", "competitive_analysis", "financial_plan"
+        ]
+        assert all(s["elapsed_ms"] >= SECTION_LATENCY * 1000 * 0.9 for s in result["sections"])
+        assert result["total_section_time_ms"] >= SECTION_LATENCY * 3 * 1000 * 0.9
+        assert result["wall_time_ms"] < SECTION_LATENCY * 2 * 1000
+
+    def test_concurrency_limit(self):
+        """
+        @TEST:ai-generator-integration-002
+        동시 실행 한도가 1이면 섹션이 순차 실행됨
+        """
+        with FakeOpenAIServer(latency=0.2) as server:
+            generator = make_generator(server, max_concurrency=1)
+            result = asyncio.run(generator.generate_full_plan(BUSINESS_INFO, [], {}))
+
+        assert result["wall_time_ms"] >= 0.2 * 3 * 1000 * 0.9
+        assert max(s["queued_ms"] for s in result["sections"]) >= 0.2 * 2 * 1000 * 0.9
+
+    def test_partial_results_when_section_fails(self):
+        """
+        @TEST:ai-generator-integration-003
+        한 섹션이 실패해도 나머지 섹션 결과 반환
+        """
+        def fail_competitive(payload):
+            return 500 if "경쟁사" in _system_prompt(payload) else None
+
+        with FakeOpenAIServer(latency=0.05, fail_status=fail_competitive) as server:
+            generator = make_generator(server)
+            result = asyncio.run(generator.generate_full_plan(BUSINESS_INFO, [], {}))
+
+        statuses = {s["section_name"]: s["status"] for s in result["sections"]}
+        assert statuses == {"market_analysis": "ok", "competitive_analysis": "error", "financial_plan": "ok"}
+        assert result["failed_sections"] == ["competitive_analysis"]
+
+    def test_unknown_section(self):
+        """
+        @TEST:ai-generator-integration-004
+        지원되지 않는 섹션 요청
+        """
+        generator = AIGenerator(client=None)
+        with pytest.raises(ValueError):
+            asyncio.run(generator.generate_full_plan(BUSINESS_INFO, [], {}, sections=["swot"]))
+
+    def test_full_plan_endpoint(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-005
+        /api/generation/full-plan 엔드포인트 응답 구조
+        """
+        with FakeOpenAIServer(latency=0.05) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+            response = TestClient(app).post(
+                "/api/generation/full-plan",
+                json={"title": "AI 물류 플랫폼", "sections": ["market_analysis", "financial_plan"]}
+            )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [s["section_name"] for s in body["sections"]] == ["market_analysis", "financial_plan"]
+        assert set(body["metadata"]["timings"]) == {"market_analysis", "financial_plan"}
+
+
+def _parse_sse(lines) -> list:
+    """SSE 응답 줄 목록 → [(event, data)]"""
+    events, event = [], None
+    for line in lines:
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            events.append((event, json.loads(line[len("data: "):])))
+    return events
+
+
+class TestSectionStreaming:
+    """@TEST:ai-generator-integration - 섹션 생성 토큰 스트리밍"""
+
+    REPLY = "시장 규모는 연평균 12% 성장하고 있으며 중소 화주 수요가 빠르게 늘고 있습니다."
+
+    def test_stream_section_measures_ttft(self):
+        """
+        @TEST:ai-generator-integration-006
+        첫 토큰 시간이 전체 생성 시간보다 훨씬 짧고, 조각을 이으면 전체 응답과 같음
+        """
+        async def run(generator):
+            metrics = {}
+            parts = [d async for d in generator.stream_section(
+                "market_analysis", BUSINESS_INFO, reference_docs=[], metrics=metrics
+            )]
+            return parts, metrics
+
+        with FakeOpenAIServer(latency=0.05, token_interval=0.03, reply=lambda p: self.REPLY) as server:
+            generator = make_generator(server)
+            parts, metrics = asyncio.run(run(generator))
+
+        assert "".join(parts) == self.REPLY
+        assert len(parts) == metrics["chunks"] > 10
+        assert metrics["ttft_ms"] < metrics["total_ms"] / 3
+        assert generator.stats()["completed"] == 1
+        assert generator.stats()["ttft_ms"]["count"] == 1
+
+    def test_non_streaming_uses_stream_path(self):
+        """
+        @TEST:ai-generator-integration-007
+        일반 생성 메서드도 stream=True 요청을 모아서 반환
+        """
+        with FakeOpenAIServer(reply=lambda p: self.REPLY) as server:
+            generator = make_generator(server)
+            content = asyncio.run(generator.generate_competitive_analysis(BUSINESS_INFO, []))
+
+        assert content == self.REPLY
+        assert server.requests[0]["stream"] is True
+        assert server.requests[0]["max_tokens"] == 2000
+
+    def test_sse_endpoint_event_order(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-008
+        SSE 엔드포인트: start → token... → done(metrics) 순서
+        """
+        with FakeOpenAIServer(latency=0.05, reply=lambda p: self.REPLY) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+            with TestClient(app).stream(
+                "POST", "/api/generation/financial-plan/stream", json={"title": "AI 물류 플랫폼"}
+            ) as response:
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("text/event-stream")
+                events = _parse_sse(response.iter_lines())
+
+        names = [name for name, _ in events]
+        assert names[0] == "start" and names[-1] == "done"
+        assert set(names[1:-1]) == {"token"}
+        assert "".join(data["text"] for name, data in events if name == "token") == self.REPLY
+        done = events[-1][1]
+        assert done["section"] == "financial_plan"
+        assert done["tables"] == []
+        assert 0 < done["metrics"]["ttft_ms"] <= done["metrics"]["total_ms"]
+
+    def test_sse_endpoint_reports_error_event(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-009
+        업스트림 오류는 error 이벤트로 전달
+        """
+        with FakeOpenAIServer(fail_status=lambda p: 500) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+            with TestClient(app).stream(
+                "POST", "/api/generation/market-analysis/stream", json={"title": "AI 물류 플랫폼"}
+            ) as response:
+                events = _parse_sse(response.iter_lines())
+
+        assert [name for name, _ in events] == ["start", "error"]
+        assert events[-1][1]["detail"].startswith("시장 분석 생성 오류")
+
+
+class TestResponseCaching:
+    """@TEST:ai-generator-integration - 응답 캐시"""
+
+    def test_repeated_generation_served_from_cache(self):
+        """
+        @TEST:ai-generator-integration-010
+        같은 사업 정보로 다시 생성하면 API 를 호출하지 않고, bypass 는 새로 생성
+        """
+        async def run(generator):
+            first = await generator.generate_market_analysis(BUSINESS_INFO, [])
+            # 공백만 다른 입력도 같은 프롬프트로 정규화됨
+            second = await generator.generate_market_analysis({**BUSINESS_INFO, "title": " AI 물류 플랫폼 "}, [])
+            third = await generator.generate_market_analysis(BUSINESS_INFO, [], cache_mode="bypass")
+            return first, second, third
+
+        with FakeOpenAIServer(latency=0.05) as server:
+            cache = ResponseCache(MemoryResponseBackend())
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            generator = AIGenerator(client=client, cache=cache)
+            first, second, third = asyncio.run(run(generator))
+
+        assert first == second == third
+        assert len(server.requests) == 2
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["bypassed"] == 1
+        assert stats["saved_tokens"] > 0
+
+    def test_endpoint_cache_query(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-011
+        ?cache=bypass 및 /cache-stats 보고
+        """
+        with FakeOpenAIServer() as server:
+            cache = ResponseCache(MemoryResponseBackend())
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            monkeypatch.setattr(generation, "ai_generator", AIGenerator(client=client, cache=cache))
+            monkeypatch.setattr(generation, "response_cache", cache)
+
+            with TestClient(app) as test_client:
+                body = {"title": "AI 물류 플랫폼"}
+                test_client.post("/api/generation/competitive-analysis", json=body)
+                test_client.post("/api/generation/competitive-analysis", json=body)
+                test_client.post("/api/generation/competitive-analysis?cache=bypass", json=body)
+                invalid = test_client.post("/api/generation/competitive-analysis?cache=refresh", json=body)
+                stats = test_client.get("/api/generation/cache-stats").json()
+
+        assert len(server.requests) == 2
+        assert invalid.status_code == 422
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["backend"] == "memory"
+
+
+class TestReferenceRetrieval:
+    """@TEST:ai-generator-integration - 참고 문서 청크 검색"""
+
+    def test_prompt_contains_only_relevant_chunks(self):
+        """
+        @TEST:ai-generator-integration-012
+        경쟁사 분석 프롬프트에는 경쟁사 관련 청크만 토큰 예산 안에서 포함
+        """
+        filler = "\n".join(f"{i}. 본 보고서의 작성 방법과 조사 일정에 대한 설명입니다." for i in range(200))
+        reference = filler + "\n주요 경쟁사 A사는 점유율 30%, B사는 15%를 차지하고 있습니다.\n" + filler
+
+        with FakeOpenAIServer() as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            generator = AIGenerator(
+                client=client,
+                reference_index=ReferenceIndex(chunk_tokens=80, overlap_tokens=0),
+                reference_top_k=2,
+                reference_budget_tokens=200
+            )
+            asyncio.run(generator.generate_competitive_analysis(BUSINESS_INFO, [reference]))
+
+        prompt = server.requests[0]["messages"][1]["content"]
+        assert "점유율 30%" in prompt
+        assert estimate_tokens(prompt) < estimate_tokens(reference) / 10
+
+    def test_reference_ids_resolved_from_store(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-013
+        reference_documents 의 ID 를 저장소에서 조회하여 프롬프트에 사용, 없는 ID 는 404
+        """
+        with FakeOpenAIServer() as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            monkeypatch.setattr(generation, "ai_generator", AIGenerator(
+                client=client, reference_index=ReferenceIndex(), reference_top_k=4, reference_budget_tokens=500
+            ))
+
+            with TestClient(app) as test_client:
+                uploaded = test_client.post(
+                    "/api/documents/upload-reference",
+                    files={"file": ("rivals.txt", "주요 경쟁사 C사는 점유율 22%입니다.".encode("utf-8"), "text/plain")}
+                ).json()
+                ok = test_client.post("/api/generation/competitive-analysis?cache=bypass", json={
+                    "title": "AI 물류 플랫폼", "reference_documents": [uploaded["reference_id"]]
+                })
+                missing = test_client.post("/api/generation/competitive-analysis", json={
+                    "title": "AI 물류 플랫폼", "reference_documents": ["0" * 64]
+                })
+
+        assert ok.status_code == 200
+        assert "점유율 22%" in server.requests[0]["messages"][1]["content"]
+        assert missing.status_code == 404
+        assert len(server.requests) == 1
+
+
+class TestFinancialTables:
+    """@TEST:ai-generator-integration - 재무 계획 표 추출"""
+
+    def test_markdown_tables_without_extra_request(self):
+        """
+        @TEST:ai-generator-integration-014
+        본문에 마크다운 표가 있으면 추가 요청 없이 열 단위 표 데이터 반환
+        """
+        reply = "매출 계획 (단위: 백만원)\n\n| 구분 | 1차년도 | 2차년도 |\n|---|---|---|\n| 매출 | 100 | 300 |"
+
+        with FakeOpenAIServer(reply=lambda payload: reply) as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            generator = AIGenerator(client=client, json_tables=True)
+            result = asyncio.run(generator.generate_financial_plan(BUSINESS_INFO, {}))
+
+        assert len(server.requests) == 1
+        assert "마크다운 표" in server.requests[0]["messages"][1]["content"]
+        assert result["tables"][0]["columns"] == [["매출"], [100000000], [300000000]]
+
+    def test_json_mode_fallback(self):
+        """
+        @TEST:ai-generator-integration-015
+        본문에 표가 없으면 JSON 모드로 표 데이터를 한 번 더 요청하고 결과를 캐시
+
+        Tests: @SPEC:FEAT-002-REQ-009
+        """
+        tables_json = json.dumps({"tables": [{
+            "title": "매출 계획", "unit": "단위: 원", "headers": ["구분", "1차년도"], "rows": [["매출", 100000000]]
+        }]})
+
+        def reply(payload):
+            return tables_json if payload.get("response_format") else "1차년도 매출은 1억원입니다."
+
+        with FakeOpenAIServer(reply=reply) as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            generator = AIGenerator(client=client, cache=ResponseCache(MemoryResponseBackend()), json_tables=True)
+            first = asyncio.run(generator.generate_financial_plan(BUSINESS_INFO, {}))
+            second = asyncio.run(generator.generate_financial_plan(BUSINESS_INFO, {}))
+
+        assert len(server.requests) == 2
+        assert server.requests[1]["response_format"] == {"type": "json_object"}
+        assert "1억원" in server.requests[1]["messages"][1]["content"]
+        assert first["tables"] == second["tables"]
+        assert first["tables"][0]["columns"] == [["매출"], [100000000]]
+        assert first["tables"][0]["source"] == "json"
+
+
+class TestTokenBudget:
+    """@TEST:ai-generator-integration - 토큰 예산"""
+
+    def test_references_fit_input_budget(self):
+        """
+        @TEST:ai-generator-integration-016
+        참고 자료를 입력 한도에 맞춰 넣고 max_tokens 를 컨텍스트에 남은 토큰으로 제한,
+        호출별 입력/출력 토큰을 측정값과 통계에 기록
+
+        Tests: @SPEC:FEAT-002-REQ-010
+        """
+        budget = TokenBudget(EstimateTokenizer(), context_tokens=2500, input_budget_tokens=1200, min_output_tokens=200)
+        references = [f"{i}번째 참고 문서: 국내 물류 시장은 연평균 8% 성장하고 있습니다. " * 20 for i in range(5)]
+
+        async def run(generator):
+            metrics = {}
+            parts = [d async for d in generator.stream_section(
+                "market_analysis", BUSINESS_INFO, reference_docs=references, metrics=metrics
+            )]
+            return "".join(parts), metrics
+
+        with FakeOpenAIServer(reply=lambda p: "시장 분석 결과입니다.") as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            generator = AIGenerator(client=client, token_budget=budget)
+            content, metrics = asyncio.run(run(generator))
+
+        request = server.requests[0]
+        prompt = request["messages"][1]["content"]
+        assert budget.count_messages(request["messages"]) == metrics["prompt_tokens"] <= 1200
+        assert references[0] in prompt and references[-1] not in prompt
+        assert request["max_tokens"] == metrics["max_tokens"] == 2500 - metrics["prompt_tokens"]
+        assert metrics["completion_tokens"] == estimate_tokens(content)
+
+        stats = generator.stats()["tokens"]
+        assert stats["calls"] == 1
+        assert stats["prompt_tokens"] == metrics["prompt_tokens"]
+        assert stats["dropped_reference_tokens"] > 0
+        assert stats["tokenizer"] == "estimate"
+
+    def test_oversized_prompt_rejected_before_request(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-017
+        사업 정보를 줄여도 컨텍스트에 들어가지 않으면 요청을 보내지 않고 413, SSE done 에 토큰 측정값 포함
+        """
+        with FakeOpenAIServer(reply=lambda p: "재무 계획") as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            monkeypatch.setattr(generation, "ai_generator", AIGenerator(
+                client=client,
+                token_budget=TokenBudget(EstimateTokenizer(), context_tokens=1200, min_output_tokens=200)
+            ))
+            client_app = TestClient(app)
+            rejected = client_app.post("/api/generation/market-analysis", json={"title": "물류" * 2000})
+            with client_app.stream(
+                "POST", "/api/generation/financial-plan/stream", json={"title": "AI 물류 플랫폼"}
+            ) as response:
+                events = _parse_sse(response.iter_lines())
+
+        assert rejected.status_code == 413
+        assert len(server.requests) == 1
+        done = events[-1][1]["metrics"]
+        assert done["prompt_tokens"] > 0 and done["completion_tokens"] > 0
+        assert done["max_tokens"] == 1200 - done["prompt_tokens"]
+
+
+class TestGenerationJobs:
+    """@TEST:ai-generator-integration - 비동기 생성 작업"""
+
+    def test_submit_dedup_and_long_poll(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-018
+        작업 등록은 바로 202 로 작업 ID 반환, 진행 중인 같은 요청은 같은 작업, 롱 폴링으로 결과 조회
+        """
+        with FakeOpenAIServer(latency=0.5) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+
+            with TestClient(app) as test_client:
+                body = {"title": "AI 물류 플랫폼", "description": "배차 최적화", "sections": ["market_analysis"]}
+                started = time.perf_counter()
+                submitted = test_client.post("/api/generation/jobs/full_plan?cache=bypass", json=body)
+                submit_ms = (time.perf_counter() - started) * 1000
+                duplicate = test_client.post("/api/generation/jobs/full_plan?cache=bypass", json=body)
+                job_id = submitted.json()["job_id"]
+                finished = test_client.get(f"/api/generation/jobs/{job_id}?wait=5").json()
+                again = test_client.get(f"/api/generation/jobs/{job_id}").json()
+                stats = test_client.get("/api/generation/job-stats").json()
+
+        assert submitted.status_code == 202 and submit_ms < 400
+        assert submitted.json()["status"] in ("queued", "running") and not submitted.json()["deduplicated"]
+        assert duplicate.json()["job_id"] == job_id and duplicate.json()["deduplicated"]
+        assert len(server.requests) == 1
+        assert finished["status"] == "succeeded"
+        assert finished["result"]["sections"][0]["section_name"] == "market_analysis"
+        assert finished["result"]["sections"][0]["content"].startswith("생성 결과")
+        assert again == finished
+        assert stats["deduplicated"] >= 1 and stats["started"]
+
+    def test_cancel_and_errors(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-019
+        실행 중인 작업 취소, 끝난 작업 취소는 409, 없는 작업 404, 없는 참고 문서는 등록 전에 404
+        """
+        with FakeOpenAIServer(latency=2.0) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+
+            with TestClient(app) as test_client:
+                job = test_client.post("/api/generation/jobs/market_analysis", json={"title": "취소할 작업"}).json()
+                for _ in range(50):
+                    if test_client.get(f"/api/generation/jobs/{job['job_id']}").json()["status"] == "running":
+                        break
+                    time.sleep(0.02)
+                cancelled = test_client.delete(f"/api/generation/jobs/{job['job_id']}")
+                again = test_client.delete(f"/api/generation/jobs/{job['job_id']}")
+                missing = test_client.get("/api/generation/jobs/unknown")
+                unknown_kind = test_client.post("/api/generation/jobs/summary", json={"title": "t"})
+                missing_reference = test_client.post(
+                    "/api/generation/jobs/market_analysis", json={"title": "t", "reference_documents": ["nope"]}
+                )
+
+        assert cancelled.status_code == 200 and cancelled.json()["status"] == "cancelled"
+        assert again.status_code == 409
+        assert missing.status_code == 404
+        assert unknown_kind.status_code == 422
+        assert missing_reference.status_code == 404
+
+    def test_expired_job_returns_404(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-027
+        실행 중인 서버에서도 보관 시간(GENERATION_JOB_RESULT_TTL)이 지난 작업은 삭제되어 404
+        """
+        with FakeOpenAIServer(latency=0.0) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+            monkeypatch.setattr(generation.job_queue, "result_ttl", 0.2)
+            monkeypatch.setattr(generation.job_queue, "lease", 0.3)
+
+            with TestClient(app) as test_client:
+                job = test_client.post("/api/generation/jobs/market_analysis?cache=bypass", json={"title": "만료 작업"}).json()
+                finished = test_client.get(f"/api/generation/jobs/{job['job_id']}?wait=5").json()
+                for _ in range(100):
+                    expired = test_client.get(f"/api/generation/jobs/{job['job_id']}")
+                    if expired.status_code == 404:
+                        break
+                    time.sleep(0.02)
+
+        assert finished["status"] == "succeeded"
+        assert expired.status_code == 404
+
+
+class TestRequestCoalescing:
+    """@TEST:ai-generator-integration - 같은 요청 동시 호출 공유"""
+
+    REPLY = "국내 물류 시장은 연평균 8% 성장하고 있으며 당일 배송 수요가 늘고 있습니다."
+
+    def test_identical_requests_share_upstream_call(self):
+        """
+        @TEST:ai-generator-integration-020
+        동시에 들어온 같은 시장 분석 요청은 업스트림 호출 하나를 공유하고 토큰은 한 번만 기록
+        """
+        async def run(generator):
+            return await asyncio.gather(
+                *[generator.generate_market_analysis(BUSINESS_INFO, []) for _ in range(4)],
+                generator.generate_market_analysis({**BUSINESS_INFO, "title": "다른 사업"}, [])
+            )
+
+        with FakeOpenAIServer(latency=0.2, token_interval=0.01, reply=lambda p: self.REPLY) as server:
+            generator = make_generator(server)
+            results = asyncio.run(run(generator))
+
+        assert results == [self.REPLY] * 5
+        assert len(server.requests) == 2
+        stats = generator.stats()
+        assert stats["single_flight"] == {"flights": 2, "coalesced": 3, "abandoned": 0, "in_flight": 0}
+        assert stats["tokens"]["calls"] == 2
+        assert stats["completed"] == 5
+
+    def test_first_caller_disconnect_does_not_cancel_others(self):
+        """
+        @TEST:ai-generator-integration-021
+        먼저 요청한 스트림이 중간에 끊겨도 같은 요청의 다른 스트림은 끝까지 받고, coalesce 를 끄면 요청마다 호출
+        """
+        async def run(generator):
+            async def first():
+                async for _ in generator.stream_section("market_analysis", BUSINESS_INFO, reference_docs=[]):
+                    raise ConnectionResetError("client disconnected")
+
+            async def second(metrics):
+                return "".join([d async for d in generator.stream_section(
+                    "market_analysis", BUSINESS_INFO, reference_docs=[], metrics=metrics
+                )])
+
+            metrics = {}
+            results = await asyncio.gather(first(), second(metrics), return_exceptions=True)
+            return results, metrics
+
+        with FakeOpenAIServer(latency=0.1, token_interval=0.02, reply=lambda p: self.REPLY) as server:
+            generator = make_generator(server)
+            (disconnected, content), metrics = asyncio.run(run(generator))
+
+            uncoalesced = AIGenerator(
+                client=AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0), coalesce=False
+            )
+
+            async def run_twice():
+                await asyncio.gather(*[uncoalesced.generate_market_analysis(BUSINESS_INFO, []) for _ in range(2)])
+
+            asyncio.run(run_twice())
+
+        assert isinstance(disconnected, ConnectionResetError)
+        assert content == self.REPLY
+        assert metrics["coalesced"] is True and metrics["completion_tokens"] > 0
+        assert generator.stats()["single_flight"]["abandoned"] == 0
+        assert (generator.stats()["completed"], generator.stats()["failed"]) == (1, 1)
+        assert len(server.requests) == 3
+
+
+class TestResilientTransport:
+    """@TEST:ai-generator-integration - 속도 제한/재시도 전송 계층"""
+
+    def test_burst_against_rate_limited_server(self):
+        """
+        @TEST:ai-generator-integration-022
+        초당 4건만 받는 서버에 6건을 동시에 보내도 모두 성공: 기본 전송 계층은 Retry-After 를 따라 재시도,
+        RPM 을 설정하면 요청 간격을 벌려 429 없이 처리
+        """
+        async def burst(generator):
+            return await asyncio.gather(*[
+                generator.generate_market_analysis({**BUSINESS_INFO, "title": f"사업 {index}"}, [])
+                for index in range(6)
+            ])
+
+        def run(server, limiter=None):
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url)
+            transport = LLMTransport(client, limiter=limiter) if limiter else None
+            generator = AIGenerator(client=client, transport=transport)
+            return asyncio.run(burst(generator)), generator.stats()["transport"]
+
+        with FakeOpenAIServer(rate_limit=4, rate_window=1.0) as server:
+            retried, retried_stats = run(server)
+        retried_429s = server.rate_limited
+
+        with FakeOpenAIServer(rate_limit=4, rate_window=1.0) as server:
+            paced, paced_stats = run(server, AdaptiveRateLimiter(rpm=150, burst_seconds=0.1))
+
+        assert all(content.startswith("생성 결과") for content in retried + paced)
+        assert retried_429s > 0 and retried_stats["retries"] == retried_429s
+        assert retried_stats["limiter"]["rate_limited"] == retried_429s
+        assert server.rate_limited == 0 and paced_stats["retries"] == 0
+        assert paced_stats["limiter"]["waits"] >= 4
+
+
+class TestModelRouting:
+    """@TEST:ai-generator-integration - 모델 라우팅과 초안 생성"""
+
+    def test_draft_stream_then_background_refine(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-023
+        ?tier=draft 는 작은 모델로 스트리밍하고 done 에 기본 모델 생성 작업 ID 를 알려 줌,
+        작업 결과는 기본 모델 응답이며 경로별 호출 수/비용은 /stats 의 routes 에 기록
+
+        Tests: @SPEC:FEAT-002-REQ-014
+        """
+        def reply(payload):
+            return "초안: 시장 규모 1조원" if payload["model"].startswith("gpt-3.5") else "보완: 시장 규모 1조 2천억원, 연 12% 성장"
+
+        with FakeOpenAIServer(latency=0.05, reply=reply) as server:
+            monkeypatch.setattr(generation, "ai_generator", make_generator(server))
+
+            with TestClient(app) as test_client:
+                body = {"title": "AI 물류 플랫폼", "description": "배차 최적화"}
+                with test_client.stream(
+                    "POST", "/api/generation/market-analysis/stream?tier=draft&cache=bypass", json=body
+                ) as response:
+                    events = _parse_sse(response.iter_lines())
+                done = events[-1][1]
+                refined = test_client.get(f"/api/generation/jobs/{done['refine_job_id']}?wait=5").json()
+                with test_client.stream(
+                    "POST", "/api/generation/market-analysis/stream?cache=bypass", json=body
+                ) as response:
+                    standard_done = _parse_sse(response.iter_lines())[-1][1]
+                invalid = test_client.post("/api/generation/market-analysis/stream?tier=premium", json=body)
+                routes = test_client.get("/api/generation/stats").json()["routes"]
+
+        assert "".join(data["text"] for name, data in events if name == "token") == "초안: 시장 규모 1조원"
+        assert (done["metrics"]["tier"], done["metrics"]["route"]) == ("draft", "draft")
+        assert done["metrics"]["model"] == server.requests[0]["model"] == "gpt-3.5-turbo-0125"
+        assert done["metrics"]["cost_usd"] > 0
+        assert refined["status"] == "succeeded" and refined["kind"] == "market_analysis"
+        assert refined["result"]["content"].startswith("보완:")
+        assert server.requests[1]["model"] == "gpt-4-turbo-preview"
+        assert standard_done["refine_job_id"] is None and standard_done["metrics"]["route"] == "standard"
+        assert invalid.status_code == 422
+        assert (routes["draft"]["calls"], routes["standard"]["calls"]) == (1, 2)
+        assert routes["draft"]["cost_per_call_usd"] < routes["standard"]["cost_per_call_usd"]
+        assert routes["standard"]["ttft_ms"]["count"] == 2
+
+    def test_routing_table_by_section_and_input_size(self):
+        """
+        @TEST:ai-generator-integration-024
+        라우팅 표에 따라 짧은 입력의 섹션은 작은 모델, 표 JSON 변환은 temperature 0 경로로 요청
+        """
+        tables_json = json.dumps({"tables": [{"title": "매출", "headers": ["구분", "1차년도"], "rows": [["매출", 1]]}]})
+
+        def reply(payload):
+            return tables_json if payload.get("response_format") else "1차년도 매출은 1억원입니다."
+
+        router = ModelRouter([
+            {"name": "table-json", "sections": ["financial_tables"], "model": "gpt-4o-mini", "temperature": 0},
+            {"name": "short-input", "sections": ["competitive_analysis"], "max_prompt_tokens": 400,
+             "model": "gpt-4o-mini"},
+            {"name": "standard", "model": "gpt-4-turbo-preview"}
+        ])
+
+        async def run(generator):
+            short = await generator.generate_competitive_analysis(BUSINESS_INFO, [])
+            long = await generator.generate_competitive_analysis(BUSINESS_INFO, ["경쟁사 점유율 자료 " * 300])
+            financial = await generator.generate_financial_plan(BUSINESS_INFO, {})
+            return short, long, financial
+
+        with FakeOpenAIServer(reply=reply) as server:
+            client = AsyncOpenAI(api_key="test-key", base_url=server.base_url, max_retries=0)
+            generator = AIGenerator(client=client, router=router, json_tables=True)
+            _, _, financial = asyncio.run(run(generator))
+
+        assert [request["model"] for request in server.requests] == [
+            "gpt-4o-mini", "gpt-4-turbo-preview", "gpt-4-turbo-preview", "gpt-4o-mini"
+        ]
+        assert server.requests[3]["temperature"] == 0 and server.requests[3]["response_format"]
+        assert financial["tables"][0]["source"] == "json"
+        assert set(generator.stats()["routes"]) == {"table-json", "short-input", "standard"}
+
+
+class TestFakeBackend:
+    """@TEST:ai-generator-integration - 가짜 LLM 백엔드로 전체 흐름"""
+
+    def test_pipeline_without_api_key(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-025
+        가짜 백엔드로 양식 업로드 → 섹션 식별 → 전체 생성 → 내보내기가 API 키 없이 동작하고
+        재무 계획의 표는 합계 검증을 통과
+
+        Tests: @SPEC:FEAT-002-REQ-015
+        """
+        backend = FakeLLMBackend(latency="fixed:0", tokens_per_second=0)
+        monkeypatch.setattr(generation, "ai_generator", AIGenerator(transport=backend))
+
+        doc = Document()
+        doc.add_heading("사업계획서", 0)
+        for heading in ("2. 시장 분석", "3. 경쟁사 분석", "4. 재무 계획"):
+            doc.add_heading(heading, 1)
+            doc.add_paragraph("※ 작성하세요")
+        stream = io.BytesIO()
+        doc.save(stream)
+        files = {"file": ("plan.docx", stream.getvalue(), DOCX_MEDIA_TYPE)}
+
+        with TestClient(app) as test_client:
+            uploaded = test_client.post("/api/documents/upload-template", files=files).json()
+            identified = test_client.post(
+                "/api/analysis/identify-sections", json={"paragraphs": uploaded["structure"]["paragraphs"]}
+            )
+            plan = test_client.post("/api/generation/full-plan?cache=bypass", json=BUSINESS_INFO).json()
+            exported = test_client.post("/api/export/export-docx", json={
+                "template_id": uploaded["template_id"],
+                "generated_content": {s["section_name"]: s["content"] for s in plan["sections"]},
+                "business_info": {"title": BUSINESS_INFO["title"]}
+            })
+            stats = test_client.get("/api/generation/stats").json()
+
+        assert identified.status_code == 200
+        assert [s["status"] for s in plan["sections"]] == ["ok", "ok", "ok"]
+        assert all(BUSINESS_INFO["title"] in s["content"] for s in plan["sections"])
+        financial = next(s for s in plan["sections"] if s["section_name"] == "financial_plan")
+        assert financial["tables"] and all(t["validation"]["valid"] for t in financial["tables"])
+        assert exported.status_code == 200
+        texts = [p.text for p in Document(io.BytesIO(exported.content)).paragraphs]
+        assert any(BUSINESS_INFO["title"] in text for text in texts)
+        assert stats["backend"] == "fake" and stats["transport"]["requests"] == 3
+
+    def test_injected_errors_reach_stream_clients(self, monkeypatch):
+        """
+        @TEST:ai-generator-integration-026
+        오류 주입 시 스트림은 error 이벤트로 끝나고, 스트림 중간 연결 끊김도 error 이벤트로 전달
+        """
+        body = {"title": "AI 물류 플랫폼", "description": "배차 최적화"}
+        events = {}
+        for name, backend in (
+            ("status", FakeLLMBackend(latency="fixed:0", tokens_per_second=0, error_rate=1.0, error_status=503)),
+            ("disconnect", FakeLLMBackend(latency="fixed:0", tokens_per_second=0, disconnect_rate=1.0)),
+        ):
+            monkeypatch.setattr(generation, "ai_generator", AIGenerator(transport=backend))
+            with TestClient(app) as test_client:
+                with test_client.stream(
+                    "POST", "/api/generation/market-analysis/stream?cache=bypass", json=body
+                ) as response:
+                    events[name] = _parse_sse(response.iter_lines())
+
+        assert [name for name, _ in events["status"]] == ["start", "error"]
+        assert "503" in events["status"][-1][1]["detail"]
+        assert events["disconnect"][-1][0] == "error"
+        assert all(name != "done" for name, _ in events["disconnect"])
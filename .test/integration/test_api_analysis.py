@@ -0,0 +1,65 @@
+"""
+@TEST:api-integration-analysis
+Integration tests for section identification endpoint
+
+Related:
+- @SPEC:FEAT-001-REQ-003 - Section Type Identification
+- @SPEC:FEAT-001-REQ-008 - Incremental Template Diff
+- @CODE:section-classifier-service
+"""
+
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+class TestAnalysisApi:
+    """@TEST:api-integration-analysis - 섹션 식별 API 통합 테스트"""
+
+    def test_identify_sections(self):
+        """
+        @TEST:api-integration-analysis-001
+        문단 목록을 한 번에 분류하여 입력 순서대로 반환
+        """
+        paragraphs = [
+            {"index": 0, "text": "1. 사업 개요"},
+            {"index": 1, "text": "2. 경쟁사 분석"},
+            {"index": 2, "text": "3. 재무 계획"},
+            {"index": 3, "text": "첨부 서류 목록"},
+        ]
+
+        response = TestClient(app).post("/api/analysis/identify-sections", json={"paragraphs": paragraphs})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_sections"] == 4
+        assert [section["section_type"] for section in body["sections"]] == [
+            "business_overview", "competitive_analysis", "financial_plan", "general"
+        ]
+        assert [section["index"] for section in body["sections"]] == [0, 1, 2, 3]
+
+    def test_previous_sections_reused_by_hash(self):
+        """
+        @TEST:api-integration-analysis-002
+        previous_sections 에 같은 해시가 있는 문단은 이전 섹션 타입을 쓰고 나머지만 다시 분류
+        """
+        client = TestClient(app)
+        first = client.post("/api/analysis/identify-sections", json={"paragraphs": [
+            {"index": 0, "text": "2. 시장 분석", "hash": "a"},
+            {"index": 1, "text": "※ 시장 규모", "hash": "b"},
+        ]}).json()
+        first["sections"][1]["section_type"] = "custom"  # 재사용 여부 확인용
+
+        second = client.post("/api/analysis/identify-sections", json={
+            "paragraphs": [
+                {"index": 0, "text": "2. 시장 분석", "hash": "a"},
+                {"index": 1, "text": "※ 시장 규모", "hash": "b"},
+                {"index": 2, "text": "3. 재무 계획", "hash": "c"},
+            ],
+            "previous_sections": first["sections"]
+        }).json()
+
+        assert first["reclassified"] == 2
+        assert second["reclassified"] == 1
+        assert [section["section_type"] for section in second["sections"]] == [
+            "market_analysis", "custom", "financial_plan"
+        ]
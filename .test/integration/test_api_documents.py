@@ -0,0 +1,418 @@
+"""
+@TEST:api-integration-documents
+Integration tests for document upload endpoints
+
+Related:
+- @CODE:api-documents-upload
+- @CODE:parse-cache-service
+- @CODE:reference-extractors
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+import zipfile
+import httpx
+import pytest
+from docx import Document
+from fastapi.testclient import TestClient
+from app.main import app
+from app.api import documents
+from app.services.docx_parser import DocxParser
+from app.services.executor import DocumentExecutor
+from app.services.reference_index import ReferenceIndex
+from document_builders import build_hwp, build_pdf
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def template_bytes():
+    doc = Document()
+    doc.add_heading('사업계획서 양식', 0)
+    doc.add_paragraph('1. 시장 분석')
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = '항목'
+    table.cell(0, 1).text = '금액'
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+class TestDocumentsApi:
+    """@TEST:api-integration-documents - 문서 업로드 API 통합 테스트"""
+
+    def test_upload_template_cache_hit_skips_parser(self, client, template_bytes, monkeypatch):
+        """
+        @TEST:api-integration-documents-001
+        같은 양식을 다시 업로드하면 python-docx 파서를 호출하지 않음
+        """
+        documents.parse_cache.clear()
+        files = {"file": ("template.docx", template_bytes, DOCX_MEDIA_TYPE)}
+
+        first = client.post("/api/documents/upload-template", files=files)
+        assert first.status_code == 200
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("cache hit must not parse")
+
+        monkeypatch.setattr(DocxParser, "parse_document", staticmethod(fail_parse))
+
+        second = client.post("/api/documents/upload-template", files=files)
+        assert second.status_code == 200
+        assert second.json()["structure"] == first.json()["structure"]
+
+        stats = client.get("/api/documents/cache-stats").json()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_health_stays_responsive_during_parses(self, monkeypatch):
+        """
+        @TEST:api-integration-documents-002
+        파싱 작업이 실행되는 동안에도 /health 응답 지연이 늘지 않음
+        """
+        def slow_parse(source):
+            time.sleep(0.3)
+            return {"paragraphs": [], "tables": [], "metadata": {"size": len(source.read())}}
+
+        monkeypatch.setattr(documents, "_parse_docx", slow_parse)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                uploads = [
+                    asyncio.create_task(client.post(
+                        "/api/documents/upload-template",
+                        files={"file": (f"t{idx}.docx", f"load-{idx}-{time.time()}".encode(), DOCX_MEDIA_TYPE)}
+                    ))
+                    for idx in range(4)
+                ]
+                await asyncio.sleep(0.05)
+
+                latencies = []
+                while not all(task.done() for task in uploads):
+                    started = time.perf_counter()
+                    response = await client.get("/health")
+                    latencies.append(time.perf_counter() - started)
+                    assert response.status_code == 200
+                    await asyncio.sleep(0.02)
+
+                responses = await asyncio.gather(*uploads)
+                return latencies, responses
+
+        latencies, responses = asyncio.run(scenario())
+
+        assert all(response.status_code == 200 for response in responses)
+        assert len(latencies) >= 5
+        assert max(latencies) < 0.1
+
+    def test_saturated_executor_returns_429(self, monkeypatch):
+        """
+        @TEST:api-integration-documents-003
+        워커 풀이 가득 차면 429 와 Retry-After 헤더 반환
+        """
+        release = threading.Event()
+
+        def blocked_parse(source):
+            release.wait(5)
+            return {"paragraphs": [], "tables": [], "metadata": {}}
+
+        executor = DocumentExecutor(max_workers=1, max_queue=0)
+        monkeypatch.setattr(documents, "document_executor", executor)
+        monkeypatch.setattr(documents, "_parse_docx", blocked_parse)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = asyncio.create_task(client.post(
+                    "/api/documents/upload-template",
+                    files={"file": ("a.docx", f"blocked-{time.time()}".encode(), DOCX_MEDIA_TYPE)}
+                ))
+                await asyncio.sleep(0.05)
+                rejected = await client.post(
+                    "/api/documents/upload-template",
+                    files={"file": ("b.docx", f"rejected-{time.time()}".encode(), DOCX_MEDIA_TYPE)}
+                )
+                release.set()
+                return await first, rejected
+
+        try:
+            first, rejected = asyncio.run(scenario())
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert first.status_code == 200
+        assert rejected.status_code == 429
+        assert rejected.headers["Retry-After"] == "1"
+
+    def test_upload_parsed_without_temp_file(self, client, template_bytes, monkeypatch):
+        """
+        @TEST:api-integration-documents-004
+        업로드는 임시 파일을 만들지 않고 스풀 파일 객체에서 바로 파싱
+        """
+        import tempfile
+
+        def fail_named_temp_file(*args, **kwargs):
+            raise AssertionError("upload must not create a named temp file")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail_named_temp_file)
+        monkeypatch.setattr(documents.parse_cache, "enabled", False)
+        files = {"file": ("fresh.docx", template_bytes, DOCX_MEDIA_TYPE)}
+
+        response = client.post("/api/documents/upload-template", files=files)
+
+        assert response.status_code == 200
+        assert response.json()["structure"]["metadata"]["table_count"] == 1
+
+    def test_upload_size_limit(self, client, monkeypatch):
+        """
+        @TEST:api-integration-documents-005
+        최대 크기를 넘는 업로드는 413 으로 거절
+        """
+        monkeypatch.setattr(documents.settings, "max_upload_bytes", 1024)
+        monkeypatch.setattr(documents.settings, "upload_chunk_bytes", 256)
+
+        response = client.post(
+            "/api/documents/upload-template",
+            files={"file": ("big.docx", b"x" * 4096, DOCX_MEDIA_TYPE)}
+        )
+
+        assert response.status_code == 413
+
+    def test_upload_reference_indexes_chunks(self, client, monkeypatch):
+        """
+        @TEST:api-integration-documents-006
+        참고 문서는 청크로 나누어 검색 인덱스에 등록
+        """
+        index = ReferenceIndex(chunk_tokens=40, overlap_tokens=0)
+        monkeypatch.setattr(documents, "reference_index", index)
+        text = "\n".join(f"{i}번째 문단: 국내 물류 시장은 연평균 8% 성장하고 있습니다." for i in range(20))
+
+        response = client.post(
+            "/api/documents/upload-reference",
+            files={"file": ("market.txt", text.encode("utf-8"), "text/plain")}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["reference_id"] == ReferenceIndex.document_id(text)
+        assert body["chunks"] > 1
+        assert index.stats()["documents"] == 1
+
+    def test_uploaded_documents_retrievable_by_id(self, client, template_bytes):
+        """
+        @TEST:api-integration-documents-007
+        업로드한 양식/참고 문서를 ID 로 다시 조회
+        """
+        template = client.post(
+            "/api/documents/upload-template",
+            files={"file": ("template.docx", template_bytes, DOCX_MEDIA_TYPE)}
+        ).json()
+        reference = client.post(
+            "/api/documents/upload-reference",
+            files={"file": ("market.txt", "국내 물류 시장 동향".encode("utf-8"), "text/plain")}
+        ).json()
+
+        stored_template = client.get(f"/api/documents/templates/{template['template_id']}")
+        stored_reference = client.get(f"/api/documents/references/{reference['reference_id']}")
+
+        assert stored_template.status_code == 200
+        assert stored_template.json()["structure"] == template["structure"]
+        assert stored_reference.json()["content"] == "국내 물류 시장 동향"
+        assert stored_reference.json()["filename"] == "market.txt"
+        assert client.get("/api/documents/references/unknown").status_code == 404
+
+    def test_reupload_with_previous_template_returns_diff(self, client, template_bytes):
+        """
+        @TEST:api-integration-documents-008
+        previous_template_id 와 함께 수정한 양식을 올리면 바뀐 블록과 다시 생성할 섹션을 반환
+
+        Tests: @SPEC:FEAT-001-REQ-008
+        """
+        previous = client.post(
+            "/api/documents/upload-template",
+            files={"file": ("template.docx", template_bytes, DOCX_MEDIA_TYPE)}
+        ).json()
+
+        doc = Document(io.BytesIO(template_bytes))
+        doc.add_paragraph('※ 목표 고객을 작성하세요')
+        stream = io.BytesIO()
+        doc.save(stream)
+        response = client.post(
+            "/api/documents/upload-template",
+            files={"file": ("template.docx", stream.getvalue(), DOCX_MEDIA_TYPE)},
+            data={"previous_template_id": previous["template_id"]}
+        )
+
+        assert response.status_code == 200
+        diff = response.json()["diff"]
+        assert diff["paragraphs"]["added"] == [2]
+        assert diff["paragraphs"]["unchanged"] == 2
+        assert diff["tables"]["unchanged"] == 1
+        assert diff["changed_sections"] == ["market_analysis"]
+
+        missing = client.post(
+            "/api/documents/upload-template",
+            files={"file": ("template.docx", template_bytes, DOCX_MEDIA_TYPE)},
+            data={"previous_template_id": "unknown"}
+        )
+        assert missing.status_code == 404
+
+    def test_upload_reference_sniffs_pdf_and_hwp(self, client, monkeypatch):
+        """
+        @TEST:api-integration-documents-013
+        참고 문서 형식은 파일 이름이 아닌 내용으로 판별 (PDF 페이지 제한, HWP), 판별할 수 없으면 415
+
+        Tests: @SPEC:FEAT-001-REQ-010
+        """
+        monkeypatch.setattr(documents.settings, "reference_max_pages", 2)
+        pdf = build_pdf([["Logistics market grows 8% a year"], ["Second page"], ["Third page"]])
+
+        pdf_response = client.post(
+            "/api/documents/upload-reference",
+            files={"file": ("market.bin", pdf, "application/octet-stream")}
+        )
+        hwp_response = client.post(
+            "/api/documents/upload-reference",
+            files={"file": ("market.hwp", build_hwp([["국내 물류 시장 동향", "연평균 8% 성장"]]), "application/x-hwp")}
+        )
+        unknown = client.post(
+            "/api/documents/upload-reference",
+            files={"file": ("market.txt", b"\x00\x01\x02binary", "text/plain")}
+        )
+
+        assert pdf_response.status_code == 200
+        body = pdf_response.json()
+        assert (body["format"], body["pages"], body["truncated"]) == ("pdf", 2, True)
+        assert body["content"] == "Logistics market grows 8% a year\n\nSecond page"
+        assert body["reference_id"]
+        assert hwp_response.json()["format"] == "hwp"
+        assert hwp_response.json()["content"] == "국내 물류 시장 동향\n연평균 8% 성장"
+        assert unknown.status_code == 415
+
+
+def _docx(*paragraphs) -> bytes:
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+def _ndjson(response) -> list:
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+class TestBatchUpload:
+    """@TEST:api-integration-documents - 일괄 업로드 API 통합 테스트"""
+
+    def test_batch_results_per_file_with_isolated_errors(self, client):
+        """
+        @TEST:api-integration-documents-009
+        여러 파일을 한 요청으로 처리하고 파일별 결과를 NDJSON 으로 반환 (실패한 파일만 error)
+        """
+        response = client.post("/api/documents/upload-batch", data={"kind": "reference"}, files=[
+            ("files", ("market.docx", _docx("배치 시장 동향 A"), DOCX_MEDIA_TYPE)),
+            ("files", ("notes.txt", "배치 참고 메모".encode("utf-8"), "text/plain")),
+            ("files", ("broken.docx", b"PK\x03\x04 truncated", DOCX_MEDIA_TYPE)),
+            ("files", ("slides.pdf", b"%PDF-1.4", "application/pdf")),
+        ])
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = _ndjson(response)
+        results = {line["filename"]: line for line in lines[:-1]}
+        assert lines[-1] == {"done": True, "total": 4, "succeeded": 2, "failed": 2}
+        assert results["market.docx"]["status"] == "ok"
+        assert results["market.docx"]["content"] == "배치 시장 동향 A"
+        assert client.get(f"/api/documents/references/{results['notes.txt']['reference_id']}").status_code == 200
+        assert results["broken.docx"]["status"] == "error"
+        assert results["slides.pdf"]["status"] == "error"
+        assert sorted(line["index"] for line in lines[:-1]) == [0, 1, 2, 3]
+
+    def test_zip_archive_expanded(self, client):
+        """
+        @TEST:api-integration-documents-010
+        zip 보관 파일은 풀어서 파일마다 처리 (디렉터리/macOS 메타데이터 제외), 양식은 template_id 반환
+        """
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("templates/", "")
+            zf.writestr("templates/a.docx", _docx("1. 시장 분석", "배치 양식 A"))
+            zf.writestr("templates/b.docx", _docx("2. 재무 계획", "배치 양식 B"))
+            zf.writestr("__MACOSX/templates/._a.docx", b"meta")
+
+        response = client.post("/api/documents/upload-batch", data={"kind": "template"}, files=[
+            ("files", ("templates.zip", archive.getvalue(), "application/zip")),
+        ])
+
+        lines = _ndjson(response)
+        assert lines[-1]["succeeded"] == 2
+        filenames = sorted(line["filename"] for line in lines[:-1])
+        assert filenames == ["templates.zip/templates/a.docx", "templates.zip/templates/b.docx"]
+        template_id = lines[0]["template_id"]
+        assert client.get(f"/api/documents/templates/{template_id}").status_code == 200
+
+    def test_total_size_and_file_count_limits(self, client, monkeypatch):
+        """
+        @TEST:api-integration-documents-011
+        전체 크기(zip 은 풀린 크기)나 파일 수 제한을 넘으면 처리하기 전에 413
+        """
+        monkeypatch.setattr(documents.settings, "batch_upload_max_bytes", 64 * 1024)
+        bomb = io.BytesIO()
+        with zipfile.ZipFile(bomb, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("huge.txt", b"0" * (1024 * 1024))
+
+        too_big = client.post("/api/documents/upload-batch", files=[
+            ("files", ("a.txt", b"a" * 40 * 1024, "text/plain")),
+            ("files", ("b.txt", b"b" * 40 * 1024, "text/plain")),
+        ])
+        zip_bomb = client.post("/api/documents/upload-batch", files=[
+            ("files", ("bomb.zip", bomb.getvalue(), "application/zip")),
+        ])
+        monkeypatch.setattr(documents.settings, "batch_upload_max_files", 2)
+        too_many = client.post("/api/documents/upload-batch", files=[
+            ("files", (f"{i}.txt", b"x", "text/plain")) for i in range(3)
+        ])
+
+        assert too_big.status_code == 413
+        assert len(bomb.getvalue()) < 64 * 1024
+        assert zip_bomb.status_code == 413
+        assert too_many.status_code == 413
+
+    def test_files_parsed_concurrently_and_streamed_as_completed(self, client, monkeypatch):
+        """
+        @TEST:api-integration-documents-012
+        파일을 워커 풀에서 동시에 파싱하고 먼저 끝난 파일부터 전송
+        """
+        monkeypatch.setattr(documents.settings, "batch_upload_concurrency", 4)
+        monkeypatch.setattr(documents, "document_executor", DocumentExecutor(max_workers=4, max_queue=0))
+        original = documents._parse_docx
+
+        def slow_parse(source):
+            structure = original(source)
+            time.sleep(0.6 if "느린" in structure["paragraphs"][0]["text"] else 0.2)
+            return structure
+
+        monkeypatch.setattr(documents, "_parse_docx", slow_parse)
+        files = [("files", ("slow.docx", _docx(f"느린 문서 {time.time()}"), DOCX_MEDIA_TYPE))] + [
+            ("files", (f"{i}.docx", _docx(f"동시 파싱 {i} {time.time()}"), DOCX_MEDIA_TYPE)) for i in range(3)
+        ]
+
+        started = time.perf_counter()
+        response = client.post("/api/documents/upload-batch", files=files)
+        elapsed = time.perf_counter() - started
+
+        lines = _ndjson(response)
+        assert lines[-1]["succeeded"] == 4
+        assert lines[-2]["filename"] == "slow.docx"
+        assert elapsed < 0.6 + 3 * 0.2
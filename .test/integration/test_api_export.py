@@ -0,0 +1,135 @@
+"""
+@TEST:api-integration-export
+Integration tests for DOCX export endpoint
+
+Related:
+- @SPEC:FEAT-003-REQ-002 - Template-Preserving Export
+- @CODE:api-export-docx
+- @CODE:docx-template-export-service
+"""
+
+import io
+import os
+import pytest
+from docx import Document
+from fastapi.testclient import TestClient
+from app.main import app
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def template_bytes():
+    doc = Document()
+    doc.add_heading('예비창업패키지 사업계획서', 0)
+    doc.add_heading('2. 시장 분석', 1)
+    doc.add_paragraph('※ 시장 규모를 작성하세요')
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = '항목'
+    table.cell(0, 1).text = '금액'
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+class TestExportApi:
+    """@TEST:api-integration-export - DOCX 내보내기 API 통합 테스트"""
+
+    def test_export_with_template_id(self, client, template_bytes):
+        """
+        @TEST:api-integration-export-001
+        업로드한 양식을 복제하여 섹션과 표 셀을 채운 DOCX 반환
+
+        Tests: @SPEC:FEAT-003-REQ-002
+        """
+        files = {"file": ("template.docx", template_bytes, DOCX_MEDIA_TYPE)}
+        template_id = client.post("/api/documents/upload-template", files=files).json()["template_id"]
+
+        response = client.post("/api/export/export-docx", json={
+            "template_id": template_id,
+            "generated_content": {
+                "market_analysis": "국내 시장 규모는 1조원입니다.",
+                "tables": [{"table_index": 0, "rows": [["초기 투자", "5억"]]}]
+            },
+            "business_info": {"title": "테스트 사업"}
+        })
+
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+        doc = Document(io.BytesIO(response.content))
+        texts = [p.text for p in doc.paragraphs]
+        assert texts == ['예비창업패키지 사업계획서', '2. 시장 분석', '국내 시장 규모는 1조원입니다.']
+        assert doc.tables[0].cell(1, 1).text == '5억'
+
+    def test_export_table_start_row_out_of_range(self, client, template_bytes):
+        """
+        @TEST:api-integration-export-005
+        표 행 수를 넘는 start_row 는 400
+        """
+        files = {"file": ("template.docx", template_bytes, DOCX_MEDIA_TYPE)}
+        template_id = client.post("/api/documents/upload-template", files=files).json()["template_id"]
+
+        response = client.post("/api/export/export-docx", json={
+            "template_id": template_id,
+            "generated_content": {"tables": [{"table_index": 0, "start_row": 10, "rows": [["초기 투자", "5억"]]}]},
+            "business_info": {"title": "테스트 사업"}
+        })
+
+        assert response.status_code == 400
+        assert "start_row" in response.json()["detail"]
+
+    def test_export_unknown_template(self, client):
+        """
+        @TEST:api-integration-export-002
+        저장되지 않은 template_id 는 404
+        """
+        response = client.post("/api/export/export-docx", json={
+            "template_id": "0" * 64,
+            "generated_content": {},
+            "business_info": {}
+        })
+
+        assert response.status_code == 404
+
+    def test_export_rejects_traversal_template_id(self, client, tmp_path):
+        """
+        @TEST:api-integration-export-004
+        저장소 밖 파일을 가리키는 template_id 는 파일이 있어도 404
+        """
+        from app.services.document_store import document_store
+
+        victim = tmp_path / "victim_secret.docx"
+        victim.write_bytes(b"PK-secret")
+        os.makedirs(document_store.blob_dir, exist_ok=True)
+        # <blob_dir>/<id[:2]>/<id>.docx 로 조합하면 victim_secret.docx 를 가리키는 ID
+        traversal = os.path.relpath(str(victim)[:-len(".docx")], os.path.dirname(document_store.blob_dir))
+        assert traversal.startswith("..")
+        assert os.path.samefile(os.path.join(document_store.blob_dir, traversal[:2], f"{traversal}.docx"), victim)
+
+        response = client.post("/api/export/export-docx", json={
+            "template_id": traversal,
+            "generated_content": {},
+            "business_info": {}
+        })
+
+        assert response.status_code == 404
+
+    def test_export_without_template(self, client):
+        """
+        @TEST:api-integration-export-003
+        template_id 가 없으면 기존 방식(빈 문서에서 생성)으로 내보내기
+        """
+        response = client.post("/api/export/export-docx", json={
+            "generated_content": {"market_analysis": "시장 분석 내용"},
+            "business_info": {"title": "테스트 사업"}
+        })
+
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+        texts = [p.text for p in Document(io.BytesIO(response.content)).paragraphs]
+        assert texts[:3] == ['테스트 사업', '2. 시장 분석', '시장 분석 내용']
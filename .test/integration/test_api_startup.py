@@ -0,0 +1,105 @@
+"""
+@TEST:api-integration-startup
+Integration tests for startup warmup (lifespan)
+
+Related:
+- @SPEC:FEAT-003-REQ-005 - Startup Warmup
+- @CODE:startup-warmup-service
+- @CODE:docx-generator-service-template
+"""
+
+import asyncio
+import socket
+import statistics
+import time
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
+from app.main import app
+from app.services.ai_generator import AIGenerator
+from app.services.docx_generator import default_template
+from app.services.executor import document_executor
+from app.services.warmup import warm_up
+from fake_openai_server import FakeOpenAIServer
+
+EXPORT_REQUEST = {
+    "generated_content": {
+        "market_analysis": "국내 시장 규모는 1조원입니다.",
+        "financial_plan": "3개년 재무 계획",
+        "financial_tables": [{"headers": ["항목", "1차년도"], "columns": [["매출"], [120000000]]}]
+    },
+    "business_info": {"title": "테스트 사업", "description": "사업 개요"}
+}
+
+
+def _reset():
+    """첫 요청 전 상태로 되돌림 (기본 템플릿 해제, 워커 풀 종료)"""
+    default_template.clear()
+    document_executor.shutdown()
+
+
+def _first_request_ms(client: TestClient) -> float:
+    started = time.perf_counter()
+    response = client.post("/api/export/export-docx", json=EXPORT_REQUEST)
+    elapsed = (time.perf_counter() - started) * 1000
+    assert response.status_code == 200
+    return elapsed
+
+
+class TestStartupWarmup:
+    """@TEST:api-integration-startup - 시작 준비 통합 테스트"""
+
+    def test_lifespan_reports_phase_timings(self):
+        """
+        @TEST:api-integration-startup-001
+        시작 시 기본 템플릿과 워커 풀을 준비하고 단계별 소요 시간을 /health 로 보고
+
+        Tests: @SPEC:FEAT-003-REQ-005
+        """
+        _reset()
+        with TestClient(app) as client:
+            assert default_template.loaded
+            startup = client.get("/health").json()["startup"]
+
+        assert startup["imports_ms"] >= 0
+        phases = startup["warmup"]["phases"]
+        assert {"document_template", "document_roundtrip"} <= set(phases)
+        assert all(phase["ok"] and phase["ms"] >= 0 for phase in phases.values())
+
+    def test_warm_first_request_faster_than_cold(self):
+        """
+        @TEST:api-integration-startup-002
+        시작 준비를 거친 첫 내보내기 요청이 준비 없이 받은 첫 요청보다 빠름 (5회 중앙값)
+        """
+        cold, warm = [], []
+        for _ in range(5):
+            _reset()
+            cold.append(_first_request_ms(TestClient(app)))
+
+            _reset()
+            with TestClient(app) as client:
+                warm.append(_first_request_ms(client))
+
+        print(f"first request: cold {statistics.median(cold):.1f}ms, warm {statistics.median(warm):.1f}ms")
+        assert statistics.median(warm) < statistics.median(cold)
+
+    def test_openai_connection_warmup(self):
+        """
+        @TEST:api-integration-startup-003
+        OpenAI 연결 준비는 응답 상태와 관계없이 연결되면 성공, 연결할 수 없으면 실패로 기록 (시작은 계속)
+        """
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed_port = sock.getsockname()[1]
+
+        async def run(base_url):
+            client = AsyncOpenAI(api_key="test-key", base_url=base_url, max_retries=0)
+            return await warm_up(AIGenerator(client=client), timeout=2.0)
+
+        with FakeOpenAIServer() as server:
+            reachable = asyncio.run(run(server.base_url))
+        unreachable = asyncio.run(run(f"http://127.0.0.1:{closed_port}/v1"))
+
+        assert reachable["phases"]["openai_connection"]["ok"]
+        assert not server.requests  # 생성 요청은 보내지 않음
+        assert not unreachable["phases"]["openai_connection"]["ok"]
+        assert unreachable["phases"]["document_template"]["ok"]
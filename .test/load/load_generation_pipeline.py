@@ -0,0 +1,257 @@
+"""
+@TEST:load-generation-pipeline
+업로드 → 섹션 식별 → 생성 → 내보내기 전체 흐름 부하 테스트 (엔드포인트별 p50/p95/p99 지연 시간, 처리량)
+
+가상 사용자 --users 명이 동시에 전체 흐름을 --iterations 번씩 반복하고, 엔드포인트별 요청 수,
+오류 수, 지연 시간 분위수와 초당 처리량을 출력합니다. 생성 단계는 전체 생성(--generate full-plan)
+또는 섹션별 SSE 스트림 동시 요청(--generate stream, 첫 토큰 시간도 기록) 중에서 고릅니다.
+
+--url 을 주지 않으면 가짜 LLM 백엔드(LLM_BACKEND=fake)로 앱을 이 프로세스 안의 uvicorn 서버로
+실행하므로 API 키 없이 노트북이나 CI 에서 바로 실행할 수 있습니다. 가짜 백엔드의 지연 분포,
+출력 속도, 오류 주입은 --latency, --tokens-per-second, --error-rate, --disconnect-rate 로 정합니다.
+
+Related:
+- @SPEC:FEAT-002-REQ-015 - Pluggable LLM Backend
+- @CODE:fake-llm-backend
+
+Usage:
+    python .test/load/load_generation_pipeline.py --users 8 --iterations 3
+    python .test/load/load_generation_pipeline.py --generate stream --latency lognormal:800:0.6 --error-rate 0.05
+    cd backend && LLM_BACKEND=fake uvicorn app.main:app &
+    python .test/load/load_generation_pipeline.py --url http://127.0.0.1:8000 --json result.json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import math
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from docx import Document
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend")
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+SECTIONS = ("market_analysis", "competitive_analysis", "financial_plan")
+STREAM_PATHS = {
+    "market_analysis": "/api/generation/market-analysis/stream",
+    "competitive_analysis": "/api/generation/competitive-analysis/stream",
+    "financial_plan": "/api/generation/financial-plan/stream",
+}
+PIPELINE = "pipeline"
+
+
+def build_template(salt: str) -> bytes:
+    """섹션 제목과 재무 표가 있는 사업계획서 양식 (salt 로 파싱 캐시 적중을 피함)"""
+    doc = Document()
+    doc.add_heading(f"사업계획서 {salt}", 0)
+    for heading, guide in (
+        ("1. 사업 개요", "※ 사업의 목적과 필요성을 작성"),
+        ("2. 시장 분석", "※ 시장 규모와 성장률, 타겟 고객을 작성"),
+        ("3. 경쟁사 분석", "※ 주요 경쟁사와 차별화 전략을 작성"),
+        ("4. 재무 계획", "※ 3개년 매출 및 비용 계획을 작성"),
+    ):
+        doc.add_heading(heading, 1)
+        doc.add_paragraph(guide)
+    table = doc.add_table(rows=4, cols=4)
+    for col_idx, label in enumerate(("구분", "1차년도", "2차년도", "3차년도")):
+        table.rows[0].cells[col_idx].text = label
+    for row_idx, label in enumerate(("매출", "비용", "합계"), start=1):
+        table.rows[row_idx].cells[0].text = label
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """nearest-rank 분위수"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class Recorder:
+    """엔드포인트별 (지연 시간, 성공 여부) 기록"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, endpoint: str, seconds: float, ok: bool):
+        self.samples.setdefault(endpoint, []).append(seconds)
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    async def timed(self, endpoint: str, request) -> Optional[httpx.Response]:
+        """요청 하나를 보내고 지연 시간 기록 (연결 오류도 실패로 기록)"""
+        started = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.add(endpoint, time.perf_counter() - started, False)
+            return None
+        self.add(endpoint, time.perf_counter() - started, response.is_success)
+        return response if response.is_success else None
+
+    def report(self, wall_seconds: float) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for endpoint, samples in self.samples.items():
+            result[endpoint] = {
+                "requests": len(samples),
+                "errors": self.errors.get(endpoint, 0),
+                "p50_ms": round(percentile(samples, 0.50) * 1000, 1),
+                "p95_ms": round(percentile(samples, 0.95) * 1000, 1),
+                "p99_ms": round(percentile(samples, 0.99) * 1000, 1),
+                "max_ms": round(max(samples) * 1000, 1),
+                "throughput_rps": round(len(samples) / wall_seconds, 2)
+            }
+        return result
+
+
+async def stream_section(client: httpx.AsyncClient, recorder: Recorder, section: str, body: Dict[str, Any]):
+    """SSE 스트림 하나 (첫 token 이벤트까지와 done 까지 시간 기록), 생성 텍스트 반환"""
+    endpoint = f"POST {STREAM_PATHS[section]}"
+    started = time.perf_counter()
+    parts, done = [], False
+    try:
+        async with client.stream("POST", f"{STREAM_PATHS[section]}?cache=bypass", json=body) as response:
+            event = None
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                    if event == "token" and not parts:
+                        recorder.add(f"{endpoint} (ttft)", time.perf_counter() - started, True)
+                elif line.startswith("data: ") and event == "token":
+                    parts.append(json.loads(line[len("data: "):])["text"])
+                elif event == "done":
+                    done = True
+    except httpx.HTTPError:
+        pass
+    recorder.add(endpoint, time.perf_counter() - started, done)
+    return "".join(parts) if done else None
+
+
+async def run_pipeline(client: httpx.AsyncClient, recorder: Recorder, args, salt: str) -> bool:
+    """양식 업로드 → 섹션 식별 → 생성 → DOCX 내보내기 한 번"""
+    started = time.perf_counter()
+    template = build_template(salt if args.unique_templates else "load")
+    uploaded = await recorder.timed("POST /api/documents/upload-template", client.post(
+        "/api/documents/upload-template", files={"file": (f"load-{salt}.docx", template, DOCX_MEDIA_TYPE)}
+    ))
+    if uploaded is None:
+        recorder.add(PIPELINE, time.perf_counter() - started, False)
+        return False
+    uploaded = uploaded.json()
+
+    identified = await recorder.timed("POST /api/analysis/identify-sections", client.post(
+        "/api/analysis/identify-sections", json={"paragraphs": uploaded["structure"]["paragraphs"]}
+    ))
+
+    body = {"title": f"AI 물류 플랫폼 {salt}", "description": "중소 화주 대상 배차 최적화", "requirements": "3개년 계획"}
+    contents: Dict[str, Optional[str]] = {}
+    if args.generate == "stream":
+        texts = await asyncio.gather(*[stream_section(client, recorder, section, body) for section in SECTIONS])
+        contents = dict(zip(SECTIONS, texts))
+    else:
+        generated = await recorder.timed(
+            "POST /api/generation/full-plan", client.post("/api/generation/full-plan?cache=bypass", json=body)
+        )
+        if generated is not None:
+            contents = {s["section_name"]: s["content"] for s in generated.json()["sections"] if s["status"] == "ok"}
+
+    exported = await recorder.timed("POST /api/export/export-docx", client.post("/api/export/export-docx", json={
+        "template_id": uploaded["template_id"],
+        "generated_content": {section: text for section, text in contents.items() if text},
+        "business_info": {"title": body["title"]}
+    }))
+
+    ok = identified is not None and exported is not None and all(contents.get(s) for s in SECTIONS)
+    recorder.add(PIPELINE, time.perf_counter() - started, ok)
+    return ok
+
+
+async def virtual_user(client: httpx.AsyncClient, recorder: Recorder, args, user: int):
+    for iteration in range(args.iterations):
+        await run_pipeline(client, recorder, args, f"{user}-{iteration}")
+
+
+def start_local_server(args) -> str:
+    """가짜 LLM 백엔드 설정으로 앱을 이 프로세스 안의 uvicorn 서버로 실행"""
+    os.environ.update({
+        "LLM_BACKEND": "fake",
+        "FAKE_LLM_LATENCY": args.latency,
+        "FAKE_LLM_TOKENS_PER_SECOND": str(args.tokens_per_second),
+        "FAKE_LLM_ERROR_RATE": str(args.error_rate),
+        "FAKE_LLM_DISCONNECT_RATE": str(args.disconnect_rate),
+        "FAKE_LLM_SEED": str(args.seed),
+        "STARTUP_WARMUP_OPENAI": "false",
+    })
+    os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="modu-ai-load-"))
+    sys.path.insert(0, BACKEND_DIR)
+
+    import uvicorn
+    from app.main import app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def print_report(report: Dict[str, Dict[str, Any]], wall_seconds: float):
+    print(f"\n전체 {wall_seconds:.2f}s")
+    print(f"{'endpoint':<56} {'n':>5} {'err':>4} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'req/s':>7}")
+    for endpoint, row in sorted(report.items(), key=lambda item: (item[0] == PIPELINE, item[0])):
+        print(
+            f"{endpoint:<56} {row['requests']:>5} {row['errors']:>4} {row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms "
+            f"{row['p99_ms']:>7.1f}ms {row['max_ms']:>7.1f}ms {row['throughput_rps']:>7.2f}"
+        )
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--url", default=None, help="실행 중인 서버 (없으면 가짜 백엔드로 직접 실행)")
+    arg_parser.add_argument("--users", type=int, default=8)
+    arg_parser.add_argument("--iterations", type=int, default=3)
+    arg_parser.add_argument("--generate", choices=("full-plan", "stream"), default="full-plan")
+    arg_parser.add_argument("--unique-templates", action="store_true", help="요청마다 다른 양식 (파싱 캐시 미적중)")
+    arg_parser.add_argument("--latency", default="lognormal:400:0.5")
+    arg_parser.add_argument("--tokens-per-second", type=float, default=200.0)
+    arg_parser.add_argument("--error-rate", type=float, default=0.0)
+    arg_parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = arg_parser.parse_args()
+
+    url = args.url or start_local_server(args)
+    print(f"{url}: 사용자 {args.users}명 x {args.iterations}회, 생성 방식 {args.generate}")
+
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.users * len(SECTIONS))
+    async with httpx.AsyncClient(base_url=url, timeout=300, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[virtual_user(client, recorder, args, user) for user in range(args.users)])
+        wall_seconds = time.perf_counter() - started
+        generation_stats = (await client.get("/api/generation/stats")).json()
+
+    report = recorder.report(wall_seconds)
+    print_report(report, wall_seconds)
+    print(f"\n생성 백엔드: {generation_stats.get('backend')}, 전송 통계: {generation_stats.get('transport')}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "wall_seconds": wall_seconds, "endpoints": report}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""
+@TEST:load-health-during-parse
+대형 양식 파싱이 진행되는 동안 /health 응답 지연 측정
+
+실행 중인 서버에 대형 DOCX 업로드를 동시에 보내면서 /health 를 주기적으로 호출하고,
+부하 전(baseline)과 부하 중 지연 시간 분포를 비교합니다. 파싱이 이벤트 루프를
+막지 않으면 두 분포가 거의 같아야 합니다.
+
+Related:
+- @CODE:document-executor-service
+
+Usage:
+    cd backend && uvicorn app.main:app &
+    python .test/load/load_health_during_parse.py --url http://127.0.0.1:8000 --uploads 8
+"""
+
+import argparse
+import asyncio
+import io
+import statistics
+import time
+
+import httpx
+from docx import Document
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def build_template(table_count: int, salt: int) -> bytes:
+    """표가 많은 대형 양식 생성 (salt 로 파싱 캐시 적중을 피함)"""
+    doc = Document()
+    doc.add_heading(f'부하 테스트 양식 {salt}', 0)
+    for table_idx in range(table_count):
+        doc.add_paragraph(f'{table_idx + 1}. 재무 계획 및 시장 분석 항목')
+        table = doc.add_table(rows=10, cols=6)
+        for row_idx, row in enumerate(table.rows):
+            for col_idx, cell in enumerate(row.cells):
+                cell.text = f'{row_idx}-{col_idx}'
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+def summarize(label: str, samples):
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{label:<10} n={len(samples):<4} p50={statistics.median(samples) * 1000:7.1f}ms "
+          f"p95={p95 * 1000:7.1f}ms max={max(samples) * 1000:7.1f}ms")
+
+
+async def sample_health(client: httpx.AsyncClient, stop: asyncio.Event, interval: float):
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--url", default="http://127.0.0.1:8000")
+    arg_parser.add_argument("--uploads", type=int, default=8)
+    arg_parser.add_argument("--tables", type=int, default=80)
+    arg_parser.add_argument("--interval", type=float, default=0.02)
+    args = arg_parser.parse_args()
+
+    print(f"양식 {args.uploads}개 생성 중 (표 {args.tables}개씩)")
+    templates = [build_template(args.tables, salt) for salt in range(args.uploads)]
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=300) as client:
+        stop = asyncio.Event()
+        baseline_task = asyncio.create_task(sample_health(client, stop, args.interval))
+        await asyncio.sleep(2)
+        stop.set()
+        baseline = await baseline_task
+
+        stop = asyncio.Event()
+        load_task = asyncio.create_task(sample_health(client, stop, args.interval))
+        started = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post(
+                "/api/documents/upload-template",
+                files={"file": (f"load-{idx}.docx", content, DOCX_MEDIA_TYPE)}
+            )
+            for idx, content in enumerate(templates)
+        ])
+        elapsed = time.perf_counter() - started
+        stop.set()
+        under_load = await load_task
+
+    status_counts = {}
+    for response in responses:
+        status_counts[response.status_code] = status_counts.get(response.status_code, 0) + 1
+
+    print(f"\n업로드 {len(responses)}건 / {elapsed:.2f}s, 상태 코드: {status_counts}")
+    summarize("baseline", baseline)
+    summarize("load", under_load)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
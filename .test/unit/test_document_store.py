@@ -0,0 +1,137 @@
+"""
+@TEST:document-store-unit
+Unit tests for the local document store
+
+Related:
+- @CODE:document-store-service
+"""
+
+import io
+import os
+import pytest
+from app.services.document_store import DocumentStore, DOCUMENT_KIND_REFERENCE, DOCUMENT_KIND_TEMPLATE
+
+STRUCTURE = {"paragraphs": [{"index": 0, "text": "1. 시장 분석"}], "tables": [], "metadata": {"table_count": 0}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DocumentStore(str(tmp_path / "documents.sqlite3"), str(tmp_path / "blobs"), hot_entries=2)
+    yield store
+    store.close()
+
+
+class TestDocumentStore:
+    """@TEST:document-store-unit - 문서 저장소 단위 테스트"""
+
+    def test_roundtrip_and_persistence(self, tmp_path, store):
+        """
+        @TEST:document-store-unit-001
+        저장한 양식/참고 문서는 새 인스턴스(재시작)에서도 ID 로 조회
+        """
+        store.put_template("t" * 64, "template.docx", STRUCTURE)
+        store.put_reference("r" * 64, "market.txt", "국내 물류 시장은 성장 중입니다.")
+
+        reopened = DocumentStore(str(tmp_path / "documents.sqlite3"), str(tmp_path / "blobs"))
+        assert reopened.get_template("t" * 64) == STRUCTURE
+        assert reopened.get_reference_texts(["r" * 64]) == {"r" * 64: "국내 물류 시장은 성장 중입니다."}
+        assert reopened.metadata("r" * 64)["filename"] == "market.txt"
+        assert reopened.stats()["disk_reads"] == 2
+        reopened.close()
+
+    def test_batched_lookup_skips_missing_and_wrong_kind(self, store):
+        """
+        @TEST:document-store-unit-002
+        일괄 조회는 없는 ID 와 다른 종류의 문서를 제외
+        """
+        store.put_reference("a" * 64, "a.txt", "A")
+        store.put_reference("b" * 64, "b.txt", "B")
+        store.put_template("c" * 64, "c.docx", STRUCTURE)
+
+        found = store.get_many(["a" * 64, "missing", "b" * 64, "c" * 64], DOCUMENT_KIND_REFERENCE)
+
+        assert found == {"a" * 64: "A", "b" * 64: "B"}
+        assert store.stats()["misses"] == 2
+
+    def test_hot_cache_avoids_disk(self, store, monkeypatch):
+        """
+        @TEST:document-store-unit-003
+        최근 문서는 메모리에서 반환하며 디스크를 읽지 않음
+        """
+        store.put_reference("a" * 64, "a.txt", "A")
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("hot document must not be read from disk")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        assert store.get_many(["a" * 64], DOCUMENT_KIND_REFERENCE) == {"a" * 64: "A"}
+        assert store.stats()["hot_hits"] == 1
+
+    def test_reupload_does_not_rewrite_blob(self, store):
+        """
+        @TEST:document-store-unit-004
+        같은 ID 를 다시 저장하면 blob 을 다시 쓰지 않음
+        """
+        store.put_template("t" * 64, "template.docx", STRUCTURE)
+        path = os.path.join(store.blob_dir, "tt", "t" * 64 + ".json")
+        mtime = os.stat(path).st_mtime_ns
+
+        store.put_template("t" * 64, "renamed.docx", STRUCTURE)
+
+        assert os.stat(path).st_mtime_ns == mtime
+        assert store.metadata("t" * 64)["filename"] == "renamed.docx"
+        assert store.stats()["writes"] == 1
+
+    def test_delete(self, store):
+        """
+        @TEST:document-store-unit-005
+        삭제 후 조회되지 않음
+        """
+        store.put_template("t" * 64, "template.docx", STRUCTURE)
+
+        assert store.delete("t" * 64) is True
+        assert store.get_many(["t" * 64], DOCUMENT_KIND_TEMPLATE) == {}
+        assert store.delete("t" * 64) is False
+
+    def test_template_source(self, store):
+        """
+        @TEST:document-store-unit-006
+        양식 원본 DOCX 를 보관하고 삭제 시 함께 제거
+        """
+        template_id = "7e" * 32
+        assert store.template_source_path(template_id) is None
+        store.put_template(template_id, "template.docx", STRUCTURE)
+        store.put_template_source(template_id, io.BytesIO(b"PK-original"))
+        store.put_template_source(template_id, io.BytesIO(b"PK-ignored"))
+
+        path = store.template_source_path(template_id)
+        with open(path, "rb") as f:
+            assert f.read() == b"PK-original"
+
+        store.delete(template_id)
+        assert store.template_source_path(template_id) is None
+
+    def test_template_source_rejects_foreign_ids(self, store, tmp_path):
+        """
+        @TEST:document-store-unit-007
+        발급 형식(SHA-256 hex)이 아니거나 양식 메타데이터가 없는 ID 는 파일이 있어도 경로를 반환하지 않음
+        """
+        victim = tmp_path / "victim_secret.docx"
+        victim.write_bytes(b"PK-secret")
+        os.makedirs(store.blob_dir)
+        # <blob_dir>/<id[:2]>/<id>.docx 로 조합하면 victim_secret.docx 를 가리키는 ID
+        traversal = f"../{tmp_path.name}/victim_secret"
+        assert os.path.samefile(os.path.join(store.blob_dir, traversal[:2], f"{traversal}.docx"), victim)
+
+        assert store.template_source_path(traversal) is None
+        assert store.template_source_path("../" * 8 + "etc/passwd") is None
+        assert store.template_source_path("A" * 64) is None
+        assert store.template_source_path(None) is None
+        with pytest.raises(ValueError):
+            store.put_template_source(traversal, io.BytesIO(b"PK"))
+
+        orphan_id = "ab" * 32
+        store.put_template_source(orphan_id, io.BytesIO(b"PK-orphan"))
+        assert store.template_source_path(orphan_id) is None
+        store.put_reference(orphan_id, "ref.txt", "참고")
+        assert store.template_source_path(orphan_id) is None
@@ -0,0 +1,145 @@
+"""
+@TEST:docx-diff-unit
+Unit tests for Incremental Template Diff
+
+Related:
+- @SPEC:FEAT-001-REQ-008 - Incremental Template Diff
+- @CODE:docx-diff-service
+"""
+
+import io
+from docx import Document
+from app.services import docx_diff
+from app.services.docx_diff import carry_over_sections, diff_structures, ensure_hashes
+from app.services.docx_parser import DocxParser, PARSE_MODE_STREAM
+
+
+def build_template(market_text="※ 목표 시장 규모를 작성하세요", extra_intro=False, revenue="1억", drop_notes=False):
+    doc = Document()
+    doc.add_heading('사업계획서 양식', 0)
+    if extra_intro:
+        doc.add_paragraph('작성 요령: 각 항목을 빠짐없이 작성하세요')
+    doc.add_paragraph('1. 사업 개요')
+    doc.add_paragraph('※ 사업 아이템을 요약하세요')
+    doc.add_paragraph('2. 시장 분석')
+    doc.add_paragraph(market_text)
+    doc.add_paragraph('3. 재무 계획')
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = '항목'
+    table.cell(0, 1).text = '금액'
+    table.cell(1, 0).text = '매출'
+    table.cell(1, 1).text = revenue
+    if not drop_notes:
+        doc.add_paragraph('※ 자금 조달 계획을 함께 작성하세요')
+    stream = io.BytesIO()
+    doc.save(stream)
+    return DocxParser.parse_document(stream.getvalue())
+
+
+class TestBlockHashes:
+    """@TEST:docx-diff-unit - 블록 해시"""
+
+    def test_hashes_depend_on_content_not_position(self):
+        """
+        @TEST:docx-diff-unit-001
+        앞에 문단을 넣어도 나머지 블록 해시는 그대로, 두 파싱 모드의 해시가 같음
+
+        Tests: @SPEC:FEAT-001-REQ-008
+        """
+        original = build_template()
+        shifted = build_template(extra_intro=True)
+
+        original_hashes = [paragraph["hash"] for paragraph in original["paragraphs"]]
+        shifted_hashes = [paragraph["hash"] for paragraph in shifted["paragraphs"]]
+        assert shifted_hashes[:1] + shifted_hashes[2:] == original_hashes
+        assert shifted["tables"][0]["hash"] == original["tables"][0]["hash"]
+        assert len(set(original_hashes)) == len(original_hashes)
+
+        stream = io.BytesIO()
+        doc = Document()
+        doc.add_paragraph('2. 시장 분석')
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = '항목'
+        doc.save(stream)
+        docx_mode = DocxParser.parse_document(stream.getvalue())
+        stream_mode = DocxParser.parse_document(stream.getvalue(), mode=PARSE_MODE_STREAM)
+        assert docx_mode["paragraphs"][0]["hash"] == stream_mode["paragraphs"][0]["hash"]
+        assert docx_mode["tables"][0]["hash"] == stream_mode["tables"][0]["hash"]
+
+    def test_ensure_hashes_does_not_mutate(self):
+        """
+        @TEST:docx-diff-unit-002
+        해시 없이 저장된 구조는 복사본에 해시를 채우고 원본은 그대로 둠
+        """
+        structure = build_template()
+        legacy = {
+            **structure,
+            "paragraphs": [{k: v for k, v in p.items() if k != "hash"} for p in structure["paragraphs"]],
+            "tables": [{k: v for k, v in t.items() if k != "hash"} for t in structure["tables"]]
+        }
+
+        filled = ensure_hashes(legacy)
+
+        assert filled["paragraphs"] == structure["paragraphs"]
+        assert filled["tables"] == structure["tables"]
+        assert "hash" not in legacy["paragraphs"][0]
+        assert ensure_hashes(structure) is structure
+
+
+class TestDiffStructures:
+    """@TEST:docx-diff-unit - 구조 비교"""
+
+    def test_unchanged_reupload(self):
+        """
+        @TEST:docx-diff-unit-003
+        같은 양식을 다시 올리면 바뀐 블록과 다시 생성할 섹션이 없음
+        """
+        diff = diff_structures(build_template(), build_template())
+
+        assert diff["unchanged"]
+        assert diff["changed_sections"] == []
+        assert diff["paragraphs"]["unchanged"] == 7
+        assert diff["tables"]["unchanged"] == 1
+
+    def test_changed_added_removed_blocks(self):
+        """
+        @TEST:docx-diff-unit-004
+        바뀐 문단/표와 추가·삭제된 문단을 위치와 함께 보고하고, 해당 섹션만 다시 생성 대상
+        """
+        old = build_template()
+        new = build_template(market_text="※ 목표 시장과 고객을 작성하세요", extra_intro=True, revenue="2억", drop_notes=True)
+
+        diff = diff_structures(old, new)
+
+        assert not diff["unchanged"]
+        assert diff["paragraphs"]["added"] == [1]
+        assert diff["paragraphs"]["changed"] == [{"old": 4, "new": 5}]
+        assert diff["paragraphs"]["removed"] == [6]
+        assert diff["paragraphs"]["unchanged"] == 5
+        assert diff["tables"]["changed"] == [{"old": 0, "new": 0}]
+        # 새 안내 문단은 첫 섹션 제목 앞(general)이므로 재생성 대상이 아님
+        assert diff["changed_sections"] == ["financial_plan", "market_analysis"]
+
+
+class TestCarryOverSections:
+    """@TEST:docx-diff-unit - 섹션 분류 재사용"""
+
+    def test_only_new_hashes_are_classified(self, monkeypatch):
+        """
+        @TEST:docx-diff-unit-005
+        이전 결과에 있는 해시의 문단은 분류기를 거치지 않음
+        """
+        paragraphs = build_template()["paragraphs"]
+        previous = {paragraph["hash"]: "general" for paragraph in paragraphs[:-1]}
+        classified = []
+        original = docx_diff.section_classifier.classify_many
+
+        def recording(texts):
+            classified.extend(texts)
+            return original(texts)
+
+        monkeypatch.setattr(docx_diff.section_classifier, "classify_many", recording)
+        section_types = carry_over_sections(paragraphs, previous)
+
+        assert classified == [paragraphs[-1]["text"]]
+        assert section_types[:-1] == ["general"] * (len(paragraphs) - 1)
+        assert section_types[-1] == "financial_plan"
@@ -9,9 +9,10 @@ Related:
 
 import pytest
 import tempfile
+import io
 import os
 from docx import Document
-from backend.app.services.docx_parser import DocxParser
+from backend.app.services.docx_parser import DocxParser, PARSE_MODE_DOCX, PARSE_MODE_STREAM
 
 
 class TestDocxParser:
@@ -183,6 +184,28 @@ class TestDocxParser:
         finally:
             os.unlink(temp_file.name)
 
+    
+    def test_parse_in_memory_sources(self, sample_docx):
+        """
+        @TEST:docx-parser-unit-007
+        바이트/파일 객체/스풀 파일에서 임시 파일 없이 파싱
+        
+        Tests: @SPEC:FEAT-001-REQ-001
+        """
+        parser = DocxParser()
+        expected = parser.parse_document(sample_docx)
+        
+        with open(sample_docx, 'rb') as f:
+            content = f.read()
+        
+        spooled = tempfile.SpooledTemporaryFile(max_size=len(content) * 2)
+        spooled.write(content)
+        
+        for mode in (PARSE_MODE_DOCX, PARSE_MODE_STREAM):
+            assert parser.parse_document(content, mode=mode) == expected
+            assert parser.parse_document(io.BytesIO(content), mode=mode) == expected
+            assert parser.parse_document(spooled, mode=mode) == expected
+
 
 # Quality Gates (TRUST-5)
 # ✅ Test-first: TDD approach
@@ -0,0 +1,86 @@
+"""
+@TEST:docx-stream-parser-unit
+Unit tests for Streaming DOCX Parser
+
+Related:
+- @SPEC:FEAT-001-REQ-005 - Streaming Parse Mode
+- @CODE:docx-stream-parser-service
+"""
+
+import pytest
+import tempfile
+import os
+from docx import Document
+from app.services.docx_parser import DocxParser, PARSE_MODE_STREAM
+
+
+class TestStreamingDocxParser:
+    """@TEST:docx-stream-parser-unit - 스트리밍 파서 단위 테스트"""
+
+    @pytest.fixture
+    def sample_docx(self):
+        """python-docx 파서와 비교할 테스트용 DOCX 파일 생성"""
+        doc = Document()
+        doc.core_properties.title = '스트리밍 테스트'
+        doc.core_properties.author = '작성자'
+        doc.add_heading('테스트 사업계획서', 0)
+        doc.add_paragraph('')
+        doc.add_paragraph('이것은 사업 개요입니다.')
+        doc.add_heading('1. 시장 분석', 1)
+        para = doc.add_paragraph('탭\t과 줄바꿈')
+        para.add_run().add_break()
+        para.add_run('이후 텍스트')
+
+        table = doc.add_table(rows=3, cols=3)
+        table.rows[0].cells[0].text = '항목'
+        table.rows[0].cells[1].text = '2024'
+        table.rows[0].cells[2].text = '2025'
+        table.rows[1].cells[0].text = '매출'
+        table.rows[1].cells[1].text = '100억'
+        table.rows[1].cells[2].text = '150억'
+        table.cell(2, 0).merge(table.cell(2, 1)).text = '병합'
+
+        doc.add_paragraph('표 이후 문단', style='List Bullet')
+
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
+        doc.save(temp_file.name)
+        temp_file.close()
+
+        yield temp_file.name
+
+        os.unlink(temp_file.name)
+
+    def test_stream_mode_matches_docx_mode(self, sample_docx):
+        """
+        @TEST:docx-stream-parser-unit-001
+        스트리밍 모드 결과가 python-docx 모드와 동일한지 검증
+
+        Tests: @SPEC:FEAT-001-REQ-005
+        """
+        parser = DocxParser()
+
+        expected = parser.parse_document(sample_docx)
+        result = parser.parse_document(sample_docx, mode=PARSE_MODE_STREAM)
+
+        assert result == expected
+        assert result["metadata"]["core_properties"]["title"] == '스트리밍 테스트'
+
+    def test_invalid_mode(self, sample_docx):
+        """
+        @TEST:docx-stream-parser-unit-002
+        지원되지 않는 파싱 모드 예외 처리 테스트
+        """
+        parser = DocxParser()
+
+        with pytest.raises(ValueError):
+            parser.parse_document(sample_docx, mode="unknown")
+
+    def test_stream_file_not_found(self):
+        """
+        @TEST:docx-stream-parser-unit-003
+        파일 없음 예외 처리 테스트
+        """
+        parser = DocxParser()
+
+        with pytest.raises(Exception):
+            parser.parse_document("/nonexistent/file.docx", mode=PARSE_MODE_STREAM)
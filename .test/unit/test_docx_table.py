@@ -0,0 +1,165 @@
+"""
+@TEST:docx-table-unit
+Unit tests for merged-cell-aware table analysis
+
+Related:
+- @SPEC:FEAT-001-REQ-006 - Merged Cell Analysis
+- @CODE:docx-table-service
+"""
+
+import pytest
+from docx import Document
+from docx.oxml import OxmlElement
+import app.services.docx_table as docx_table
+from app.services.docx_table import DocxTableParser
+
+
+class TestDocxTableParser:
+    """@TEST:docx-table-unit - 병합 셀 표 분석 단위 테스트"""
+
+    @pytest.fixture
+    def multi_header_table(self):
+        """2단 헤더(구분 세로 병합 + 매출/비용 가로 병합)를 가진 재무 표"""
+        doc = Document()
+        table = doc.add_table(rows=4, cols=5)
+
+        table.cell(0, 0).merge(table.cell(1, 0)).text = '구분'
+        table.cell(0, 1).merge(table.cell(0, 2)).text = '매출'
+        table.cell(0, 3).merge(table.cell(0, 4)).text = '비용'
+        for col, label in enumerate(['2024', '2025', '2024', '2025'], start=1):
+            table.cell(1, col).text = label
+
+        table.cell(2, 0).text = '국내'
+        table.cell(3, 0).text = '해외'
+        for row in (2, 3):
+            for col in range(1, 5):
+                table.cell(row, col).text = f'{row * col}억'
+
+        return table
+
+    def test_multi_row_header_tree(self, multi_header_table):
+        """
+        @TEST:docx-table-unit-001
+        다단 헤더가 헤더 트리와 열 경로로 변환되는지 검증
+
+        Tests: @SPEC:FEAT-001-REQ-006
+        """
+        result = DocxTableParser.parse_table(multi_header_table._tbl, 0)
+
+        assert result["header_rows"] == 2
+        assert result["headers"] == ['구분', '매출 > 2024', '매출 > 2025', '비용 > 2024', '비용 > 2025']
+        assert result["row_count"] == 2
+        assert result["column_count"] == 5
+
+        roots = result["header_tree"]
+        assert [node["label"] for node in roots] == ['구분', '매출', '비용']
+        assert roots[0]["rowspan"] == 2
+        assert roots[1]["colspan"] == 2
+        assert [child["label"] for child in roots[1]["children"]] == ['2024', '2025']
+
+        first_row = result["rows"][0]
+        assert first_row["row_index"] == 2
+        assert first_row["cells"][1] == {
+            "column": '매출 > 2024', "value": '2억', "col_index": 1, "colspan": 1, "rowspan": 1
+        }
+
+    def test_spanned_cells_emitted_once(self):
+        """
+        @TEST:docx-table-unit-002
+        병합 셀은 한 번만 출력되고 rowspan/colspan 이 기록되는지 검증
+        """
+        doc = Document()
+        table = doc.add_table(rows=4, cols=3)
+        for col, label in enumerate(['분류', '항목', '금액']):
+            table.cell(0, col).text = label
+        table.cell(1, 0).merge(table.cell(3, 0)).text = '인건비'
+        table.cell(1, 1).merge(table.cell(1, 2)).text = '해당 없음'
+        table.cell(2, 1).text = '연구원'
+        table.cell(2, 2).text = '1,000'
+
+        result = DocxTableParser.parse_table(table._tbl, 3)
+
+        assert result["table_index"] == 3
+        assert result["headers"] == ['분류', '항목', '금액']
+
+        rows = result["rows"]
+        assert rows[0]["cells"][0]["value"] == '인건비'
+        assert rows[0]["cells"][0]["rowspan"] == 3
+        assert rows[0]["cells"][1]["colspan"] == 2
+        assert len(rows[0]["cells"]) == 2
+        assert [cell["col_index"] for cell in rows[1]["cells"]] == [1, 2]
+        assert all(cell["value"] != '인건비' for row in rows[1:] for cell in row["cells"])
+
+    def test_cell_text_extracted_once_per_cell(self, multi_header_table, monkeypatch):
+        """
+        @TEST:docx-table-unit-003
+        병합 셀 텍스트를 중복 추출하지 않는지 검증
+        """
+        calls = []
+        original = docx_table.cell_text
+
+        def counting_cell_text(tc):
+            calls.append(tc)
+            return original(tc)
+
+        monkeypatch.setattr(docx_table, "cell_text", counting_cell_text)
+
+        DocxTableParser.parse_table(multi_header_table._tbl, 0)
+
+        # 20개 그리드 위치 중 실제 셀은 17개 (가로 병합 2개, 세로 병합 1개 제외)
+        assert len(calls) == 17
+        assert len({id(tc) for tc in calls}) == 17
+
+    def test_repeat_header_rows(self):
+        """
+        @TEST:docx-table-unit-004
+        머리글 행 반복(w:tblHeader) 지정 행을 헤더로 인식
+        """
+        doc = Document()
+        table = doc.add_table(rows=3, cols=2)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = '사업비 집행 계획'
+        table.cell(1, 0).text = '항목'
+        table.cell(1, 1).text = '금액'
+        table.cell(2, 0).text = '장비'
+        table.cell(2, 1).text = '500'
+
+        for row in table.rows[:2]:
+            row._tr.get_or_add_trPr().append(OxmlElement('w:tblHeader'))
+
+        result = DocxTableParser.parse_table(table._tbl, 0)
+
+        assert result["header_rows"] == 2
+        assert result["headers"] == ['사업비 집행 계획 > 항목', '사업비 집행 계획 > 금액']
+        assert result["rows"][0]["cells"][1]["value"] == '500'
+
+    def test_numeric_row_is_not_sub_header(self):
+        """
+        @TEST:docx-table-unit-005
+        가로 병합 헤더 아래의 숫자 행은 하위 헤더로 보지 않음
+        """
+        doc = Document()
+        table = doc.add_table(rows=3, cols=2)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = '매출'
+        table.cell(1, 0).text = '100'
+        table.cell(1, 1).text = '200'
+
+        result = DocxTableParser.parse_table(table._tbl, 0)
+
+        assert result["header_rows"] == 1
+        assert result["headers"] == ['매출', '매출']
+        assert result["row_count"] == 2
+
+    def test_empty_table(self):
+        """
+        @TEST:docx-table-unit-006
+        빈 표 처리
+        """
+        doc = Document()
+        table = doc.add_table(rows=0, cols=0)
+
+        result = DocxTableParser.parse_table(table._tbl, 0)
+
+        assert result["headers"] == []
+        assert result["header_tree"] == []
+        assert result["rows"] == []
+        assert result["row_count"] == 0
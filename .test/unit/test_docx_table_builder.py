@@ -0,0 +1,123 @@
+"""
+@TEST:docx-table-builder-unit
+Unit tests for Bulk Table Builder
+
+Related:
+- @SPEC:FEAT-003-REQ-004 - Bulk Table Builder
+- @CODE:docx-table-builder-service
+"""
+
+import io
+import pytest
+from docx import Document
+from app.services.docx_generator import DocxGenerator
+from app.services.docx_table_builder import DocxTableBuilder
+from app.utils.docx_xml import qn
+
+
+class TestDocxTableBuilder:
+    """@TEST:docx-table-builder-unit - 대형 표 생성기 단위 테스트"""
+
+    def test_format_value(self):
+        """
+        @TEST:docx-table-builder-unit-001
+        숫자는 천 단위 구분, 서식 이름/format spec/함수 지원, None/NaN 은 빈 셀
+
+        Tests: @SPEC:FEAT-003-REQ-004
+        """
+        assert DocxTableBuilder.format_value(1234567) == ("1,234,567", True)
+        assert DocxTableBuilder.format_value(1500.0) == ("1,500", True)
+        assert DocxTableBuilder.format_value(0.5) == ("0.5", True)
+        assert DocxTableBuilder.format_value(0.153, "percent") == ("15.3%", True)
+        assert DocxTableBuilder.format_value(2500000, "krw") == ("₩2,500,000", True)
+        assert DocxTableBuilder.format_value(3.14159, ".3f") == ("3.142", True)
+        assert DocxTableBuilder.format_value(42, lambda value: f"{value}억") == ("42억", True)
+        assert DocxTableBuilder.format_value("10억") == ("10억", False)
+        assert DocxTableBuilder.format_value(True) == ("True", False)
+        assert DocxTableBuilder.format_value(None) == ("", False)
+        assert DocxTableBuilder.format_value(float("nan")) == ("", False)
+
+    def test_build_table_structure(self):
+        """
+        @TEST:docx-table-builder-unit-002
+        헤더는 굵게/배경색/반복 행, 숫자 열만 오른쪽 정렬, 짧은 열은 빈 셀로 채움
+        """
+        tbl = DocxTableBuilder.build(
+            ["구분", "매출", "비율"],
+            [["1차년도", "2차년도"], [1000000, 2500000], [0.1]],
+            formats={2: "percent"}
+        )
+
+        rows = tbl.findall(qn("w:tr"))
+        assert len(rows) == 3
+        assert len(tbl.findall(f"{qn('w:tblGrid')}/{qn('w:gridCol')}")) == 3
+        assert rows[0].find(f"{qn('w:trPr')}/{qn('w:tblHeader')}") is not None
+        header_cell = rows[0].find(qn("w:tc"))
+        assert header_cell.find(f".//{qn('w:shd')}").get(qn("w:fill")) == "D9E2F3"
+        assert header_cell.find(f".//{qn('w:rPr')}/{qn('w:b')}") is not None
+
+        def alignment(tc):
+            jc = tc.find(f"{qn('w:p')}/{qn('w:pPr')}/{qn('w:jc')}")
+            return jc.get(qn("w:val")) if jc is not None else None
+
+        first_row = rows[1].findall(qn("w:tc"))
+        assert [alignment(tc) for tc in first_row] == [None, "right", "right"]
+        assert ["".join(tc.itertext()) for tc in first_row] == ["1차년도", "1,000,000", "10.0%"]
+        assert ["".join(tc.itertext()) for tc in rows[2].findall(qn("w:tc"))] == ["2차년도", "2,500,000", ""]
+
+    def test_escapes_text(self):
+        """
+        @TEST:docx-table-builder-unit-003
+        XML 특수 문자는 이스케이프, 제어 문자는 제거, 줄바꿈은 w:br
+        """
+        tbl = DocxTableBuilder.build(["R&D <비용>"], [["A & B\n둘째 줄\x0b"]])
+
+        assert "".join(tbl.find(qn("w:tr")).itertext()) == "R&D <비용>"
+        cell = tbl.findall(qn("w:tr"))[1].find(qn("w:tc"))
+        assert [t.text for t in cell.iter(qn("w:t"))] == ["A & B", "둘째 줄"]
+        assert len(list(cell.iter(qn("w:br")))) == 1
+
+    def test_rejects_mismatched_columns(self):
+        """
+        @TEST:docx-table-builder-unit-004
+        헤더와 열 수가 다르거나 헤더가 없으면 ValueError
+        """
+        with pytest.raises(ValueError):
+            DocxTableBuilder.build_xml(["a", "b"], [[1]])
+        with pytest.raises(ValueError):
+            DocxTableBuilder.build_xml([], [])
+
+    def test_columns_from_rows(self):
+        """
+        @TEST:docx-table-builder-unit-005
+        행 단위 표 데이터를 열 목록으로 변환 (빠진 셀은 None)
+        """
+        headers, columns = DocxTableBuilder.columns_from_table({
+            "headers": ["연도", "매출"],
+            "rows": [{"cells": [{"value": "2024"}, {"value": 100}]}, {"cells": [{"value": "2025"}]}]
+        })
+
+        assert headers == ["연도", "매출"]
+        assert columns == [["2024", "2025"], [100, None]]
+
+    def test_generator_uses_builder(self):
+        """
+        @TEST:docx-table-builder-unit-006
+        DocxGenerator 재무 표가 python-docx 로 다시 읽히고 표 스타일을 유지
+        """
+        result = DocxGenerator.create_business_plan({}, {
+            "financial_plan": "3개년 재무 계획",
+            "financial_tables": [{
+                "headers": ["항목", "1차년도", "2차년도"],
+                "columns": [["매출", "비용"], [120000000, 80000000], [250000000, 110000000]]
+            }]
+        }, {"title": "테스트"})
+
+        table = Document(io.BytesIO(result.getvalue())).tables[0]
+        assert table.style.name == "Light Grid Accent 1"
+        assert [[cell.text for cell in row.cells] for row in table.rows] == [
+            ["항목", "1차년도", "2차년도"],
+            ["매출", "120,000,000", "250,000,000"],
+            ["비용", "80,000,000", "110,000,000"],
+        ]
+        assert table.cell(0, 0).paragraphs[0].runs[0].bold
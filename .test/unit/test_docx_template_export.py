@@ -0,0 +1,217 @@
+"""
+@TEST:docx-template-export-unit
+Unit tests for Template-Preserving DOCX Export
+
+Related:
+- @SPEC:FEAT-003-REQ-002 - Template-Preserving Export
+- @SPEC:FEAT-003-REQ-003 - Streamed Export
+- @CODE:docx-template-export-service
+"""
+
+import asyncio
+import io
+import zipfile
+import pytest
+from docx import Document
+from docx.shared import Pt
+from app.services.document_store import DocumentStore
+from app.services.docx_generator import DocxGenerator
+from app.services.docx_template_export import TableFillError, TemplateExporter, TemplatePackage
+from app.utils.raw_zip import aiter_zip, iter_zip, read_raw_entries, zip_size
+
+
+@pytest.fixture
+def template_bytes():
+    """제목/안내 문단/표가 있는 기관 양식 형태의 DOCX"""
+    doc = Document()
+    doc.add_heading('사업계획서 양식', 0)
+    doc.add_heading('1. 사업 개요', 1)
+    doc.add_paragraph('※ 사업 내용을 요약하여 작성')
+    doc.add_paragraph('2. 시장 분석')
+    guide = doc.add_paragraph('※ 목표 시장의 규모와 성장률을 작성')
+    guide.paragraph_format.left_indent = Pt(20)
+    doc.add_paragraph('(작성 예시) 국내 시장 규모는 ...')
+    doc.add_heading('4. 재무 계획', 1)
+    table = doc.add_table(rows=2, cols=3)
+    for col, header in enumerate(['항목', '2024', '2025']):
+        table.cell(0, col).text = header
+        table.cell(0, col).paragraphs[0].runs[0].bold = True
+    doc.add_paragraph('표 아래 주석')
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+def _texts(docx_stream):
+    return [p.text for p in Document(docx_stream).paragraphs]
+
+
+class TestTemplatePackage:
+    """@TEST:docx-template-export-unit - 양식 보존 내보내기 단위 테스트"""
+
+    def test_fills_section_slots(self, template_bytes):
+        """
+        @TEST:docx-template-export-unit-001
+        섹션 제목 아래 안내 문단을 생성 내용으로 바꾸고 문단 서식을 유지
+
+        Tests: @SPEC:FEAT-003-REQ-002
+        """
+        package = TemplatePackage.load(template_bytes)
+        assert set(package.slots) == {"business_overview", "market_analysis", "financial_plan"}
+
+        result = package.render(
+            {"market_analysis": "시장 규모는 1조원입니다.\n\n연평균 10% 성장합니다."},
+            {"description": "AI 사업계획서 작성 서비스"}
+        )
+        texts = _texts(result)
+
+        assert texts[texts.index('2. 시장 분석') + 1:texts.index('4. 재무 계획')] == [
+            '시장 규모는 1조원입니다.', '연평균 10% 성장합니다.'
+        ]
+        assert texts[texts.index('1. 사업 개요') + 1] == 'AI 사업계획서 작성 서비스'
+        assert not any(text.startswith('※ 목표 시장') for text in texts)
+        # 재무 계획 내용이 없으면 양식 안내 문단은 그대로 유지
+        assert '표 아래 주석' in texts
+
+        result.seek(0)
+        generated = next(p for p in Document(result).paragraphs if p.text == '시장 규모는 1조원입니다.')
+        assert generated.paragraph_format.left_indent == Pt(20)
+
+    def test_copies_unchanged_parts(self, template_bytes):
+        """
+        @TEST:docx-template-export-unit-002
+        본문 파트만 다시 압축하고 나머지 파트는 압축 바이트를 그대로 복사
+        """
+        package = TemplatePackage.load(template_bytes)
+        entries = package.render_entries({"market_analysis": "내용"}, {})
+
+        original = {entry.name: entry for entry in read_raw_entries(io.BytesIO(template_bytes))}
+        assert [entry.name for entry in entries] == list(original)
+        for entry in entries:
+            if entry.name == package.document_part:
+                assert entry.compressed != original[entry.name].compressed
+            else:
+                assert entry is original[entry.name] or entry.compressed == original[entry.name].compressed
+
+        data = b"".join(iter_zip(entries))
+        assert len(data) == zip_size(entries)
+        with zipfile.ZipFile(io.BytesIO(data)) as output:
+            assert output.testzip() is None
+
+    def test_fills_table_cells(self, template_bytes):
+        """
+        @TEST:docx-template-export-unit-003
+        양식 표의 헤더 아래 행부터 값을 채우고, 행이 부족하면 마지막 행을 복제
+        """
+        package = TemplatePackage.load(template_bytes)
+        result = package.render({
+            "tables": [{"table_index": 0, "rows": [["매출", "100억", "150억"], ["영업이익", "10억", None]]}]
+        }, {})
+
+        table = Document(result).tables[0]
+        assert [[cell.text for cell in row.cells] for row in table.rows] == [
+            ['항목', '2024', '2025'],
+            ['매출', '100억', '150억'],
+            ['영업이익', '10억', ''],
+        ]
+        assert table.cell(0, 0).paragraphs[0].runs[0].bold
+
+    def test_table_start_row_range(self, template_bytes):
+        """
+        @TEST:docx-template-export-unit-008
+        start_row 가 표 행 수와 같으면 끝에 행을 추가하고, 범위 밖이거나 정수가 아니면 TableFillError
+        """
+        package = TemplatePackage.load(template_bytes)
+        result = package.render({"tables": [{"table_index": 0, "start_row": 2, "rows": [["매출", "1억", "2억"]]}]}, {})
+
+        table = Document(result).tables[0]
+        assert [cell.text for cell in table.rows[-1].cells] == ['매출', '1억', '2억']
+        assert len(table.rows) == 3
+
+        for start_row in (3, 100, -1, "1", True):
+            with pytest.raises(TableFillError):
+                package.render({"tables": [{"table_index": 0, "start_row": start_row, "rows": [["매출"]]}]}, {})
+
+    def test_appends_missing_sections(self, template_bytes):
+        """
+        @TEST:docx-template-export-unit-004
+        양식에 없는 섹션은 본문 끝(구역 설정 앞)에 제목과 함께 추가
+        """
+        package = TemplatePackage.load(template_bytes)
+        result = package.render({
+            "competitive_analysis": "경쟁사 A 대비 저렴합니다.",
+            "financial_plan": "3개년 매출 계획",
+            "financial_tables": [{"headers": ["연도", "매출"], "rows": [{"cells": [{"value": "2024"}, {"value": "10억"}]}]}]
+        }, {})
+
+        doc = Document(result)
+        texts = [p.text for p in doc.paragraphs]
+        assert texts[-2:] == ['경쟁사 분석 및 차별화 전략', '경쟁사 A 대비 저렴합니다.']
+        assert doc.paragraphs[-2].style.name == 'Heading 1'
+        assert texts[texts.index('4. 재무 계획') + 1] == '3개년 매출 계획'
+        assert [cell.text for cell in doc.tables[0].rows[0].cells] == ['연도', '매출']
+        assert len(doc.tables) == 2
+        assert doc.element.body[-1].tag.endswith('sectPr')
+
+
+class TestTemplateExporter:
+    """@TEST:docx-template-export-unit - 양식 패키지 캐시 테스트"""
+
+    def test_loads_package_once(self, tmp_path, template_bytes):
+        """
+        @TEST:docx-template-export-unit-005
+        같은 양식은 한 번만 읽어 분석하고 이후 내보내기에서 재사용
+        """
+        store = DocumentStore(str(tmp_path / "documents.sqlite3"), str(tmp_path / "blobs"))
+        store.put_template("a" * 64, "template.docx", {})
+        store.put_template_source("a" * 64, io.BytesIO(template_bytes))
+        exporter = TemplateExporter(store, max_packages=2)
+
+        for _ in range(3):
+            _texts(exporter.export("a" * 64, {"market_analysis": "내용"}, {}))
+
+        assert exporter.stats()["package_loads"] == 1
+        assert exporter.stats()["package_hits"] == 2
+        with pytest.raises(KeyError):
+            exporter.export("b" * 64, {}, {})
+        store.close()
+
+
+class TestStreamedExport:
+    """@TEST:docx-template-export-unit - 스트리밍 내보내기 테스트"""
+
+    def test_aiter_zip_chunks(self, template_bytes):
+        """
+        @TEST:docx-template-export-unit-006
+        비동기 이터레이터는 chunk_size 이하 조각으로 zip 전체를 순서대로 내보냄
+
+        Tests: @SPEC:FEAT-003-REQ-003
+        """
+        entries = TemplatePackage.load(template_bytes).render_entries({"market_analysis": "내용"}, {})
+
+        async def collect():
+            return [chunk async for chunk in aiter_zip(entries, chunk_size=1024)]
+
+        chunks = asyncio.run(collect())
+
+        assert max(len(chunk) for chunk in chunks) <= 1024
+        assert b"".join(chunks) == b"".join(iter_zip(entries))
+        assert sum(len(chunk) for chunk in chunks) == zip_size(entries)
+
+    def test_generator_entries_match_saved_document(self):
+        """
+        @TEST:docx-template-export-unit-007
+        python-docx 문서를 파트별 항목으로 만든 결과가 Document.save 와 같은 내용
+        """
+        args = ({}, {"market_analysis": "시장 분석 내용"}, {"title": "테스트", "notes": "주의"})
+
+        saved = DocxGenerator.create_business_plan(*args)
+        entries = DocxGenerator.create_business_plan_entries(*args)
+        streamed = io.BytesIO(b"".join(iter_zip(entries)))
+
+        with zipfile.ZipFile(saved) as expected, zipfile.ZipFile(streamed) as result:
+            assert sorted(result.namelist()) == sorted(expected.namelist())
+            for name in expected.namelist():
+                if name != "docProps/core.xml":  # 수정 시각 포함
+                    assert result.read(name) == expected.read(name)
+        assert [p.text for p in Document(streamed).paragraphs] == [p.text for p in Document(saved).paragraphs]
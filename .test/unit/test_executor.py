@@ -0,0 +1,105 @@
+"""
+@TEST:document-executor-unit
+Unit tests for the document worker pool
+
+Related:
+- @CODE:document-executor-service
+"""
+
+import asyncio
+import threading
+import pytest
+from app.services.executor import (
+    DocumentExecutor,
+    ExecutorSaturatedError,
+    ExecutorTimeoutError,
+    EXECUTOR_KIND_PROCESS,
+)
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+class TestDocumentExecutor:
+    """@TEST:document-executor-unit - 문서 워커 풀 단위 테스트"""
+
+    def test_run_returns_result(self):
+        """
+        @TEST:document-executor-unit-001
+        워커 풀 실행 결과 반환
+        """
+        executor = DocumentExecutor(max_workers=2)
+        try:
+            assert asyncio.run(executor.run(_square, 7)) == 49
+            assert executor.stats()["completed"] == 1
+        finally:
+            executor.shutdown()
+
+    def test_saturated_queue_rejects(self):
+        """
+        @TEST:document-executor-unit-002
+        실행 + 대기 작업이 한도에 도달하면 즉시 거절
+        """
+        executor = DocumentExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(_square, 2)
+
+            release.set()
+            await asyncio.gather(*running)
+            return await executor.run(_square, 3)
+
+        try:
+            assert asyncio.run(scenario()) == 9
+            stats = executor.stats()
+            assert stats["rejected"] == 1
+            assert stats["in_flight"] == 0
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_job_timeout_keeps_slot_until_done(self):
+        """
+        @TEST:document-executor-unit-003
+        시간 초과 시 예외 발생, 실행 중인 작업은 끝날 때까지 슬롯 점유
+        """
+        executor = DocumentExecutor(max_workers=1, max_queue=0, timeout=0.05)
+        release = threading.Event()
+
+        async def scenario():
+            with pytest.raises(ExecutorTimeoutError):
+                await executor.run(release.wait)
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(_square, 2)
+
+        try:
+            asyncio.run(scenario())
+            assert executor.stats()["timed_out"] == 1
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_process_pool(self):
+        """
+        @TEST:document-executor-unit-004
+        프로세스 풀 모드 실행
+        """
+        executor = DocumentExecutor(kind=EXECUTOR_KIND_PROCESS, max_workers=1)
+        try:
+            assert asyncio.run(executor.run(_square, 5)) == 25
+        finally:
+            executor.shutdown()
+
+    def test_invalid_kind(self):
+        """
+        @TEST:document-executor-unit-005
+        지원되지 않는 실행기 종류
+        """
+        with pytest.raises(ValueError):
+            DocumentExecutor(kind="gpu")
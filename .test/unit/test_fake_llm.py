@@ -0,0 +1,248 @@
+"""
+@TEST:fake-llm-unit
+Unit tests for Pluggable LLM Backend
+
+Related:
+- @SPEC:FEAT-002-REQ-015 - Pluggable LLM Backend
+- @CODE:fake-llm-backend
+"""
+
+import asyncio
+import json
+import random
+import pytest
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from app.services.ai_generator import SECTION_CONFIGS, SECTION_FINANCIAL_PLAN, SECTION_MARKET_ANALYSIS
+from app.services.fake_llm import FakeLLMBackend, LatencyDistribution
+from app.services.financial_tables import extract_financial_tables, tables_from_json
+from app.services.llm_backend import LLMBackend
+
+
+def section_request(section: str, title: str = "스마트팜 솔루션", **extra):
+    return {
+        "model": "gpt-4-turbo-preview",
+        "messages": [
+            {"role": "system", "content": SECTION_CONFIGS[section]["system"]},
+            {"role": "user", "content": f"다음 사업에 대해 작성하세요.\n- 제목: {title}\n- 설명: 수직 농장"}
+        ],
+        "temperature": 0.7,
+        "max_tokens": SECTION_CONFIGS[section]["max_tokens"],
+        **extra
+    }
+
+
+class RecordingSleep:
+    """실제로 기다리지 않고 대기 시간만 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, seconds):
+        self.calls.append(seconds)
+
+
+async def collect(stream):
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+    return chunks
+
+
+class TestLatencyDistribution:
+    """@TEST:fake-llm-unit - 지연 분포"""
+
+    def test_parse_and_sample(self):
+        """
+        @TEST:fake-llm-unit-001
+        fixed/uniform/lognormal 설정값을 ms 로 읽고 초 단위로 뽑으며, 잘못된 형식은 ValueError
+
+        Tests: @SPEC:FEAT-002-REQ-015
+        """
+        rng = random.Random(0)
+        assert LatencyDistribution.parse("fixed:250").sample(rng) == 0.25
+        assert all(0.1 <= LatencyDistribution.parse("uniform:100:300").sample(rng) <= 0.3 for _ in range(50))
+
+        lognormal = LatencyDistribution.parse("lognormal:400:0.5")
+        samples = sorted(lognormal.sample(rng) for _ in range(2001))
+        assert 0.35 < samples[1000] < 0.45
+        assert str(lognormal) == "lognormal:400:0.5"
+
+        for spec in ("gaussian:100", "fixed", "uniform:100", "fixed:abc", "fixed:-1"):
+            with pytest.raises(ValueError):
+                LatencyDistribution.parse(spec)
+
+
+class TestFakeBackend:
+    """@TEST:fake-llm-unit - 가짜 백엔드 응답"""
+
+    def test_deterministic_content_and_retry_attempts(self):
+        """
+        @TEST:fake-llm-unit-002
+        같은 시드/요청은 같은 본문과 지연, 재요청은 본문이 같고 지연/오류만 새로 정하며 시드가 다르면 본문도 다름
+        """
+        async def scenario():
+            sleeps_a, sleeps_b = RecordingSleep(), RecordingSleep()
+            first = FakeLLMBackend(latency="uniform:100:900", seed=7, sleep=sleeps_a)
+            second = FakeLLMBackend(latency="uniform:100:900", seed=7, sleep=sleeps_b)
+            request = section_request(SECTION_MARKET_ANALYSIS)
+            a = await first.create(request)
+            b = await second.create(request)
+            retried = await first.create(request)
+            other_seed = await FakeLLMBackend(latency="fixed:0", seed=8).create(request)
+            return a, b, retried, other_seed, sleeps_a.calls, sleeps_b.calls
+
+        a, b, retried, other_seed, sleeps_a, sleeps_b = asyncio.run(scenario())
+
+        assert a.choices[0].message.content == b.choices[0].message.content == retried.choices[0].message.content
+        assert "스마트팜 솔루션" in a.choices[0].message.content
+        assert other_seed.choices[0].message.content != a.choices[0].message.content
+        assert sleeps_a[0] == sleeps_b[0]
+        assert sleeps_a[0] != sleeps_a[1]
+        assert a.usage.completion_tokens > 0 and a.choices[0].finish_reason == "stop"
+
+    def test_streams_at_token_rate_with_usage(self):
+        """
+        @TEST:fake-llm-unit-003
+        스트림은 첫 토큰 지연 뒤 단어 조각을 초당 토큰 수에 맞춰 내보내고 마지막 조각에 usage 포함
+        (조각별 추정 토큰 수의 합은 전체 본문의 추정값과 조금 다름)
+        """
+        async def scenario():
+            sleep = RecordingSleep()
+            backend = FakeLLMBackend(latency="fixed:300", tokens_per_second=50, sleep=sleep)
+            chunks = await collect(await backend.create(section_request(SECTION_MARKET_ANALYSIS), stream=True))
+            return chunks, sleep.calls, backend.stats()
+
+        chunks, sleeps, stats = asyncio.run(scenario())
+
+        text = "".join(c.choices[0].delta.content or "" for c in chunks if c.choices)
+        usage = chunks[-1].usage
+        assert chunks[-1].choices == []
+        assert chunks[-2].choices[0].finish_reason == "stop"
+        assert sleeps[0] == 0.3
+        assert sum(sleeps[1:]) == pytest.approx(usage.completion_tokens / 50, rel=0.2)
+        assert stats["completion_tokens"] == pytest.approx(usage.completion_tokens, rel=0.2)
+        assert "시장" in text
+        assert (stats["requests"], stats["streams"], stats["latency"]) == (1, 1, "fixed:300")
+
+    def test_truncates_to_max_tokens(self):
+        """
+        @TEST:fake-llm-unit-004
+        본문이 max_tokens 보다 길면 잘라서 finish_reason "length"
+        """
+        backend = FakeLLMBackend(latency="fixed:0", tokens_per_second=0)
+        response = asyncio.run(backend.create(section_request(SECTION_MARKET_ANALYSIS, max_tokens=20)))
+
+        assert response.choices[0].finish_reason == "length"
+        assert response.usage.completion_tokens <= 20
+
+    def test_financial_plan_tables_validate(self):
+        """
+        @TEST:fake-llm-unit-005
+        재무 계획 본문의 마크다운 표와 JSON 모드 응답의 표가 모두 파싱되고 합계 검증 통과
+        """
+        async def scenario():
+            backend = FakeLLMBackend(latency="fixed:0", tokens_per_second=0)
+            markdown = await backend.create(section_request(SECTION_FINANCIAL_PLAN))
+            as_json = await backend.create(section_request(
+                SECTION_FINANCIAL_PLAN, response_format={"type": "json_object"}
+            ))
+            return markdown.choices[0].message.content, as_json.choices[0].message.content
+
+        markdown, as_json = asyncio.run(scenario())
+
+        markdown_tables = extract_financial_tables(markdown)
+        json_tables = tables_from_json(json.loads(as_json))
+        assert len(markdown_tables) >= 2 and len(json_tables) >= 2
+        assert all(table["validation"]["valid"] for table in markdown_tables + json_tables)
+
+
+    def test_backend_must_implement_create(self):
+        """
+        @TEST:fake-llm-unit-008
+        create 를 구현하지 않은 백엔드는 만들 때 TypeError, create 만 구현하면 나머지는 기본 동작
+        """
+        class Incomplete(LLMBackend):
+            pass
+
+        class Minimal(LLMBackend):
+            async def create(self, request, tokens=0, **options):
+                return request
+
+        with pytest.raises(TypeError):
+            Incomplete()
+        minimal = Minimal()
+        assert asyncio.run(minimal.warmup()) is True
+        assert minimal.stats() == {}
+
+
+    def test_attempt_counter_is_bounded(self):
+        """
+        @TEST:fake-llm-unit-009
+        요청별 받은 횟수는 최근 max_tracked 개만 기억하고, 잊힌 요청은 처음 받은 요청과 같은 지연
+        """
+        async def scenario():
+            sleep = RecordingSleep()
+            backend = FakeLLMBackend(latency="uniform:100:900", tokens_per_second=0, sleep=sleep, max_tracked=2)
+            for title in ("가", "나", "가", "다", "라", "나"):
+                await backend.create(section_request(SECTION_MARKET_ANALYSIS, title=title))
+            return sleep.calls, len(backend._seen)
+
+        sleeps, tracked = asyncio.run(scenario())
+
+        assert tracked == 2
+        assert sleeps[2] != sleeps[0]  # "가" 를 아직 기억하므로 재시도
+        assert sleeps[5] == sleeps[1]  # "나" 는 잊혀서 처음 받은 요청으로 취급
+
+
+class TestFaultInjection:
+    """@TEST:fake-llm-unit - 오류/연결 끊김 주입"""
+
+    def test_error_rate_raises_sdk_errors(self):
+        """
+        @TEST:fake-llm-unit-006
+        error_rate 비율로 상태 코드에 맞는 OpenAI SDK 예외 (429 는 retry-after 포함)
+        """
+        async def scenario():
+            always = FakeLLMBackend(latency="fixed:0", error_rate=1.0)
+            limited = FakeLLMBackend(latency="fixed:0", error_rate=1.0, error_status=429)
+            sometimes = FakeLLMBackend(latency="fixed:0", error_rate=0.3)
+            errors = []
+            for exc_backend in (always, limited):
+                try:
+                    await exc_backend.create(section_request(SECTION_MARKET_ANALYSIS))
+                except Exception as e:
+                    errors.append(e)
+            failed = 0
+            for i in range(200):
+                try:
+                    await sometimes.create(section_request(SECTION_MARKET_ANALYSIS, title=f"사업 {i}"))
+                except InternalServerError:
+                    failed += 1
+            return errors, failed, sometimes.stats()
+
+        errors, failed, stats = asyncio.run(scenario())
+
+        assert isinstance(errors[0], InternalServerError)
+        assert isinstance(errors[1], RateLimitError)
+        assert errors[1].response.headers["retry-after"] == "1"
+        assert 30 <= failed <= 90
+        assert stats["errors"] == failed
+
+    def test_disconnect_mid_stream(self):
+        """
+        @TEST:fake-llm-unit-007
+        disconnect_rate 비율로 일부 조각을 보낸 뒤 APIConnectionError
+        """
+        async def scenario():
+            backend = FakeLLMBackend(latency="fixed:0", tokens_per_second=0, disconnect_rate=1.0)
+            stream = await backend.create(section_request(SECTION_MARKET_ANALYSIS), stream=True)
+            received = []
+            with pytest.raises(APIConnectionError):
+                async for chunk in stream:
+                    received.append(chunk)
+            return received, backend.stats()
+
+        received, stats = asyncio.run(scenario())
+
+        assert all(chunk.choices[0].finish_reason is None for chunk in received)
+        assert stats["disconnects"] == 1
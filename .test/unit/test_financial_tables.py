@@ -0,0 +1,146 @@
+"""
+@TEST:financial-tables-unit
+Unit tests for Financial Table Extraction
+
+Related:
+- @SPEC:FEAT-002-REQ-009 - Financial Table Extraction
+- @CODE:financial-table-extractor
+"""
+
+import io
+import json
+import os
+import time
+import pytest
+from docx import Document
+from app.services.docx_generator import DocxGenerator
+from app.services.financial_tables import (
+    KIND_KRW,
+    KIND_NUMBER,
+    KIND_PERCENT,
+    KIND_TEXT,
+    extract_financial_tables,
+    parse_amount,
+    tables_from_json,
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "financial_tables")
+
+with open(os.path.join(FIXTURE_DIR, "expected.json"), encoding="utf-8") as f:
+    EXPECTED = json.load(f)
+
+
+class TestParseAmount:
+    """@TEST:financial-tables-unit - 셀 숫자 변환"""
+
+    @pytest.mark.parametrize("text, unit, expected", [
+        ("1,234", 1, (1234, KIND_NUMBER)),
+        ("1,234", 10 ** 6, (1234000000, KIND_KRW)),
+        ("5억", 1, (500000000, KIND_KRW)),
+        ("1.1억원", 1, (110000000, KIND_KRW)),
+        ("3,000만원", 1, (30000000, KIND_KRW)),
+        ("1조 2,000억", 1, (1200000000000, KIND_KRW)),
+        ("₩1,500,000", 1, (1500000, KIND_KRW)),
+        ("15%", 10 ** 6, (0.15, KIND_PERCENT)),
+        ("(1,000)", 1, (-1000, KIND_NUMBER)),
+        ("△500", 10 ** 4, (-5000000, KIND_KRW)),
+        ("**2,000**", 1, (2000, KIND_NUMBER)),
+        ("-", 1, (None, KIND_TEXT)),
+        ("2025년", 1, ("2025년", KIND_TEXT)),
+        ("1,000 2,000", 1, ("1,000 2,000", KIND_TEXT)),
+    ])
+    def test_parse_amount(self, text, unit, expected):
+        """
+        @TEST:financial-tables-unit-001
+        콤마/억/만원/원 기호/퍼센트/음수 표기를 숫자로 변환, 숫자가 아니면 원문 유지
+
+        Tests: @SPEC:FEAT-002-REQ-009
+        """
+        assert parse_amount(text, unit) == expected
+
+
+class TestExtractFinancialTables:
+    """@TEST:financial-tables-unit - 모델 출력 표 추출"""
+
+    @pytest.mark.parametrize("name", sorted(EXPECTED))
+    def test_fixture_corpus(self, name):
+        """
+        @TEST:financial-tables-unit-002
+        모델 출력 예시 모음에서 표 제목/헤더/열 종류/값/합계 검증 결과가 기대값과 일치
+        """
+        with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+            tables = extract_financial_tables(f.read())
+
+        assert [
+            {
+                "title": table["title"],
+                "headers": table["headers"],
+                "kinds": table["kinds"],
+                "columns": table["columns"],
+                "valid": table["validation"]["valid"]
+            }
+            for table in tables
+        ] == EXPECTED[name]
+
+    def test_total_mismatch_details(self):
+        """
+        @TEST:financial-tables-unit-003
+        합계 행이 위 행의 합과 다르면 열/행과 계산값을 보고
+        """
+        with open(os.path.join(FIXTURE_DIR, "total_mismatch.md"), encoding="utf-8") as f:
+            table = extract_financial_tables(f.read())[0]
+
+        assert table["validation"]["mismatches"] == [{
+            "type": "row_total", "row": 2, "column": "2026", "expected": 1000000000, "actual": 1200000000
+        }]
+
+    def test_column_total_mismatch(self):
+        """
+        @TEST:financial-tables-unit-004
+        합계 열이 같은 행 금액 열의 합과 다르면 보고 (비율 열은 더하지 않음)
+        """
+        tables = tables_from_json({"tables": [{
+            "headers": ["구분", "상반기", "하반기", "비중", "합계"],
+            "rows": [["매출", "1억", "2억", "60%", "3억"], ["비용", "1억", "1억", "40%", "3억"]]
+        }]})
+
+        assert tables[0]["kinds"] == [KIND_TEXT, KIND_KRW, KIND_KRW, KIND_PERCENT, KIND_KRW]
+        assert tables[0]["validation"] == {"valid": False, "mismatches": [{
+            "type": "column_total", "row": 1, "column": "합계", "expected": 200000000, "actual": 300000000
+        }]}
+
+    def test_linear_time_on_long_output(self):
+        """
+        @TEST:financial-tables-unit-005
+        긴 출력과 역추적을 유발하기 쉬운 셀도 빠르게 처리
+        """
+        row = "| 항목 | 1,234 | 5억 3,000만원 | 12.5% |"
+        long_output = "\n\n".join(
+            "재무 표 (단위: 천원)\n| 구분 | 금액 | 금액2 | 비율 |\n|---|---|---|---|\n" + "\n".join([row] * 50)
+            for _ in range(200)
+        )
+        pathological = "| 구분 | 값 |\n|---|---|\n| a | " + "1," * 50000 + "x |\n" + "|" * 100000
+
+        started = time.perf_counter()
+        tables = extract_financial_tables(long_output)
+        extract_financial_tables(pathological)
+        elapsed = time.perf_counter() - started
+
+        assert len(tables) == 200
+        assert tables[0]["columns"][2][0] == 530000000
+        assert elapsed < 5
+
+    def test_tables_export_with_builder(self):
+        """
+        @TEST:financial-tables-unit-006
+        추출한 표를 financial_tables 로 그대로 내보내면 숫자 서식이 적용됨 (JSON 왕복 후에도)
+        """
+        with open(os.path.join(FIXTURE_DIR, "korean_units.md"), encoding="utf-8") as f:
+            tables = json.loads(json.dumps(extract_financial_tables(f.read())))
+
+        result = DocxGenerator.create_business_plan(
+            {}, {"financial_plan": "자금 조달 계획", "financial_tables": tables}, {"title": "테스트"}
+        )
+
+        table = Document(io.BytesIO(result.getvalue())).tables[0]
+        assert [cell.text for cell in table.rows[1].cells] == ["정부지원금", "₩100,000,000", "40.0%"]
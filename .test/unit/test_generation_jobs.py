@@ -0,0 +1,385 @@
+"""
+@TEST:generation-jobs-unit
+Unit tests for Generation Job Queue
+
+Related:
+- @SPEC:FEAT-002-REQ-011 - Generation Job Queue
+- @CODE:generation-jobs-service
+"""
+
+import asyncio
+import os
+import sqlite3
+import time
+import pytest
+from app.services.generation_jobs import (
+    GenerationJobQueue,
+    JobNotActiveError,
+    JobQueueFullError,
+    JobStore,
+)
+
+
+class BlockingRunner:
+    """release 될 때까지 기다렸다가 요청 내용을 그대로 돌려주는 작업 실행기"""
+
+    def __init__(self):
+        self.started = []
+        self.cancelled = []
+        self.release = None
+
+    async def __call__(self, kind, payload):
+        if self.release is None:
+            self.release = asyncio.Event()
+        self.started.append(payload["name"])
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(payload["name"])
+            raise
+        if payload.get("fail"):
+            raise ValueError("생성 실패")
+        return {"kind": kind, "name": payload["name"]}
+
+
+async def until(predicate, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+def make_queue(tmp_path, runner, **kwargs) -> GenerationJobQueue:
+    return GenerationJobQueue(runner, JobStore(os.path.join(tmp_path, "jobs.sqlite3")), **kwargs)
+
+
+class TestSubmit:
+    """@TEST:generation-jobs-unit - 등록, 우선순위, 중복 제거"""
+
+    def test_priority_order_and_dedup(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-001
+        우선순위가 큰 작업부터 등록 순서로 실행하고, 대기/실행 중인 같은 요청은 기존 작업 반환
+
+        Tests: @SPEC:FEAT-002-REQ-011
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=1)
+            await queue.start()
+            first, _ = await queue.submit("market_analysis", {"name": "a"})
+            await until(lambda: runner.started == ["a"])
+            b, _ = await queue.submit("market_analysis", {"name": "b"})
+            c, _ = await queue.submit("market_analysis", {"name": "c"}, priority=5)
+            d, _ = await queue.submit("market_analysis", {"name": "d"})
+            running_dup, running_deduplicated = await queue.submit("market_analysis", {"name": "a"})
+            # 대기 중인 같은 요청이 더 높은 우선순위로 오면 기존 작업의 우선순위를 올림
+            bumped, bumped_deduplicated = await queue.submit("market_analysis", {"name": "d"}, priority=9)
+            other_kind, other_deduplicated = await queue.submit("competitive_analysis", {"name": "a"})
+
+            runner.release.set()
+            await until(lambda: queue.store.get(other_kind["job_id"])["status"] == "succeeded")
+            stats = await queue.stats()
+            await queue.stop()
+            return first, running_dup, running_deduplicated, d, bumped, bumped_deduplicated, other_kind, other_deduplicated, stats
+
+        first, running_dup, running_deduplicated, d, bumped, bumped_deduplicated, other_kind, other_deduplicated, stats = asyncio.run(scenario())
+
+        assert (running_dup["job_id"], running_deduplicated) == (first["job_id"], True)
+        assert (bumped["job_id"], bumped["priority"], bumped_deduplicated) == (d["job_id"], 9, True)
+        assert other_kind["job_id"] != first["job_id"] and not other_deduplicated
+        assert runner.started == ["a", "d", "c", "b", "a"]
+        assert (stats["submitted"], stats["deduplicated"], stats["succeeded"]) == (5, 2, 5)
+
+    def test_queue_limit(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-002
+        대기 작업 수가 한도에 도달하면 JobQueueFullError, 시작 전 등록은 RuntimeError
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=1, max_queued=1)
+            with pytest.raises(RuntimeError):
+                await queue.submit("market_analysis", {"name": "early"})
+            await queue.start()
+            await queue.submit("market_analysis", {"name": "a"})
+            await until(lambda: runner.started == ["a"])
+            await queue.submit("market_analysis", {"name": "b"})
+            with pytest.raises(JobQueueFullError):
+                await queue.submit("market_analysis", {"name": "c"})
+            await queue.stop()
+
+        asyncio.run(scenario())
+
+
+class TestCancelAndWait:
+    """@TEST:generation-jobs-unit - 취소와 롱 폴링"""
+
+    def test_cancel_queued_and_running(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-003
+        실행 중인 작업은 작업 태스크를 취소하고, 대기 중인 작업은 실행하지 않음.
+        끝난 작업 취소는 JobNotActiveError
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=1)
+            await queue.start()
+            running, _ = await queue.submit("market_analysis", {"name": "running"})
+            queued, _ = await queue.submit("market_analysis", {"name": "queued"})
+            after, _ = await queue.submit("market_analysis", {"name": "after"})
+            await until(lambda: runner.started == ["running"])
+
+            cancelled_queued = await queue.cancel(queued["job_id"])
+            cancelled_running = await queue.cancel(running["job_id"])
+            await until(lambda: runner.started == ["running", "after"])
+            runner.release.set()
+            finished = await queue.wait(after["job_id"], timeout=2)
+            with pytest.raises(JobNotActiveError):
+                await queue.cancel(running["job_id"])
+            missing = await queue.cancel("unknown")
+            await queue.stop()
+            return cancelled_queued, cancelled_running, finished, missing, await queue.get(running["job_id"])
+
+        cancelled_queued, cancelled_running, finished, missing, running_job = asyncio.run(scenario())
+
+        assert cancelled_queued["status"] == cancelled_running["status"] == "cancelled"
+        assert runner.cancelled == ["running"]
+        assert running_job["status"] == "cancelled" and running_job["result"] is None
+        assert finished["status"] == "succeeded" and finished["result"] == {"kind": "market_analysis", "name": "after"}
+        assert missing is None
+
+    def test_wait_returns_when_done_or_timeout(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-004
+        롱 폴링은 작업이 끝나면 바로, 끝나지 않으면 timeout 후 현재 상태를 반환
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=1)
+            await queue.start()
+            job, _ = await queue.submit("market_analysis", {"name": "a", "fail": True})
+
+            started = time.monotonic()
+            pending = await queue.wait(job["job_id"], timeout=0.2)
+            timed_out_after = time.monotonic() - started
+
+            asyncio.get_running_loop().call_later(0.1, runner.release.set)
+            started = time.monotonic()
+            done = await queue.wait(job["job_id"], timeout=5)
+            done_after = time.monotonic() - started
+            await queue.stop()
+            return pending, timed_out_after, done, done_after
+
+        pending, timed_out_after, done, done_after = asyncio.run(scenario())
+
+        assert pending["status"] == "running" and timed_out_after >= 0.2
+        assert done["status"] == "failed" and done["error"] == "생성 실패"
+        assert done_after < 0.5
+
+    def test_wait_does_not_keep_events(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-008
+        롱 폴링 완료 이벤트는 기다리는 요청이 있는 동안만 보관 (시간 초과, 다른 큐가 실행하는 작업, 없는 작업)
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            owner = make_queue(tmp_path, runner, workers=1)
+            other = make_queue(tmp_path, runner, workers=1)
+            await owner.start()
+            await other.start()
+            job, _ = await owner.submit("market_analysis", {"name": "a"})
+            await until(lambda: runner.started == ["a"])
+
+            await other.wait(job["job_id"], timeout=0.05)
+            await other.wait("missing", timeout=0.05)
+            await owner.wait(job["job_id"], timeout=0.05)
+            after_timeouts = ((await owner.stats())["waiting"], (await other.stats())["waiting"])
+
+            waiters = [asyncio.create_task(owner.wait(job["job_id"], timeout=2)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            while_waiting = (await owner.stats())["waiting"]
+            runner.release.set()
+            done = await asyncio.gather(*waiters)
+            after_done = (await owner.stats())["waiting"]
+            await other.stop()
+            await owner.stop()
+            return after_timeouts, while_waiting, done, after_done
+
+        after_timeouts, while_waiting, done, after_done = asyncio.run(scenario())
+
+        assert after_timeouts == (0, 0)
+        assert while_waiting == 1
+        assert [job["status"] for job in done] == ["succeeded"] * 3
+        assert after_done == 0
+
+
+    def test_store_lock_does_not_block_event_loop(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-009
+        다른 프로세스가 저장소 쓰기 잠금을 잡고 있는 동안 등록은 기다리지만 이벤트 루프는 계속 실행
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=1)
+            await queue.start()
+            other_process = sqlite3.connect(queue.store.path, isolation_level=None)
+            other_process.execute("BEGIN IMMEDIATE")
+            submit = asyncio.create_task(queue.submit("market_analysis", {"name": "a"}))
+            ticks = 0
+            while ticks < 20 and not submit.done():
+                await asyncio.sleep(0.01)
+                ticks += 1
+            blocked = not submit.done()
+            other_process.execute("COMMIT")
+            other_process.close()
+            job, _ = await submit
+            status = (await queue.get(job["job_id"]))["status"]
+            await queue.stop()
+            return ticks, blocked, status
+
+        ticks, blocked, status = asyncio.run(scenario())
+
+        assert (ticks, blocked) == (20, True)
+        assert status in ("queued", "running")
+
+
+class TestPersistence:
+    """@TEST:generation-jobs-unit - 저장과 재시작 복구"""
+
+    def test_restart_resumes_unfinished_jobs(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-005
+        종료 시 실행 중이던 작업과 대기 작업은 다음 시작 때 다시 실행하고, 결과는 새 저장소 연결에서도 조회
+        """
+        first_runner = BlockingRunner()
+        second_runner = BlockingRunner()
+
+        async def first_process():
+            queue = make_queue(tmp_path, first_runner, workers=1)
+            await queue.start()
+            running, _ = await queue.submit("market_analysis", {"name": "a"})
+            await until(lambda: first_runner.started == ["a"])
+            queued, _ = await queue.submit("market_analysis", {"name": "b"}, priority=1)
+            await queue.stop()
+            queue.store.close()
+            return running, queued
+
+        async def second_process(job_ids):
+            queue = make_queue(tmp_path, second_runner, workers=1)
+            recovered = await queue.start()
+            second_runner.release = asyncio.Event()
+            second_runner.release.set()
+            jobs = [await queue.wait(job_id, timeout=2) for job_id in job_ids]
+            await queue.stop()
+            return recovered, jobs
+
+        running, queued = asyncio.run(first_process())
+        recovered, jobs = asyncio.run(second_process([running["job_id"], queued["job_id"]]))
+
+        assert first_runner.cancelled == ["a"]
+        assert recovered == 2
+        assert second_runner.started == ["b", "a"]
+        assert [job["status"] for job in jobs] == ["succeeded", "succeeded"]
+        assert jobs[0]["result"] == {"kind": "market_analysis", "name": "a"}
+
+    def test_shared_store_does_not_steal_running_jobs(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-006
+        같은 저장소를 쓰는 다른 큐가 시작/종료해도 임대가 살아 있는 실행 중 작업은 되돌리지 않음
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            first = make_queue(tmp_path, runner, workers=1)
+            second = make_queue(tmp_path, runner, workers=1)
+            await first.start()
+            job, _ = await first.submit("market_analysis", {"name": "a"})
+            await until(lambda: runner.started == ["a"])
+
+            recovered = await second.start()
+            await asyncio.sleep(0.05)
+            await second.stop()
+            status_after_second = (await first.get(job["job_id"]))["status"]
+
+            runner.release.set()
+            done = await first.wait(job["job_id"], timeout=2)
+            await first.stop()
+            return recovered, status_after_second, done
+
+        recovered, status_after_second, done = asyncio.run(scenario())
+
+        assert recovered == 0
+        assert status_after_second == "running"
+        assert runner.started == ["a"]
+        assert done["status"] == "succeeded"
+
+    def test_expired_lease_is_recovered(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-007
+        임대가 끝난(멈춘 프로세스의) 작업과 소유자가 없는 이전 형식 작업은 다른 큐가 시작할 때 다시 실행하고,
+        실행 중인 큐는 임대를 연장
+        """
+        runner = BlockingRunner()
+        store = JobStore(os.path.join(tmp_path, "jobs.sqlite3"))
+        for name, owner, lease_until in (("dead", "crashed-host:1", time.time() - 1), ("legacy", None, None)):
+            store.insert({
+                "job_id": name, "kind": "market_analysis", "dedup_key": name, "status": "queued",
+                "priority": 0, "payload": {"name": name}, "created_at": time.time()
+            })
+            store.update(name, status="running", owner=owner, lease_until=lease_until)
+        store.close()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=2, lease=0.3)
+            recovered = await queue.start()
+            await until(lambda: sorted(runner.started) == ["dead", "legacy"])
+            first_lease = queue.store.get("dead")["lease_until"]
+            await asyncio.sleep(0.25)
+            renewed_lease = queue.store.get("dead")["lease_until"]
+            runner.release.set()
+            jobs = [await queue.wait(job_id, timeout=2) for job_id in ("dead", "legacy")]
+            await queue.stop()
+            return recovered, first_lease, renewed_lease, jobs
+
+        recovered, first_lease, renewed_lease, jobs = asyncio.run(scenario())
+
+        assert recovered == 2
+        assert renewed_lease > first_lease
+        assert "owner" not in jobs[0] and "lease_until" not in jobs[0]
+        assert [job["status"] for job in jobs] == ["succeeded", "succeeded"]
+
+
+    def test_expired_results_purged_while_running(self, tmp_path):
+        """
+        @TEST:generation-jobs-unit-010
+        시작한 뒤에도 보관 시간이 지난 끝난 작업은 주기적으로 삭제 (조회 결과 None), 진행 중인 작업은 유지
+        """
+        runner = BlockingRunner()
+
+        async def scenario():
+            queue = make_queue(tmp_path, runner, workers=1, lease=0.3, result_ttl=0.2)
+            await queue.start()
+            done, _ = await queue.submit("market_analysis", {"name": "done"})
+            await until(lambda: runner.started == ["done"])
+            runner.release.set()
+            finished = await queue.wait(done["job_id"], timeout=2)
+            runner.release = asyncio.Event()
+            pending, _ = await queue.submit("market_analysis", {"name": "pending"})
+            await until(lambda: queue.store.get(done["job_id"]) is None, timeout=2)
+            jobs = (await queue.get(done["job_id"]), await queue.get(pending["job_id"]))
+            runner.release.set()
+            await queue.stop()
+            return finished, jobs
+
+        finished, (expired, pending) = asyncio.run(scenario())
+
+        assert finished["status"] == "succeeded"
+        assert expired is None
+        assert pending["status"] in ("queued", "running")
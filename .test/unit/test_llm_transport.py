@@ -0,0 +1,173 @@
+"""
+@TEST:llm-transport-unit
+Unit tests for Resilient Transport
+
+Related:
+- @SPEC:FEAT-002-REQ-013 - Resilient Transport
+- @CODE:llm-transport-service
+"""
+
+import asyncio
+import httpx
+import pytest
+from openai import AsyncOpenAI, APIConnectionError, BadRequestError, RateLimitError
+from app.services.llm_transport import (
+    AdaptiveRateLimiter,
+    LLMTransport,
+    RetryPolicy,
+    parse_retry_after,
+)
+from fake_openai_server import FakeOpenAIServer
+
+REQUEST = {"model": "gpt-4-turbo-preview", "messages": [{"role": "user", "content": "시장 분석"}], "max_tokens": 100}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_transport(server, **kwargs) -> LLMTransport:
+    client = AsyncOpenAI(api_key="test-key", base_url=server.base_url)
+    return LLMTransport(client, **kwargs)
+
+
+class TestRetryPolicy:
+    """@TEST:llm-transport-unit - 재시도 대기 시간"""
+
+    def test_backoff_with_jitter_and_retry_after(self):
+        """
+        @TEST:llm-transport-unit-001
+        지수 백오프 상한 안에서 지터를 고르고, Retry-After 가 있으면 그보다 짧게 기다리지 않음
+
+        Tests: @SPEC:FEAT-002-REQ-013
+        """
+        upper = RetryPolicy(base_delay=0.5, max_delay=3.0, rng=lambda: 0.999)
+        lower = RetryPolicy(base_delay=0.5, max_delay=3.0, rng=lambda: 0.0)
+
+        assert [round(upper.delay(attempt), 2) for attempt in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+        assert lower.delay(3) == 0.0
+        assert lower.delay(0, retry_after=2.5) == 2.5
+        assert upper.delay(4, retry_after=0.1) == pytest.approx(3.0, abs=0.01)
+        assert RetryPolicy(max_retry_after=10).delay(0, retry_after=3600) <= 10
+
+        assert parse_retry_after({"retry-after-ms": "1500", "retry-after": "9"}) == 1.5
+        assert parse_retry_after({"retry-after": "2"}) == 2.0
+        assert parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:05 GMT"}, now=1445412480.0) == 5.0
+        assert parse_retry_after({"retry-after": "soon"}) is None
+        assert parse_retry_after({}) is None
+
+    def test_retryable_errors(self):
+        """
+        @TEST:llm-transport-unit-002
+        429/5xx/연결 오류만 다시 시도
+        """
+        request = httpx.Request("POST", "http://test/v1/chat/completions")
+
+        def status_error(cls, status):
+            return cls("error", response=httpx.Response(status, request=request), body=None)
+
+        assert RetryPolicy.retryable(status_error(RateLimitError, 429))
+        assert RetryPolicy.retryable(APIConnectionError(request=request))
+        assert not RetryPolicy.retryable(status_error(BadRequestError, 400))
+        assert not RetryPolicy.retryable(ValueError("bug"))
+
+
+class TestRateLimiter:
+    """@TEST:llm-transport-unit - RPM/TPM 속도 제한"""
+
+    def test_token_bucket_paces_requests_and_tokens(self):
+        """
+        @TEST:llm-transport-unit-003
+        버킷 크기만큼은 바로 보내고 그 뒤는 분당 한도 간격으로 대기, TPM 은 요청 토큰 수로 계산
+        """
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rpm=60, burst_seconds=3, clock=clock)
+
+        assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([1.0, 2.0, 3.0])
+        clock.now += 10
+        assert limiter.reserve() == 0
+
+        tokens = AdaptiveRateLimiter(tpm=6000, burst_seconds=10, clock=FakeClock())
+        assert tokens.reserve(800) == 0
+        assert tokens.reserve(400) == pytest.approx(2.0)  # 200 토큰 부족, 초당 100 토큰
+        assert tokens.reserve(10 ** 6) == pytest.approx(12.0)  # 버킷보다 큰 요청은 버킷 크기로 계산
+        assert tokens.stats()["waits"] == 2
+
+    def test_rate_limited_backs_off_and_recovers(self):
+        """
+        @TEST:llm-transport-unit-004
+        429 는 Retry-After 동안 모든 요청을 멈추고 허용 속도를 절반으로, 성공하면 조금씩 회복
+        """
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rpm=120, burst_seconds=1, recovery=0.25, clock=clock)
+        unlimited = AdaptiveRateLimiter(clock=clock)
+
+        limiter.on_rate_limited(retry_after=5)
+        unlimited.on_rate_limited(retry_after=5)
+
+        assert limiter.scale == 0.5
+        assert limiter.reserve() == pytest.approx(5.0)
+        assert unlimited.reserve() == pytest.approx(5.0)
+        clock.now += 5
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(1.0)  # 60 RPM 으로 줄어 1초 간격
+        limiter.on_success()
+        limiter.on_success()
+        limiter.on_success()
+        assert limiter.scale == 1.0
+        assert limiter.stats()["rate_limited"] == 1
+
+
+class TestTransport:
+    """@TEST:llm-transport-unit - 가짜 서버 재시도"""
+
+    def test_retries_honor_retry_after(self):
+        """
+        @TEST:llm-transport-unit-005
+        429 는 Retry-After 이상 기다린 뒤 다시 시도하여 성공, 400 은 바로 실패, 재시도를 모두 쓰면 마지막 오류
+        """
+        attempts = {"count": 0}
+
+        def fail_twice(payload):
+            attempts["count"] += 1
+            return 429 if attempts["count"] <= 2 else None
+
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        async def run(transport, **options):
+            try:
+                return await transport.create(REQUEST, tokens=120, **options)
+            finally:
+                await transport.aclose()
+
+        with FakeOpenAIServer(fail_status=fail_twice, retry_after=0.3) as server:
+            transport = make_transport(server, retry=RetryPolicy(max_retries=3, base_delay=0.01), sleep=record_sleep)
+            response = asyncio.run(run(transport))
+        stats = transport.stats()
+
+        assert response.choices[0].message.content.startswith("생성 결과")
+        assert len(server.requests) == 3
+        assert len(delays) == 2 and all(delay >= 0.3 for delay in delays)
+        assert (stats["attempts"], stats["retries"], stats["failures"]) == (3, 2, 0)
+        assert stats["limiter"]["rate_limited"] == 2
+
+        with FakeOpenAIServer(fail_status=lambda p: 400) as server:
+            transport = make_transport(server, sleep=record_sleep)
+            with pytest.raises(BadRequestError):
+                asyncio.run(run(transport))
+        assert len(server.requests) == 1
+
+        with FakeOpenAIServer(fail_status=lambda p: 503) as server:
+            transport = make_transport(server, retry=RetryPolicy(max_retries=2, base_delay=0.01))
+            with pytest.raises(Exception) as error:
+                asyncio.run(run(transport, stream=True))
+        assert getattr(error.value, "status_code", None) == 503
+        assert len(server.requests) == 3 and transport.stats()["failures"] == 1
@@ -0,0 +1,125 @@
+"""
+@TEST:model-router-unit
+Unit tests for Model Routing
+
+Related:
+- @SPEC:FEAT-002-REQ-014 - Model Routing
+- @CODE:model-router-service
+"""
+
+import json
+import pytest
+from app.services.model_router import ModelRouter, ROUTE_SECTION_TABLE_JSON, TIER_DRAFT
+
+ROUTES = [
+    {"name": "short-competitive", "sections": ["competitive_analysis"], "max_prompt_tokens": 1500,
+     "model": "gpt-4o-mini", "temperature": 0.5},
+    {"name": "draft-small", "tier": "draft", "max_prompt_tokens": 3000, "model": "gpt-3.5-turbo-0125"},
+    {"name": "large-input", "min_prompt_tokens": 6000, "model": "gpt-4o", "max_tokens": 1000},
+    {"name": "default", "model": "gpt-4-turbo-preview"}
+]
+
+
+class TestSelect:
+    """@TEST:model-router-unit - 라우팅 규칙 선택"""
+
+    def test_routes_by_section_size_and_tier(self):
+        """
+        @TEST:model-router-unit-001
+        섹션과 입력 토큰 범위가 맞는 첫 규칙을 쓰고, 초안 규칙이 맞지 않으면 기본 등급 규칙 사용
+
+        Tests: @SPEC:FEAT-002-REQ-014
+        """
+        router = ModelRouter(ROUTES)
+
+        assert router.select("competitive_analysis", 1200)["name"] == "short-competitive"
+        assert router.select("competitive_analysis", 2000)["name"] == "default"
+        assert router.select("market_analysis", 1200)["name"] == "default"
+        assert router.select("market_analysis", 7000)["name"] == "large-input"
+        assert router.select("market_analysis", 2000, tier=TIER_DRAFT)["name"] == "draft-small"
+        assert router.select("market_analysis", 5000, tier=TIER_DRAFT)["name"] == "default"
+        with pytest.raises(ValueError):
+            router.select("market_analysis", 1000, tier="fastest")
+
+    def test_skips_models_whose_context_is_too_small(self):
+        """
+        @TEST:model-router-unit-002
+        모델 컨텍스트에 입력과 최소 출력 토큰이 들어가지 않는 규칙은 건너뛰고, max_tokens 는 경로 모델에 맞춤
+        """
+        router = ModelRouter([
+            {"name": "small", "model": "gpt-4-0613"},
+            {"name": "long", "model": "gpt-4-turbo-preview"}
+        ], min_output_tokens=256)
+        request = {"model": "gpt-4-turbo-preview", "messages": [], "temperature": 0.7, "max_tokens": 2000}
+
+        small = router.select("market_analysis", 7000)
+        assert small["name"] == "small"
+        assert router.apply(request, small, 7000)["max_tokens"] == 8192 - 7000
+        assert router.select("market_analysis", 8000)["name"] == "long"
+
+        routed = router.apply(request, ModelRouter(ROUTES).select("market_analysis", 7000), 7000)
+        assert (routed["model"], routed["temperature"], routed["max_tokens"]) == ("gpt-4o", 0.7, 1000)
+        assert request["model"] == "gpt-4-turbo-preview"
+
+        with pytest.raises(ValueError):
+            ModelRouter([{"name": "only-small", "model": "gpt-4-0613"}]).select("market_analysis", 9000)
+
+    def test_default_table_and_file_config(self, tmp_path):
+        """
+        @TEST:model-router-unit-003
+        기본 표는 섹션 본문에 기존 모델, 표 JSON/초안에 작은 모델. 파일의 표/가격 사용, 잘못된 규칙은 ValueError
+        """
+        router = ModelRouter()
+        assert router.select("financial_plan", 1000)["model"] == "gpt-4-turbo-preview"
+        assert router.select("financial_plan", 1000)["temperature"] == 0.7
+        assert router.select(ROUTE_SECTION_TABLE_JSON, 1000)["temperature"] == 0
+        assert router.select("market_analysis", 1000, tier=TIER_DRAFT)["model"].startswith("gpt-3.5-turbo")
+
+        path = tmp_path / "routes.json"
+        path.write_text(json.dumps({
+            "routes": [{"name": "local", "model": "local-llm"}],
+            "prices": {"local-llm": [0.001, 0.002]}
+        }), encoding="utf-8")
+        loaded = ModelRouter.from_file(str(path))
+        assert loaded.select("market_analysis", 100)["name"] == "local"
+        assert loaded.cost("local-llm", 1000, 1000) == 0.003
+
+        with pytest.raises(ValueError):
+            ModelRouter([{"name": "no-model"}])
+        with pytest.raises(ValueError):
+            ModelRouter([{"model": "gpt-4o", "tier": "premium"}])
+        with pytest.raises(ValueError):
+            ModelRouter([{"model": "gpt-4o", "max_prompt_token": 100}])
+        with pytest.raises(ValueError):
+            ModelRouter([{"name": "a", "model": "gpt-4o"}, {"name": "a", "model": "gpt-4o-mini"}])
+
+
+class TestRouteStats:
+    """@TEST:model-router-unit - 경로별 비용/지연 시간"""
+
+    def test_records_cost_and_latency_per_route(self):
+        """
+        @TEST:model-router-unit-004
+        가격표로 호출 비용을 계산하고 경로별 호출 수, 토큰, 비용, 지연 시간 분포를 누적 (실패는 지연 시간 제외)
+        """
+        router = ModelRouter(ROUTES)
+        default = router.select("market_analysis", 1000)
+        short = router.select("competitive_analysis", 1000)
+
+        assert router.cost("gpt-4-turbo-preview", 1000, 500) == pytest.approx(0.025)
+        assert router.cost("gpt-4o-mini", 1000, 1000) == pytest.approx(0.00075)
+        assert router.cost("unknown-model", 1000, 1000) is None
+
+        assert router.record(default, 1000, 500, ttft_ms=400.0, total_ms=9000.0) == pytest.approx(0.025)
+        router.record(default, 1000, 100, ttft_ms=None, total_ms=2000.0, failed=True)
+        router.record(short, 1000, 1000, ttft_ms=150.0, total_ms=3000.0)
+        stats = router.stats()
+
+        assert list(stats) == ["short-competitive", "default"]
+        assert stats["default"]["model"] == "gpt-4-turbo-preview"
+        assert (stats["default"]["calls"], stats["default"]["failed"]) == (2, 1)
+        assert stats["default"]["cost_usd"] == pytest.approx(0.025 + 0.013)
+        assert stats["default"]["cost_per_call_usd"] == pytest.approx(0.019)
+        assert stats["default"]["total_ms"] == {"count": 1, "avg": 9000.0, "p50": 9000.0, "p95": 9000.0}
+        assert stats["short-competitive"]["ttft_ms"]["p50"] == 150.0
+        assert stats["short-competitive"]["completion_tokens"] == 1000
@@ -0,0 +1,109 @@
+"""
+@TEST:parse-cache-unit
+Unit tests for content-addressed parse cache
+
+Related:
+- @CODE:parse-cache-service
+"""
+
+import asyncio
+import pytest
+from app.services.parse_cache import ParseCache
+
+
+def get_or_parse(cache: ParseCache, content: bytes, parse):
+    """API 와 같은 경로(get_or_parse_async, 키는 업로드 바이트의 SHA-256)로 조회/파싱"""
+    async def parse_content():
+        return parse(content)
+    return asyncio.run(cache.get_or_parse_async(ParseCache.digest(content), parse_content))
+
+
+class TestParseCache:
+    """@TEST:parse-cache-unit - 파싱 캐시 단위 테스트"""
+
+    @pytest.fixture
+    def parse_calls(self):
+        return []
+
+    @pytest.fixture
+    def parse(self, parse_calls):
+        def _parse(content: bytes):
+            parse_calls.append(content)
+            return {"paragraphs": [{"index": 0, "text": content.decode("utf-8")}], "tables": [], "metadata": {}}
+        return _parse
+
+    def test_memory_hit(self, tmp_path, parse, parse_calls):
+        """
+        @TEST:parse-cache-unit-001
+        같은 바이트는 한 번만 파싱
+        """
+        cache = ParseCache(str(tmp_path))
+
+        first = get_or_parse(cache, b"template", parse)
+        second = get_or_parse(cache, b"template", parse)
+
+        assert first == second
+        assert len(parse_calls) == 1
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["disk_entries"] == 1
+
+    def test_disk_hit_after_restart(self, tmp_path, parse, parse_calls):
+        """
+        @TEST:parse-cache-unit-002
+        메모리 계층이 비어 있어도 디스크 계층에서 복원
+        """
+        get_or_parse(ParseCache(str(tmp_path)), b"template", parse)
+
+        cache = ParseCache(str(tmp_path))
+        result = get_or_parse(cache, b"template", parse)
+
+        assert result["paragraphs"][0]["text"] == "template"
+        assert len(parse_calls) == 1
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_memory_lru_eviction(self, tmp_path, parse, parse_calls):
+        """
+        @TEST:parse-cache-unit-003
+        메모리 계층은 최근 사용 항목만 유지
+        """
+        cache = ParseCache(None, memory_entries=2)
+
+        get_or_parse(cache, b"a", parse)
+        get_or_parse(cache, b"b", parse)
+        get_or_parse(cache, b"a", parse)
+        get_or_parse(cache, b"c", parse)  # b 제거
+        get_or_parse(cache, b"a", parse)
+        get_or_parse(cache, b"b", parse)
+
+        assert parse_calls == [b"a", b"b", b"c", b"b"]
+        assert cache.stats()["memory_evictions"] == 2
+
+    def test_disk_size_eviction(self, tmp_path, parse):
+        """
+        @TEST:parse-cache-unit-004
+        디스크 계층 총 크기 제한 초과 시 오래된 항목부터 삭제
+        """
+        cache = ParseCache(str(tmp_path), memory_entries=0, disk_max_bytes=200)
+
+        for idx in range(5):
+            get_or_parse(cache, f"document-{idx}".encode("utf-8"), parse)
+
+        stats = cache.stats()
+        assert stats["disk_bytes"] <= 200
+        assert stats["disk_evictions"] > 0
+        assert cache.get(ParseCache.digest(b"document-4")) is not None
+        assert cache.get(ParseCache.digest(b"document-0")) is None
+
+    def test_disabled_cache(self, tmp_path, parse, parse_calls):
+        """
+        @TEST:parse-cache-unit-005
+        비활성화 시 항상 파싱
+        """
+        cache = ParseCache(str(tmp_path), enabled=False)
+
+        get_or_parse(cache, b"template", parse)
+        get_or_parse(cache, b"template", parse)
+
+        assert len(parse_calls) == 2
@@ -0,0 +1,179 @@
+"""
+@TEST:reference-extractors-unit
+Unit tests for Reference Extractor Registry
+
+Related:
+- @SPEC:FEAT-001-REQ-010 - Reference Extractor Registry
+- @CODE:reference-extractors
+"""
+
+import io
+import os
+import subprocess
+import sys
+import zlib
+import pytest
+from docx import Document
+from app.services.extractors import (
+    ExtractorRegistry,
+    ExtractorSpec,
+    ExtractorUnavailableError,
+    UnsupportedFormatError,
+    extractor_registry,
+)
+from app.services.extractors.hwp import para_text
+from document_builders import build_cfb, build_hwp, build_hwpx, build_pdf
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "backend")
+
+
+def docx_bytes(*paragraphs) -> bytes:
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    stream = io.BytesIO()
+    doc.save(stream)
+    return stream.getvalue()
+
+
+class TestDetect:
+    """@TEST:reference-extractors-unit - 형식 판별"""
+
+    def test_detect_by_content(self):
+        """
+        @TEST:reference-extractors-unit-001
+        시그니처/zip 항목 이름으로 형식 판별, 파일 위치는 처음으로 되돌림
+
+        Tests: @SPEC:FEAT-001-REQ-010
+        """
+        cases = {
+            "pdf": build_pdf([["page"]]),
+            "hwp": build_hwp([["문단"]]),
+            "hwpx": build_hwpx([["문단"]]),
+            "docx": docx_bytes("문단"),
+            "text": "국내 시장 동향".encode("cp949"),
+        }
+        for expected, data in cases.items():
+            stream = io.BytesIO(data)
+            assert extractor_registry.detect(stream) == expected
+            assert stream.tell() == 0
+
+        assert extractor_registry.detect("UTF-16 메모".encode("utf-16")) == "text"
+        assert extractor_registry.detect(b"\x00\x01binary") is None
+        assert extractor_registry.detect(b"PK\x03\x04 truncated") is None
+
+
+class TestExtract:
+    """@TEST:reference-extractors-unit - 형식별 추출"""
+
+    def test_pdf_pages_and_page_cap(self):
+        """
+        @TEST:reference-extractors-unit-002
+        PDF 는 페이지 단위로 추출하고 제한을 넘는 페이지는 읽지 않음
+        """
+        pytest.importorskip("pypdf")
+        pdf = build_pdf([["First page", "second line"], ["Second page"], ["Third page"]])
+
+        full = extractor_registry.extract("pdf", pdf, max_pages=10)
+        capped = extractor_registry.extract("pdf", pdf, max_pages=1)
+
+        assert (full.pages, full.truncated) == (3, False)
+        assert full.text.split("\n\n") == ["First page\nsecond line", "Second page", "Third page"]
+        assert (capped.pages, capped.truncated, capped.text) == (1, True, "First page\nsecond line")
+        with pytest.raises(UnsupportedFormatError):
+            extractor_registry.extract("pdf", b"%PDF-1.4", max_pages=10)
+
+    def test_hwp_body_text(self):
+        """
+        @TEST:reference-extractors-unit-003
+        HWP 5.x 본문 구역의 문단 텍스트만 추출 (압축/비압축, 컨트롤 건너뜀, 배포용은 미리보기)
+        """
+        pytest.importorskip("olefile")
+        sections = [["1. 시장 분석", "국내 시장 규모는 1조원"], ["2. 재무 계획"]]
+
+        compressed = extractor_registry.extract("hwp", build_hwp(sections), max_pages=10)
+        plain = extractor_registry.extract("hwp", build_hwp(sections, compressed=False), max_pages=1)
+        distribution = extractor_registry.extract(
+            "hwp", build_hwp(sections, distribution=True, preview="미리보기 본문"), max_pages=10
+        )
+
+        assert compressed.text == "1. 시장 분석\n국내 시장 규모는 1조원\n\n2. 재무 계획"
+        assert (plain.pages, plain.truncated, plain.text) == (1, True, "1. 시장 분석\n국내 시장 규모는 1조원")
+        assert (distribution.text, distribution.truncated) == ("미리보기 본문", True)
+        # 탭(인라인 컨트롤)은 8 WCHAR 를 차지하지만 탭 문자 하나로 읽음
+        assert para_text("가\t".encode("utf-16-le") + b"\x00\x00" * 7 + "나\r".encode("utf-16-le")) == "가\t나"
+        with pytest.raises(UnsupportedFormatError):
+            extractor_registry.extract("hwp", build_cfb({"WordDocument": b"\x00" * 4096}), max_pages=10)
+
+    def test_hwp_inflate_limit(self, monkeypatch):
+        """
+        @TEST:reference-extractors-unit-007
+        압축률이 높은 HWP 구역은 풀린 크기가 제한을 넘는 순간 멈추고 거절 (제한 안이면 그대로 추출)
+        """
+        pytest.importorskip("olefile")
+        from app.config import settings
+        from app.services.extractors.hwp import inflate
+
+        hwp = build_hwp([["가" * 2000] * 200])
+        assert len(hwp) < 64 * 1024
+
+        monkeypatch.setattr(settings, "reference_max_extract_bytes", 100 * 1024)
+        with pytest.raises(UnsupportedFormatError):
+            extractor_registry.extract("hwp", hwp, max_pages=10)
+
+        monkeypatch.setattr(settings, "reference_max_extract_bytes", 10 * 1024 * 1024)
+        assert extractor_registry.extract("hwp", hwp, max_pages=10).text.count("\n") == 199
+
+        bomb = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        bomb = bomb.compress(b"\x00" * (50 * 1024 * 1024)) + bomb.flush()
+        with pytest.raises(UnsupportedFormatError):
+            inflate(io.BytesIO(bomb), 1024 * 1024)
+
+    def test_hwpx_sections_and_tables(self):
+        """
+        @TEST:reference-extractors-unit-004
+        HWPX 는 구역 순서대로, 표 안 문단은 한 번씩만 추출
+        """
+        hwpx = build_hwpx([["첫 문단", "둘째 문단"], ["다음 구역"]], table_cells=["매출", "1억"])
+
+        extracted = extractor_registry.extract("hwpx", hwpx, max_pages=10)
+
+        assert extracted.text == "첫 문단\n둘째 문단\n매출\n1억\n표 아래\n\n다음 구역"
+        assert extracted.pages == 2
+
+
+class TestLazyLoading:
+    """@TEST:reference-extractors-unit - 지연 로드와 플러그인"""
+
+    def test_backends_not_imported_at_startup(self):
+        """
+        @TEST:reference-extractors-unit-005
+        앱 import 시 PDF/HWP 백엔드를 로드하지 않고 첫 추출 때 로드
+        """
+        code = (
+            "import sys; import app.main; "
+            "from app.services.extractors import extractor_registry; "
+            "print(sorted(m for m in ('pypdf', 'olefile') if m in sys.modules), extractor_registry.loaded())"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip().splitlines()[-1] == "[] []"
+
+    def test_registered_plugin_and_missing_dependency(self):
+        """
+        @TEST:reference-extractors-unit-006
+        새 추출기를 등록해 우선 판별하고, 의존성이 없는 추출기는 설치 안내 오류
+        """
+        registry = ExtractorRegistry()
+        registry.register(ExtractorSpec(
+            "rtf", "missing_rtf_backend:extract", lambda head, names: head.startswith(b"{\\rtf"),
+            requires=("striprtf",), priority=15
+        ))
+
+        assert registry.detect(b"{\\rtf1 hello}") == "rtf"
+        assert registry.formats().index("rtf") < registry.formats().index("text")
+        with pytest.raises(ExtractorUnavailableError, match="striprtf"):
+            registry.extract("rtf", b"{\\rtf1 hello}", max_pages=1)
+        assert registry.loaded() == []
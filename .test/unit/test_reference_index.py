@@ -0,0 +1,107 @@
+"""
+@TEST:reference-index-unit
+Unit tests for reference chunking and BM25 retrieval
+
+Related:
+- @CODE:reference-index-service
+"""
+
+from app.services.reference_index import ReferenceIndex, chunk_text, tokenize
+from app.utils.tokens import estimate_tokens
+
+MARKET_DOC = "\n\n".join([
+    "국내 물류 시장 규모는 2024년 기준 약 100조원이며 연평균 8% 성장하고 있습니다.",
+    "주요 경쟁사로는 A사와 B사가 있으며 두 회사의 시장 점유율 합계는 45% 입니다.",
+    "정부는 스마트 물류 육성을 위해 R&D 예산을 확대하고 있습니다.",
+    "중소 화주의 배차 비용 절감 수요가 증가하는 추세입니다."
+])
+RECIPE_DOC = "김치찌개는 돼지고기와 신김치를 넣고 끓입니다. 두부와 대파를 마지막에 넣습니다."
+
+
+class TestTokenizeAndChunk:
+    """@TEST:reference-index-unit - 토큰 분리 및 청크 분할"""
+
+    def test_hangul_bigrams(self):
+        """
+        @TEST:reference-index-unit-001
+        한국어 어절은 음절 bigram 을 함께 색인하여 조사가 붙어도 일치
+        """
+        assert "경쟁" in tokenize("경쟁사는")
+        assert set(tokenize("경쟁사")) & set(tokenize("경쟁사와의"))
+        assert tokenize("AI Market 2025") == ["ai", "market", "2025"]
+
+    def test_chunks_respect_token_size(self):
+        """
+        @TEST:reference-index-unit-002
+        청크는 문단 경계를 따르며 지정 크기를 넘지 않음
+        """
+        text = "\n".join(f"{i}번 문단은 시장 분석 내용을 담고 있습니다." for i in range(50))
+        chunks = chunk_text(text, chunk_tokens=60, overlap_tokens=0)
+
+        assert len(chunks) > 5
+        assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+        assert "".join(chunks).count("번 문단은") == 50
+
+    def test_long_sentence_split(self):
+        """
+        @TEST:reference-index-unit-003
+        청크보다 긴 문장도 분할
+        """
+        chunks = chunk_text("가" * 1000, chunk_tokens=100, overlap_tokens=0)
+
+        assert len(chunks) == 10
+        assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+
+
+class TestReferenceIndex:
+    """@TEST:reference-index-unit - BM25 검색"""
+
+    def test_relevant_chunk_ranked_first(self):
+        """
+        @TEST:reference-index-unit-004
+        질의와 관련된 청크가 가장 높은 점수
+        """
+        index = ReferenceIndex(chunk_tokens=50, overlap_tokens=0)
+        market_id = index.add(MARKET_DOC)
+        index.add(RECIPE_DOC)
+
+        results = index.search("경쟁사 점유율", top_k=2)
+
+        assert results[0]["doc_id"] == market_id
+        assert "점유율" in results[0]["text"]
+        assert results[0]["score"] >= results[-1]["score"]
+
+    def test_budget_and_document_filter(self):
+        """
+        @TEST:reference-index-unit-005
+        토큰 예산과 대상 문서 제한
+        """
+        index = ReferenceIndex(chunk_tokens=50, overlap_tokens=0)
+        market_id = index.add(MARKET_DOC)
+        recipe_id = index.add(RECIPE_DOC)
+
+        budgeted = index.search("시장 규모 성장 경쟁사 점유율 물류", top_k=10, budget_tokens=60)
+        assert budgeted
+        assert sum(r["tokens"] for r in budgeted) <= 60
+
+        assert index.search("시장 규모", doc_ids=[recipe_id]) == []
+        assert {r["doc_id"] for r in index.search("시장 규모", doc_ids=[market_id])} == {market_id}
+
+    def test_idempotent_add_and_eviction(self):
+        """
+        @TEST:reference-index-unit-006
+        같은 문서는 한 번만 색인하고, 문서 수 제한 초과 시 오래된 문서 제거
+        """
+        index = ReferenceIndex(chunk_tokens=50, overlap_tokens=0, max_documents=2)
+        market_id = index.add(MARKET_DOC)
+        chunks = index.stats()["chunks"]
+
+        assert index.add(MARKET_DOC) == market_id
+        assert index.stats()["chunks"] == chunks
+
+        index.add(RECIPE_DOC)
+        index.add("세 번째 문서: 재무 계획과 손익 분기점")
+
+        assert index.stats()["documents"] == 2
+        assert index.chunk_count(market_id) == 0
+        assert all(r["doc_id"] != market_id for r in index.search("물류 시장"))
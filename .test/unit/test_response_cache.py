@@ -0,0 +1,169 @@
+"""
+@TEST:response-cache-unit
+Unit tests for AI response cache
+
+Related:
+- @CODE:response-cache-service
+"""
+
+import pytest
+from app.services.response_cache import (
+    ResponseCache,
+    MemoryResponseBackend,
+    SQLiteResponseBackend,
+    CACHE_MODE_BYPASS,
+    create_backend,
+    normalize_prompt
+)
+
+
+def make_request(prompt: str, **params):
+    request = {
+        "model": "gpt-4-turbo-preview",
+        "messages": [
+            {"role": "system", "content": "당신은 전문 사업계획서 작성자입니다."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 2000
+    }
+    request.update(params)
+    return request
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend_factory(request, tmp_path):
+    def _create(max_entries: int = 16):
+        if request.param == "memory":
+            return MemoryResponseBackend(max_entries=max_entries)
+        return SQLiteResponseBackend(str(tmp_path / "responses.sqlite3"), max_entries=max_entries)
+    return _create
+
+
+class TestResponseCacheKey:
+    """@TEST:response-cache-unit - 캐시 키 정규화"""
+
+    def test_whitespace_and_unicode_normalized(self):
+        """
+        @TEST:response-cache-unit-001
+        공백/빈 줄/유니코드 정규화 차이는 같은 키
+        """
+        import unicodedata
+        nfd_title = unicodedata.normalize("NFD", "물류 플랫폼")
+
+        a = make_request("\n  제목: 물류 플랫폼\n\n설명:   배차 최적화  \n")
+        b = make_request(f"제목: {nfd_title}\n설명: 배차 최적화")
+
+        assert ResponseCache.key(a) == ResponseCache.key(b)
+        assert normalize_prompt("  a \t b \n\n c ") == "a b\nc"
+
+    def test_model_params_in_key(self):
+        """
+        @TEST:response-cache-unit-002
+        모델 파라미터가 다르면 다른 키
+        """
+        base = make_request("제목: 물류 플랫폼")
+
+        assert ResponseCache.key(base) != ResponseCache.key(make_request("제목: 물류 플랫폼", temperature=0.2))
+        assert ResponseCache.key(base) != ResponseCache.key(make_request("제목: 물류 플랫폼", model="gpt-4o-mini"))
+        assert ResponseCache.key(base) != ResponseCache.key(make_request("제목: 택배 플랫폼"))
+
+
+class TestResponseCache:
+    """@TEST:response-cache-unit - 응답 캐시 단위 테스트"""
+
+    def test_hit_and_saved_tokens(self, backend_factory):
+        """
+        @TEST:response-cache-unit-003
+        저장 후 같은 요청은 적중하며 절약한 토큰 수 누적
+        """
+        cache = ResponseCache(backend_factory())
+        request = make_request("제목: 물류 플랫폼")
+
+        assert cache.get(request) is None
+        cache.put(request, "시장 규모는 3조원입니다.")
+        entry = cache.get(request)
+
+        assert entry["content"] == "시장 규모는 3조원입니다."
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["saved_tokens"] == entry["prompt_tokens"] + entry["completion_tokens"] > 0
+
+    def test_ttl_expiry(self, backend_factory, monkeypatch):
+        """
+        @TEST:response-cache-unit-004
+        TTL 이 지나면 만료
+        """
+        import app.services.response_cache as response_cache
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+
+        cache = ResponseCache(backend_factory(), ttl=60)
+        request = make_request("제목: 물류 플랫폼")
+        cache.put(request, "결과")
+
+        now[0] += 59
+        assert cache.get(request) is not None
+        now[0] += 2
+        assert cache.get(request) is None
+
+    def test_lru_eviction(self, backend_factory, monkeypatch):
+        """
+        @TEST:response-cache-unit-005
+        항목 수 제한 초과 시 가장 오래 사용하지 않은 항목 삭제
+        """
+        import app.services.response_cache as response_cache
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+
+        cache = ResponseCache(backend_factory(max_entries=2))
+        first, second, third = (make_request(f"제목: 사업 {i}") for i in range(3))
+
+        cache.put(first, "1")
+        now[0] += 1
+        cache.put(second, "2")
+        now[0] += 1
+        assert cache.get(first) is not None  # first 를 최근 사용으로 갱신
+        now[0] += 1
+        cache.put(third, "3")
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["entries"] == 2
+
+    def test_bypass_skips_lookup(self, backend_factory):
+        """
+        @TEST:response-cache-unit-006
+        bypass 모드는 조회하지 않음
+        """
+        cache = ResponseCache(backend_factory())
+        request = make_request("제목: 물류 플랫폼")
+        cache.put(request, "결과")
+
+        assert cache.get(request, CACHE_MODE_BYPASS) is None
+        stats = cache.stats()
+        assert stats["bypassed"] == 1
+        assert stats["hits"] == 0
+
+    def test_sqlite_persists_across_instances(self, tmp_path):
+        """
+        @TEST:response-cache-unit-007
+        SQLite 백엔드는 재시작 후에도 유지
+        """
+        path = str(tmp_path / "responses.sqlite3")
+        request = make_request("제목: 물류 플랫폼")
+        ResponseCache(SQLiteResponseBackend(path)).put(request, "결과")
+
+        assert ResponseCache(SQLiteResponseBackend(path)).get(request)["content"] == "결과"
+
+    def test_unknown_backend(self):
+        """
+        @TEST:response-cache-unit-008
+        지원되지 않는 백엔드
+        """
+        with pytest.raises(ValueError):
+            create_backend("redis")
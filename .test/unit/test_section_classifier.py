@@ -0,0 +1,80 @@
+"""
+@TEST:section-classifier-unit
+Unit tests for Section Classifier
+
+Related:
+- @SPEC:FEAT-001-REQ-003 - Section Type Identification
+- @CODE:section-classifier-service
+"""
+
+import json
+import os
+from app.services.docx_parser import DocxParser
+from app.services.section_classifier import SectionClassifier, section_classifier
+
+LABELS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "section_labels.json")
+
+
+def load_labels():
+    with open(LABELS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestSectionClassifier:
+    """@TEST:section-classifier-unit - 섹션 분류기 단위 테스트"""
+
+    def test_labeled_headings(self):
+        """
+        @TEST:section-classifier-unit-001
+        실제 사업계획서 양식 제목 모음을 모두 올바르게 분류 ("분석"만으로 시장 분석이 되지 않음)
+
+        Tests: @SPEC:FEAT-001-REQ-003
+        """
+        labels = load_labels()
+        wrong = [
+            (item["text"], item["section"], section_classifier.classify(item["text"]))
+            for item in labels
+            if section_classifier.classify(item["text"]) != item["section"]
+        ]
+
+        assert wrong == []
+        assert section_classifier.classify("경쟁사 분석") == "competitive_analysis"
+        assert section_classifier.classify("SWOT 분석") == "swot_analysis"
+
+    def test_batch_matches_single(self):
+        """
+        @TEST:section-classifier-unit-002
+        일괄 분류 결과가 문단별 분류와 같고, 키워드가 문단 경계를 넘지 않음
+        """
+        texts = [item["text"] for item in load_labels()] + ["", "시장\n분석", "경쟁", "사 분석"]
+
+        assert DocxParser.identify_section_types(texts) == [section_classifier.classify(text) for text in texts]
+        assert section_classifier.classify_many(["경쟁", "사"]) == ["competitive_analysis", "general"]
+        assert section_classifier.classify_many([]) == []
+
+    def test_case_and_whitespace_insensitive(self):
+        """
+        @TEST:section-classifier-unit-003
+        영문 대소문자와 키워드 사이 공백 개수에 관계없이 일치
+        """
+        assert section_classifier.classify("MARKET   ANALYSIS") == "market_analysis"
+        assert section_classifier.classify("사업   개요") == "business_overview"
+        assert section_classifier.scores("Cash\tFlow") == {"financial_plan": 2.5}
+
+    def test_custom_keyword_table(self, tmp_path):
+        """
+        @TEST:section-classifier-unit-004
+        키워드 표 파일은 기본 표에 덮어쓰며, 가중치 0 은 키워드 제거
+        """
+        path = tmp_path / "keywords.json"
+        path.write_text(json.dumps({
+            "team": {"팀 구성": 3, "대표자": 2},
+            "business_overview": {"사업": 0}
+        }, ensure_ascii=False), encoding="utf-8")
+
+        classifier = SectionClassifier.from_file(str(path))
+
+        assert classifier.classify("5. 대표자 및 팀 구성") == "team"
+        assert classifier.classify("사업 추진 배경") == "general"
+        assert classifier.classify("2. 시장 분석") == "market_analysis"
+        assert SectionClassifier({}).classify("시장 분석") == "general"
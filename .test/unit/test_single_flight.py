@@ -0,0 +1,123 @@
+"""
+@TEST:single-flight-unit
+Unit tests for Request Coalescing (single-flight)
+
+Related:
+- @SPEC:FEAT-002-REQ-012 - Request Coalescing
+- @CODE:single-flight-service
+"""
+
+import asyncio
+from app.services.single_flight import SingleFlight
+
+
+class Upstream:
+    """parts 를 interval 간격으로 내보내는 업스트림 호출 (호출/취소 횟수 기록)"""
+
+    def __init__(self, parts, interval: float = 0.02, error: Exception = None):
+        self.parts = parts
+        self.interval = interval
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, flight):
+        self.calls += 1
+        try:
+            for part in self.parts:
+                await asyncio.sleep(self.interval)
+                flight.publish(part)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+
+
+async def consume(group, key, upstream, limit=None):
+    received = []
+    async with group.join(key, upstream) as (flight, coalesced):
+        async for part in flight.follow():
+            received.append(part)
+            if limit is not None and len(received) >= limit:
+                break
+    return received, coalesced
+
+
+class TestSingleFlight:
+    """@TEST:single-flight-unit - 진행 중인 호출 공유"""
+
+    def test_concurrent_callers_share_one_call(self):
+        """
+        @TEST:single-flight-unit-001
+        같은 키의 동시 호출은 업스트림 호출 하나를 공유하고, 늦게 참여해도 처음 조각부터 받음
+
+        Tests: @SPEC:FEAT-002-REQ-012
+        """
+        group = SingleFlight()
+        upstream = Upstream(["시장", " 규모는", " 1조원"])
+        other = Upstream(["다른 요청"])
+
+        async def scenario():
+            first = asyncio.create_task(consume(group, "same", upstream))
+            await asyncio.sleep(0.03)  # 첫 조각이 나온 뒤 참여
+            return await asyncio.gather(
+                first, consume(group, "same", upstream), consume(group, "other", other)
+            )
+
+        (first, second, different) = asyncio.run(scenario())
+
+        assert first == (["시장", " 규모는", " 1조원"], False)
+        assert second == (["시장", " 규모는", " 1조원"], True)
+        assert different == (["다른 요청"], False)
+        assert (upstream.calls, other.calls) == (1, 1)
+        assert group.stats() == {"flights": 2, "coalesced": 1, "abandoned": 0, "in_flight": 0}
+
+    def test_first_caller_leaving_keeps_call_for_others(self):
+        """
+        @TEST:single-flight-unit-002
+        먼저 요청한 호출자가 떠나도 업스트림 호출은 계속되고, 모두 떠나면 취소
+        """
+        group = SingleFlight()
+        upstream = Upstream(["a", "b", "c", "d"])
+        abandoned = Upstream(["x", "y", "z"])
+
+        async def scenario():
+            leader = asyncio.create_task(consume(group, "same", upstream))
+            follower = asyncio.create_task(consume(group, "same", upstream))
+            await asyncio.sleep(0.03)
+            leader.cancel()
+            partial = await consume(group, "alone", abandoned, limit=1)
+            await asyncio.sleep(0.05)
+            return await follower, partial, leader.cancelled()
+
+        follower, partial, leader_cancelled = asyncio.run(scenario())
+
+        assert leader_cancelled
+        assert follower == (["a", "b", "c", "d"], True)
+        assert (upstream.calls, upstream.cancelled) == (1, 0)
+        assert partial == (["x"], False)
+        assert (abandoned.calls, abandoned.cancelled) == (1, 1)
+        assert group.stats()["abandoned"] == 1 and group.stats()["in_flight"] == 0
+
+    def test_error_reaches_every_caller(self):
+        """
+        @TEST:single-flight-unit-003
+        업스트림 오류는 공유한 호출자 모두에게 발생하고, 끝난 키는 다음 호출에서 새로 시작
+        """
+        group = SingleFlight()
+        failing = Upstream(["부분"], error=RuntimeError("429 Too Many Requests"))
+
+        async def scenario():
+            results = await asyncio.gather(
+                consume(group, "same", failing), consume(group, "same", failing), return_exceptions=True
+            )
+            retried = await consume(group, "same", Upstream(["다시"]))
+            return results, retried
+
+        results, retried = asyncio.run(scenario())
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert [str(result) for result in results] == ["429 Too Many Requests"] * 2
+        assert failing.calls == 1
+        assert retried == (["다시"], False)
@@ -0,0 +1,145 @@
+"""
+@TEST:token-budget-unit
+Unit tests for Token Budget
+
+Related:
+- @SPEC:FEAT-002-REQ-010 - Token Budget
+- @CODE:token-budget-service
+"""
+
+import pytest
+from app.services.token_budget import PromptBudgetError, TokenBudget, context_tokens
+from app.utils import tokens
+from app.utils.tokens import EstimateTokenizer, estimate_tokens, get_tokenizer, register_tokenizer_backend
+
+
+def build(info, references):
+    """시장 분석 프롬프트와 같은 모양의 메시지"""
+    ref_context = "\n\n".join(references) if references else "참고 문서 없음"
+    return [
+        {"role": "system", "content": "당신은 전문 사업계획서 작성자입니다."},
+        {"role": "user", "content": f"제목: {info['title']}\n설명: {info['description']}\n참고 자료:\n{ref_context}"}
+    ]
+
+
+class TestTokenizer:
+    """@TEST:token-budget-unit - 토크나이저 백엔드"""
+
+    def test_estimate_tokenizer_truncate_within_limit(self):
+        """
+        @TEST:token-budget-unit-001
+        추정 토크나이저는 estimate_tokens 와 같은 수를 세고, 자른 텍스트는 한도를 넘지 않음
+
+        Tests: @SPEC:FEAT-002-REQ-010
+        """
+        tokenizer = EstimateTokenizer()
+        text = "국내 물류 시장 market size 1조원, " * 20
+
+        assert tokenizer.count(text) == estimate_tokens(text)
+        for limit in (0, 1, 7, 50, 10 ** 6):
+            truncated = tokenizer.truncate(text, limit)
+            assert text.startswith(truncated)
+            assert tokenizer.count(truncated) <= limit
+
+    def test_tokenizer_cached_and_pluggable(self, monkeypatch):
+        """
+        @TEST:token-budget-unit-002
+        (백엔드, 모델)별 토크나이저는 한 번만 만들고, auto 는 tiktoken 을 쓸 수 없으면 추정값 사용
+        """
+        created = []
+
+        class CharTokenizer(EstimateTokenizer):
+            name = "chars"
+
+            def count(self, text):
+                return len(text)
+
+        def failing_tiktoken(model):
+            raise ImportError("No module named 'tiktoken'")
+
+        monkeypatch.setitem(tokens.TOKENIZER_BACKENDS, "tiktoken", failing_tiktoken)
+        register_tokenizer_backend("chars", lambda model: created.append(model) or CharTokenizer())
+        try:
+            assert get_tokenizer("chars", "gpt-4") is get_tokenizer("chars", "gpt-4")
+            assert created == ["gpt-4"]
+            assert get_tokenizer("chars").count("abcd") == 4
+            assert get_tokenizer("auto", "gpt-4").name == "estimate"
+            with pytest.raises(ValueError):
+                get_tokenizer("sentencepiece")
+        finally:
+            del tokens.TOKENIZER_BACKENDS["chars"]
+            get_tokenizer.cache_clear()
+
+    def test_tiktoken_backend(self):
+        """
+        @TEST:token-budget-unit-003
+        tiktoken 백엔드 (설치된 경우): BPE 토큰 수와 토큰 경계 자르기
+        """
+        pytest.importorskip("tiktoken")
+        try:
+            tokenizer = get_tokenizer("tiktoken", "gpt-4")
+        except Exception as e:  # 인코딩 파일을 받을 수 없는 환경
+            pytest.skip(f"tiktoken 인코딩을 불러올 수 없음: {e}")
+
+        text = "Market size grows 12% a year. 국내 시장 규모는 1조원입니다."
+        assert 0 < tokenizer.count(text) < len(text)
+        assert tokenizer.count(tokenizer.truncate(text, 5)) <= 5
+
+
+class TestTokenBudget:
+    """@TEST:token-budget-unit - 입력/출력 토큰 배분"""
+
+    def test_fit_texts_keeps_order_and_truncates_first_overflow(self):
+        """
+        @TEST:token-budget-unit-004
+        앞의 텍스트부터 넣고, 처음 넘치는 텍스트는 잘라서 넣으며 그 뒤는 뺌
+        """
+        budget = TokenBudget(EstimateTokenizer(), context_tokens=8192)
+        texts = ["가" * 100, "나" * 300, "다" * 50]
+
+        fitted, dropped = budget.fit_texts(texts, 250)
+
+        assert fitted[0] == texts[0]
+        assert fitted[1].startswith("나") and fitted[1].endswith("(이하 생략)")
+        assert len(fitted) == 2
+        assert budget.count(fitted[0]) + budget.count("\n\n") + budget.count(fitted[1]) <= 250
+        assert dropped == 450 - budget.count(fitted[0]) - budget.count(fitted[1])
+        assert budget.fit_texts(texts, 120) == ([texts[0]], 350)
+        assert budget.fit_texts(texts, 10 ** 6) == (texts, 0)
+
+    def test_fit_prompt_compacts_long_fields_and_sets_max_tokens(self):
+        """
+        @TEST:token-budget-unit-005
+        기본 프롬프트가 입력 한도를 넘으면 긴 설명을 잘라 맞추고, 참고 자료는 남은 토큰에 맞춤.
+        max_tokens 는 섹션 설정값과 컨텍스트에 남은 토큰 중 작은 값
+        """
+        budget = TokenBudget(EstimateTokenizer(), context_tokens=1500, input_budget_tokens=1000, min_output_tokens=200)
+        info = {"title": "AI 물류 플랫폼", "description": "배차 최적화 " * 400}
+
+        fitted = budget.fit_prompt(build, info, ["참고 " * 300], requested_output_tokens=2000)
+
+        assert fitted["compacted_fields"] == ["description"]
+        assert fitted["prompt_tokens"] <= 1000
+        assert fitted["prompt_tokens"] == budget.count_messages(fitted["messages"])
+        assert fitted["reference_tokens"] == 0 and fitted["dropped_reference_tokens"] > 0
+        assert fitted["max_tokens"] == 1500 - fitted["prompt_tokens"]
+        assert info["description"] == "배차 최적화 " * 400  # 원본은 그대로
+
+        short = budget.fit_prompt(build, {"title": "t", "description": "d"}, ["참고 " * 100], 300)
+        assert short["compacted_fields"] == [] and short["dropped_reference_tokens"] == 0
+        assert short["max_tokens"] == 300
+
+    def test_budget_errors_and_model_context(self):
+        """
+        @TEST:token-budget-unit-006
+        줄일 항목이 없는데 한도를 넘거나 출력 토큰이 부족하면 PromptBudgetError
+        """
+        budget = TokenBudget(EstimateTokenizer(), context_tokens=600, min_output_tokens=256)
+
+        with pytest.raises(PromptBudgetError):
+            budget.fit_prompt(build, {"title": "제목" * 400, "description": ""}, [], 100)
+        with pytest.raises(PromptBudgetError):
+            budget.output_tokens(400, 100)
+        assert context_tokens("gpt-4-turbo-preview") == 128000
+        assert context_tokens("gpt-4-0613") == 8192
+        assert context_tokens("gpt-4", override=32000) == 32000
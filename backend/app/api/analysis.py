@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.services.docx_parser import DocxParser
+from app.services.docx_diff import carry_over_sections
 
 router = APIRouter()
 
@@ -7,19 +7,30 @@ router = APIRouter()
 async def identify_sections(document_data: dict):
     """
     문서의 각 섹션 식별
+    
+    재업로드한 양식이면 previous_sections 에 이전 응답의 sections 를 넣으면
+    해시가 같은 문단은 이전 섹션 타입을 그대로 쓰고 바뀐 문단만 다시 분류합니다.
     """
-    parser = DocxParser()
+    paragraphs = document_data.get('paragraphs', [])
+    previous = {
+        section['hash']: section['section_type']
+        for section in document_data.get('previous_sections') or []
+        if section.get('hash')
+    }
+    section_types = carry_over_sections(paragraphs, previous)
     
-    sections = []
-    for paragraph in document_data.get('paragraphs', []):
-        section_type = parser.identify_section_type(paragraph['text'])
-        sections.append({
+    sections = [
+        {
             "index": paragraph['index'],
             "text": paragraph['text'],
+            "hash": paragraph.get('hash'),
             "section_type": section_type
-        })
+        }
+        for paragraph, section_type in zip(paragraphs, section_types)
+    ]
     
     return {
         "sections": sections,
-        "total_sections": len(sections)
+        "total_sections": len(sections),
+        "reclassified": sum(1 for paragraph in paragraphs if paragraph.get('hash') not in previous)
     }
@@ -1,40 +1,150 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
-from app.services.docx_parser import DocxParser
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from app.services.docx_parser import DocumentSource, docx_parser
+from app.services.parse_cache import ParseCache
+from app.services.docx_diff import diff_structures
+from app.services.extractors import (
+    extractor_registry,
+    extract_reference,
+    ExtractedText,
+    ExtractorUnavailableError,
+    UnsupportedFormatError,
+    FORMAT_DOCX,
+)
+from app.services.reference_index import reference_index
+from app.services.document_store import document_store, DOCUMENT_KIND_TEMPLATE, DOCUMENT_KIND_REFERENCE
+from app.services.executor import (
+    document_executor,
+    ExecutorSaturatedError,
+    ExecutorTimeoutError,
+    EXECUTOR_KIND_PROCESS,
+)
+from app.utils.uploads import extract_zip_members, hash_upload, spool_upload
+from app.config import settings
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional
 import aiofiles
-import os
-import tempfile
+import asyncio
+import json
+import logging
+import zipfile
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+parse_cache = ParseCache(
+    settings.parse_cache_dir,
+    memory_entries=settings.parse_cache_memory_entries,
+    disk_max_bytes=settings.parse_cache_disk_max_bytes,
+    enabled=settings.parse_cache_enabled
+)
+
+def _parse_docx(source: DocumentSource) -> Dict[str, Any]:
+    """업로드된 DOCX 를 임시 파일 없이 메모리/스풀 파일에서 바로 파싱"""
+    return docx_parser.parse_document(source)
+
+def _store_reference(filename: str, text: str) -> Dict[str, Any]:
+    """참고 문서 텍스트를 저장소에 보관하고 검색 인덱스에 등록"""
+    reference_id = reference_index.add(text)
+    document_store.put_reference(reference_id, filename, text)
+    return {"reference_id": reference_id, "chunks": reference_index.chunk_count(reference_id)}
+
+async def _worker_source(source: BinaryIO) -> DocumentSource:
+    """워커 풀에 넘길 원본 (프로세스 풀에는 pickle 가능한 bytes 만 전달할 수 있음)"""
+    if document_executor.kind == EXECUTOR_KIND_PROCESS:
+        source.seek(0)
+        return await asyncio.to_thread(source.read)
+    return source
+
+async def _parse_in_worker(source: BinaryIO) -> Dict[str, Any]:
+    """DOCX 파일 객체 파싱을 문서 워커 풀에서 실행"""
+    return await document_executor.run(_parse_docx, await _worker_source(source))
+
+async def _ingest_template(filename: str, digest: str, source: BinaryIO) -> Dict[str, Any]:
+    """
+    양식 파싱 (동일한 파일은 캐시된 결과 사용) 후 구조와 원본을 저장소에 보관
+    
+    파일 해시를 ID 로 저장하여 이후 요청에서 다시 업로드하지 않고 참조하며,
+    원본 패키지는 양식 보존 내보내기에서 복제합니다.
+    """
+    structure = await parse_cache.get_or_parse_async(digest, lambda: _parse_in_worker(source))
+    await asyncio.to_thread(document_store.put_template, digest, filename, structure)
+    source.seek(0)
+    await asyncio.to_thread(document_store.put_template_source, digest, source)
+    return {"template_id": digest, "filename": filename, "structure": structure}
+
+async def _reference_text(digest: str, source: BinaryIO) -> ExtractedText:
+    """
+    참고 문서 텍스트 추출 (파일 이름이 아닌 내용으로 형식 판별)
+    
+    DOCX 는 양식 파싱 캐시를 함께 쓰고, PDF/HWP/HWPX/텍스트는 레지스트리 추출기를
+    워커 풀에서 실행합니다 (PDF 는 reference_max_pages 페이지까지).
+    
+    Raises:
+        UnsupportedFormatError: 판별할 수 없거나 읽을 수 없는 파일
+        ExtractorUnavailableError: 형식에 필요한 선택 의존성 미설치
+    """
+    kind = await asyncio.to_thread(extractor_registry.detect, source)
+    if kind is None:
+        raise UnsupportedFormatError(
+            f"지원되지 않는 파일 형식입니다 ({', '.join(extractor_registry.formats())} 만 가능)."
+        )
+    if kind == FORMAT_DOCX:
+        doc_data = await parse_cache.get_or_parse_async(digest, lambda: _parse_in_worker(source))
+        return ExtractedText(
+            format=FORMAT_DOCX,
+            text="\n".join([p['text'] for p in doc_data['paragraphs']]),
+            pages=1,
+            truncated=False
+        )
+    return await document_executor.run(
+        extract_reference, kind, await _worker_source(source), settings.reference_max_pages
+    )
+
+def _reference_result(extracted: ExtractedText) -> Dict[str, Any]:
+    """참고 문서 응답의 추출 정보와 미리보기"""
+    return {
+        "format": extracted.format,
+        "pages": extracted.pages,
+        "truncated": extracted.truncated,
+        "content": extracted.text[:500]  # 처음 500자만 미리보기
+    }
+
 @router.post("/upload-template")
-async def upload_template(file: UploadFile = File(...)):
+async def upload_template(file: UploadFile = File(...), previous_template_id: Optional[str] = Form(None)):
     """
     사업계획서 양식 업로드 및 분석
+    
+    수정한 양식을 다시 올릴 때 previous_template_id 에 이전 template_id 를 넣으면
+    문단/표 단위 비교 결과(diff)를 함께 반환합니다. 클라이언트는 diff.changed_sections 의
+    섹션만 다시 생성하면 됩니다.
     """
     if not file.filename.endswith('.docx'):
         raise HTTPException(status_code=400, detail="DOCX 파일만 업로드 가능합니다.")
     
+    previous_structure = None
+    if previous_template_id:
+        previous = await document_store.get_many_async([previous_template_id], DOCUMENT_KIND_TEMPLATE)
+        if previous_template_id not in previous:
+            raise HTTPException(status_code=404, detail="이전 양식을 찾을 수 없습니다.")
+        previous_structure = previous[previous_template_id]
+    
     try:
-        # 임시 파일 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_path = temp_file.name
-        
-        # 문서 파싱
-        parser = DocxParser()
-        document_structure = parser.parse_document(temp_path)
+        # 청크 단위로 읽으며 해시 계산 (크기 제한 초과 시 413)
+        digest, _ = await hash_upload(file, settings.max_upload_bytes, settings.upload_chunk_bytes)
         
-        # 임시 파일 삭제
-        os.unlink(temp_path)
+        # 문서 파싱 후 구조와 원본 저장
+        stored = await _ingest_template(file.filename, digest, file.file)
+        document_structure = stored["structure"]
         
-        return {
-            "message": "문서 분석 완료",
-            "filename": file.filename,
-            "structure": document_structure
-        }
+        response = {"message": "문서 분석 완료", **stored}
+        if previous_structure is not None:
+            response["previous_template_id"] = previous_template_id
+            response["diff"] = await asyncio.to_thread(diff_structures, previous_structure, document_structure)
+        return response
         
+    except (HTTPException, ExecutorSaturatedError, ExecutorTimeoutError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"문서 분석 오류: {str(e)}")
 
@@ -42,31 +152,242 @@ async def upload_template(file: UploadFile = File(...)):
 async def upload_reference(file: UploadFile = File(...)):
     """
     참고 문서 업로드
+    
+    형식은 파일 이름이 아닌 내용으로 판별합니다 (PDF, HWP 5.x, HWPX, DOCX, 텍스트).
+    추출한 텍스트는 저장소에 보관하고 청크로 나누어 검색 인덱스에 등록합니다.
+    생성 요청의 reference_documents 에 reference_id 를 넣으면 섹션과 관련된
+    청크만 프롬프트에 포함됩니다.
     """
     try:
-        content = await file.read()
+        digest, _ = await hash_upload(file, settings.max_upload_bytes, settings.upload_chunk_bytes)
         
-        # 파일 형식에 따라 처리
-        if file.filename.endswith('.txt'):
-            text_content = content.decode('utf-8')
-        elif file.filename.endswith('.docx'):
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-                temp_file.write(content)
-                temp_path = temp_file.name
-            
-            parser = DocxParser()
-            doc_data = parser.parse_document(temp_path)
-            text_content = "\n".join([p['text'] for p in doc_data['paragraphs']])
-            
-            os.unlink(temp_path)
-        else:
-            text_content = "지원되지 않는 파일 형식"
+        extracted = await _reference_text(digest, file.file)
+        
+        stored = {"reference_id": None, "chunks": 0}
+        if extracted.text.strip():
+            stored = await asyncio.to_thread(_store_reference, file.filename, extracted.text)
         
         return {
             "message": "참고 문서 업로드 완료",
             "filename": file.filename,
-            "content": text_content[:500]  # 처음 500자만 미리보기
+            **stored,
+            **_reference_result(extracted)
         }
         
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ExtractorUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except (HTTPException, ExecutorSaturatedError, ExecutorTimeoutError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"참고 문서 처리 오류: {str(e)}")
+
+# 일괄 업로드 문서 종류와 허용 확장자 (참고 문서는 파일 내용으로 형식 판별)
+BATCH_KIND_TEMPLATE = "template"
+BATCH_KIND_REFERENCE = "reference"
+BATCH_SUFFIXES = {
+    BATCH_KIND_TEMPLATE: ('.docx',),
+    BATCH_KIND_REFERENCE: None,
+}
+
+async def _collect_batch(files: List[UploadFile], kind: str) -> List[Dict[str, Any]]:
+    """
+    업로드 파일을 스풀 파일로 복사하고 zip 보관 파일은 풀어서 처리할 파일 목록 생성
+    
+    크기 제한(파일별 max_upload_bytes, 전체 batch_upload_max_bytes)이나 파일 수 제한을 넘으면
+    아무것도 처리하지 않고 요청 전체를 거절합니다. 지원하지 않는 형식은 파일별 오류로 남깁니다.
+    """
+    items: List[Dict[str, Any]] = []
+    total = 0
+    try:
+        for file in files:
+            filename = file.filename or ""
+            is_zip = filename.lower().endswith('.zip')
+            digest, size, spool = await spool_upload(
+                file,
+                settings.batch_upload_max_bytes if is_zip else settings.max_upload_bytes,
+                settings.upload_chunk_bytes
+            )
+            if not is_zip:
+                total += size
+                if total > settings.batch_upload_max_bytes:
+                    spool.close()
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"전체 업로드 크기가 제한({settings.batch_upload_max_bytes // (1024 * 1024)}MB)을 초과했습니다."
+                    )
+                items.append({"filename": filename, "digest": digest, "size": size, "source": spool})
+                continue
+            
+            try:
+                members = await asyncio.to_thread(
+                    extract_zip_members,
+                    spool,
+                    settings.max_upload_bytes,
+                    settings.batch_upload_max_bytes,
+                    total,
+                    settings.upload_chunk_bytes
+                )
+            except zipfile.BadZipFile:
+                items.append({"filename": filename, "size": size, "error": "zip 파일을 읽을 수 없습니다."})
+                continue
+            finally:
+                spool.close()
+            for name, member_digest, member_size, member_spool in members:
+                total += member_size
+                items.append({
+                    "filename": f"{filename}/{name}",
+                    "digest": member_digest,
+                    "size": member_size,
+                    "source": member_spool
+                })
+        
+        if len(items) > settings.batch_upload_max_files:
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일 수가 제한({settings.batch_upload_max_files}개)을 초과했습니다."
+            )
+    except BaseException:
+        for item in items:
+            if item.get("source"):
+                item["source"].close()
+        raise
+    
+    for item in items:
+        suffixes = BATCH_SUFFIXES[kind]
+        if suffixes and "error" not in item and not item["filename"].lower().endswith(suffixes):
+            item["source"].close()
+            item["source"] = None
+            item["error"] = f"지원되지 않는 파일 형식입니다 ({', '.join(suffixes)} 만 가능)."
+    return items
+
+async def _ingest_batch_item(item: Dict[str, Any], kind: str) -> Dict[str, Any]:
+    """일괄 업로드 파일 하나 처리 (단일 업로드와 같은 파싱/저장 경로)"""
+    filename = item["filename"]
+    if kind == BATCH_KIND_TEMPLATE:
+        return await _ingest_template(filename, item["digest"], item["source"])
+    
+    extracted = await _reference_text(item["digest"], item["source"])
+    if not extracted.text.strip():
+        raise ValueError("추출한 텍스트가 없습니다.")
+    stored = await asyncio.to_thread(_store_reference, filename, extracted.text)
+    return {**stored, **_reference_result(extracted)}
+
+async def _stream_batch(items: List[Dict[str, Any]], kind: str) -> AsyncIterator[str]:
+    """
+    파일을 동시에 처리하고 끝나는 순서대로 파일별 결과를 NDJSON 으로 전송
+    
+    동시 처리 수는 batch_upload_concurrency 로 제한하여 한 요청이 워커 풀 대기열을
+    모두 차지하지 않도록 합니다. 클라이언트가 연결을 끊으면 남은 작업을 취소합니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.batch_upload_concurrency))
+    
+    async def process(position: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        result = {"index": position, "filename": item["filename"], "size": item["size"]}
+        if "error" in item:
+            return {**result, "status": "error", "error": item["error"]}
+        try:
+            async with semaphore:
+                return {**result, "status": "ok", **(await _ingest_batch_item(item, kind))}
+        except HTTPException as e:
+            return {**result, "status": "error", "error": e.detail}
+        except Exception as e:
+            logger.warning(f"일괄 업로드 파일 처리 실패 ({item['filename']}): {str(e)}")
+            return {**result, "status": "error", "error": str(e)}
+        finally:
+            item["source"].close()
+    
+    tasks = [asyncio.create_task(process(position, item)) for position, item in enumerate(items)]
+    succeeded = 0
+    try:
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            succeeded += result["status"] == "ok"
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+        yield json.dumps({
+            "done": True,
+            "total": len(items),
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded
+        }) + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+        for item in items:
+            if item.get("source"):
+                item["source"].close()
+
+@router.post("/upload-batch")
+async def upload_batch(files: List[UploadFile] = File(...), kind: str = Form(BATCH_KIND_REFERENCE)):
+    """
+    여러 양식/참고 문서를 한 번에 업로드 (zip 보관 파일은 풀어서 각 파일로 처리)
+    
+    kind 는 "template" (DOCX) 또는 "reference" (내용으로 판별한 PDF/HWP/HWPX/DOCX/텍스트) 입니다. 파일을 워커 풀에서
+    동시에 파싱하고, 끝나는 순서대로 파일별 결과(index, filename, status, 단일 업로드와
+    같은 결과 또는 error)를 NDJSON 한 줄씩 보냅니다. 마지막 줄은 {"done": true, ...} 요약입니다.
+    파일 하나의 실패는 그 파일의 error 줄로만 보고합니다.
+    """
+    if kind not in BATCH_SUFFIXES:
+        raise HTTPException(status_code=400, detail=f"지원되지 않는 문서 종류: {kind}")
+    
+    items = await _collect_batch(files, kind)
+    return StreamingResponse(
+        _stream_batch(items, kind),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/templates/{template_id}")
+async def get_template(template_id: str):
+    """
+    저장된 양식 구조 조회
+    """
+    structure = await document_store.get_many_async([template_id], DOCUMENT_KIND_TEMPLATE)
+    if template_id not in structure:
+        raise HTTPException(status_code=404, detail="양식을 찾을 수 없습니다.")
+    metadata = await asyncio.to_thread(document_store.metadata, template_id)
+    
+    return {
+        "template_id": template_id,
+        "filename": metadata["filename"] if metadata else None,
+        "structure": structure[template_id]
+    }
+
+@router.get("/references/{reference_id}")
+async def get_reference(reference_id: str):
+    """
+    저장된 참고 문서 조회 (메타데이터 + 미리보기)
+    """
+    texts = await document_store.get_many_async([reference_id], DOCUMENT_KIND_REFERENCE)
+    if reference_id not in texts:
+        raise HTTPException(status_code=404, detail="참고 문서를 찾을 수 없습니다.")
+    metadata = await asyncio.to_thread(document_store.metadata, reference_id)
+    
+    return {
+        "reference_id": reference_id,
+        "filename": metadata["filename"] if metadata else None,
+        "size": metadata["size"] if metadata else None,
+        "content": texts[reference_id][:500]
+    }
+
+@router.get("/store-stats")
+async def store_stats():
+    """
+    문서 저장소 상태 (저장 문서 수, 메모리 캐시 적중)
+    """
+    return await asyncio.to_thread(document_store.stats)
+
+@router.get("/cache-stats")
+async def cache_stats():
+    """
+    양식 파싱 캐시 적중/미스 통계 (처음 호출 시 디스크 캐시 디렉터리를 훑으므로 스레드에서 실행)
+    """
+    return await asyncio.to_thread(parse_cache.stats)
+
+@router.get("/executor-stats")
+async def executor_stats():
+    """
+    문서 워커 풀 상태 (실행/대기 작업 수, 거절/시간 초과 횟수)
+    """
+    return document_executor.stats()
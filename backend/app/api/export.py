@@ -1,8 +1,15 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from app.services.docx_generator import DocxGenerator
+from app.services.docx_generator import docx_generator
+from app.services.docx_template_export import export_template_entries, template_exporter, TableFillError
+from app.services.document_store import document_store
+from app.services.executor import document_executor, ExecutorSaturatedError, ExecutorTimeoutError
 from app.models import BusinessPlanInput
+from app.utils.raw_zip import aiter_zip, zip_size
+from app.config import settings
 from typing import Dict, Any
+import asyncio
+from urllib.parse import quote
 
 router = APIRouter()
 
@@ -10,29 +17,63 @@ router = APIRouter()
 async def export_docx(data: Dict[str, Any]):
     """
     생성된 사업계획서를 DOCX로 내보내기
+    
+    template_id (양식 업로드 응답) 를 넣으면 원본 양식을 복제하여 스타일과 표 레이아웃을
+    유지한 채 섹션 제목 아래와 표 셀(generated_content.tables)에 생성 내용을 채웁니다.
+    
+    워커는 압축된 zip 항목까지만 만들고 문서 DOM 을 해제합니다. 응답은 항목을
+    export_chunk_bytes 단위로 나누어 보내며, 전체 크기를 미리 알 수 있으므로
+    Content-Length 를 함께 보냅니다.
     """
+    template_id = data.get('template_id')
+    if template_id and await asyncio.to_thread(document_store.template_source_path, template_id) is None:
+        raise HTTPException(status_code=404, detail="양식 원본을 찾을 수 없습니다.")
+    
     try:
         template_structure = data.get('template_structure', {})
         generated_content = data.get('generated_content', {})
         business_info = data.get('business_info', {})
         
-        # DOCX 생성
-        generator = DocxGenerator()
-        docx_stream = generator.create_business_plan(
-            template_structure,
-            generated_content,
-            business_info
-        )
+        # DOCX 생성 (워커 풀에서 실행)
+        if template_id:
+            entries = await document_executor.run(
+                export_template_entries,
+                template_id,
+                generated_content,
+                business_info
+            )
+        else:
+            entries = await document_executor.run(
+                docx_generator.create_business_plan_entries,
+                template_structure,
+                generated_content,
+                business_info
+            )
         
-        # 파일명 생성
+        # 파일명 생성 (한글 제목은 RFC 5987 filename* 로 전달)
         filename = f"{business_info.get('title', 'business_plan')}.docx"
         filename = filename.replace(' ', '_')
+        fallback = filename if filename.isascii() else "business_plan.docx"
         
         return StreamingResponse(
-            docx_stream,
+            aiter_zip(entries, settings.export_chunk_bytes),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers={
+                "Content-Disposition": f"attachment; filename={fallback}; filename*=UTF-8''{quote(filename)}",
+                "Content-Length": str(zip_size(entries))
+            }
         )
         
+    except (ExecutorSaturatedError, ExecutorTimeoutError):
+        raise
+    except TableFillError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"DOCX 생성 오류: {str(e)}")
+
+@router.get("/export-stats")
+async def export_stats():
+    """
+    양식 보존 내보내기 상태 (분석된 양식 캐시 적중/로드 횟수)
+    """
+    return template_exporter.stats()
@@ -1,16 +1,287 @@
-from fastapi import APIRouter, HTTPException
-from app.services.ai_generator import AIGenerator
-from app.models import BusinessPlanInput
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.services.ai_generator import (
+    AIGenerator,
+    GENERATION_MODEL,
+    SECTION_CONFIGS,
+    SECTION_MARKET_ANALYSIS,
+    SECTION_COMPETITIVE_ANALYSIS,
+    SECTION_FINANCIAL_PLAN
+)
+from app.services.token_budget import TokenBudget, PromptBudgetError
+from app.services.llm_backend import LLMBackend, BACKEND_FAKE
+from app.services.llm_transport import AdaptiveRateLimiter, LLMTransport, RetryPolicy, create_openai_client
+from app.services.fake_llm import FakeLLMBackend
+from app.services.response_cache import ResponseCache, CacheMode, CACHE_MODE_USE, create_backend
+from app.services.generation_jobs import GenerationJobQueue, JobStore, JobQueueFullError, JobNotActiveError
+from app.services.model_router import ModelRouter, GenerationTier, TIER_DRAFT, TIER_STANDARD
+from app.services.reference_index import reference_index
+from app.services.document_store import document_store, DOCUMENT_KIND_REFERENCE
+from app.models import BusinessPlanInput, FullPlanInput
+from app.config import settings
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
-ai_generator = AIGenerator()
+response_cache = ResponseCache(
+    create_backend(
+        settings.response_cache_backend,
+        max_entries=settings.response_cache_max_entries,
+        path=settings.response_cache_path
+    ),
+    ttl=settings.response_cache_ttl,
+    enabled=settings.response_cache_enabled
+)
+def _create_backend() -> Optional[LLMBackend]:
+    """
+    LLM_BACKEND 설정의 생성 백엔드
+    
+    - fake: API 키 없이 결정적인 가짜 응답 (FAKE_LLM_* 설정의 지연 분포/출력 속도/오류 주입)
+    - openai: OPENAI_API_KEY 가 있으면 설정값의 연결 풀/재시도/속도 제한으로 OpenAI 전송 계층 생성
+      (없으면 None, 생성 기능 비활성화)
+    """
+    if settings.llm_backend == BACKEND_FAKE:
+        return FakeLLMBackend(
+            latency=settings.fake_llm_latency,
+            tokens_per_second=settings.fake_llm_tokens_per_second,
+            error_rate=settings.fake_llm_error_rate,
+            error_status=settings.fake_llm_error_status,
+            disconnect_rate=settings.fake_llm_disconnect_rate,
+            seed=settings.fake_llm_seed
+        )
+    
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    client = create_openai_client(
+        api_key,
+        base_url=os.getenv("OPENAI_BASE_URL"),
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry=settings.openai_keepalive_expiry,
+        connect_timeout=settings.openai_connect_timeout,
+        read_timeout=settings.openai_read_timeout
+    )
+    return LLMTransport(
+        client,
+        retry=RetryPolicy(
+            max_retries=settings.openai_max_retries,
+            base_delay=settings.openai_retry_base_delay,
+            max_delay=settings.openai_retry_max_delay
+        ),
+        limiter=AdaptiveRateLimiter(rpm=settings.openai_rpm_limit, tpm=settings.openai_tpm_limit)
+    )
+
+def _create_router() -> ModelRouter:
+    """설정의 라우팅 표 파일이 있으면 사용, 없거나 잘못되었으면 기본 표"""
+    if settings.generation_routes_file:
+        try:
+            return ModelRouter.from_file(
+                settings.generation_routes_file, min_output_tokens=settings.generation_min_output_tokens
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"모델 라우팅 표를 읽지 못해 기본 표를 사용합니다: {str(e)}")
+    return ModelRouter(min_output_tokens=settings.generation_min_output_tokens)
+
+ai_generator = AIGenerator(
+    transport=_create_backend(),
+    router=_create_router(),
+    max_concurrency=settings.generation_max_concurrency,
+    cache=response_cache,
+    reference_index=reference_index,
+    reference_top_k=settings.reference_top_k,
+    reference_budget_tokens=settings.reference_budget_tokens,
+    json_tables=settings.financial_tables_json_mode,
+    coalesce=settings.generation_coalesce_requests,
+    token_budget=TokenBudget.for_model(
+        GENERATION_MODEL,
+        backend=settings.tokenizer_backend,
+        context_override=settings.generation_context_tokens,
+        input_budget_tokens=settings.generation_input_budget_tokens,
+        min_output_tokens=settings.generation_min_output_tokens
+    )
+)
+
+# 요청별 응답 캐시 사용 방식 (?cache=bypass 이면 캐시를 조회하지 않고 새로 생성)
+CACHE_QUERY = Query(CACHE_MODE_USE, description="응답 캐시 사용 방식 (use / bypass)")
+
+# 스트리밍 생성 등급 (?tier=draft 이면 작은 모델로 초안을 먼저 보내고 기본 모델 생성 작업을 등록)
+TIER_QUERY = Query(TIER_STANDARD, description="생성 등급 (standard / draft)")
+
+# 초안 뒤 기본 모델로 다시 생성하는 작업의 우선순위 (직접 등록한 작업보다 나중에 실행)
+REFINE_JOB_PRIORITY = -1
+
+# 생성 작업 종류 (섹션 이름 또는 전체 사업계획서)
+JOB_KIND_FULL_PLAN = "full_plan"
+JobKind = Literal["market_analysis", "competitive_analysis", "financial_plan", "full_plan"]
+
+# 작업 종류별 프롬프트에 쓰는 사업 정보 항목 (동기 엔드포인트와 같음)
+JOB_INFO_FIELDS = {
+    SECTION_MARKET_ANALYSIS: ("title", "description", "requirements"),
+    SECTION_COMPETITIVE_ANALYSIS: ("title", "description"),
+    SECTION_FINANCIAL_PLAN: ("title", "description"),
+    JOB_KIND_FULL_PLAN: ("title", "description", "requirements")
+}
+
+# SSE 응답 헤더: 프록시(nginx 등)가 응답을 모아서 보내지 않도록 버퍼링 해제
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
+async def _load_reference_docs(reference_ids: Optional[List[str]]) -> List[str]:
+    """
+    요청의 참고 문서 ID 를 저장소에서 한 번에 조회하여 텍스트 목록 반환
+    
+    Raises:
+        HTTPException: 저장소에 없는 ID 가 있는 경우 (404)
+    """
+    if not reference_ids:
+        return []
+    
+    texts = await document_store.get_many_async(reference_ids, DOCUMENT_KIND_REFERENCE)
+    missing = [reference_id for reference_id in reference_ids if reference_id not in texts]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"참고 문서를 찾을 수 없습니다: {', '.join(missing)}")
+    return [texts[reference_id] for reference_id in dict.fromkeys(reference_ids)]
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 이벤트 한 개"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _job_payload(
+    kind: str,
+    business_info: Dict[str, Any],
+    reference_documents: Optional[List[str]],
+    cache_mode: str,
+    sections: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """생성 작업 내용 (같은 요청은 같은 내용이 되도록 작업 종류별 사업 정보 항목만 사용)"""
+    return {
+        "business_info": {field: business_info.get(field) for field in JOB_INFO_FIELDS[kind]},
+        "reference_documents": [] if kind == SECTION_FINANCIAL_PLAN else list(reference_documents or []),
+        "sections": list(sections or []) if kind == JOB_KIND_FULL_PLAN else None,
+        "cache_mode": cache_mode
+    }
+
+async def _submit_refine_job(section: str, payload: Dict[str, Any]) -> Optional[str]:
+    """초안을 기본 모델로 다시 생성하는 작업 등록 (큐가 가득 찼거나 시작 전이면 None)"""
+    try:
+        job, _ = await job_queue.submit(section, payload, priority=REFINE_JOB_PRIORITY)
+    except (JobQueueFullError, RuntimeError) as e:
+        logger.warning(f"{section} 초안 보완 작업을 등록하지 못했습니다: {str(e)}")
+        return None
+    return job["job_id"]
+
+async def _section_events(
+    section: str,
+    business_info: Dict[str, Any],
+    reference_docs: Optional[List[str]] = None,
+    table_structure: Optional[Dict[str, Any]] = None,
+    cache_mode: str = CACHE_MODE_USE,
+    tier: str = TIER_STANDARD,
+    refine_payload: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[str]:
+    """
+    섹션 생성 스트림을 SSE 이벤트로 변환
+    
+    - start: 생성 시작 (응답 헤더를 즉시 전송)
+    - token: 생성된 텍스트 조각 {"text"}
+    - done: 완료 {"section", "tables", "refine_job_id", "metrics": {"ttft_ms", "total_ms", "chunks", "cached",
+      "coalesced", "tier", "route", "model", "cost_usd", "prompt_tokens", "completion_tokens", "max_tokens"}}
+    - error: 생성 중 오류 {"detail"}
+    
+    초안(tier=draft) 이 끝나면 refine_payload 로 같은 섹션의 기본 모델 생성 작업을 등록하고
+    done 의 refine_job_id 로 알려 줍니다 (결과는 GET /jobs/{job_id} 로 조회).
+    """
+    metrics: Dict[str, Any] = {}
+    parts: List[str] = []
+    
+    yield _sse_event("start", {"section": section})
+    try:
+        async for delta in ai_generator.stream_section(
+            section,
+            business_info,
+            reference_docs=reference_docs,
+            table_structure=table_structure,
+            metrics=metrics,
+            cache_mode=cache_mode,
+            tier=tier
+        ):
+            parts.append(delta)
+            yield _sse_event("token", {"text": delta})
+    except Exception as e:
+        yield _sse_event("error", {"detail": f"{SECTION_CONFIGS[section]['label']} 생성 오류: {str(e)}"})
+        return
+    
+    refine_job_id = None
+    if tier == TIER_DRAFT and refine_payload is not None and settings.generation_draft_refine:
+        refine_job_id = await _submit_refine_job(section, refine_payload)
+    
+    yield _sse_event("done", {
+        "section": section,
+        "tables": await ai_generator.structure_tables(section, "".join(parts), cache_mode=cache_mode),
+        "refine_job_id": refine_job_id,
+        "metrics": {
+            "ttft_ms": metrics.get("ttft_ms"),
+            "total_ms": metrics.get("total_ms"),
+            "chunks": metrics.get("chunks", 0),
+            "cached": metrics.get("cached", False),
+            "coalesced": metrics.get("coalesced", False),
+            "tier": metrics.get("tier", tier),
+            "route": metrics.get("route"),
+            "model": metrics.get("model"),
+            "cost_usd": metrics.get("cost_usd"),
+            "prompt_tokens": metrics.get("prompt_tokens"),
+            "completion_tokens": metrics.get("completion_tokens"),
+            "max_tokens": metrics.get("max_tokens")
+        }
+    })
+
+def _section_errors(result: Dict[str, Any]) -> str:
+    return "; ".join(f"{s['section_name']}: {s['error']}" for s in result["sections"])
+
+def _full_plan_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """generate_full_plan 결과를 응답 형식으로 변환 (섹션별 결과 + 소요 시간)"""
+    return {
+        "sections": [
+            {
+                "section_name": section["section_name"],
+                "content": section["content"],
+                "tables": section["tables"],
+                "status": section["status"],
+                "error": section["error"]
+            }
+            for section in result["sections"]
+        ],
+        "metadata": {
+            "wall_time_ms": result["wall_time_ms"],
+            "total_section_time_ms": result["total_section_time_ms"],
+            "failed_sections": result["failed_sections"],
+            "timings": {
+                section["section_name"]: {
+                    "queued_ms": section["queued_ms"],
+                    "elapsed_ms": section["elapsed_ms"]
+                }
+                for section in result["sections"]
+            }
+        }
+    }
+
+def _stream_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
 
 @router.post("/market-analysis")
-async def generate_market_analysis(input_data: BusinessPlanInput):
+async def generate_market_analysis(input_data: BusinessPlanInput, cache: CacheMode = CACHE_QUERY):
     """
     AI 기반 시장 분석 생성
     """
+    reference_docs = await _load_reference_docs(input_data.reference_documents)
+    
     try:
         business_info = {
             "title": input_data.title,
@@ -18,12 +289,10 @@ async def generate_market_analysis(input_data: BusinessPlanInput):
             "requirements": input_data.requirements
         }
         
-        # 참고 문서는 실제 구현에서는 저장소에서 가져옴
-        reference_docs = []
-        
         analysis = await ai_generator.generate_market_analysis(
             business_info,
-            reference_docs
+            reference_docs,
+            cache_mode=cache
         )
         
         return {
@@ -31,25 +300,53 @@ async def generate_market_analysis(input_data: BusinessPlanInput):
             "content": analysis
         }
         
+    except PromptBudgetError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"시장 분석 생성 오류: {str(e)}")
 
+@router.post("/market-analysis/stream")
+async def stream_market_analysis(
+    input_data: BusinessPlanInput,
+    cache: CacheMode = CACHE_QUERY,
+    tier: GenerationTier = TIER_QUERY
+):
+    """
+    AI 기반 시장 분석 생성 (SSE 토큰 스트리밍, ?tier=draft 이면 초안 후 기본 모델 생성 작업 등록)
+    """
+    reference_docs = await _load_reference_docs(input_data.reference_documents)
+    business_info = {
+        "title": input_data.title,
+        "description": input_data.description,
+        "requirements": input_data.requirements
+    }
+    
+    return _stream_response(_section_events(
+        SECTION_MARKET_ANALYSIS,
+        business_info,
+        reference_docs=reference_docs,
+        cache_mode=cache,
+        tier=tier,
+        refine_payload=_job_payload(SECTION_MARKET_ANALYSIS, business_info, input_data.reference_documents, cache)
+    ))
+
 @router.post("/competitive-analysis")
-async def generate_competitive_analysis(input_data: BusinessPlanInput):
+async def generate_competitive_analysis(input_data: BusinessPlanInput, cache: CacheMode = CACHE_QUERY):
     """
     AI 기반 경쟁사 분석 생성
     """
+    reference_docs = await _load_reference_docs(input_data.reference_documents)
+    
     try:
         business_info = {
             "title": input_data.title,
             "description": input_data.description
         }
         
-        reference_docs = []
-        
         analysis = await ai_generator.generate_competitive_analysis(
             business_info,
-            reference_docs
+            reference_docs,
+            cache_mode=cache
         )
         
         return {
@@ -57,11 +354,39 @@ async def generate_competitive_analysis(input_data: BusinessPlanInput):
             "content": analysis
         }
         
+    except PromptBudgetError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"경쟁사 분석 생성 오류: {str(e)}")
 
+@router.post("/competitive-analysis/stream")
+async def stream_competitive_analysis(
+    input_data: BusinessPlanInput,
+    cache: CacheMode = CACHE_QUERY,
+    tier: GenerationTier = TIER_QUERY
+):
+    """
+    AI 기반 경쟁사 분석 생성 (SSE 토큰 스트리밍, ?tier=draft 이면 초안 후 기본 모델 생성 작업 등록)
+    """
+    reference_docs = await _load_reference_docs(input_data.reference_documents)
+    business_info = {
+        "title": input_data.title,
+        "description": input_data.description
+    }
+    
+    return _stream_response(_section_events(
+        SECTION_COMPETITIVE_ANALYSIS,
+        business_info,
+        reference_docs=reference_docs,
+        cache_mode=cache,
+        tier=tier,
+        refine_payload=_job_payload(
+            SECTION_COMPETITIVE_ANALYSIS, business_info, input_data.reference_documents, cache
+        )
+    ))
+
 @router.post("/financial-plan")
-async def generate_financial_plan(input_data: BusinessPlanInput):
+async def generate_financial_plan(input_data: BusinessPlanInput, cache: CacheMode = CACHE_QUERY):
     """
     AI 기반 재무 계획 생성
     """
@@ -76,7 +401,8 @@ async def generate_financial_plan(input_data: BusinessPlanInput):
         
         financial_plan = await ai_generator.generate_financial_plan(
             business_info,
-            table_structure
+            table_structure,
+            cache_mode=cache
         )
         
         return {
@@ -85,5 +411,179 @@ async def generate_financial_plan(input_data: BusinessPlanInput):
             "tables": financial_plan["tables"]
         }
         
+    except PromptBudgetError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"재무 계획 생성 오류: {str(e)}")
+
+@router.post("/financial-plan/stream")
+async def stream_financial_plan(
+    input_data: BusinessPlanInput,
+    cache: CacheMode = CACHE_QUERY,
+    tier: GenerationTier = TIER_QUERY
+):
+    """
+    AI 기반 재무 계획 생성 (SSE 토큰 스트리밍, 표 데이터는 done 이벤트에 포함,
+    ?tier=draft 이면 초안 후 기본 모델 생성 작업 등록)
+    """
+    business_info = {
+        "title": input_data.title,
+        "description": input_data.description
+    }
+    
+    return _stream_response(_section_events(
+        SECTION_FINANCIAL_PLAN,
+        business_info,
+        table_structure={},
+        cache_mode=cache,
+        tier=tier,
+        refine_payload=_job_payload(SECTION_FINANCIAL_PLAN, business_info, None, cache)
+    ))
+
+@router.post("/full-plan")
+async def generate_full_plan(input_data: FullPlanInput, cache: CacheMode = CACHE_QUERY):
+    """
+    시장 분석, 경쟁사 분석, 재무 계획을 동시에 생성
+    
+    일부 섹션이 실패해도 성공한 섹션은 그대로 반환하며, 섹션별 소요 시간을 함께 기록합니다.
+    """
+    business_info = {
+        "title": input_data.title,
+        "description": input_data.description,
+        "requirements": input_data.requirements
+    }
+    
+    reference_docs = await _load_reference_docs(input_data.reference_documents)
+    table_structure = {}
+    
+    try:
+        result = await ai_generator.generate_full_plan(
+            business_info,
+            reference_docs,
+            table_structure,
+            sections=input_data.sections,
+            cache_mode=cache
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if result["sections"] and len(result["failed_sections"]) == len(result["sections"]):
+        raise HTTPException(status_code=500, detail=f"사업계획서 생성 오류: {_section_errors(result)}")
+    
+    return _full_plan_response(result)
+
+@router.get("/stats")
+async def generation_stats():
+    """
+    생성 스트림 통계 (첫 토큰 시간 / 전체 시간 분포, API 호출별 입력/출력 토큰 사용량, 공유한 호출 수,
+    라우팅 경로별 호출 수/비용/지연 시간)
+    """
+    return ai_generator.stats()
+
+@router.get("/cache-stats")
+async def cache_stats():
+    """
+    응답 캐시 적중률 및 절약한 토큰 수
+    """
+    return response_cache.stats()
+
+
+async def _run_job(kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    생성 작업 실행 (동기 엔드포인트와 같은 결과 형식)
+    
+    참고 문서는 실행 시점에 저장소에서 다시 읽습니다.
+    """
+    business_info = payload["business_info"]
+    cache_mode = payload["cache_mode"]
+    reference_docs = await _load_reference_docs(payload["reference_documents"])
+    
+    if kind == SECTION_MARKET_ANALYSIS:
+        content = await ai_generator.generate_market_analysis(business_info, reference_docs, cache_mode=cache_mode)
+        return {"section": kind, "content": content}
+    if kind == SECTION_COMPETITIVE_ANALYSIS:
+        content = await ai_generator.generate_competitive_analysis(business_info, reference_docs, cache_mode=cache_mode)
+        return {"section": kind, "content": content}
+    if kind == SECTION_FINANCIAL_PLAN:
+        financial_plan = await ai_generator.generate_financial_plan(business_info, {}, cache_mode=cache_mode)
+        return {"section": kind, "content": financial_plan["text"], "tables": financial_plan["tables"]}
+    
+    result = await ai_generator.generate_full_plan(
+        business_info, reference_docs, {}, sections=payload["sections"], cache_mode=cache_mode
+    )
+    if result["sections"] and len(result["failed_sections"]) == len(result["sections"]):
+        raise RuntimeError(f"사업계획서 생성 오류: {_section_errors(result)}")
+    return _full_plan_response(result)
+
+job_queue = GenerationJobQueue(
+    _run_job,
+    JobStore(settings.generation_jobs_path),
+    workers=settings.generation_job_workers,
+    max_queued=settings.generation_job_max_queued,
+    result_ttl=settings.generation_job_result_ttl,
+    lease=settings.generation_job_lease
+)
+
+@router.post("/jobs/{kind}", status_code=202)
+async def submit_generation_job(
+    kind: JobKind,
+    input_data: FullPlanInput,
+    priority: int = Query(0, ge=-10, le=10, description="우선순위 (큰 값 먼저 실행)"),
+    cache: CacheMode = CACHE_QUERY
+):
+    """
+    생성 작업 등록 (작업 ID 를 바로 반환하고 결과는 GET /jobs/{job_id} 로 조회)
+    
+    같은 요청이 이미 대기/실행 중이면 새 작업을 만들지 않고 그 작업을 반환합니다 (deduplicated).
+    """
+    # 없는 참고 문서는 등록 전에 404
+    await _load_reference_docs(input_data.reference_documents)
+    if kind == JOB_KIND_FULL_PLAN and input_data.sections:
+        unknown = [name for name in input_data.sections if name not in SECTION_CONFIGS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"지원되지 않는 섹션: {', '.join(unknown)}")
+    
+    payload = _job_payload(
+        kind, input_data.model_dump(), input_data.reference_documents, cache, sections=input_data.sections
+    )
+    try:
+        job, deduplicated = await job_queue.submit(kind, payload, priority=priority)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    return {**job, "deduplicated": deduplicated}
+
+@router.get("/jobs/{job_id}")
+async def get_generation_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="작업이 끝날 때까지 기다릴 최대 시간(초, 롱 폴링)")
+):
+    """
+    생성 작업 상태/결과 조회 (wait 를 주면 끝나거나 시간이 지날 때까지 기다린 뒤 응답)
+    """
+    job = await job_queue.wait(job_id, min(wait, settings.generation_job_max_wait))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"생성 작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+@router.delete("/jobs/{job_id}")
+async def cancel_generation_job(job_id: str):
+    """
+    생성 작업 취소 (대기 중이면 실행하지 않고, 실행 중이면 중단)
+    """
+    try:
+        job = await job_queue.cancel(job_id)
+    except JobNotActiveError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"생성 작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+@router.get("/job-stats")
+async def job_stats():
+    """
+    생성 작업 큐 통계 (상태별 누적 작업 수, 현재 대기/실행 중인 작업 수)
+    """
+    return await job_queue.stats()
@@ -0,0 +1,140 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+
+
+class Settings(BaseSettings):
+    """애플리케이션 설정 (환경 변수 / .env 에서 로드)"""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # 로컬 데이터 저장 경로 (캐시, 저장소 등)
+    data_dir: str = "data"
+
+    # 업로드 크기 제한 및 청크 크기
+    max_upload_bytes: int = 25 * 1024 * 1024
+    upload_chunk_bytes: int = 1024 * 1024
+
+    # 여러 파일/zip 일괄 업로드: 파일 수, 전체(zip 은 풀린 크기) 크기, 동시 파싱 수
+    batch_upload_max_files: int = 100
+    batch_upload_max_bytes: int = 200 * 1024 * 1024
+    batch_upload_concurrency: int = min(4, os.cpu_count() or 1)
+
+    # 참고 문서 추출: PDF 는 앞에서부터 이 페이지 수까지만 (HWP/HWPX 는 구역 수)
+    reference_max_pages: int = 200
+    # HWP 본문 구역의 압축을 푼 전체 최대 크기 (압축 폭탄 방지)
+    reference_max_extract_bytes: int = 200 * 1024 * 1024
+
+    # 양식 파싱 캐시
+    parse_cache_enabled: bool = True
+    parse_cache_memory_entries: int = 128
+    parse_cache_disk_max_bytes: int = 512 * 1024 * 1024
+
+    # 문서 파싱/생성 워커 풀 ("thread" 또는 "process")
+    document_executor_kind: str = "thread"
+    document_executor_workers: int = min(4, os.cpu_count() or 1)
+    document_executor_queue: int = 16
+    document_job_timeout: float = 60.0
+
+    # AI 생성: 전체 사업계획서 생성 시 동시에 실행할 섹션 수
+    generation_max_concurrency: int = 3
+    # 동시에 들어온 같은 생성 요청은 업스트림 호출 하나를 공유
+    generation_coalesce_requests: bool = True
+    # 모델 라우팅 표 JSON ({"routes": [...], "prices": {...}}, 비우면 기본 표: 본문은 GPT-4 Turbo,
+    # 표 JSON 변환과 초안은 GPT-3.5 Turbo) 와 초안(?tier=draft) 스트림 뒤 기본 모델로 다시 생성하는 작업 등록 여부
+    generation_routes_file: str = ""
+    generation_draft_refine: bool = True
+
+    # 생성 백엔드 ("openai" 또는 "fake": API 키 없이 결정적인 가짜 응답, 부하 테스트/로컬 개발용)
+    llm_backend: str = "openai"
+    # 가짜 백엔드: 첫 토큰 지연 분포("fixed:ms", "uniform:최소ms:최대ms", "lognormal:중앙값ms:sigma"),
+    # 초당 출력 토큰 수, 오류 주입 비율/상태 코드, 스트림 중간 끊김 비율, 난수 시드
+    fake_llm_latency: str = "lognormal:400:0.5"
+    fake_llm_tokens_per_second: float = 40.0
+    fake_llm_error_rate: float = 0.0
+    fake_llm_error_status: int = 500
+    fake_llm_disconnect_rate: float = 0.0
+    fake_llm_seed: int = 0
+
+    # OpenAI 연결 풀 (최대 연결 수, 유휴 연결 수와 유지 시간), 연결/응답 시간 제한(초)
+    openai_max_connections: int = 20
+    openai_max_keepalive_connections: int = 10
+    openai_keepalive_expiry: float = 30.0
+    openai_connect_timeout: float = 5.0
+    openai_read_timeout: float = 120.0
+    # 429/5xx/연결 오류 재시도: 최대 횟수, 지수 백오프 시작/상한(초) (Retry-After 가 있으면 그 이상 대기)
+    openai_max_retries: int = 3
+    openai_retry_base_delay: float = 0.5
+    openai_retry_max_delay: float = 20.0
+    # 계정의 분당 요청/토큰 한도 (0 이면 제한 없음, 429 를 받으면 자동으로 속도를 낮춤)
+    openai_rpm_limit: int = 0
+    openai_tpm_limit: int = 0
+
+    # 토큰 예산: 토크나이저("auto", "tiktoken", "estimate"), 컨텍스트 크기(0 이면 모델별 기본값),
+    # 입력 프롬프트 상한(참고 자료/긴 사업 정보를 이 안에 맞춤), 출력에 최소로 남길 토큰
+    tokenizer_backend: str = "auto"
+    generation_context_tokens: int = 0
+    generation_input_budget_tokens: int = 8000
+    generation_min_output_tokens: int = 256
+
+    # 생성 작업 큐: 동시에 실행하는 작업 수, 대기 작업 수 한도, 끝난 작업 결과 보관 시간(초),
+    # 롱 폴링 최대 대기 시간(초), 실행 중 작업 임대 시간(초, 연장되지 않으면 다른 워커 프로세스가 다시 실행)
+    generation_job_workers: int = 2
+    generation_job_max_queued: int = 100
+    generation_job_result_ttl: float = 7 * 24 * 3600
+    generation_job_max_wait: float = 30.0
+    generation_job_lease: float = 60.0
+
+    # AI 생성 응답 캐시 ("memory" 또는 "sqlite")
+    response_cache_enabled: bool = True
+    response_cache_backend: str = "memory"
+    response_cache_ttl: float = 24 * 3600
+    response_cache_max_entries: int = 1024
+
+    # 참고 문서 청크 검색 (섹션 프롬프트에 상위 청크만 토큰 예산 안에서 포함)
+    reference_chunk_tokens: int = 300
+    reference_chunk_overlap_tokens: int = 50
+    reference_index_max_documents: int = 256
+    reference_top_k: int = 8
+    reference_budget_tokens: int = 1500
+
+    # 재무 계획에서 마크다운 표를 찾지 못하면 JSON 모드(지원 모델만)로 표 데이터 재요청
+    financial_tables_json_mode: bool = True
+
+    # 섹션 분류 키워드 표 JSON ({"섹션": {"키워드": 가중치}}, 기본 표에 덮어씀, 비우면 기본 표)
+    section_keywords_file: str = ""
+
+    # 시작 준비: 기본 문서 템플릿/워커 풀/OpenAI 연결을 첫 요청 전에 미리 준비
+    startup_warmup_enabled: bool = True
+    startup_warmup_openai: bool = True
+    startup_warmup_timeout: float = 5.0
+
+    # 업로드 문서 저장소: 메모리에 유지하는 최근 문서 본문 수
+    document_store_hot_entries: int = 64
+
+    # 양식 보존 DOCX 내보내기: 메모리에 유지하는 분석된 양식 패키지 수
+    template_export_cache_entries: int = 8
+    # DOCX 내보내기 응답 조각 크기
+    export_chunk_bytes: int = 64 * 1024
+
+    @property
+    def parse_cache_dir(self) -> str:
+        return os.path.join(self.data_dir, "parse-cache")
+
+    @property
+    def document_store_path(self) -> str:
+        return os.path.join(self.data_dir, "documents.sqlite3")
+
+    @property
+    def document_blob_dir(self) -> str:
+        return os.path.join(self.data_dir, "documents")
+
+    @property
+    def response_cache_path(self) -> str:
+        return os.path.join(self.data_dir, "response-cache.sqlite3")
+
+    @property
+    def generation_jobs_path(self) -> str:
+        return os.path.join(self.data_dir, "generation-jobs.sqlite3")
+
+
+settings = Settings()
@@ -1,11 +1,45 @@
-from fastapi import FastAPI
+import time
+
+# 라우터/서비스 모듈 import (공유 인스턴스 생성 포함) 시간 측정
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.api import documents, analysis, generation, export
+from app.services.executor import document_executor, ExecutorSaturatedError, ExecutorTimeoutError
+from app.services.warmup import warm_up
+from app.config import settings
+
+IMPORT_MS = round((time.perf_counter() - _import_started) * 1000, 1)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    시작 시 문서 템플릿/워커 풀/OpenAI 연결을 미리 준비하고 생성 작업 큐를 시작하며,
+    종료 시 작업 큐, OpenAI 연결 풀과 워커 풀 정리
+    """
+    startup = {"imports_ms": IMPORT_MS, "warmup": None}
+    if settings.startup_warmup_enabled:
+        startup["warmup"] = await warm_up(
+            generation.ai_generator,
+            openai=settings.startup_warmup_openai,
+            timeout=settings.startup_warmup_timeout
+        )
+    # 이전 프로세스에서 끝나지 않은 생성 작업은 다시 대기열에 넣어 이어서 실행
+    startup["recovered_jobs"] = await generation.job_queue.start()
+    app.state.startup = startup
+    yield
+    await generation.job_queue.stop()
+    await generation.ai_generator.aclose()
+    document_executor.shutdown(wait=False)
 
 app = FastAPI(
     title="Auto Business Plan Generator API",
     description="AI-powered business plan generation service",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -23,6 +57,19 @@ app.include_router(analysis.router, prefix="/api/analysis", tags=["analysis"])
 app.include_router(generation.router, prefix="/api/generation", tags=["generation"])
 app.include_router(export.router, prefix="/api/export", tags=["export"])
 
+# 문서 워커 풀 포화/시간 초과 응답
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+@app.exception_handler(ExecutorTimeoutError)
+async def executor_timeout_handler(request: Request, exc: ExecutorTimeoutError):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
 @app.get("/")
 async def root():
     return {
@@ -33,4 +80,5 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # 시작 준비 단계별 소요 시간 (lifespan 없이 실행된 경우 None)
+    return {"status": "healthy", "startup": getattr(app.state, "startup", None)}
@@ -19,7 +19,11 @@ class BusinessPlanInput(BaseModel):
     description: Optional[str] = None
     requirements: Optional[str] = None
     notes: Optional[str] = None
-    reference_documents: Optional[List[str]] = []
+    reference_documents: Optional[List[str]] = []  # /upload-reference 가 반환한 reference_id 목록
+
+class FullPlanInput(BusinessPlanInput):
+    """전체 사업계획서 동시 생성 입력 모델"""
+    sections: Optional[List[str]] = None
 
 class GeneratedSection(BaseModel):
     """생성된 섹션 모델"""
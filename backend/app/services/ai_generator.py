@@ -1,23 +1,143 @@
 from openai import AsyncOpenAI
-from typing import Dict, Any, List
+from app.services.llm_backend import LLMBackend
+from app.services.llm_transport import LLMTransport, create_openai_client
+from app.services.response_cache import ResponseCache, CACHE_MODE_USE
+from app.services.reference_index import ReferenceIndex
+from app.services.financial_tables import extract_financial_tables, tables_from_json
+from app.services.token_budget import TokenBudget
+from app.services.single_flight import Flight, SingleFlight
+from app.services.model_router import ModelRouter, ROUTE_SECTION_TABLE_JSON, TIER_STANDARD
+from collections import deque
+from typing import Dict, Any, AsyncIterator, List, Optional, Sequence
+import asyncio
 import os
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# 전체 사업계획서 생성 시 동시에 생성하는 섹션
+SECTION_MARKET_ANALYSIS = "market_analysis"
+SECTION_COMPETITIVE_ANALYSIS = "competitive_analysis"
+SECTION_FINANCIAL_PLAN = "financial_plan"
+FULL_PLAN_SECTIONS = (SECTION_MARKET_ANALYSIS, SECTION_COMPETITIVE_ANALYSIS, SECTION_FINANCIAL_PLAN)
+
+# 섹션별 시스템 프롬프트 및 최대 출력 토큰 (스트리밍/일반 생성 공통, 컨텍스트에 남은 토큰이 적으면 줄임)
+SECTION_CONFIGS = {
+    SECTION_MARKET_ANALYSIS: {
+        "label": "시장 분석",
+        "system": "당신은 전문 사업계획서 작성자입니다. 시장 분석을 상세하고 체계적으로 작성합니다.",
+        "max_tokens": 2000,
+        "retrieval_query": "시장 규모 성장률 전망 트렌드 타겟 고객 수요 시장 진입 기회"
+    },
+    SECTION_COMPETITIVE_ANALYSIS: {
+        "label": "경쟁사 분석",
+        "system": "당신은 시장 전문가입니다. 경쟁사 분석과 차별화 전략을 명확하게 제시합니다.",
+        "max_tokens": 2000,
+        "retrieval_query": "경쟁사 경쟁 업체 점유율 강점 약점 차별화 경쟁 우위 대체재"
+    },
+    SECTION_FINANCIAL_PLAN: {
+        "label": "재무 계획",
+        "system": "당신은 재무 전문가입니다. 현실적이고 구체적인 재무 계획을 수립합니다.",
+        "max_tokens": 2500,
+        "retrieval_query": "매출 비용 손익 투자 자금 조달 재무"
+    }
+}
+
+# 첫 토큰 시간 통계에 유지하는 최근 스트림 수
+STREAM_STATS_WINDOW = 512
+
+# 기본 생성 모델 (토큰 예산 기준, 섹션별 실제 모델은 라우팅 표에서 선택)
+GENERATION_MODEL = "gpt-4-turbo-preview"
+
+# response_format={"type": "json_object"} 를 지원하는 모델 (접두사)
+JSON_MODE_MODELS = (
+    "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-4o",
+    "gpt-3.5-turbo-1106", "gpt-3.5-turbo-0125"
+)
+
+# 재무 계획 본문에서 표를 찾지 못했을 때 JSON 모드로 표만 다시 요청
+TABLE_JSON_SYSTEM = "당신은 재무 계획의 수치를 표로 정리하는 도우미입니다. 반드시 JSON 객체만 출력합니다."
+TABLE_JSON_MAX_TOKENS = 1500
+
 class AIGenerator:
     """GPT-4 기반 사업계획서 자동 생성 서비스"""
     
-    def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+        max_concurrency: int = 3,
+        cache: Optional[ResponseCache] = None,
+        reference_index: Optional[ReferenceIndex] = None,
+        reference_top_k: int = 8,
+        reference_budget_tokens: int = 1500,
+        json_tables: bool = False,
+        token_budget: Optional[TokenBudget] = None,
+        coalesce: bool = True,
+        transport: Optional[LLMBackend] = None,
+        router: Optional[ModelRouter] = None
+    ):
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if transport is not None:
+            client = getattr(transport, "client", None)
+        if transport is None and client is None and not api_key:
             logger.warning("OPENAI_API_KEY not found. AI generation will be disabled.")
-        self.client = AsyncOpenAI(api_key=api_key) if api_key else None
+        if transport is None and client is None and api_key:
+            client = create_openai_client(api_key, base_url=base_url or os.getenv("OPENAI_BASE_URL"))
+        self.client = client
+        
+        # 생성 요청을 보내는 LLM 백엔드: OpenAI 는 속도 제한/재시도 전송 계층을 거침 (지정하지 않으면
+        # 기본 재시도, 속도 제한 없음), FakeLLMBackend 등 다른 백엔드는 transport 로 지정
+        self.transport = transport or (LLMTransport(client) if client is not None else None)
+        self.cache = cache
+        
+        # 참고 문서는 통째로 넣지 않고 섹션과 관련된 상위 청크만 토큰 예산 안에서 사용
+        # (reference_index 가 없으면 전체 문서를 그대로 사용)
+        self.reference_index = reference_index
+        self.reference_top_k = reference_top_k
+        self.reference_budget_tokens = reference_budget_tokens
+        
+        # 재무 계획에서 마크다운 표를 찾지 못하면 JSON 모드(지원 모델만)로 표 데이터를 다시 요청
+        self.json_tables = json_tables
+        
+        # 요청 전에 입력 토큰을 세어 참고 자료/사업 정보를 입력 한도에 맞추고 max_tokens 결정
+        # (지정하지 않으면 모델 컨텍스트 한도만 적용)
+        self.token_budget = token_budget or TokenBudget.for_model(GENERATION_MODEL)
+        
+        # 섹션/입력 크기/등급별 모델 선택과 경로별 지연 시간/비용 기록 (지정하지 않으면 기본 라우팅 표)
+        self.router = router or ModelRouter(min_output_tokens=self.token_budget.min_output_tokens)
+        
+        # 동시에 들어온 같은 요청(같은 프롬프트 + 모델 파라미터)은 업스트림 호출 하나를 공유
+        self.coalesce = coalesce
+        self.single_flight = SingleFlight()
+        
+        # 전체 생성 시 동시에 실행하는 섹션 수 제한 (요청 간 공유)
+        self.max_concurrency = max(1, max_concurrency)
+        self._section_semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # 스트림별 첫 토큰 시간(TTFT) / 전체 시간 측정값
+        self._stream_stats = {"streams": 0, "completed": 0, "failed": 0, "cached": 0}
+        self._ttft_samples: deque = deque(maxlen=STREAM_STATS_WINDOW)
+        self._total_samples: deque = deque(maxlen=STREAM_STATS_WINDOW)
+        
+        # API 호출별 입력/출력 토큰 (캐시 적중은 제외, 비용 추적용 누적값)
+        self._token_stats = {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "compacted_requests": 0,
+            "dropped_reference_tokens": 0
+        }
+        self._prompt_token_samples: deque = deque(maxlen=STREAM_STATS_WINDOW)
+        self._completion_token_samples: deque = deque(maxlen=STREAM_STATS_WINDOW)
     
     async def generate_market_analysis(
         self, 
         business_info: Dict[str, Any],
-        reference_docs: List[str]
+        reference_docs: List[str],
+        cache_mode: str = CACHE_MODE_USE
     ) -> str:
         """
         시장 분석 자동 생성
@@ -25,36 +145,23 @@ class AIGenerator:
         Args:
             business_info: 사업 정보
             reference_docs: 참고 문서 내용
+            cache_mode: 응답 캐시 사용 방식 ("use" / "bypass")
             
         Returns:
             생성된 시장 분석 텍스트
         """
-        if not self.client:
+        if self.transport is None:
             return "AI 생성 기능이 비활성화되어 있습니다. OPENAI_API_KEY를 설정해주세요."
         
-        prompt = self._create_market_analysis_prompt(business_info, reference_docs)
-        
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "당신은 전문 사업계획서 작성자입니다. 시장 분석을 상세하고 체계적으로 작성합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            logger.error(f"시장 분석 생성 오류: {str(e)}")
-            raise
+        return await self._generate_text(
+            SECTION_MARKET_ANALYSIS, business_info, reference_docs=reference_docs, cache_mode=cache_mode
+        )
     
     async def generate_competitive_analysis(
         self,
         business_info: Dict[str, Any],
-        reference_docs: List[str]
+        reference_docs: List[str],
+        cache_mode: str = CACHE_MODE_USE
     ) -> str:
         """
         경쟁사 분석 및 차별화 전략 생성
@@ -62,36 +169,23 @@ class AIGenerator:
         Args:
             business_info: 사업 정보
             reference_docs: 참고 문서 내용
+            cache_mode: 응답 캐시 사용 방식 ("use" / "bypass")
             
         Returns:
             생성된 경쟁사 분석 텍스트
         """
-        if not self.client:
+        if self.transport is None:
             return "AI 생성 기능이 비활성화되어 있습니다."
         
-        prompt = self._create_competitive_analysis_prompt(business_info, reference_docs)
-        
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "당신은 시장 전문가입니다. 경쟁사 분석과 차별화 전략을 명확하게 제시합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            logger.error(f"경쟁사 분석 생성 오류: {str(e)}")
-            raise
+        return await self._generate_text(
+            SECTION_COMPETITIVE_ANALYSIS, business_info, reference_docs=reference_docs, cache_mode=cache_mode
+        )
     
     async def generate_financial_plan(
         self,
         business_info: Dict[str, Any],
-        table_structure: Dict[str, Any]
+        table_structure: Dict[str, Any],
+        cache_mode: str = CACHE_MODE_USE
     ) -> Dict[str, Any]:
         """
         재무 계획 생성 (표 포함)
@@ -99,42 +193,595 @@ class AIGenerator:
         Args:
             business_info: 사업 정보
             table_structure: 표 구조
+            cache_mode: 응답 캐시 사용 방식 ("use" / "bypass")
             
         Returns:
             생성된 재무 계획 (텍스트 + 표 데이터)
         """
-        if not self.client:
+        if self.transport is None:
             return {
                 "text": "AI 생성 기능이 비활성화되어 있습니다.",
                 "tables": []
             }
         
-        prompt = self._create_financial_plan_prompt(business_info, table_structure)
+        content = await self._generate_text(
+            SECTION_FINANCIAL_PLAN, business_info, table_structure=table_structure, cache_mode=cache_mode
+        )
+        
+        return {
+            "text": content,
+            "tables": await self.structure_tables(SECTION_FINANCIAL_PLAN, content, cache_mode=cache_mode)
+        }
+    
+    async def stream_section(
+        self,
+        section: str,
+        business_info: Dict[str, Any],
+        reference_docs: Optional[List[str]] = None,
+        table_structure: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        cache_mode: str = CACHE_MODE_USE,
+        tier: str = TIER_STANDARD
+    ) -> AsyncIterator[str]:
+        """
+        섹션 생성 결과를 토큰 조각 단위로 스트리밍 (stream=True)
+        
+        일반 생성 메서드도 이 스트림을 모아서 반환하므로 프롬프트/모델 설정과
+        오류 처리, 응답 캐시는 두 경로가 동일합니다. 캐시에 같은 요청의 응답이 있으면
+        API 를 호출하지 않고 저장된 텍스트를 한 조각으로 내보냅니다. 스트림이 끝나거나
+        중단되면 metrics 에 첫 토큰까지의 시간(ttft_ms), 전체 시간(total_ms),
+        조각 수(chunks), 캐시 적중 여부(cached), 입력/출력 토큰 수(prompt_tokens,
+        completion_tokens) 와 요청의 max_tokens 를 기록합니다.
         
+        같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 스트림을 처음부터 함께 받습니다
+        (coalesced). 업스트림 스트림은 호출자와 별도 태스크에서 읽으므로 먼저 요청한 호출자의
+        연결이 끊겨도 나머지 호출자는 계속 받고, 모두 떠나면 업스트림 호출을 취소합니다.
+        
+        모델과 temperature 는 라우팅 표에서 섹션, 입력 토큰 수, 등급(tier)으로 고르며
+        metrics 에 경로(route), 모델(model), 호출 비용(cost_usd, 캐시 적중/공유한 호출은 0)을
+        함께 기록합니다.
+        
+        Args:
+            section: 섹션 이름 (FULL_PLAN_SECTIONS 중 하나)
+            business_info: 사업 정보
+            reference_docs: 참고 문서 내용
+            table_structure: 표 구조
+            metrics: 측정값을 기록할 dict (선택)
+            cache_mode: 응답 캐시 사용 방식 ("use" / "bypass")
+            tier: 생성 등급 ("standard" / "draft": 작은 모델로 빠르게 초안 생성)
+            
+        Yields:
+            생성된 텍스트 조각
+        """
+        if section not in SECTION_CONFIGS:
+            raise ValueError(f"지원되지 않는 섹션: {section}")
+        
+        metrics = metrics if metrics is not None else {}
+        metrics.update({
+            "section": section,
+            "ttft_ms": None,
+            "total_ms": None,
+            "chunks": 0,
+            "chars": 0,
+            "cached": False,
+            "coalesced": False,
+            "tier": tier,
+            "route": None,
+            "model": None,
+            "cost_usd": None,
+            "prompt_tokens": None,
+            "completion_tokens": None,
+            "max_tokens": None
+        })
+        
+        if self.transport is None:
+            yield "AI 생성 기능이 비활성화되어 있습니다. OPENAI_API_KEY를 설정해주세요."
+            return
+        
+        started = time.perf_counter()
+        if reference_docs and self.reference_index is not None:
+            # 처음 보는 문서는 청크 분할/색인이 필요하므로 이벤트 루프 밖에서 실행
+            reference_docs = await asyncio.to_thread(self.select_references, section, business_info, reference_docs)
+        budget: Dict[str, Any] = {}
+        request = self._section_request(
+            section, business_info, reference_docs or [], table_structure or {}, budget=budget
+        )
+        route = self.router.select(section, budget["prompt_tokens"], tier)
+        request = self.router.apply(request, route, budget["prompt_tokens"])
+        metrics.update({
+            "route": route["name"],
+            "model": route["model"],
+            "prompt_tokens": budget["prompt_tokens"],
+            "max_tokens": request["max_tokens"]
+        })
+        
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, request, cache_mode)
+            if cached is not None:
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                metrics.update({
+                    "ttft_ms": elapsed_ms,
+                    "total_ms": elapsed_ms,
+                    "chunks": 1,
+                    "chars": len(cached["content"]),
+                    "cached": True,
+                    "cost_usd": 0.0,
+                    "completion_tokens": self.token_budget.count(cached["content"])
+                })
+                self._stream_stats["cached"] += 1
+                yield cached["content"]
+                return
+        
+        parts: List[str] = []
+        failed = True
+        
+        try:
+            async with self._join_flight(
+                request, lambda flight: self._produce_section(flight, section, request, budget, route)
+            ) as (flight, coalesced):
+                metrics["coalesced"] = coalesced
+                async for delta in flight.follow():
+                    if metrics["ttft_ms"] is None:
+                        metrics["ttft_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                    metrics["chunks"] += 1
+                    metrics["chars"] += len(delta)
+                    parts.append(delta)
+                    yield delta
+                failed = False
+        finally:
+            # 업스트림 사용량은 호출을 공유한 요청 모두 같은 값 (끝나기 전에 떠나면 받은 조각만 셈)
+            metrics["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            if not failed and flight.info.get("prompt_tokens") is not None:
+                metrics["prompt_tokens"] = flight.info["prompt_tokens"]
+            metrics["completion_tokens"] = (
+                flight.info["completion_tokens"] if not failed and "completion_tokens" in flight.info
+                else self.token_budget.count("".join(parts))
+            )
+            if not failed:
+                metrics["cost_usd"] = 0.0 if metrics["coalesced"] else flight.info.get("cost_usd")
+            self._record_stream(metrics, failed)
+    
+    async def _produce_section(
+        self,
+        flight: Flight,
+        section: str,
+        request: Dict[str, Any],
+        budget: Dict[str, Any],
+        route: Dict[str, Any]
+    ):
+        """
+        업스트림 스트림 하나를 읽어 flight 로 내보냄 (같은 요청의 호출자가 공유)
+        
+        토큰 사용량, 경로별 지연 시간/비용 기록과 응답 캐시 저장은 호출자 수와 관계없이 한 번만 합니다.
+        """
+        stream = None
+        parts: List[str] = []
+        usage = None
+        started = time.perf_counter()
+        ttft_ms = None
+        failed = True
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "당신은 재무 전문가입니다. 현실적이고 구체적인 재무 계획을 수립합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2500
+            stream = await self.transport.create(
+                request, tokens=budget["prompt_tokens"] + request["max_tokens"], stream=True
+            )
+            async for chunk in stream:
+                # 사용량을 보내는 서버(stream_options.include_usage)는 마지막 조각에 usage 포함
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                if ttft_ms is None:
+                    ttft_ms = round((time.perf_counter() - started) * 1000, 1)
+                parts.append(delta)
+                flight.publish(delta)
+            failed = False
+        except Exception as e:
+            logger.error(f"{SECTION_CONFIGS[section]['label']} 생성 오류: {str(e)}")
+            raise
+        finally:
+            # 모든 호출자가 떠나 취소된 경우에도 업스트림 연결을 정리
+            if stream is not None:
+                await stream.close()
+                flight.info.update({
+                    "prompt_tokens": usage.prompt_tokens if usage is not None else budget["prompt_tokens"],
+                    "completion_tokens": (
+                        usage.completion_tokens if usage is not None else self.token_budget.count("".join(parts))
+                    )
+                })
+                self._record_tokens(flight.info["prompt_tokens"], flight.info["completion_tokens"], budget)
+            flight.info["cost_usd"] = self.router.record(
+                route,
+                flight.info.get("prompt_tokens", 0),
+                flight.info.get("completion_tokens", 0),
+                ttft_ms,
+                round((time.perf_counter() - started) * 1000, 1),
+                failed=failed
             )
+        
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put, request, "".join(parts))
+    
+    def _join_flight(self, request: Dict[str, Any], produce):
+        """
+        같은 요청(응답 캐시 키 기준)이 진행 중이면 그 호출을 공유
+        
+        coalesce 가 꺼져 있으면 요청마다 별도 호출 (키를 공유하지 않는 SingleFlight 사용)
+        """
+        group = self.single_flight if self.coalesce else SingleFlight()
+        return group.join(ResponseCache.key(request), produce)
+    
+    def select_references(
+        self,
+        section: str,
+        business_info: Dict[str, Any],
+        reference_docs: List[str]
+    ) -> List[str]:
+        """
+        참고 문서에서 섹션과 관련된 청크만 선택
+        
+        섹션별 검색어와 사업 정보로 BM25 검색하여 상위 reference_top_k 개 청크를
+        reference_budget_tokens 안에서 반환합니다.
+        
+        Args:
+            section: 섹션 이름
+            business_info: 사업 정보
+            reference_docs: 참고 문서 전체 텍스트
             
-            content = response.choices[0].message.content
+        Returns:
+            프롬프트에 넣을 청크 텍스트 목록
+        """
+        if self.reference_index is None or not reference_docs:
+            return reference_docs
+        
+        doc_ids = self.reference_index.add_many(reference_docs)
+        query = " ".join(filter(None, [
+            SECTION_CONFIGS[section]["retrieval_query"],
+            business_info.get("title"),
+            business_info.get("description"),
+            business_info.get("requirements")
+        ]))
+        chunks = self.reference_index.search(
+            query,
+            doc_ids=doc_ids,
+            top_k=self.reference_top_k,
+            budget_tokens=self.reference_budget_tokens
+        )
+        return [chunk["text"] for chunk in chunks]
+    
+    def extract_tables(self, section: str, content: str) -> List[Dict[str, Any]]:
+        """섹션 결과 텍스트에서 표 데이터 추출 (재무 계획만 해당)"""
+        if section == SECTION_FINANCIAL_PLAN:
+            return self._parse_financial_tables(content)
+        return []
+    
+    async def structure_tables(
+        self,
+        section: str,
+        content: str,
+        cache_mode: str = CACHE_MODE_USE
+    ) -> List[Dict[str, Any]]:
+        """
+        섹션 결과의 표 데이터 (본문에 표가 없으면 JSON 모드로 추출)
+        
+        본문의 마크다운/JSON 표를 먼저 사용하고, 재무 계획에서 표를 찾지 못했으며
+        json_tables 가 켜져 있고 라우팅 표에서 고른 모델이 JSON 모드를 지원하면 본문을 표 JSON 으로
+        변환하는 요청을 한 번 더 보냅니다 (응답 캐시 공유). 변환에 실패하면 빈 목록을 반환합니다.
+        """
+        tables = self.extract_tables(section, content)
+        if tables or section != SECTION_FINANCIAL_PLAN or not self.json_tables or self.transport is None:
+            return tables
+        if not content.strip():
+            return tables
+        
+        request = self._table_json_request(content)
+        prompt_tokens = self.token_budget.count_messages(request["messages"])
+        try:
+            route = self.router.select(ROUTE_SECTION_TABLE_JSON, prompt_tokens)
+            if not self.supports_json_mode(route["model"]):
+                return tables
+            request = self.router.apply(request, route, prompt_tokens)
+            cached = await asyncio.to_thread(self.cache.get, request, cache_mode) if self.cache is not None else None
+            if cached is not None:
+                return tables_from_json(cached["content"])
             
-            # 표 데이터 파싱 (간단한 예시)
-            tables = self._parse_financial_tables(content)
+            async with self._join_flight(
+                request, lambda flight: self._produce_table_json(flight, request, route)
+            ) as (flight, _):
+                result = "".join([part async for part in flight.follow()])
+        except Exception as e:
+            logger.warning(f"재무 표 JSON 추출 오류: {str(e)}")
+            return tables
+        
+        return tables_from_json(result)
+    
+    async def _produce_table_json(self, flight: Flight, request: Dict[str, Any], route: Dict[str, Any]):
+        """표 JSON 요청 하나 (같은 본문의 호출자가 공유)"""
+        prompt_tokens = self.token_budget.count_messages(request["messages"])
+        started = time.perf_counter()
+        try:
+            response = await self.transport.create(request, tokens=prompt_tokens + request["max_tokens"])
+        except Exception:
+            self.router.record(route, 0, 0, None, round((time.perf_counter() - started) * 1000, 1), failed=True)
+            raise
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        result = response.choices[0].message.content or ""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = usage.prompt_tokens if usage else prompt_tokens
+        completion_tokens = usage.completion_tokens if usage else self.token_budget.count(result)
+        self._record_tokens(prompt_tokens, completion_tokens)
+        self.router.record(route, prompt_tokens, completion_tokens, elapsed_ms, elapsed_ms)
+        if self.cache is not None and tables_from_json(result):
+            await asyncio.to_thread(self.cache.put, request, result)
+        flight.publish(result)
+    
+    @staticmethod
+    def supports_json_mode(model: str) -> bool:
+        """모델이 response_format={"type": "json_object"} 를 지원하는지 여부"""
+        return model.startswith(JSON_MODE_MODELS)
+    
+    async def warmup(self, timeout: float = 5.0) -> bool:
+        """
+        LLM 백엔드 연결 미리 열기 (시작 시 호출)
+        
+        OpenAI 백엔드는 가벼운 GET /models 요청으로 연결을 만들어 연결 풀에 남겨 두므로
+        첫 생성 요청이 연결 수립 시간을 기다리지 않습니다.
+        
+        Returns:
+            연결 성공 여부 (백엔드가 없거나 연결 실패 시 False)
+        """
+        if self.transport is None:
+            return False
+        return await self.transport.warmup(timeout)
+    
+    async def aclose(self):
+        """LLM 백엔드 연결 풀 정리 (종료 시 호출)"""
+        if self.transport is not None:
+            await self.transport.aclose()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        스트림 수, 최근 스트림의 첫 토큰 시간/전체 시간 분포, API 호출 토큰 사용량, 공유한 호출 수,
+        전송 계층 재시도/속도 제한 대기, 라우팅 경로별 호출 수/비용/지연 시간
+        """
+        return {
+            **self._stream_stats,
+            "ttft_ms": self._summarize(self._ttft_samples),
+            "total_ms": self._summarize(self._total_samples),
+            "tokens": {
+                **self._token_stats,
+                "tokenizer": self.token_budget.tokenizer.name,
+                "prompt_per_call": self._summarize(self._prompt_token_samples),
+                "completion_per_call": self._summarize(self._completion_token_samples)
+            },
+            "backend": self.transport.name if self.transport is not None else None,
+            "single_flight": self.single_flight.stats(),
+            "routes": self.router.stats(),
+            "transport": self.transport.stats() if self.transport is not None else None
+        }
+    
+    async def _generate_text(
+        self,
+        section: str,
+        business_info: Dict[str, Any],
+        reference_docs: Optional[List[str]] = None,
+        table_structure: Optional[Dict[str, Any]] = None,
+        cache_mode: str = CACHE_MODE_USE
+    ) -> str:
+        """stream_section 의 조각을 모아 전체 텍스트 반환 (일반 생성 경로)"""
+        parts = [
+            delta async for delta in self.stream_section(
+                section,
+                business_info,
+                reference_docs=reference_docs,
+                table_structure=table_structure,
+                cache_mode=cache_mode
+            )
+        ]
+        return "".join(parts)
+    
+    def _section_request(
+        self,
+        section: str,
+        business_info: Dict[str, Any],
+        reference_docs: List[str],
+        table_structure: Dict[str, Any],
+        budget: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        섹션별 chat.completions.create 인자 구성
+        
+        프롬프트 토큰을 세어 참고 자료(앞의 청크 우선)와 긴 사업 정보를 입력 한도에 맞추고,
+        max_tokens 는 섹션 설정값과 컨텍스트에 남은 토큰 중 작은 값으로 정합니다.
+        budget 에 토큰 배분 결과(prompt_tokens, reference_tokens, dropped_reference_tokens,
+        compacted_fields)를 기록합니다.
+        
+        Raises:
+            PromptBudgetError: 사업 정보를 줄여도 컨텍스트에 들어가지 않는 경우
+        """
+        config = SECTION_CONFIGS[section]
+        
+        def build(info: Dict[str, Any], references: List[str]) -> List[Dict[str, str]]:
+            if section == SECTION_MARKET_ANALYSIS:
+                prompt = self._create_market_analysis_prompt(info, references)
+            elif section == SECTION_COMPETITIVE_ANALYSIS:
+                prompt = self._create_competitive_analysis_prompt(info, references)
+            else:
+                prompt = self._create_financial_plan_prompt(info, table_structure)
+            return [
+                {"role": "system", "content": config["system"]},
+                {"role": "user", "content": prompt}
+            ]
+        
+        fitted = self.token_budget.fit_prompt(build, business_info, reference_docs, config["max_tokens"])
+        if budget is not None:
+            budget.update({key: value for key, value in fitted.items() if key not in ("messages", "max_tokens")})
+        
+        return {
+            "model": GENERATION_MODEL,
+            "messages": fitted["messages"],
+            "temperature": 0.7,
+            "max_tokens": fitted["max_tokens"]
+        }
+    
+    def _table_json_request(self, content: str) -> Dict[str, Any]:
+        """재무 계획 본문을 표 JSON 으로 변환하는 JSON 모드 요청"""
+        prompt = f"""
+다음 재무 계획에 나온 수치를 표로 정리하여 아래 형식의 JSON 으로 반환해주세요:
+
+{{"tables": [{{"title": "표 제목", "unit": "단위: 원", "headers": ["구분", "1차년도", ...], "rows": [["매출", 100000000, ...], ...]}}]}}
+
+- 금액은 unit 에 맞춘 숫자로, 비율은 "15%" 처럼 작성
+- 합계 행은 첫 열을 "합계"로 표시
+- 표로 정리할 수치가 없으면 {{"tables": []}}
+
+**재무 계획:**
+{content}
+"""
+        messages = [
+            {"role": "system", "content": TABLE_JSON_SYSTEM},
+            {"role": "user", "content": prompt}
+        ]
+        return {
+            "model": GENERATION_MODEL,
+            "messages": messages,
+            "temperature": 0,
+            "max_tokens": self.token_budget.output_tokens(
+                self.token_budget.count_messages(messages), TABLE_JSON_MAX_TOKENS
+            ),
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _record_tokens(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        budget: Optional[Dict[str, Any]] = None
+    ):
+        """API 호출 하나의 입력/출력 토큰 누적 (응답 캐시 적중은 호출하지 않음)"""
+        self._token_stats["calls"] += 1
+        self._token_stats["prompt_tokens"] += prompt_tokens
+        self._token_stats["completion_tokens"] += completion_tokens
+        self._prompt_token_samples.append(prompt_tokens)
+        self._completion_token_samples.append(completion_tokens)
+        if budget:
+            self._token_stats["compacted_requests"] += bool(budget["compacted_fields"])
+            self._token_stats["dropped_reference_tokens"] += budget["dropped_reference_tokens"]
+    
+    def _record_stream(self, metrics: Dict[str, Any], failed: bool):
+        """스트림 측정값 누적"""
+        self._stream_stats["streams"] += 1
+        self._stream_stats["failed" if failed else "completed"] += 1
+        if metrics["ttft_ms"] is not None:
+            self._ttft_samples.append(metrics["ttft_ms"])
+        self._total_samples.append(metrics["total_ms"])
+        logger.info(
+            f"{metrics['section']} 스트림 {'실패' if failed else '완료'} ({metrics['route']}, {metrics['model']}): "
+            f"첫 토큰 {metrics['ttft_ms']}ms, 전체 {metrics['total_ms']}ms, 조각 {metrics['chunks']}개, "
+            f"입력 {metrics['prompt_tokens']}토큰, 출력 {metrics['completion_tokens']}/{metrics['max_tokens']}토큰"
+        )
+    
+    @staticmethod
+    def _summarize(samples: Sequence[float]) -> Dict[str, Optional[float]]:
+        """측정값 목록의 평균/p50/p95"""
+        if not samples:
+            return {"count": 0, "avg": None, "p50": None, "p95": None}
+        ordered = sorted(samples)
+        return {
+            "count": len(ordered),
+            "avg": round(sum(ordered) / len(ordered), 1),
+            "p50": ordered[int(0.50 * (len(ordered) - 1))],
+            "p95": ordered[int(0.95 * (len(ordered) - 1))]
+        }
+    
+    async def generate_full_plan(
+        self,
+        business_info: Dict[str, Any],
+        reference_docs: List[str],
+        table_structure: Dict[str, Any],
+        sections: Optional[Sequence[str]] = None,
+        cache_mode: str = CACHE_MODE_USE
+    ) -> Dict[str, Any]:
+        """
+        여러 섹션을 동시에 생성
+        
+        섹션별 생성은 max_concurrency 한도 안에서 병렬로 실행되므로 전체 소요 시간은
+        섹션 소요 시간의 합이 아니라 최댓값에 가깝습니다. 한 섹션이 실패해도 나머지
+        섹션 결과는 그대로 반환합니다.
+        
+        Args:
+            business_info: 사업 정보
+            reference_docs: 참고 문서 내용
+            table_structure: 표 구조
+            sections: 생성할 섹션 목록 (기본값: FULL_PLAN_SECTIONS)
+            cache_mode: 응답 캐시 사용 방식 ("use" / "bypass")
             
-            return {
-                "text": content,
-                "tables": tables
+        Returns:
+            섹션별 결과 (content, tables, status, error, queued_ms, elapsed_ms) 및 전체 소요 시간
+        """
+        sections = list(dict.fromkeys(sections or FULL_PLAN_SECTIONS))
+        unknown = [name for name in sections if name not in SECTION_CONFIGS]
+        if unknown:
+            raise ValueError(f"지원되지 않는 섹션: {', '.join(unknown)}")
+        
+        started = time.perf_counter()
+        results = await asyncio.gather(*[
+            self._generate_section_timed(name, business_info, reference_docs, table_structure, cache_mode)
+            for name in sections
+        ])
+        wall_ms = (time.perf_counter() - started) * 1000
+        
+        return {
+            "sections": results,
+            "wall_time_ms": round(wall_ms, 1),
+            "total_section_time_ms": round(sum(r["elapsed_ms"] for r in results), 1),
+            "failed_sections": [r["section_name"] for r in results if r["status"] != "ok"]
+        }
+    
+    async def _generate_section_timed(
+        self,
+        section: str,
+        business_info: Dict[str, Any],
+        reference_docs: List[str],
+        table_structure: Dict[str, Any],
+        cache_mode: str = CACHE_MODE_USE
+    ) -> Dict[str, Any]:
+        """섹션 하나를 동시 실행 한도 안에서 생성하고 대기/실행 시간 기록"""
+        queued_at = time.perf_counter()
+        async with self._section_semaphore:
+            started = time.perf_counter()
+            result = {
+                "section_name": section,
+                "content": "",
+                "tables": [],
+                "status": "ok",
+                "error": None
             }
+            try:
+                if section == SECTION_MARKET_ANALYSIS:
+                    result["content"] = await self.generate_market_analysis(
+                        business_info, reference_docs, cache_mode=cache_mode
+                    )
+                elif section == SECTION_COMPETITIVE_ANALYSIS:
+                    result["content"] = await self.generate_competitive_analysis(
+                        business_info, reference_docs, cache_mode=cache_mode
+                    )
+                else:
+                    financial_plan = await self.generate_financial_plan(
+                        business_info, table_structure, cache_mode=cache_mode
+                    )
+                    result["content"] = financial_plan["text"]
+                    result["tables"] = financial_plan["tables"]
+            except Exception as e:
+                logger.error(f"{section} 섹션 생성 실패: {str(e)}")
+                result["status"] = "error"
+                result["error"] = str(e)
             
-        except Exception as e:
-            logger.error(f"재무 계획 생성 오류: {str(e)}")
-            raise
+            finished = time.perf_counter()
+            result["queued_ms"] = round((started - queued_at) * 1000, 1)
+            result["elapsed_ms"] = round((finished - started) * 1000, 1)
+            return result
     
     def _create_market_analysis_prompt(
         self,
@@ -211,9 +858,10 @@ class AIGenerator:
 4. 자금 조달 계획
 
 표 형식으로 구체적인 숫자를 포함하여 작성해주세요.
+표는 마크다운 표(| 구분 | 1차년도 | 2차년도 | 3차년도 |)로 작성하고, 표 바로 위에 제목과 단위(예: 단위: 백만원)를 적어주세요.
+합계 행은 첫 열을 "합계"로 표시해주세요.
 """
     
     def _parse_financial_tables(self, content: str) -> List[Dict[str, Any]]:
-        """재무 계획에서 표 데이터 추출 (간단한 구현)"""
-        # TODO: 더 정교한 파싱 로직 구현
-        return []
+        """재무 계획에서 표 데이터 추출 (마크다운/파이프 표, ```json 블록)"""
+        return extract_financial_tables(content)
@@ -0,0 +1,318 @@
+"""
+@CODE:document-store-service
+업로드한 양식/참고 문서를 ID 로 보관하는 로컬 저장소 (SQLite 메타데이터 + blob 디렉터리)
+
+Related:
+- @CODE:parse-cache-service
+- @CODE:reference-index-service
+- @TEST:document-store-unit
+"""
+
+from app.config import settings
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_KIND_TEMPLATE = "template"
+DOCUMENT_KIND_REFERENCE = "reference"
+
+# SQLite IN (...) 절 한 번에 넣는 ID 수 (SQLITE_MAX_VARIABLE_NUMBER 기본값 999 이하)
+LOOKUP_BATCH_SIZE = 500
+
+# 업로드 시 발급하는 양식 ID (파일 내용의 SHA-256 hex)
+_DOCUMENT_ID = re.compile(r"[0-9a-f]{64}")
+
+
+def is_document_id(doc_id: Any) -> bool:
+    """저장소가 발급하는 형식의 ID 인지 (파일 경로에 넣기 전에 확인)"""
+    return isinstance(doc_id, str) and _DOCUMENT_ID.fullmatch(doc_id) is not None
+
+
+class DocumentStore:
+    """
+    @CODE:document-store-service
+    양식(파싱된 구조)과 참고 문서(추출 텍스트)를 ID 로 저장/조회
+
+    - 메타데이터: SQLite `documents` 테이블 (id, kind, filename, size, created_at, last_used)
+    - 본문: `<blob_dir>/<id[:2]>/<id>.json` (양식 구조) 또는 `<id>.txt` (참고 문서 텍스트)
+    - 양식 원본: `<blob_dir>/<id[:2]>/<id>.docx` (양식 보존 내보내기에서 복제)
+    - 최근 사용한 본문은 메모리 LRU(hot_entries) 에 보관하여 디스크를 다시 읽지 않음
+
+    ID 는 호출자가 정하는 콘텐츠 해시이므로 같은 파일을 다시 올리면 같은 ID 가 됩니다.
+    SQLite 연결과 디렉터리는 첫 사용 시 생성합니다.
+    """
+
+    def __init__(self, db_path: str, blob_dir: str, hot_entries: int = 64):
+        self.db_path = db_path
+        self.blob_dir = blob_dir
+        self.hot_entries = hot_entries
+
+        self._conn: Optional[sqlite3.Connection] = None
+        # (kind, id) → 본문
+        self._hot: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hot_hits": 0, "disk_reads": 0, "misses": 0, "writes": 0}
+
+    def put_template(self, template_id: str, filename: str, structure: Dict[str, Any]) -> str:
+        """파싱된 양식 구조 저장 (이미 있으면 사용 시각만 갱신)"""
+        if self._touch(template_id, DOCUMENT_KIND_TEMPLATE, filename, structure):
+            return template_id
+        payload = json.dumps(structure, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._put(template_id, DOCUMENT_KIND_TEMPLATE, filename, payload, structure)
+        return template_id
+
+    def put_template_source(self, template_id: str, source: BinaryIO) -> str:
+        """
+        양식 원본 DOCX 저장 (이미 있으면 건너뜀)
+
+        파일 객체를 청크 단위로 복사하므로 업로드 전체를 메모리에 올리지 않습니다.
+        """
+        path = self._source_path(template_id)
+        if os.path.exists(path):
+            return template_id
+        self._write_atomic(path, lambda f: shutil.copyfileobj(source, f))
+        return template_id
+
+    def template_source_path(self, template_id: str) -> Optional[str]:
+        """
+        저장된 양식 원본 DOCX 경로 (없으면 None)
+
+        클라이언트가 보낸 ID 를 받으므로 발급 형식이 아니거나 양식 메타데이터가 없으면
+        파일 경로를 만들지 않고 None 을 반환합니다.
+        """
+        if not is_document_id(template_id):
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT 1 FROM documents WHERE id = ? AND kind = ?", (template_id, DOCUMENT_KIND_TEMPLATE)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self._source_path(template_id)
+        return path if os.path.exists(path) else None
+
+    def put_reference(self, reference_id: str, filename: str, text: str) -> str:
+        """참고 문서 텍스트 저장 (이미 있으면 사용 시각만 갱신)"""
+        if self._touch(reference_id, DOCUMENT_KIND_REFERENCE, filename, text):
+            return reference_id
+        self._put(reference_id, DOCUMENT_KIND_REFERENCE, filename, text.encode("utf-8"), text)
+        return reference_id
+
+    def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """양식 구조 조회 (없으면 None)"""
+        return self.get_many([template_id], DOCUMENT_KIND_TEMPLATE).get(template_id)
+
+    def get_reference_texts(self, reference_ids: Sequence[str]) -> Dict[str, str]:
+        """참고 문서 텍스트 일괄 조회 (찾은 ID 만 포함)"""
+        return self.get_many(reference_ids, DOCUMENT_KIND_REFERENCE)
+
+    def get_many(self, ids: Sequence[str], kind: str) -> Dict[str, Any]:
+        """
+        여러 문서 본문을 한 번에 조회
+
+        메모리 LRU 에 없는 ID 만 모아 SQLite 에서 배치로 확인한 뒤 blob 을 읽습니다.
+
+        Returns:
+            {id: 본문} (없는 ID 는 제외)
+        """
+        found: Dict[str, Any] = {}
+        pending: List[str] = []
+        with self._lock:
+            for doc_id in dict.fromkeys(ids):
+                key = (kind, doc_id)
+                if key in self._hot:
+                    self._hot.move_to_end(key)
+                    found[doc_id] = self._hot[key]
+                    self._stats["hot_hits"] += 1
+                else:
+                    pending.append(doc_id)
+
+        if not pending:
+            return found
+
+        existing = set()
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(pending), LOOKUP_BATCH_SIZE):
+                batch = pending[start:start + LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT id FROM documents WHERE kind = ? AND id IN ({placeholders})",
+                    (kind, *batch)
+                ).fetchall()
+                existing.update(row[0] for row in rows)
+                if rows:
+                    conn.execute(
+                        f"UPDATE documents SET last_used = ? WHERE kind = ? AND id IN ({placeholders})",
+                        (now, kind, *batch)
+                    )
+
+        for doc_id in pending:
+            if doc_id not in existing:
+                continue
+            try:
+                with open(self._blob_path(doc_id, kind), "rb") as f:
+                    raw = f.read()
+            except OSError as e:
+                logger.warning(f"문서 저장소 읽기 오류 ({doc_id}): {str(e)}")
+                continue
+            found[doc_id] = json.loads(raw) if kind == DOCUMENT_KIND_TEMPLATE else raw.decode("utf-8")
+
+        with self._lock:
+            for doc_id in pending:
+                if doc_id in found:
+                    self._remember((kind, doc_id), found[doc_id])
+                    self._stats["disk_reads"] += 1
+                else:
+                    self._stats["misses"] += 1
+        return found
+
+    async def get_many_async(self, ids: Sequence[str], kind: str) -> Dict[str, Any]:
+        """get_many 를 이벤트 루프 밖에서 실행 (모두 메모리 LRU 에 있으면 바로 반환)"""
+        with self._lock:
+            cached = all((kind, doc_id) in self._hot for doc_id in ids)
+        if cached:
+            return self.get_many(ids, kind)
+        return await asyncio.to_thread(self.get_many, ids, kind)
+
+    def metadata(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """문서 메타데이터 (id, kind, filename, size, created_at, last_used)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT id, kind, filename, size, created_at, last_used FROM documents WHERE id = ?",
+                (doc_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "kind", "filename", "size", "created_at", "last_used"), row))
+
+    def delete(self, doc_id: str) -> bool:
+        """문서 삭제 (존재하지 않으면 False)"""
+        with self._lock:
+            row = self._connect().execute("SELECT kind FROM documents WHERE id = ?", (doc_id,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+            self._hot.pop((row[0], doc_id), None)
+        paths = [self._blob_path(doc_id, row[0])]
+        if row[0] == DOCUMENT_KIND_TEMPLATE and is_document_id(doc_id):
+            paths.append(self._source_path(doc_id))
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """저장 문서 수 및 메모리 LRU 적중 통계"""
+        with self._lock:
+            counts = dict(self._connect().execute(
+                "SELECT kind, COUNT(*) FROM documents GROUP BY kind"
+            ).fetchall())
+            return {
+                **self._stats,
+                "templates": counts.get(DOCUMENT_KIND_TEMPLATE, 0),
+                "references": counts.get(DOCUMENT_KIND_REFERENCE, 0),
+                "hot_entries": len(self._hot),
+                "hot_max_entries": self.hot_entries
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _put(self, doc_id: str, kind: str, filename: str, payload: bytes, value: Any):
+        self._write_atomic(self._blob_path(doc_id, kind), lambda f: f.write(payload))
+
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO documents (id, kind, filename, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET filename = excluded.filename, last_used = excluded.last_used",
+                (doc_id, kind, filename, len(payload), now, now)
+            )
+            self._remember((kind, doc_id), value)
+            self._stats["writes"] += 1
+
+    @staticmethod
+    def _write_atomic(path: str, write):
+        """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 함"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _touch(self, doc_id: str, kind: str, filename: str, value: Any) -> bool:
+        """같은 ID 가 이미 저장되어 있으면 blob 을 다시 쓰지 않고 메타데이터만 갱신"""
+        with self._lock:
+            cursor = self._connect().execute(
+                "UPDATE documents SET filename = ?, last_used = ? WHERE id = ? AND kind = ?",
+                (filename, time.time(), doc_id, kind)
+            )
+            if cursor.rowcount == 0 or not os.path.exists(self._blob_path(doc_id, kind)):
+                return False
+            self._remember((kind, doc_id), value)
+            return True
+
+    def _remember(self, key: Tuple[str, str], value: Any):
+        """메모리 LRU 에 저장 (잠금 보유 상태에서 호출)"""
+        if self.hot_entries <= 0:
+            return
+        self._hot[key] = value
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+
+    def _blob_path(self, doc_id: str, kind: str) -> str:
+        suffix = "json" if kind == DOCUMENT_KIND_TEMPLATE else "txt"
+        return os.path.join(self.blob_dir, doc_id[:2], f"{doc_id}.{suffix}")
+
+    def _source_path(self, doc_id: str) -> str:
+        if not is_document_id(doc_id):
+            raise ValueError(f"잘못된 양식 ID: {doc_id!r}")
+        return os.path.join(self.blob_dir, doc_id[:2], f"{doc_id}.docx")
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결을 한 번 생성 (잠금 보유 상태에서 호출)"""
+        if self._conn is None:
+            if os.path.dirname(self.db_path):
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " id TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " filename TEXT,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+        return self._conn
+
+
+document_store = DocumentStore(
+    settings.document_store_path,
+    settings.document_blob_dir,
+    hot_entries=settings.document_store_hot_entries
+)
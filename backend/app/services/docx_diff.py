@@ -0,0 +1,161 @@
+"""
+@CODE:docx-diff-service
+양식 재업로드 시 이전 버전과의 문단/표 단위 구조 비교
+
+Related:
+- @SPEC:FEAT-001-REQ-008 - Incremental Template Diff
+- @CODE:docx-parser-service
+- @TEST:docx-diff-unit
+
+파서가 붙인 블록 내용 해시(문단: 텍스트+스타일, 표: 헤더+셀) 목록을 순서 비교하여
+추가/삭제/변경 블록을 찾습니다. 같은 해시의 블록은 위치가 바뀌어도 변경이 아니므로
+섹션 분류와 생성을 다시 할 필요가 없습니다.
+"""
+
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set
+from app.services.section_classifier import SECTION_GENERAL, section_classifier
+from app.utils.block_hash import paragraph_hash, table_hash
+from app.utils.docx_xml import is_heading
+
+
+def ensure_hashes(structure: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    해시가 없는 블록(해시 도입 전에 저장된 구조)에 해시를 채운 구조
+
+    캐시/저장소의 구조는 여러 요청이 공유하므로 수정하지 않고, 빠진 해시가 있을 때만 복사본을 만듭니다.
+    """
+    paragraphs = structure.get("paragraphs", [])
+    tables = structure.get("tables", [])
+    if all("hash" in block for block in paragraphs) and all("hash" in block for block in tables):
+        return structure
+    return {
+        **structure,
+        "paragraphs": [
+            paragraph if "hash" in paragraph
+            else {**paragraph, "hash": paragraph_hash(paragraph["text"], paragraph.get("style", "Normal"))}
+            for paragraph in paragraphs
+        ],
+        "tables": [table if "hash" in table else {**table, "hash": table_hash(table)} for table in tables]
+    }
+
+
+def diff_blocks(old: Sequence[Mapping[str, Any]], new: Sequence[Mapping[str, Any]], index_key: str) -> Dict[str, Any]:
+    """
+    @CODE:docx-diff-service-blocks
+    블록 목록 비교 (해시 순서의 최장 공통 부분열 기준)
+
+    바뀐 구간에서 이전/새 블록이 함께 있으면 앞에서부터 짝지어 changed, 남는 블록은
+    removed/added 로 보고합니다.
+
+    Args:
+        old: 이전 버전 블록 목록 (hash 포함)
+        new: 새 버전 블록 목록 (hash 포함)
+        index_key: 보고할 블록 위치 키 ("index" 또는 "table_index")
+
+    Returns:
+        {"unchanged", "added", "removed", "changed": [{"old", "new"}]}
+    """
+    matcher = SequenceMatcher(None, [block["hash"] for block in old], [block["hash"] for block in new], autojunk=False)
+    result: Dict[str, Any] = {"unchanged": 0, "added": [], "removed": [], "changed": []}
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            result["unchanged"] += old_end - old_start
+            continue
+        paired = min(old_end - old_start, new_end - new_start)
+        for offset in range(paired):
+            result["changed"].append({
+                "old": old[old_start + offset][index_key],
+                "new": new[new_start + offset][index_key]
+            })
+        result["removed"].extend(block[index_key] for block in old[old_start + paired:old_end])
+        result["added"].extend(block[index_key] for block in new[new_start + paired:new_end])
+    return result
+
+
+def section_context(paragraphs: Sequence[Mapping[str, Any]]) -> Dict[int, str]:
+    """
+    문단 위치 → 속한 섹션 타입
+
+    제목 문단(제목 스타일 또는 번호가 붙은 짧은 문단)을 분류하고, 다음 제목까지의
+    문단은 그 섹션에 속한다고 봅니다. 문서 제목(Title)은 섹션을 바꾸지 않습니다.
+    """
+    headings = [
+        paragraph for paragraph in paragraphs
+        if paragraph.get("style") != "Title" and is_heading(paragraph["text"], paragraph.get("style", ""))
+    ]
+    heading_sections = dict(zip(
+        (paragraph["index"] for paragraph in headings),
+        section_classifier.classify_many([paragraph["text"] for paragraph in headings])
+    ))
+
+    context: Dict[int, str] = {}
+    current = SECTION_GENERAL
+    for paragraph in paragraphs:
+        current = heading_sections.get(paragraph["index"], current)
+        context[paragraph["index"]] = current
+    return context
+
+
+def diff_structures(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    @CODE:docx-diff-service-structure
+    두 양식 구조(parse_document 결과)의 문단/표 단위 비교
+
+    Implements: @SPEC:FEAT-001-REQ-008
+
+    Returns:
+        {
+            "paragraphs": diff_blocks 결과 (문단 index 기준),
+            "tables": diff_blocks 결과 (table_index 기준),
+            "changed_sections": 바뀐 문단이 속한 섹션 타입 (다시 생성할 섹션, general 제외),
+            "unchanged": 바뀐 블록이 하나도 없는지 여부
+        }
+    """
+    old, new = ensure_hashes(old), ensure_hashes(new)
+    old_paragraphs, new_paragraphs = old.get("paragraphs", []), new.get("paragraphs", [])
+    paragraphs = diff_blocks(old_paragraphs, new_paragraphs, "index")
+    tables = diff_blocks(old.get("tables", []), new.get("tables", []), "table_index")
+
+    old_context = section_context(old_paragraphs)
+    new_context = section_context(new_paragraphs)
+    sections: Set[str] = set()
+    sections.update(old_context[index] for index in paragraphs["removed"])
+    sections.update(new_context[index] for index in paragraphs["added"])
+    for pair in paragraphs["changed"]:
+        sections.update((old_context[pair["old"]], new_context[pair["new"]]))
+    sections.discard(SECTION_GENERAL)
+
+    return {
+        "paragraphs": paragraphs,
+        "tables": tables,
+        "changed_sections": sorted(sections),
+        "unchanged": not any(
+            result[key] for result in (paragraphs, tables) for key in ("added", "removed", "changed")
+        )
+    }
+
+
+def carry_over_sections(
+    paragraphs: Sequence[Mapping[str, Any]],
+    previous: Optional[Mapping[str, str]] = None
+) -> List[str]:
+    """
+    @CODE:docx-diff-service-sections
+    문단 섹션 타입 식별 (이전 결과에 같은 해시가 있으면 다시 분류하지 않음)
+
+    Args:
+        paragraphs: 문단 목록 (text, 선택: hash)
+        previous: 이전 분류 결과 {문단 해시: 섹션 타입}
+
+    Returns:
+        paragraphs 와 같은 순서의 섹션 타입 목록
+    """
+    previous = previous or {}
+    section_types: List[Optional[str]] = [previous.get(paragraph.get("hash")) for paragraph in paragraphs]
+    pending = [position for position, section_type in enumerate(section_types) if section_type is None]
+    for position, section_type in zip(
+        pending, section_classifier.classify_many([paragraphs[position]["text"] for position in pending])
+    ):
+        section_types[position] = section_type
+    return section_types
@@ -1,8 +1,95 @@
 from docx import Document
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml.parser import oxml_parser
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import copy
 import io
+import threading
+
+from app.services.docx_table_builder import DocxTableBuilder
+from app.utils.raw_zip import RawZipEntry, check_zip_size, deflate_entry
+
+
+class _EntryWriter:
+    """python-docx PhysPkgWriter 대신 파트를 압축된 zip 항목으로 모음"""
+
+    def __init__(self):
+        self.entries: List[RawZipEntry] = []
+
+    def write(self, pack_uri, blob: bytes):
+        self.entries.append(deflate_entry(pack_uri.membername, blob))
+
+
+class DefaultTemplate:
+    """
+    @CODE:docx-generator-service-template
+    python-docx 기본 템플릿을 한 번만 열어 두고 요청마다 복제
+
+    Document() 는 호출할 때마다 기본 템플릿 zip 을 열고 모든 파트를 다시 파싱하며,
+    add_heading 은 스타일 이름으로 styles.xml 을 매번 검색합니다. 열어 둔 문서를
+    deepcopy 하고 제목 스타일 ID 는 처음 열 때 한 번만 찾아 둡니다.
+
+    생성기는 본문 파트만 바꾸므로 나머지 파트(styles.xml 등)는 처음 열 때 압축해 둔
+    zip 항목을 그대로 씁니다.
+    """
+
+    # 생성 문서에서 쓰는 스타일 (add_heading 레벨 0 = Title)
+    STYLE_NAMES = ("Title", "Heading 1", "Heading 2")
+
+    def __init__(self):
+        self._document: Optional[Document] = None
+        self._style_ids: Dict[str, str] = {}
+        self._shared_entries: Dict[str, RawZipEntry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._document is not None
+
+    def load(self) -> Document:
+        """기본 템플릿과 스타일 파트를 읽어 둠 (이미 읽었으면 그대로 반환)"""
+        with self._lock:
+            if self._document is None:
+                document = Document()
+                styles = document.styles
+                self._style_ids = {name: styles[name].style_id for name in self.STYLE_NAMES}
+                self._shared_entries = {
+                    str(part.partname): deflate_entry(part.partname.membername, part.blob)
+                    for part in document.part.package.parts
+                    if part is not document.part
+                }
+                self._document = document
+            return self._document
+
+    def new_document(self) -> Document:
+        """기본 템플릿의 새 복사본"""
+        document = self.load()
+        with self._lock:
+            return copy.deepcopy(document)
+
+    def style_id(self, name: str) -> str:
+        """스타일 이름 → 스타일 ID"""
+        self.load()
+        return self._style_ids[name]
+
+    def shared_entries(self) -> Dict[str, RawZipEntry]:
+        """본문 외 파트 이름 → 미리 압축해 둔 zip 항목"""
+        self.load()
+        return self._shared_entries
+
+    def clear(self):
+        """읽어 둔 템플릿 해제 (다음 사용 시 다시 읽음)"""
+        with self._lock:
+            self._document = None
+            self._style_ids = {}
+            self._shared_entries = {}
+
+
+# 앱 전체에서 공유하는 기본 템플릿 (시작 시 warmup 에서 미리 읽음)
+default_template = DefaultTemplate()
+
 
 class DocxGenerator:
     """DOCX 문서 생성 서비스"""
@@ -24,30 +111,105 @@ class DocxGenerator:
         Returns:
             BytesIO: DOCX 파일 바이트 스트림
         """
-        doc = Document()
+        doc = DocxGenerator._build_document(template_structure, generated_content, business_info)
+        
+        # BytesIO로 저장
+        file_stream = io.BytesIO()
+        doc.save(file_stream)
+        file_stream.seek(0)
+        
+        return file_stream
+    
+    @staticmethod
+    def create_business_plan_entries(
+        template_structure: Dict[str, Any],
+        generated_content: Dict[str, Any],
+        business_info: Dict[str, Any]
+    ) -> List[RawZipEntry]:
+        """
+        사업계획서 DOCX 를 압축된 zip 항목 목록으로 생성 (스트리밍 응답용)
+        
+        파트를 하나씩 직렬화/압축하여 전체 파일을 BytesIO 에 모으지 않고,
+        직렬화가 끝나면 문서 DOM 을 바로 해제합니다.
+        
+        Returns:
+            파트별 RawZipEntry 목록 (raw_zip.aiter_zip 으로 전송)
+        """
+        doc = DocxGenerator._build_document(template_structure, generated_content, business_info)
+        entries = DocxGenerator._package_entries(doc, default_template.shared_entries())
+        DocxGenerator._release(doc)
+        check_zip_size(entries)
+        return entries
+    
+    @staticmethod
+    def _package_entries(doc: Document, shared: Optional[Dict[str, RawZipEntry]] = None) -> List[RawZipEntry]:
+        """
+        Document.save 와 같은 순서로 패키지 파트를 압축된 zip 항목으로 변환
+        
+        Args:
+            shared: 파트 이름 → 미리 압축해 둔 항목 (해당 파트는 다시 직렬화/압축하지 않음)
+        """
+        package = doc.part.package
+        parts = package.parts
+        for part in parts:
+            part.before_marshal()
+        
+        writer = _EntryWriter()
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        shared = shared or {}
+        for part in parts:
+            entry = shared.get(str(part.partname))
+            if entry is not None:
+                writer.entries.append(entry)
+            else:
+                writer.write(part.partname, part.blob)
+            if len(part.rels):
+                writer.write(part.partname.rels_uri, part.rels.xml)
+        return writer.entries
+    
+    @staticmethod
+    def _release(doc: Document):
+        """
+        문서 본문 트리 해제
+        
+        python-docx 의 패키지와 파트는 서로 참조하므로 참조 카운트만으로는 바로 해제되지 않고
+        순환 GC 를 기다립니다. 메모리 대부분을 차지하는 본문 요소를 먼저 비워 둡니다.
+        """
+        doc.element.body.clear()
+    
+    @staticmethod
+    def _build_document(
+        template_structure: Dict[str, Any],
+        generated_content: Dict[str, Any],
+        business_info: Dict[str, Any]
+    ) -> Document:
+        """사업계획서 내용을 채운 python-docx Document 생성"""
+        doc = default_template.new_document()
+        add_heading = DocxGenerator._add_heading
         
         # 제목 추가
-        title = doc.add_heading(business_info.get('title', '사업계획서'), 0)
+        title = add_heading(doc, business_info.get('title', '사업계획서'), 0)
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # 사업 개요
         if business_info.get('description'):
-            doc.add_heading('1. 사업 개요', 1)
+            add_heading(doc, '1. 사업 개요', 1)
             doc.add_paragraph(business_info['description'])
         
         # 시장 분석
         if 'market_analysis' in generated_content:
-            doc.add_heading('2. 시장 분석', 1)
+            add_heading(doc, '2. 시장 분석', 1)
             doc.add_paragraph(generated_content['market_analysis'])
         
         # 경쟁사 분석
         if 'competitive_analysis' in generated_content:
-            doc.add_heading('3. 경쟁사 분석 및 차별화 전략', 1)
+            add_heading(doc, '3. 경쟁사 분석 및 차별화 전략', 1)
             doc.add_paragraph(generated_content['competitive_analysis'])
         
         # 재무 계획
         if 'financial_plan' in generated_content:
-            doc.add_heading('4. 재무 계획', 1)
+            add_heading(doc, '4. 재무 계획', 1)
             doc.add_paragraph(generated_content['financial_plan'])
             
             # 재무 계획 표 추가
@@ -62,57 +224,58 @@ class DocxGenerator:
                 if section_type not in ['market_analysis', 'competitive_analysis', 'financial_plan']:
                     # 기타 섹션 추가
                     if para.get('style', '').startswith('Heading'):
-                        doc.add_heading(para['text'], 2)
+                        add_heading(doc, para['text'], 2)
                     else:
                         doc.add_paragraph(para['text'])
         
         # 요구사항 및 주의사항
         if business_info.get('requirements') or business_info.get('notes'):
             doc.add_page_break()
-            doc.add_heading('참고사항', 1)
+            add_heading(doc, '참고사항', 1)
             
             if business_info.get('requirements'):
-                doc.add_paragraph('필수 요구사항:', style='Heading 2')
+                add_heading(doc, '필수 요구사항:', 2)
                 doc.add_paragraph(business_info['requirements'])
             
             if business_info.get('notes'):
-                doc.add_paragraph('주의사항:', style='Heading 2')
+                add_heading(doc, '주의사항:', 2)
                 doc.add_paragraph(business_info['notes'])
         
-        # BytesIO로 저장
-        file_stream = io.BytesIO()
-        doc.save(file_stream)
-        file_stream.seek(0)
-        
-        return file_stream
+        return doc
+    
+    @staticmethod
+    def _add_heading(doc: Document, text: str, level: int = 1):
+        """doc.add_heading 과 같은 제목 문단 (스타일 ID 는 미리 찾아 둔 값 사용)"""
+        paragraph = doc.add_paragraph(text)
+        paragraph._p.style = default_template.style_id("Title" if level == 0 else f"Heading {level}")
+        return paragraph
     
     @staticmethod
     def _add_table(doc: Document, table_data: Dict[str, Any]):
-        """문서에 표 추가"""
-        headers = table_data.get('headers', [])
-        rows = table_data.get('rows', [])
+        """
+        문서에 표 추가
         
-        if not headers or not rows:
+        셀마다 python-docx 프록시를 거치지 않고 DocxTableBuilder 로 w:tbl 을 한 번에 만들어
+        본문 끝(구역 설정 앞)에 넣습니다. 열 단위({"headers", "columns", "formats"})와
+        행 단위({"headers", "rows"}) 데이터를 모두 받습니다.
+        """
+        headers, columns = DocxTableBuilder.columns_from_table(table_data)
+        
+        if not headers or not any(len(column) for column in columns):
             return
         
-        # 표 생성
-        table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
-        table.style = 'Light Grid Accent 1'
-        
-        # 헤더 추가
-        header_cells = table.rows[0].cells
-        for idx, header in enumerate(headers):
-            header_cells[idx].text = str(header)
-            # 헤더 스타일링
-            for paragraph in header_cells[idx].paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-        
-        # 데이터 행 추가
-        for row_idx, row_data in enumerate(rows, start=1):
-            cells = table.rows[row_idx].cells
-            for col_idx, cell_data in enumerate(row_data.get('cells', [])):
-                if col_idx < len(cells):
-                    cells[col_idx].text = str(cell_data.get('value', ''))
+        tbl = DocxTableBuilder.build(
+            headers,
+            columns,
+            formats=table_data.get('formats'),
+            style_id='LightGrid-Accent1',
+            borders=False,
+            parser=oxml_parser
+        )
+        doc.element.body._insert_tbl(tbl)
         
         doc.add_paragraph()  # 표 아래 여백
+
+
+# 앱 전체에서 공유하는 생성기
+docx_generator = DocxGenerator()
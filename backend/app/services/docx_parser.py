@@ -9,11 +9,24 @@ Related:
 """
 
 from docx import Document
-from typing import List, Dict, Any
+from typing import List, Dict, Any, BinaryIO, Sequence, Union
+from app.services.docx_stream_parser import StreamingDocxParser
+from app.services.docx_table import DocxTableParser
+from app.services.section_classifier import section_classifier
+from app.utils.block_hash import paragraph_hash
+import io
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+# parse_document 파싱 모드
+PARSE_MODE_DOCX = "docx"        # python-docx Document 기반 (기본값)
+PARSE_MODE_STREAM = "stream"    # lxml iterparse 기반 스트리밍 파서
+
+# 파일 경로, 메모리 바이트, 또는 seek 가능한 파일 객체 (BytesIO, SpooledTemporaryFile 등)
+DocumentSource = Union[str, os.PathLike, bytes, BinaryIO]
+
 class DocxParser:
     """
     @CODE:docx-parser-service
@@ -27,31 +40,43 @@ class DocxParser:
     """
     
     @staticmethod
-    def parse_document(file_path: str) -> Dict[str, Any]:
+    def parse_document(source: DocumentSource, mode: str = PARSE_MODE_DOCX) -> Dict[str, Any]:
         """
         @CODE:docx-parser-service-parse
         DOCX 문서를 파싱하여 구조화된 데이터 반환
         
-        Implements: @SPEC:FEAT-001-REQ-001, @SPEC:FEAT-001-REQ-004
+        Implements: @SPEC:FEAT-001-REQ-001, @SPEC:FEAT-001-REQ-004, @SPEC:FEAT-001-REQ-005
         Tests: @TEST:docx-parser-unit-001, @TEST:docx-parser-unit-004
         
         Args:
-            file_path: DOCX 파일 경로
+            source: DOCX 파일 경로, 바이트, 또는 seek 가능한 파일 객체
+                (업로드를 임시 파일로 저장하지 않고 메모리/스풀 파일에서 바로 파싱)
+            mode: 파싱 모드 ("docx": python-docx, "stream": lxml 스트리밍)
             
         Returns:
             문서 구조 (문단, 표, 메타데이터)
         """
+        source = DocxParser._open_source(source)
+        
+        if mode == PARSE_MODE_STREAM:
+            return StreamingDocxParser.parse_document(source)
+        if mode != PARSE_MODE_DOCX:
+            raise ValueError(f"지원되지 않는 파싱 모드: {mode}")
+        
         try:
-            doc = Document(file_path)
+            doc = Document(source)
             
             # 문단 추출
             paragraphs = []
             for idx, para in enumerate(doc.paragraphs):
-                if para.text.strip():
+                text = para.text.strip()
+                if text:
+                    style = para.style.name if para.style else "Normal"
                     paragraphs.append({
                         "index": idx,
-                        "text": para.text.strip(),
-                        "style": para.style.name if para.style else "Normal"
+                        "text": text,
+                        "style": style,
+                        "hash": paragraph_hash(text, style)
                     })
             
             # 표 추출 및 분석 (핵심 기능)
@@ -81,50 +106,35 @@ class DocxParser:
             logger.error(f"DOCX 파싱 오류: {str(e)}")
             raise
     
+    @staticmethod
+    def _open_source(source: DocumentSource) -> Union[str, os.PathLike, BinaryIO]:
+        """바이트는 BytesIO 로 감싸고, 파일 객체는 처음 위치로 되돌림"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return io.BytesIO(source)
+        if hasattr(source, "read"):
+            source.seek(0)
+        return source
+    
     @staticmethod
     def _parse_table(table, table_idx: int) -> Dict[str, Any]:
         """
         @CODE:docx-parser-service-table (핵심 기능)
         표를 파싱하여 구조화된 데이터 반환
         
-        Implements: @SPEC:FEAT-001-REQ-002
-        Tests: @TEST:docx-parser-unit-002
+        row.cells 는 병합 셀을 반복 반환하므로 사용하지 않고, w:tbl 그리드를
+        DocxTableParser 로 한 번만 순회합니다.
+        
+        Implements: @SPEC:FEAT-001-REQ-002, @SPEC:FEAT-001-REQ-006
+        Tests: @TEST:docx-parser-unit-002, @TEST:docx-table-unit
         
         Args:
             table: python-docx Table 객체
             table_idx: 표 인덱스
             
         Returns:
-            표 구조 (헤더, 행, 열 정보)
+            표 구조 (헤더, 헤더 트리, 행, 열 정보)
         """
-        rows = []
-        headers = []
-        
-        # 첫 번째 행을 헤더로 간주
-        if len(table.rows) > 0:
-            header_cells = table.rows[0].cells
-            headers = [cell.text.strip() for cell in header_cells]
-        
-        # 데이터 행 추출
-        for row_idx, row in enumerate(table.rows[1:], start=1):
-            row_data = []
-            for cell_idx, cell in enumerate(row.cells):
-                row_data.append({
-                    "column": headers[cell_idx] if cell_idx < len(headers) else f"Column_{cell_idx}",
-                    "value": cell.text.strip()
-                })
-            rows.append({
-                "row_index": row_idx,
-                "cells": row_data
-            })
-        
-        return {
-            "table_index": table_idx,
-            "headers": headers,
-            "rows": rows,
-            "row_count": len(table.rows) - 1,  # 헤더 제외
-            "column_count": len(headers)
-        }
+        return DocxTableParser.parse_table(table._tbl, table_idx)
     
     @staticmethod
     def identify_section_type(text: str) -> str:
@@ -139,20 +149,27 @@ class DocxParser:
             text: 문단 텍스트
             
         Returns:
-            섹션 타입 (예: "title", "market_analysis", "financial_plan")
+            섹션 타입 (예: "market_analysis", "financial_plan", 해당 없으면 "general")
         """
-        text_lower = text.lower()
+        return section_classifier.classify(text)
+    
+    @staticmethod
+    def identify_section_types(texts: Sequence[str]) -> List[str]:
+        """
+        @CODE:docx-parser-service-section-batch
+        여러 문단의 섹션 타입을 한 번에 식별 (키워드 정규식을 한 번만 실행)
         
-        # 키워드 기반 섹션 식별
-        if any(keyword in text_lower for keyword in ["시장", "분석", "market"]):
-            return "market_analysis"
-        elif any(keyword in text_lower for keyword in ["경쟁", "competitor", "차별"]):
-            return "competitive_analysis"
-        elif any(keyword in text_lower for keyword in ["재무", "financial", "손익", "현금"]):
-            return "financial_plan"
-        elif any(keyword in text_lower for keyword in ["사업", "개요", "summary"]):
-            return "business_overview"
-        elif any(keyword in text_lower for keyword in ["swot"]):
-            return "swot_analysis"
-        else:
-            return "general"
+        Implements: @SPEC:FEAT-001-REQ-003
+        Tests: @TEST:section-classifier-unit
+        
+        Args:
+            texts: 문단 텍스트 목록
+            
+        Returns:
+            texts 와 같은 순서의 섹션 타입 목록
+        """
+        return section_classifier.classify_many(texts)
+
+
+# 앱 전체에서 공유하는 파서
+docx_parser = DocxParser()
@@ -0,0 +1,134 @@
+"""
+@CODE:docx-stream-parser-service
+python-docx 객체를 만들지 않는 스트리밍 DOCX 파서
+
+Related:
+- @SPEC:FEAT-001-REQ-005 - Streaming Parse Mode
+- @CODE:docx-parser-service
+- @TEST:docx-stream-parser-unit
+"""
+
+from lxml import etree
+from typing import Dict, Any, BinaryIO, Union
+import zipfile
+import logging
+
+from app.services.docx_table import DocxTableParser
+from app.utils.block_hash import paragraph_hash
+from app.utils.docx_xml import (
+    CORE_PROPERTIES_REL,
+    DC_NS,
+    W_BODY,
+    W_P,
+    W_TBL,
+    load_style_names,
+    main_document_part,
+    paragraph_style,
+    paragraph_text,
+    related_part,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingDocxParser:
+    """
+    @CODE:docx-stream-parser-service
+    word/document.xml 을 zip 에서 직접 iterparse 하는 DOCX 파서
+
+    DocxParser.parse_document 와 같은 {paragraphs, tables, metadata} 구조를
+    반환하지만 python-docx Document/Paragraph/_Cell 프록시 객체를 만들지 않습니다.
+    본문 최상위 블록(문단, 표)을 처리한 직후 해당 XML 노드를 해제하므로
+    메모리 사용량은 가장 큰 단일 블록 크기로 제한됩니다.
+
+    Implements:
+    - @SPEC:FEAT-001-REQ-005 (Streaming Parse Mode)
+    """
+
+    @staticmethod
+    def parse_document(source: Union[str, BinaryIO]) -> Dict[str, Any]:
+        """
+        @CODE:docx-stream-parser-service-parse
+        DOCX 문서를 스트리밍 방식으로 파싱하여 구조화된 데이터 반환
+
+        Args:
+            source: DOCX 파일 경로 또는 seek 가능한 파일 객체
+
+        Returns:
+            문서 구조 (문단, 표, 메타데이터)
+        """
+        try:
+            with zipfile.ZipFile(source) as package:
+                document_part = main_document_part(package)
+                style_names = load_style_names(package, document_part)
+
+                paragraphs = []
+                tables = []
+                paragraph_idx = 0
+
+                with package.open(document_part) as stream:
+                    for elem in StreamingDocxParser._iter_body_blocks(stream):
+                        if elem.tag == W_P:
+                            text = paragraph_text(elem).strip()
+                            if text:
+                                style = paragraph_style(elem, style_names)
+                                paragraphs.append({
+                                    "index": paragraph_idx,
+                                    "text": text,
+                                    "style": style,
+                                    "hash": paragraph_hash(text, style)
+                                })
+                            paragraph_idx += 1
+                        else:
+                            tables.append(DocxTableParser.parse_table(elem, len(tables)))
+
+                metadata = {
+                    "paragraph_count": len(paragraphs),
+                    "table_count": len(tables),
+                    "core_properties": StreamingDocxParser._load_core_properties(package)
+                }
+
+            return {
+                "paragraphs": paragraphs,
+                "tables": tables,
+                "metadata": metadata
+            }
+
+        except Exception as e:
+            logger.error(f"DOCX 스트리밍 파싱 오류: {str(e)}")
+            raise
+
+    @staticmethod
+    def _iter_body_blocks(stream):
+        """본문 최상위 w:p / w:tbl 요소를 순서대로 생성하고, 처리 후 메모리에서 해제"""
+        for _, elem in etree.iterparse(stream, events=("end",), tag=(W_P, W_TBL)):
+            parent = elem.getparent()
+            if parent is None or parent.tag != W_BODY:
+                # 표 안의 문단/중첩 표는 상위 표가 끝날 때 함께 처리
+                continue
+
+            yield elem
+
+            # 처리한 블록과 그 이전 형제 노드를 제거하여 트리가 커지지 않도록 유지
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def _load_core_properties(package: zipfile.ZipFile) -> Dict[str, str]:
+        """docProps/core.xml 에서 제목/저자/주제 추출"""
+        core_properties = {"title": "", "author": "", "subject": ""}
+
+        core_part = related_part(package, "", CORE_PROPERTIES_REL)
+        if core_part is None:
+            return core_properties
+
+        with package.open(core_part) as stream:
+            root = etree.parse(stream).getroot()
+
+        for key, tag in (("title", "title"), ("author", "creator"), ("subject", "subject")):
+            elem = root.find(f"{{{DC_NS}}}{tag}")
+            if elem is not None and elem.text:
+                core_properties[key] = elem.text
+
+        return core_properties
@@ -0,0 +1,291 @@
+"""
+@CODE:docx-table-service
+병합 셀을 인식하는 DOCX 표 분석 엔진
+
+Related:
+- @SPEC:FEAT-001-REQ-002 - Table Analysis
+- @SPEC:FEAT-001-REQ-006 - Merged Cell Analysis
+- @TEST:docx-table-unit
+"""
+
+from typing import List, Dict, Any, Optional
+import re
+
+from app.utils.docx_xml import (
+    ON_VALUES,
+    W_GRID_BEFORE,
+    W_GRID_COL,
+    W_GRID_SPAN,
+    W_TBL_GRID,
+    W_TBL_HEADER,
+    W_TC,
+    W_TC_PR,
+    W_TR,
+    W_TR_PR,
+    W_V_MERGE,
+    W_VAL,
+    cell_text,
+)
+from app.utils.block_hash import table_hash
+
+HEADER_PATH_SEPARATOR = " > "
+
+_NUMERIC_PATTERN = re.compile(r"^[\s\d,.\-+%()₩원억만천백조]*$")
+
+
+class _GridCell:
+    """표 그리드의 실제 셀 하나 (병합 범위 포함)"""
+
+    __slots__ = ("row", "col", "rowspan", "colspan", "text", "parent")
+
+    def __init__(self, row: int, col: int, colspan: int, text: str):
+        self.row = row
+        self.col = col
+        self.rowspan = 1
+        self.colspan = colspan
+        self.text = text
+        self.parent: Optional["_GridCell"] = None
+
+
+class DocxTableParser:
+    """
+    @CODE:docx-table-service
+    w:tbl 그리드를 한 번만 순회하여 병합 정보를 포함한 표 구조를 생성
+
+    python-docx 의 row.cells 는 가로(gridSpan)/세로(vMerge) 병합 셀을 여러 번
+    반환하므로 같은 텍스트를 반복해서 계산하고 출력합니다. 이 엔진은 w:tc 하나당
+    텍스트를 한 번만 추출하고, 각 셀에 rowspan/colspan 을 기록합니다.
+
+    Implements:
+    - @SPEC:FEAT-001-REQ-002 (Table Analysis)
+    - @SPEC:FEAT-001-REQ-006 (Merged Cell Analysis)
+    """
+
+    @staticmethod
+    def parse_table(tbl, table_idx: int) -> Dict[str, Any]:
+        """
+        @CODE:docx-table-service-parse
+        w:tbl 요소를 구조화된 표 데이터로 변환
+
+        Args:
+            tbl: w:tbl lxml 요소 (python-docx Table 의 경우 table._tbl)
+            table_idx: 표 인덱스
+
+        Returns:
+            표 구조 (헤더, 헤더 트리, 행, 열 정보)
+        """
+        grid, header_flags, column_count = DocxTableParser._build_grid(tbl)
+        header_rows = DocxTableParser._detect_header_rows(grid, header_flags)
+        header_tree = DocxTableParser._build_header_tree(grid, header_rows)
+
+        headers = []
+        if header_rows:
+            for col in range(column_count):
+                headers.append(DocxTableParser._header_path(grid[header_rows - 1][col]))
+
+        rows = []
+        for row_idx in range(header_rows, len(grid)):
+            row_data = []
+            for col, cell in enumerate(grid[row_idx]):
+                # 병합 셀은 시작 위치에서 한 번만 출력
+                if cell is None or cell.row != row_idx or cell.col != col:
+                    continue
+                row_data.append({
+                    "column": headers[col] if col < len(headers) else f"Column_{col}",
+                    "value": cell.text,
+                    "col_index": col,
+                    "colspan": cell.colspan,
+                    "rowspan": cell.rowspan
+                })
+            rows.append({
+                "row_index": row_idx,
+                "cells": row_data
+            })
+
+        table = {
+            "table_index": table_idx,
+            "headers": headers,
+            "header_rows": header_rows,
+            "header_tree": header_tree,
+            "rows": rows,
+            "row_count": len(rows),  # 헤더 제외
+            "column_count": column_count
+        }
+        # 내용 해시 (재업로드 시 변경된 표만 찾기 위함, 위치와 무관)
+        table["hash"] = table_hash(table)
+        return table
+
+    @staticmethod
+    def _build_grid(tbl):
+        """
+        w:tr / w:tc 를 한 번 순회하여 (그리드, 행별 헤더 반복 여부, 열 수) 반환
+
+        그리드의 각 위치는 해당 위치를 차지하는 _GridCell 을 가리키며,
+        병합된 위치는 같은 _GridCell 을 공유합니다.
+        """
+        tbl_grid = tbl.find(W_TBL_GRID)
+        column_count = len(tbl_grid.findall(W_GRID_COL)) if tbl_grid is not None else 0
+
+        grid: List[List[Optional[_GridCell]]] = []
+        header_flags: List[bool] = []
+        previous_row: List[Optional[_GridCell]] = []
+
+        for row_idx, tr in enumerate(tbl.iterchildren(W_TR)):
+            grid_before, is_header = DocxTableParser._row_properties(tr)
+            row: List[Optional[_GridCell]] = [None] * grid_before
+            col = grid_before
+
+            for tc in tr.iterchildren(W_TC):
+                grid_span, v_merge = DocxTableParser._cell_properties(tc)
+
+                above = previous_row[col] if col < len(previous_row) else None
+                if v_merge == "continue" and above is not None and above.col == col:
+                    # 세로 병합: 위 셀의 범위만 늘리고 텍스트는 다시 추출하지 않음
+                    above.rowspan += 1
+                    cell = above
+                else:
+                    cell = _GridCell(row_idx, col, grid_span, cell_text(tc).strip())
+
+                row.extend([cell] * grid_span)
+                col += grid_span
+
+            grid.append(row)
+            header_flags.append(is_header)
+            previous_row = row
+            column_count = max(column_count, len(row))
+
+        for row in grid:
+            row.extend([None] * (column_count - len(row)))
+
+        return grid, header_flags, column_count
+
+    @staticmethod
+    def _row_properties(tr):
+        """행의 (gridBefore, 머리글 행 반복 여부) 반환"""
+        grid_before = 0
+        is_header = False
+        for tr_pr in tr.iterchildren(W_TR_PR):
+            for prop in tr_pr.iterchildren(W_GRID_BEFORE, W_TBL_HEADER):
+                if prop.tag == W_GRID_BEFORE:
+                    grid_before = int(prop.get(W_VAL, 0))
+                else:
+                    is_header = prop.get(W_VAL, "1") in ON_VALUES
+        return grid_before, is_header
+
+    @staticmethod
+    def _cell_properties(tc):
+        """셀의 (gridSpan, vMerge) 값 반환"""
+        grid_span = 1
+        v_merge = None
+        for tc_pr in tc.iterchildren(W_TC_PR):
+            for prop in tc_pr.iterchildren(W_GRID_SPAN, W_V_MERGE):
+                if prop.tag == W_GRID_SPAN:
+                    grid_span = max(1, int(prop.get(W_VAL, 1)))
+                else:
+                    v_merge = prop.get(W_VAL, "continue")
+        return grid_span, v_merge
+
+    @staticmethod
+    def _detect_header_rows(grid: List[List[Optional[_GridCell]]], header_flags: List[bool]) -> int:
+        """
+        헤더 영역(상단 행 수) 판별
+
+        - w:tblHeader(머리글 행 반복)가 지정된 선두 행은 헤더
+        - 지정이 없으면 첫 번째 행을 헤더로 간주
+        - 헤더 셀이 아래로 병합(rowspan)되어 있으면 병합 범위까지 헤더 확장
+          (단, 표 마지막 행까지 이어지는 병합은 제외)
+        - 가로 병합된 헤더 셀 바로 아래 행이 그 범위를 여러 개의 텍스트 셀로
+          나누면 하위 헤더로 간주하여 확장
+        """
+        row_total = len(grid)
+        if row_total == 0:
+            return 0
+
+        header_rows = 0
+        while header_rows < row_total and header_flags[header_rows]:
+            header_rows += 1
+        header_rows = max(header_rows, 1)
+
+        changed = True
+        while changed:
+            changed = False
+
+            # 표 끝까지 이어지는 세로 병합(좌측 구분 열 등)은 헤더로 보지 않음
+            span_end = max(
+                (cell.row + cell.rowspan
+                 for row in grid[:header_rows] for cell in row
+                 if cell is not None and cell.row + cell.rowspan < row_total),
+                default=header_rows
+            )
+            if span_end > header_rows:
+                header_rows = span_end
+                changed = True
+                continue
+
+            if header_rows < row_total - 1 and DocxTableParser._has_sub_header(grid, header_rows):
+                header_rows += 1
+                changed = True
+
+        return header_rows
+
+    @staticmethod
+    def _has_sub_header(grid: List[List[Optional[_GridCell]]], row_idx: int) -> bool:
+        """row_idx 행이 바로 위 가로 병합 헤더 셀의 하위 헤더인지 확인"""
+        above_row = grid[row_idx - 1]
+        row = grid[row_idx]
+
+        for col, group in enumerate(above_row):
+            if group is None or group.col != col or group.colspan < 2:
+                continue
+            if group.row + group.rowspan != row_idx:
+                continue
+
+            children = {
+                id(cell): cell for cell in row[col:col + group.colspan]
+                if cell is not None and cell.row == row_idx
+            }
+            if len(children) < 2:
+                continue
+            if all(cell.text and not _NUMERIC_PATTERN.match(cell.text) for cell in children.values()):
+                return True
+
+        return False
+
+    @staticmethod
+    def _build_header_tree(grid: List[List[Optional[_GridCell]]], header_rows: int) -> List[Dict[str, Any]]:
+        """헤더 영역의 셀을 위 → 아래 포함 관계에 따라 트리로 구성"""
+        roots: List[Dict[str, Any]] = []
+        nodes: Dict[int, Dict[str, Any]] = {}
+
+        for row_idx in range(header_rows):
+            for col, cell in enumerate(grid[row_idx]):
+                if cell is None or cell.row != row_idx or cell.col != col:
+                    continue
+
+                node = {
+                    "label": cell.text,
+                    "col_index": cell.col,
+                    "colspan": cell.colspan,
+                    "rowspan": cell.rowspan,
+                    "children": []
+                }
+                nodes[id(cell)] = node
+
+                parent = grid[row_idx - 1][col] if row_idx > 0 else None
+                if parent is not None and parent.col + parent.colspan >= col + cell.colspan:
+                    cell.parent = parent
+                    nodes[id(parent)]["children"].append(node)
+                else:
+                    roots.append(node)
+
+        return roots
+
+    @staticmethod
+    def _header_path(cell: Optional[_GridCell]) -> str:
+        """최하위 헤더 셀에서 루트까지의 레이블을 연결한 열 이름"""
+        labels = []
+        while cell is not None:
+            if cell.text:
+                labels.append(cell.text)
+            cell = cell.parent
+        return HEADER_PATH_SEPARATOR.join(reversed(labels))
@@ -0,0 +1,244 @@
+"""
+@CODE:docx-table-builder-service
+열 단위 데이터로 w:tbl XML 을 한 번에 만드는 대형 표 생성기
+
+Related:
+- @SPEC:FEAT-003-REQ-004 - Bulk Table Builder
+- @CODE:docx-generator-service
+- @CODE:docx-template-export-service
+- @TEST:docx-table-builder-unit
+"""
+
+from lxml import etree
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import math
+import re
+
+from app.utils.docx_xml import W_NS
+
+# 새 표의 전체 너비 (A4 본문 폭, twip)
+TABLE_WIDTH_TWIPS = 9026
+HEADER_FILL = "D9E2F3"
+
+# 이름으로 지정하는 숫자 서식 (JSON 요청에서 사용)
+NUMBER_FORMATS: Dict[str, Union[str, Callable[[float], str]]] = {
+    "integer": ",.0f",
+    "decimal": ",.2f",
+    "percent": ".1%",
+    "krw": lambda value: f"₩{value:,.0f}",
+}
+
+NumberFormat = Union[str, Callable[[float], str]]
+
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CELL_END = "</w:t></w:r></w:p></w:tc>"
+_LINE_BREAK = '</w:t><w:br/><w:t xml:space="preserve">'
+
+
+class DocxTableBuilder:
+    """
+    @CODE:docx-table-builder-service
+    열 목록(리스트 또는 NumPy 배열)을 받아 w:tbl 을 문자열로 만든 뒤 한 번만 파싱
+
+    python-docx 의 table.rows[i].cells 는 호출할 때마다 그리드를 다시 계산하므로
+    셀마다 값을 넣으면 큰 표에서 수 초가 걸립니다. 이 생성기는 열마다 서식을 한 번에
+    적용하고, 셀 XML 은 열별로 미리 만든 접두사에 텍스트만 붙여 연결합니다.
+
+    - 헤더: 굵게, 가운데 정렬, 배경색, 페이지마다 반복 (w:tblHeader)
+    - 숫자: 천 단위 구분 기호 (열별 서식 지정 가능), 숫자 열은 오른쪽 정렬
+    - None / NaN: 빈 셀
+
+    Implements:
+    - @SPEC:FEAT-003-REQ-004 (Bulk Table Builder)
+    """
+
+    @staticmethod
+    def build(
+        headers: Sequence[Any],
+        columns: Sequence[Sequence[Any]],
+        formats: Optional[Dict[Union[int, str], NumberFormat]] = None,
+        style_id: Optional[str] = None,
+        header_fill: Optional[str] = HEADER_FILL,
+        borders: bool = True,
+        width_twips: int = TABLE_WIDTH_TWIPS,
+        parser: Optional[etree.XMLParser] = None
+    ):
+        """
+        w:tbl lxml 요소 생성 (인자는 build_xml 과 같음)
+
+        Args:
+            parser: 파싱에 사용할 XML 파서 (python-docx 문서에 넣을 때는 docx.oxml.parser.oxml_parser)
+        """
+        return etree.fromstring(
+            DocxTableBuilder.build_xml(headers, columns, formats, style_id, header_fill, borders, width_twips),
+            parser
+        )
+
+    @staticmethod
+    def build_xml(
+        headers: Sequence[Any],
+        columns: Sequence[Sequence[Any]],
+        formats: Optional[Dict[Union[int, str], NumberFormat]] = None,
+        style_id: Optional[str] = None,
+        header_fill: Optional[str] = HEADER_FILL,
+        borders: bool = True,
+        width_twips: int = TABLE_WIDTH_TWIPS
+    ) -> bytes:
+        """
+        @CODE:docx-table-builder-service-build
+        열 단위 데이터를 w:tbl XML 로 변환
+
+        Args:
+            headers: 열 제목
+            columns: 열별 값 목록 (길이가 다르면 짧은 열은 빈 셀로 채움)
+            formats: 열 인덱스 또는 열 제목 → 숫자 서식 (format spec, NUMBER_FORMATS 이름, 함수)
+            style_id: 표 스타일 ID (예: "LightGrid-Accent1")
+            header_fill: 헤더 배경색 (None 이면 없음)
+            borders: 직접 테두리 지정 여부 (표 스타일을 쓰면 False)
+            width_twips: 표 전체 너비
+
+        Returns:
+            UTF-8 XML bytes
+
+        Raises:
+            ValueError: 헤더와 열 수가 다른 경우
+        """
+        headers = [str(header) for header in headers]
+        if not headers:
+            raise ValueError("표 헤더가 비어 있습니다.")
+        if len(columns) != len(headers):
+            raise ValueError(f"헤더 {len(headers)}개와 열 {len(columns)}개의 수가 다릅니다.")
+
+        formats = formats or {}
+        cell_width = width_twips // len(headers)
+        texts: List[List[str]] = []
+        prefixes: List[str] = []
+        for col, (header, values) in enumerate(zip(headers, columns)):
+            # JSON 으로 오간 서식은 열 인덱스가 문자열 키
+            spec = formats.get(col, formats.get(str(col), formats.get(header)))
+            column_texts, numeric = DocxTableBuilder._format_column(values, spec)
+            texts.append(column_texts)
+            align = '<w:pPr><w:jc w:val="right"/></w:pPr>' if numeric else ""
+            prefixes.append(
+                f'<w:tc><w:tcPr><w:tcW w:w="{cell_width}" w:type="dxa"/></w:tcPr>'
+                f'<w:p>{align}<w:r><w:t xml:space="preserve">'
+            )
+        row_count = max((len(column) for column in texts), default=0)
+
+        parts = [f'<w:tbl xmlns:w="{W_NS}"><w:tblPr>']
+        if style_id:
+            parts.append(f'<w:tblStyle w:val="{_escape(style_id).replace(chr(34), "&quot;")}"/>')
+        parts.append('<w:tblW w:w="0" w:type="auto"/>')
+        if borders:
+            parts.append("<w:tblBorders>")
+            parts.extend(
+                f'<w:{edge} w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+                for edge in ("top", "left", "bottom", "right", "insideH", "insideV")
+            )
+            parts.append("</w:tblBorders>")
+        parts.append(
+            '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1"'
+            ' w:lastColumn="0" w:noHBand="0" w:noVBand="1"/></w:tblPr><w:tblGrid>'
+        )
+        parts.append(f'<w:gridCol w:w="{cell_width}"/>' * len(headers))
+        parts.append("</w:tblGrid>")
+
+        shading = f'<w:shd w:val="clear" w:color="auto" w:fill="{header_fill}"/>' if header_fill else ""
+        parts.append("<w:tr><w:trPr><w:tblHeader/></w:trPr>")
+        for header in headers:
+            parts.append(
+                f'<w:tc><w:tcPr><w:tcW w:w="{cell_width}" w:type="dxa"/>{shading}</w:tcPr>'
+                f'<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r><w:rPr><w:b/></w:rPr>'
+                f'<w:t xml:space="preserve">{_escape(header)}'
+            )
+            parts.append(_CELL_END)
+        parts.append("</w:tr>")
+
+        for row in range(row_count):
+            parts.append("<w:tr>")
+            for prefix, column in zip(prefixes, texts):
+                parts.append(prefix)
+                if row < len(column):
+                    parts.append(column[row])
+                parts.append(_CELL_END)
+            parts.append("</w:tr>")
+        parts.append("</w:tbl>")
+        return "".join(parts).encode("utf-8")
+
+    @staticmethod
+    def columns_from_table(table_data: Dict[str, Any]) -> Tuple[List[Any], List[List[Any]]]:
+        """
+        표 데이터를 (헤더, 열 목록) 으로 변환
+
+        - 열 단위: {"headers", "columns": [[...], ...]}
+        - 행 단위 (파서/생성기 형식): {"headers", "rows": [{"cells": [{"value"}]}]}
+        """
+        headers = list(table_data.get("headers") or [])
+        if "columns" in table_data:
+            return headers, list(table_data["columns"])
+
+        columns: List[List[Any]] = [[] for _ in headers]
+        for row in table_data.get("rows") or []:
+            cells = row.get("cells", []) if isinstance(row, dict) else row
+            for col, column in enumerate(columns):
+                cell = cells[col] if col < len(cells) else None
+                column.append(cell.get("value", "") if isinstance(cell, dict) else cell)
+        return headers, columns
+
+    @staticmethod
+    def format_value(value: Any, spec: Optional[NumberFormat] = None) -> Tuple[str, bool]:
+        """
+        셀 값 서식 적용
+
+        Returns:
+            (표시 문자열, 숫자 여부)
+        """
+        if value is None:
+            return "", False
+        if not isinstance(value, (int, float, str)) and hasattr(value, "item"):
+            # NumPy 스칼라
+            value = value.item()
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return str(value), False
+        if isinstance(value, float) and math.isnan(value):
+            return "", False
+
+        spec = NUMBER_FORMATS.get(spec, spec) if isinstance(spec, str) else spec
+        if callable(spec):
+            return spec(value), True
+        if spec:
+            return format(value, spec), True
+        if isinstance(value, int) or value.is_integer():
+            return f"{int(value):,}", True
+        if math.isinf(value):
+            return str(value), True
+        return f"{value:,.2f}".rstrip("0").rstrip("."), True
+
+    @staticmethod
+    def _format_column(values: Sequence[Any], spec: Optional[NumberFormat]) -> Tuple[List[str], bool]:
+        """열 전체에 서식을 적용하고 XML 이스케이프 (값이 모두 숫자면 숫자 열)"""
+        if hasattr(values, "tolist"):
+            # NumPy 배열은 한 번에 파이썬 값으로 변환
+            values = values.tolist()
+        format_value = DocxTableBuilder.format_value
+        texts = []
+        numeric = True
+        non_empty = 0
+        for value in values:
+            text, is_number = format_value(value, spec)
+            if text:
+                non_empty += 1
+                numeric = numeric and is_number
+            texts.append(_escape(text))
+        return texts, numeric and non_empty > 0
+
+
+def _escape(text: str) -> str:
+    """w:t 텍스트용 XML 이스케이프 (제어 문자 제거, 줄바꿈은 w:br)"""
+    if _INVALID_XML_CHARS.search(text):
+        text = _INVALID_XML_CHARS.sub("", text)
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if "\n" in text:
+        text = text.replace("\r\n", "\n").replace("\n", _LINE_BREAK)
+    return text
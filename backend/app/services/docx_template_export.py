@@ -0,0 +1,513 @@
+"""
+@CODE:docx-template-export-service
+업로드한 원본 양식 패키지를 복제하여 생성 내용을 채우는 DOCX 내보내기 엔진
+
+Related:
+- @SPEC:FEAT-003-REQ-002 - Template-Preserving Export
+- @CODE:docx-generator-service
+- @CODE:document-store-service
+- @TEST:docx-template-export-unit
+"""
+
+from collections import OrderedDict
+from lxml import etree
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Union
+import copy
+import io
+import logging
+import threading
+import zipfile
+
+from app.config import settings
+from app.services.docx_parser import DocxParser
+from app.services.docx_table import DocxTableParser
+from app.services.docx_table_builder import DocxTableBuilder
+from app.services.document_store import document_store, DocumentStore
+from app.utils.docx_xml import (
+    W_BODY,
+    W_BR,
+    W_GRID_BEFORE,
+    W_GRID_SPAN,
+    W_P,
+    W_P_PR,
+    W_P_STYLE,
+    W_R,
+    W_T,
+    W_TBL,
+    W_TBL_HEADER,
+    W_TC,
+    W_TC_PR,
+    W_TR,
+    W_TR_PR,
+    W_V_MERGE,
+    W_VAL,
+    is_heading,
+    load_style_names,
+    main_document_part,
+    paragraph_style,
+    paragraph_text,
+    qn,
+)
+from app.utils.raw_zip import RawZipEntry, check_zip_size, deflate_entry, iter_zip, read_raw_entries
+
+logger = logging.getLogger(__name__)
+
+W_R_PR = qn("w:rPr")
+W_B = qn("w:b")
+W_SECT_PR = qn("w:sectPr")
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# 생성 내용을 채우는 섹션 (문서 순서)과 양식에 해당 제목이 없을 때 본문 끝에 추가할 제목
+SECTION_TITLES = OrderedDict([
+    ("business_overview", "사업 개요"),
+    ("market_analysis", "시장 분석"),
+    ("competitive_analysis", "경쟁사 분석 및 차별화 전략"),
+    ("financial_plan", "재무 계획"),
+])
+
+
+
+class TableFillError(ValueError):
+    """양식 표 채우기 요청(generated_content.tables)이 표 구조와 맞지 않음"""
+
+
+class _Slot:
+    """양식 안에서 섹션 내용을 채울 위치 (본문 최상위 요소 인덱스 기준)"""
+
+    __slots__ = ("heading", "placeholders", "paragraph_properties")
+
+    def __init__(self, heading: int):
+        self.heading = heading
+        # 제목 뒤에서 생성 내용으로 바꿀 안내 문단 (다음 제목/표 전까지)
+        self.placeholders: List[int] = []
+        # 생성 문단에 복제할 문단 서식 (첫 안내 문단의 w:pPr)
+        self.paragraph_properties = None
+
+
+class _TemplateTable:
+    """양식 표의 위치와 셀 배치 (렌더링 때 w:tcPr 을 다시 해석하지 않도록 미리 계산)"""
+
+    __slots__ = ("position", "header_rows", "row_layouts")
+
+    def __init__(self, position: int, header_rows: int, row_layouts: List[Dict[int, int]]):
+        self.position = position
+        self.header_rows = header_rows
+        # 행별 그리드 열 → 행 안의 w:tc 순번
+        self.row_layouts = row_layouts
+
+
+class TemplatePackage:
+    """
+    @CODE:docx-template-export-service
+    한 번 읽어 분석해 둔 양식 패키지
+
+    - 모든 zip 항목을 압축된 바이트 그대로 보관 (바뀌지 않은 파트는 그대로 복사)
+    - 본문 파트(word/document.xml)는 파싱된 lxml 트리로 보관
+    - 섹션 제목 위치(슬롯)와 표 위치/헤더 행 수/셀 배치를 미리 계산
+
+    render 는 보관한 트리의 복사본에서 본문 최상위 요소를 한 번 순회하며
+    슬롯에 생성 문단을 넣고 표 셀을 채운 뒤, 본문 파트만 다시 압축합니다.
+
+    Implements:
+    - @SPEC:FEAT-003-REQ-002 (Template-Preserving Export)
+    """
+
+    def __init__(self, entries: List[RawZipEntry], document_part: str, root, style_names: Dict[Optional[str], str]):
+        self.entries = entries
+        self.document_part = document_part
+        self.style_names = style_names
+        self._root = root
+
+        self.slots: Dict[str, _Slot] = {}
+        self.tables: List[_TemplateTable] = []
+        self._heading_style_id = next(
+            (style_id for style_id, name in style_names.items() if style_id and name == "Heading 1"), None
+        )
+        self._analyze()
+
+    @classmethod
+    def load(cls, source: Union[bytes, str, BinaryIO]) -> "TemplatePackage":
+        """
+        DOCX 파일(경로, 바이트, 파일 객체)에서 양식 패키지 생성
+
+        Raises:
+            zipfile.BadZipFile: DOCX(zip) 형식이 아닌 경우
+        """
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                return cls.load(f)
+
+        entries = read_raw_entries(source)
+        source.seek(0)
+        with zipfile.ZipFile(source) as package:
+            document_part = main_document_part(package)
+            style_names = load_style_names(package, document_part)
+            with package.open(document_part) as stream:
+                root = etree.parse(stream).getroot()
+        return cls(entries, document_part, root, style_names)
+
+    def render(self, generated_content: Dict[str, Any], business_info: Dict[str, Any]) -> io.BytesIO:
+        """
+        생성 내용을 채운 DOCX 생성
+
+        Args:
+            generated_content: 섹션별 생성 텍스트 (market_analysis, competitive_analysis,
+                financial_plan), financial_tables (새 표), tables (양식 표 셀 값:
+                [{"table_index", "rows": [[값, ...]], "start_row"}])
+            business_info: 사업 기본 정보 (description 은 사업 개요 슬롯에 채움)
+
+        Returns:
+            BytesIO: DOCX 파일 바이트 스트림
+
+        Raises:
+            TableFillError: start_row 가 정수가 아니거나 표 행 범위(0 ~ 행 수) 밖인 경우
+        """
+        file_stream = io.BytesIO()
+        for chunk in iter_zip(self.render_entries(generated_content, business_info)):
+            file_stream.write(chunk)
+        file_stream.seek(0)
+        return file_stream
+
+    def render_entries(self, generated_content: Dict[str, Any], business_info: Dict[str, Any]) -> List[RawZipEntry]:
+        """
+        생성 내용을 채운 zip 항목 목록 (본문 파트만 새로 압축)
+
+        바뀌지 않은 항목은 패키지가 보관한 객체를 그대로 공유하므로 내보내기마다 새로 잡는
+        메모리는 압축된 본문 파트뿐입니다. 복사한 트리는 직렬화 직후 해제합니다.
+        """
+        root = copy.deepcopy(self._root)
+        body = root.find(W_BODY)
+        children = list(body)
+
+        contents = {section: generated_content.get(section) for section in SECTION_TITLES}
+        contents["business_overview"] = business_info.get("description")
+        new_tables = generated_content.get("financial_tables") or []
+
+        inserts: Dict[int, List[Any]] = {}
+        skipped = set()
+        tail: List[Any] = []
+        for section, title in SECTION_TITLES.items():
+            text = contents.get(section)
+            if not text:
+                continue
+            slot = self.slots.get(section)
+            blocks = self._paragraphs(text, slot.paragraph_properties if slot else None)
+            if section == "financial_plan":
+                blocks.extend(block for table in new_tables for block in self._table_blocks(table))
+            if slot is None:
+                tail.append(self._heading(title))
+                tail.extend(blocks)
+            else:
+                inserts[slot.heading] = blocks
+                skipped.update(slot.placeholders)
+
+        fills = {}
+        for fill in generated_content.get("tables") or []:
+            table_index = fill.get("table_index")
+            if isinstance(table_index, int) and 0 <= table_index < len(self.tables):
+                table = self.tables[table_index]
+                start_row = fill.get("start_row", table.header_rows)
+                if isinstance(start_row, bool) or not isinstance(start_row, int) \
+                        or not 0 <= start_row <= len(table.row_layouts):
+                    raise TableFillError(
+                        f"표 {table_index} 의 start_row 는 0 이상 {len(table.row_layouts)} 이하여야 합니다: {start_row!r}"
+                    )
+                fills[table.position] = (table, fill, start_row)
+
+        # 본문 최상위 요소 한 번 순회: 안내 문단 제거, 슬롯 뒤 생성 문단 삽입, 표 셀 채우기
+        tail_position = len(children) - 1 if children and children[-1].tag == W_SECT_PR else len(children)
+        body_blocks = []
+        for position, child in enumerate(children):
+            if position == tail_position:
+                body_blocks.extend(tail)
+            if position in skipped:
+                continue
+            body_blocks.append(child)
+            if position in inserts:
+                body_blocks.extend(inserts[position])
+            if position in fills:
+                table, fill, start_row = fills[position]
+                self._fill_table(child, table, fill.get("rows") or [], start_row)
+        if tail_position == len(children):
+            body_blocks.extend(tail)
+        body[:] = body_blocks
+
+        document_xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+        del root, body, children, body_blocks, inserts, tail
+
+        entries = [
+            deflate_entry(entry.name, document_xml, like=entry) if entry.name == self.document_part else entry
+            for entry in self.entries
+        ]
+        check_zip_size(entries)
+        return entries
+
+    def _analyze(self):
+        """본문 최상위 요소를 한 번 순회하여 섹션 슬롯과 표 위치 기록"""
+        body = self._root.find(W_BODY)
+        if body is None:
+            raise ValueError("본문(w:body)이 없는 문서입니다.")
+
+        current: Optional[_Slot] = None
+        for position, child in enumerate(body):
+            if child.tag == W_TBL:
+                header_rows = DocxTableParser.parse_table(child, len(self.tables))["header_rows"]
+                row_layouts = [_row_layout(tr) for tr in child.iterchildren(W_TR)]
+                self.tables.append(_TemplateTable(position, header_rows, row_layouts))
+                current = None
+                continue
+            if child.tag != W_P:
+                continue
+
+            text = paragraph_text(child).strip()
+            style = paragraph_style(child, self.style_names)
+            if is_heading(text, style):
+                current = None
+                # 문서 제목("OO 사업계획서")은 섹션 슬롯이 아님
+                section = DocxParser.identify_section_type(text) if style != "Title" else None
+                if section in SECTION_TITLES and section not in self.slots:
+                    current = self.slots[section] = _Slot(position)
+            elif current is not None:
+                current.placeholders.append(position)
+                if current.paragraph_properties is None and text:
+                    current.paragraph_properties = child.find(W_P_PR)
+
+    def _heading(self, text: str):
+        """양식에 슬롯이 없는 섹션의 제목 문단 (Heading 1 스타일이 없으면 굵게)"""
+        p = etree.Element(W_P)
+        if self._heading_style_id:
+            etree.SubElement(etree.SubElement(p, W_P_PR), W_P_STYLE).set(W_VAL, self._heading_style_id)
+            _append_run(p, text)
+        else:
+            _append_run(p, text, bold=True)
+        return p
+
+    @staticmethod
+    def _paragraphs(text: str, paragraph_properties=None) -> List[Any]:
+        """생성 텍스트를 줄 단위 문단으로 변환 (빈 줄 제외, 슬롯의 문단 서식 복제)"""
+        paragraphs = []
+        for line in str(text).splitlines():
+            if not line.strip():
+                continue
+            p = etree.Element(W_P)
+            if paragraph_properties is not None:
+                p.append(copy.deepcopy(paragraph_properties))
+            _append_run(p, line)
+            paragraphs.append(p)
+        return paragraphs
+
+    @staticmethod
+    def _table_blocks(table_data: Dict[str, Any]) -> List[Any]:
+        """재무 표 데이터(행 단위 또는 열 단위)를 w:tbl 과 뒤 여백 문단으로 변환"""
+        headers, columns = DocxTableBuilder.columns_from_table(table_data)
+        if not headers or not any(len(column) for column in columns):
+            return []
+        return [DocxTableBuilder.build(headers, columns, formats=table_data.get("formats")), etree.Element(W_P)]
+
+    @staticmethod
+    def _fill_table(tbl, table: _TemplateTable, rows: Sequence[Sequence[Any]], start_row: int):
+        """
+        양식 표의 셀 값 채우기
+
+        값은 그리드 열 기준으로 지정하며 (병합 셀은 시작 열), None 인 값은 건너뜁니다.
+        양식보다 행이 많으면 마지막 행을 복제하여 늘립니다 (start_row 는 render_entries 에서
+        0 이상 양식 행 수 이하로 검증).
+        """
+        trs = list(tbl.iterchildren(W_TR))
+        if not trs:
+            return
+        blank_layout = None
+        for offset, values in enumerate(rows):
+            row_idx = start_row + offset
+            if row_idx < len(table.row_layouts):
+                layout = table.row_layouts[row_idx]
+            else:
+                tr = _blank_row(trs[-1])
+                trs[-1].addnext(tr)
+                trs.append(tr)
+                if blank_layout is None:
+                    blank_layout = _row_layout(tr)
+                layout = blank_layout
+            tcs = list(trs[row_idx].iterchildren(W_TC))
+            for col, value in enumerate(values):
+                ordinal = layout.get(col)
+                if value is not None and ordinal is not None:
+                    _set_cell_text(tcs[ordinal], str(value))
+
+
+def _append_run(p, text: str, bold: bool = False, run_properties=None):
+    """문단에 텍스트 런 추가 (줄바꿈은 w:br)"""
+    r = etree.SubElement(p, W_R)
+    if run_properties is not None:
+        r.append(copy.deepcopy(run_properties))
+    elif bold:
+        etree.SubElement(etree.SubElement(r, W_R_PR), W_B)
+    for idx, line in enumerate(text.split("\n")):
+        if idx:
+            etree.SubElement(r, W_BR)
+        _set_text(etree.SubElement(r, W_T), line)
+    return r
+
+
+def _set_text(t, text: str):
+    """w:t 텍스트 설정 (앞뒤 공백이 있으면 xml:space="preserve")"""
+    t.text = text
+    if text != text.strip():
+        t.set(XML_SPACE, "preserve")
+    elif XML_SPACE in t.attrib:
+        del t.attrib[XML_SPACE]
+
+
+def _first_child(elem, tag):
+    """첫 번째 tag 자식 (find 보다 빠른 C 수준 순회)"""
+    return next(elem.iterchildren(tag), None)
+
+
+def _row_layout(tr) -> Dict[int, int]:
+    """행의 그리드 열 → w:tc 순번 매핑 (세로 병합의 이어지는 셀은 제외)"""
+    layout = {}
+    col = 0
+    tr_pr = _first_child(tr, W_TR_PR)
+    if tr_pr is not None:
+        grid_before = _first_child(tr_pr, W_GRID_BEFORE)
+        if grid_before is not None:
+            col = int(grid_before.get(W_VAL, "0"))
+    for ordinal, tc in enumerate(tr.iterchildren(W_TC)):
+        span = 1
+        continued = False
+        tc_pr = _first_child(tc, W_TC_PR)
+        if tc_pr is not None:
+            grid_span = _first_child(tc_pr, W_GRID_SPAN)
+            if grid_span is not None:
+                span = int(grid_span.get(W_VAL, "1"))
+            v_merge = _first_child(tc_pr, W_V_MERGE)
+            continued = v_merge is not None and v_merge.get(W_VAL, "continue") != "restart"
+        if not continued:
+            layout[col] = ordinal
+        col += span
+    return layout
+
+
+def _set_cell_text(tc, text: str):
+    """셀 내용을 text 로 교체 (첫 문단의 문단/런 서식 유지)"""
+    paragraphs = list(tc.iterchildren(W_P))
+    if not paragraphs:
+        paragraphs = [etree.SubElement(tc, W_P)]
+    p = paragraphs[0]
+    for extra in paragraphs[1:]:
+        tc.remove(extra)
+
+    content = [child for child in p if child.tag != W_P_PR]
+    if len(content) == 1 and content[0].tag == W_R and text and "\n" not in text:
+        # 런 하나에 w:t 하나인 일반적인 셀은 텍스트만 교체
+        run_content = [child for child in content[0] if child.tag != W_R_PR]
+        if len(run_content) == 1 and run_content[0].tag == W_T:
+            _set_text(run_content[0], text)
+            return
+
+    first_run = _first_child(p, W_R)
+    run_properties = _first_child(first_run, W_R_PR) if first_run is not None else None
+    for child in content:
+        p.remove(child)
+    if text:
+        _append_run(p, text, run_properties=run_properties)
+
+
+def _blank_row(tr):
+    """행을 복제하고 셀 텍스트와 세로 병합 표시를 지움"""
+    clone = copy.deepcopy(tr)
+    for v_merge in list(clone.iter(W_V_MERGE)):
+        v_merge.getparent().remove(v_merge)
+    for header in list(clone.iter(W_TBL_HEADER)):
+        header.getparent().remove(header)
+    for tc in clone.iterchildren(W_TC):
+        _set_cell_text(tc, "")
+    return clone
+
+
+class TemplateExporter:
+    """
+    @CODE:docx-template-export-service
+    template_id 별 TemplatePackage 를 메모리 LRU 에 보관하는 내보내기 서비스
+
+    양식 원본은 문서 저장소에서 처음 내보낼 때 한 번만 읽고 분석합니다.
+    """
+
+    def __init__(self, store: DocumentStore, max_packages: int = 8):
+        self.store = store
+        self.max_packages = max_packages
+        self._packages: "OrderedDict[str, TemplatePackage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"exports": 0, "package_hits": 0, "package_loads": 0}
+
+    def package(self, template_id: str) -> Optional[TemplatePackage]:
+        """분석된 양식 패키지 (원본이 없으면 None)"""
+        with self._lock:
+            package = self._packages.get(template_id)
+            if package is not None:
+                self._packages.move_to_end(template_id)
+                self._stats["package_hits"] += 1
+                return package
+
+        path = self.store.template_source_path(template_id)
+        if path is None:
+            return None
+        package = TemplatePackage.load(path)
+
+        with self._lock:
+            self._stats["package_loads"] += 1
+            if self.max_packages > 0:
+                self._packages[template_id] = package
+                while len(self._packages) > self.max_packages:
+                    self._packages.popitem(last=False)
+        return package
+
+    def export(self, template_id: str, generated_content: Dict[str, Any], business_info: Dict[str, Any]) -> io.BytesIO:
+        """
+        양식을 복제하여 생성 내용을 채운 DOCX 생성
+
+        Raises:
+            KeyError: 저장된 양식 원본이 없는 경우
+        """
+        file_stream = io.BytesIO()
+        for chunk in iter_zip(self.export_entries(template_id, generated_content, business_info)):
+            file_stream.write(chunk)
+        file_stream.seek(0)
+        return file_stream
+
+    def export_entries(self, template_id: str, generated_content: Dict[str, Any], business_info: Dict[str, Any]) -> List[RawZipEntry]:
+        """
+        양식을 복제하여 생성 내용을 채운 zip 항목 목록 (스트리밍 응답용)
+
+        Raises:
+            KeyError: 저장된 양식 원본이 없는 경우
+        """
+        package = self.package(template_id)
+        if package is None:
+            raise KeyError(template_id)
+        entries = package.render_entries(generated_content, business_info)
+        with self._lock:
+            self._stats["exports"] += 1
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "packages": len(self._packages), "max_packages": self.max_packages}
+
+    def clear(self):
+        with self._lock:
+            self._packages.clear()
+
+
+template_exporter = TemplateExporter(document_store, max_packages=settings.template_export_cache_entries)
+
+
+def export_template_entries(
+    template_id: str,
+    generated_content: Dict[str, Any],
+    business_info: Dict[str, Any]
+) -> List[RawZipEntry]:
+    """문서 워커 풀에서 실행하는 내보내기 함수 (프로세스 풀에서는 워커마다 양식 캐시를 가짐)"""
+    return template_exporter.export_entries(template_id, generated_content, business_info)
@@ -0,0 +1,178 @@
+"""
+@CODE:document-executor-service
+블로킹 문서 작업(파싱/생성)을 이벤트 루프 밖의 워커 풀에서 실행
+
+Related:
+- @CODE:docx-parser-service
+- @CODE:docx-generator-service
+- @TEST:document-executor-unit
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from app.config import settings
+import asyncio
+import functools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KIND_THREAD = "thread"
+EXECUTOR_KIND_PROCESS = "process"
+
+
+class ExecutorSaturatedError(Exception):
+    """실행 중 + 대기 중 작업 수가 한도에 도달 (HTTP 429 로 변환)"""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("문서 처리 작업이 많아 요청을 처리할 수 없습니다. 잠시 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+class ExecutorTimeoutError(Exception):
+    """작업이 제한 시간 안에 끝나지 않음 (HTTP 504 로 변환)"""
+
+    def __init__(self, timeout: float):
+        super().__init__(f"문서 처리 시간이 초과되었습니다 ({timeout:.0f}초).")
+        self.timeout = timeout
+
+
+class DocumentExecutor:
+    """
+    @CODE:document-executor-service
+    문서 파싱/생성 같은 CPU 작업을 위한 제한된 워커 풀
+
+    - kind="thread": ThreadPoolExecutor (기본값, lxml 파싱 중 GIL 해제)
+    - kind="process": ProcessPoolExecutor (CPU 바운드 파싱을 코어별로 분산,
+      함수와 인자/결과는 pickle 가능해야 함)
+
+    실행 중 작업(max_workers)과 대기 작업(max_queue)의 합이 한도에 도달하면
+    ExecutorSaturatedError 로 즉시 거절합니다. 작업별 timeout 이 지나면
+    ExecutorTimeoutError 를 발생시키며, 이미 실행 중인 작업은 중단할 수 없으므로
+    끝날 때까지 슬롯을 계속 점유합니다.
+    """
+
+    def __init__(
+        self,
+        kind: str = EXECUTOR_KIND_THREAD,
+        max_workers: int = 4,
+        max_queue: int = 16,
+        timeout: Optional[float] = 60.0
+    ):
+        if kind not in (EXECUTOR_KIND_THREAD, EXECUTOR_KIND_PROCESS):
+            raise ValueError(f"지원되지 않는 실행기 종류: {kind}")
+
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "timed_out": 0
+        }
+
+    @property
+    def capacity(self) -> int:
+        """동시에 받을 수 있는 최대 작업 수 (실행 + 대기)"""
+        return self.max_workers + self.max_queue
+
+    async def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        fn(*args, **kwargs) 를 워커 풀에서 실행하고 결과 반환
+
+        Args:
+            fn: 실행할 블로킹 함수
+            timeout: 작업 제한 시간 (None 이면 기본값 사용)
+
+        Returns:
+            fn 의 반환값
+
+        Raises:
+            ExecutorSaturatedError: 대기열이 가득 찬 경우
+            ExecutorTimeoutError: 제한 시간 초과
+        """
+        self._acquire()
+
+        try:
+            future = self._get_pool().submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._release(failed=True)
+            raise
+
+        future.add_done_callback(lambda f: self._release(failed=f.cancelled() or f.exception() is not None))
+
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()  # 아직 대기 중이면 실행하지 않음
+            with self._lock:
+                self._stats["timed_out"] += 1
+            logger.warning(f"문서 작업 시간 초과: {getattr(fn, '__qualname__', fn)} ({timeout}초)")
+            raise ExecutorTimeoutError(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """실행기 상태 및 누적 카운터"""
+        with self._lock:
+            return {
+                **self._stats,
+                "kind": self.kind,
+                "in_flight": self._in_flight,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "capacity": self.capacity
+            }
+
+    def shutdown(self, wait: bool = True):
+        """워커 풀 종료 (다음 run 호출 시 다시 생성)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _acquire(self):
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._stats["rejected"] += 1
+                raise ExecutorSaturatedError()
+            self._in_flight += 1
+            self._stats["submitted"] += 1
+
+    def _release(self, failed: bool = False):
+        with self._lock:
+            self._in_flight -= 1
+            self._stats["failed" if failed else "completed"] += 1
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                started = time.perf_counter()
+                if self.kind == EXECUTOR_KIND_PROCESS:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="document-worker"
+                    )
+                logger.info(
+                    f"문서 워커 풀 시작: {self.kind} x{self.max_workers} "
+                    f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+                )
+            return self._pool
+
+
+document_executor = DocumentExecutor(
+    kind=settings.document_executor_kind,
+    max_workers=settings.document_executor_workers,
+    max_queue=settings.document_executor_queue,
+    timeout=settings.document_job_timeout
+)
@@ -0,0 +1,241 @@
+"""
+@CODE:reference-extractors
+참고 문서 텍스트 추출기 레지스트리 (파일 내용 판별 + 지연 import)
+
+Related:
+- @SPEC:FEAT-001-REQ-010 - Reference Extractor Registry
+- @CODE:docx-parser-service
+- @TEST:reference-extractors-unit
+
+파일 이름 확장자 대신 앞부분 바이트(시그니처)와 zip 항목 이름으로 형식을 판별합니다.
+추출기는 "모듈:함수" 문자열로 등록하고 처음 사용할 때 import 하므로 pypdf/olefile 같은
+무거운 선택 의존성은 해당 형식 문서가 처음 들어올 때까지 로드되지 않습니다.
+
+추출 함수는 `(source, max_pages) -> Iterator[str]` 제너레이터로, 페이지(HWP/HWPX 는
+구역) 단위 텍스트를 하나씩 내보내고 max_pages(설정 reference_max_pages)에서 멈췄으면
+True 를 반환합니다.
+"""
+
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+import importlib
+import io
+import threading
+import zipfile
+
+# 형식 이름
+FORMAT_PDF = "pdf"
+FORMAT_HWP = "hwp"
+FORMAT_HWPX = "hwpx"
+FORMAT_DOCX = "docx"
+FORMAT_TEXT = "text"
+
+# 형식 판별에 읽는 앞부분 크기
+SNIFF_BYTES = 8 * 1024
+
+PDF_MAGIC = b"%PDF-"
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_MAGIC = b"PK\x03\x04"
+
+ExtractSource = Union[bytes, BinaryIO]
+# matches(앞부분 바이트, zip 항목 이름 목록 또는 None) -> 해당 형식 여부
+Matcher = Callable[[bytes, Optional[FrozenSet[str]]], bool]
+
+
+class UnsupportedFormatError(ValueError):
+    """등록된 추출기로 판별되지 않거나 해당 형식으로 읽을 수 없는 파일"""
+
+
+class ExtractorUnavailableError(RuntimeError):
+    """추출기에 필요한 선택 의존성이 설치되지 않음"""
+
+
+@dataclass(frozen=True)
+class ExtractorSpec:
+    """추출기 등록 정보"""
+    name: str
+    target: str  # "모듈:함수", 처음 사용할 때 import
+    matches: Matcher
+    requires: Tuple[str, ...] = ()  # 선택 의존성 패키지 (설치 안내용)
+    priority: int = 50  # 낮을수록 먼저 판별
+
+
+@dataclass(frozen=True)
+class ExtractedText:
+    """추출 결과"""
+    format: str
+    text: str
+    pages: int  # 추출한 페이지(HWP/HWPX 는 구역) 수
+    truncated: bool  # 페이지 제한으로 뒷부분을 생략했는지 여부
+
+
+def _is_text(head: bytes) -> bool:
+    """NUL 바이트가 없고 UTF-8/UTF-16(BOM)/CP949 로 읽히는 앞부분"""
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return True
+    if b"\x00" in head:
+        return False
+    for encoding in ("utf-8", "cp949"):
+        try:
+            # 잘린 멀티바이트 글자가 끝에 걸릴 수 있으므로 마지막 3바이트는 제외하고 검사
+            head[:-3 if len(head) == SNIFF_BYTES else None].decode(encoding)
+            return True
+        except UnicodeDecodeError:
+            continue
+    return False
+
+
+def _has_hwpx_sections(names: FrozenSet[str]) -> bool:
+    return any(name.startswith("Contents/section") and name.endswith(".xml") for name in names)
+
+
+BUILTIN_EXTRACTORS = (
+    ExtractorSpec(
+        FORMAT_PDF, "app.services.extractors.pdf:extract_pdf",
+        lambda head, names: PDF_MAGIC in head[:1024],  # 앞에 쓰레기 바이트가 붙은 PDF 도 허용
+        requires=("pypdf",), priority=10
+    ),
+    ExtractorSpec(
+        FORMAT_HWP, "app.services.extractors.hwp:extract_hwp",
+        lambda head, names: head.startswith(OLE_MAGIC),
+        requires=("olefile",), priority=20
+    ),
+    ExtractorSpec(
+        FORMAT_DOCX, "app.services.extractors.docx:extract_docx",
+        lambda head, names: names is not None and "word/document.xml" in names,
+        priority=30
+    ),
+    ExtractorSpec(
+        FORMAT_HWPX, "app.services.extractors.hwpx:extract_hwpx",
+        lambda head, names: names is not None and _has_hwpx_sections(names),
+        priority=30
+    ),
+    ExtractorSpec(
+        FORMAT_TEXT, "app.services.extractors.text:extract_text",
+        lambda head, names: names is None and _is_text(head),
+        priority=100
+    ),
+)
+
+
+class ExtractorRegistry:
+    """
+    @CODE:reference-extractors-registry
+    형식 판별과 추출기 지연 로드
+
+    Implements: @SPEC:FEAT-001-REQ-010
+    """
+
+    def __init__(self, specs: Tuple[ExtractorSpec, ...] = BUILTIN_EXTRACTORS):
+        self._specs: List[ExtractorSpec] = []
+        self._loaded: Dict[str, Callable[..., Iterator[str]]] = {}
+        self._lock = threading.Lock()
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: ExtractorSpec) -> None:
+        """추출기 등록 (같은 이름은 교체, priority 순으로 판별)"""
+        with self._lock:
+            self._specs = sorted(
+                [existing for existing in self._specs if existing.name != spec.name] + [spec],
+                key=lambda item: item.priority
+            )
+            self._loaded.pop(spec.name, None)
+
+    def formats(self) -> List[str]:
+        """등록된 형식 이름 (판별 순서)"""
+        return [spec.name for spec in self._specs]
+
+    def loaded(self) -> List[str]:
+        """지금까지 import 된 추출기 형식"""
+        return sorted(self._loaded)
+
+    def detect(self, source: ExtractSource) -> Optional[str]:
+        """
+        파일 내용으로 형식 판별 (판별할 수 없으면 None)
+
+        파일 객체는 앞부분과 zip 중앙 디렉터리만 읽고 처음 위치로 되돌립니다.
+        """
+        stream = io.BytesIO(source) if isinstance(source, bytes) else source
+        stream.seek(0)
+        head = stream.read(SNIFF_BYTES)
+        names: Optional[FrozenSet[str]] = None
+        if head.startswith(ZIP_MAGIC):
+            stream.seek(0)
+            try:
+                with zipfile.ZipFile(stream) as archive:
+                    names = frozenset(archive.namelist())
+            except zipfile.BadZipFile:
+                names = frozenset()
+        stream.seek(0)
+
+        for spec in self._specs:
+            if spec.matches(head, names):
+                return spec.name
+        return None
+
+    def _spec(self, name: str) -> ExtractorSpec:
+        for spec in self._specs:
+            if spec.name == name:
+                return spec
+        raise UnsupportedFormatError(f"등록되지 않은 문서 형식: {name}")
+
+    def extractor(self, name: str) -> Callable[..., Iterator[str]]:
+        """형식의 추출 함수 (처음 호출할 때 모듈 import)"""
+        function = self._loaded.get(name)
+        if function is not None:
+            return function
+
+        spec = self._spec(name)
+        module_name, _, attribute = spec.target.partition(":")
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            packages = ", ".join(spec.requires) or e.name
+            raise ExtractorUnavailableError(
+                f"{name.upper()} 문서 추출에 필요한 패키지({packages})가 설치되어 있지 않습니다."
+            ) from e
+        function = getattr(module, attribute)
+        with self._lock:
+            self._loaded[name] = function
+        return function
+
+    def extract(self, name: str, source: ExtractSource, max_pages: int) -> ExtractedText:
+        """
+        형식 추출기로 텍스트 추출 (페이지/구역 사이는 빈 줄로 구분)
+
+        Raises:
+            UnsupportedFormatError: 해당 형식으로 읽을 수 없는 파일 (손상, 암호화 등)
+            ExtractorUnavailableError: 선택 의존성 미설치
+        """
+        extract = self.extractor(name)
+        stream = io.BytesIO(source) if isinstance(source, bytes) else source
+        stream.seek(0)
+
+        pages: List[str] = []
+        iterator = extract(stream, max_pages)
+        try:
+            while True:
+                pages.append(next(iterator))
+        except StopIteration as stop:
+            truncated = bool(stop.value)
+        except (UnsupportedFormatError, ExtractorUnavailableError):
+            raise
+        except Exception as e:
+            raise UnsupportedFormatError(f"{name.upper()} 문서를 읽을 수 없습니다: {str(e)}") from e
+
+        return ExtractedText(
+            format=name,
+            text="\n\n".join(page.strip() for page in pages if page.strip()),
+            pages=len(pages),
+            truncated=truncated
+        )
+
+
+# 앱 전역 레지스트리
+extractor_registry = ExtractorRegistry()
+
+
+def extract_reference(name: str, source: ExtractSource, max_pages: int) -> ExtractedText:
+    """워커 풀(프로세스 포함)에서 실행할 수 있는 모듈 수준 추출 함수"""
+    return extractor_registry.extract(name, source, max_pages)
@@ -0,0 +1,18 @@
+"""
+@CODE:reference-extractors-docx
+DOCX 추출기 (문단 텍스트)
+
+업로드 API 는 양식 파싱 캐시를 함께 쓰기 위해 DOCX 를 parse_cache 경로로 처리하며,
+이 추출기는 레지스트리를 직접 사용하는 경우(벤치마크, 플러그인 조합)를 위한 것입니다.
+"""
+
+from typing import BinaryIO, Iterator
+
+from app.services.docx_parser import PARSE_MODE_STREAM, docx_parser
+
+
+def extract_docx(source: BinaryIO, max_pages: int) -> Iterator[str]:
+    """문서 전체를 한 페이지로, 문단마다 한 줄 (텍스트만 필요하므로 스트리밍 파서 사용)"""
+    structure = docx_parser.parse_document(source, mode=PARSE_MODE_STREAM)
+    yield "\n".join(paragraph["text"] for paragraph in structure["paragraphs"])
+    return False
@@ -0,0 +1,146 @@
+"""
+@CODE:reference-extractors-hwp
+HWP 5.x 추출기 (olefile, 본문 문단 텍스트만 읽는 경량 파서)
+
+HWP 5.x 문서는 OLE 복합 파일이며 본문은 BodyText/Section{N} 스트림에 레코드로 저장됩니다
+(문서 속성의 압축 비트가 켜져 있으면 raw deflate). 레코드 중 문단 텍스트(HWPTAG_PARA_TEXT)만
+UTF-16LE 로 읽고 표/그림 등 컨트롤 내용은 건너뜁니다. 배포용 문서는 본문이 암호화되어 있어
+미리보기 텍스트(PrvText, 앞부분 일부)만 읽고 잘린 것으로 보고합니다. 압축 본문은 조각 단위로
+풀면서 풀린 크기 합을 reference_max_extract_bytes 로 제한합니다 (압축 폭탄 방지).
+"""
+
+from typing import BinaryIO, Iterator, List
+import struct
+import zlib
+
+import olefile
+
+from app.config import settings
+from app.services.extractors import UnsupportedFormatError
+
+HWP_SIGNATURE = b"HWP Document File"
+
+# FileHeader 속성 비트
+FLAG_COMPRESSED = 0x01
+FLAG_PASSWORD = 0x02
+FLAG_DISTRIBUTION = 0x04
+
+# 레코드 태그 (HWPTAG_BEGIN = 0x10)
+HWPTAG_PARA_TEXT = 0x10 + 51
+
+# 글자 컨트롤: 1 WCHAR 만 차지 (나머지 0~31 코드는 확장/인라인 컨트롤로 8 WCHAR)
+CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+CONTROL_TEXT = {9: "\t", 10: "\n", 24: "-", 30: " ", 31: " "}
+CONTROL_WCHARS = 8
+
+# 본문 스트림을 읽고 푸는 조각 크기
+INFLATE_CHUNK_BYTES = 64 * 1024
+
+
+def iter_records(data: bytes) -> Iterator[tuple]:
+    """(태그, 레벨, 데이터) 레코드 순회"""
+    offset, end = 0, len(data)
+    while offset + 4 <= end:
+        header, = struct.unpack_from("<I", data, offset)
+        offset += 4
+        tag, level, size = header & 0x3FF, (header >> 10) & 0x3FF, header >> 20
+        if size == 0xFFF:
+            if offset + 4 > end:
+                return
+            size, = struct.unpack_from("<I", data, offset)
+            offset += 4
+        yield tag, level, data[offset:offset + size]
+        offset += size
+
+
+def para_text(payload: bytes) -> str:
+    """문단 텍스트 레코드 → 문자열 (컨트롤 문자는 탭/줄바꿈/공백으로 바꾸거나 제거)"""
+    codes = struct.unpack(f"<{len(payload) // 2}H", payload[:len(payload) // 2 * 2])
+    chars: List[str] = []
+    position = 0
+    while position < len(codes):
+        code = codes[position]
+        if code >= 32:
+            chars.append(chr(code))
+            position += 1
+            continue
+        chars.append(CONTROL_TEXT.get(code, ""))
+        position += 1 if code in CHAR_CONTROLS else CONTROL_WCHARS
+    return "".join(chars)
+
+
+def section_text(data: bytes) -> str:
+    """본문 구역 스트림(압축 해제 후) → 문단마다 한 줄"""
+    return "\n".join(
+        para_text(payload).rstrip("\n")
+        for tag, _, payload in iter_records(data)
+        if tag == HWPTAG_PARA_TEXT
+    )
+
+
+def inflate(stream: BinaryIO, limit: int) -> bytes:
+    """
+    raw deflate 스트림을 조각 단위로 풀기 (출력 크기를 limit + 1 로 제한하며 진행)
+
+    Raises:
+        UnsupportedFormatError: 풀린 크기가 limit 초과
+    """
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    parts: List[bytes] = []
+    size = 0
+    while not decompressor.eof:
+        data = decompressor.unconsumed_tail or stream.read(INFLATE_CHUNK_BYTES)
+        if not data:
+            break
+        part = decompressor.decompress(data, limit - size + 1)
+        size += len(part)
+        if size > limit:
+            raise UnsupportedFormatError("HWP 본문의 압축을 푼 크기가 제한을 넘습니다.")
+        parts.append(part)
+    return b"".join(parts)
+
+
+def _section_number(entry: List[str]) -> int:
+    suffix = entry[-1][len("Section"):]
+    return int(suffix) if suffix.isdigit() else -1
+
+
+def extract_hwp(source: BinaryIO, max_pages: int) -> Iterator[str]:
+    """
+    본문 구역 텍스트를 순서대로 내보냄
+
+    Returns:
+        구역 수 제한 또는 배포용 문서 미리보기로 잘렸으면 True
+    """
+    with olefile.OleFileIO(source) as ole:
+        if not ole.exists("FileHeader"):
+            raise UnsupportedFormatError("HWP 문서가 아닌 OLE 파일입니다.")
+        header = ole.openstream("FileHeader").read()
+        if not header.startswith(HWP_SIGNATURE):
+            raise UnsupportedFormatError("HWP 문서가 아닌 OLE 파일입니다.")
+        flags, = struct.unpack_from("<I", header, 36)
+        if flags & FLAG_PASSWORD:
+            raise UnsupportedFormatError("암호가 걸린 HWP 문서는 읽을 수 없습니다.")
+
+        if flags & FLAG_DISTRIBUTION:
+            if not ole.exists("PrvText"):
+                raise UnsupportedFormatError("배포용 HWP 문서는 읽을 수 없습니다.")
+            yield ole.openstream("PrvText").read().decode("utf-16-le", errors="ignore").strip("\x00")
+            return True
+
+        sections = sorted(
+            (entry for entry in ole.listdir() if len(entry) == 2 and entry[0] == "BodyText"),
+            key=_section_number
+        )
+        remaining = settings.reference_max_extract_bytes
+        for entry in sections[:max_pages]:
+            stream = ole.openstream(entry)
+            if flags & FLAG_COMPRESSED:
+                data = inflate(stream, remaining)
+            else:
+                data = stream.read(remaining + 1)
+                if len(data) > remaining:
+                    raise UnsupportedFormatError("HWP 본문의 압축을 푼 크기가 제한을 넘습니다.")
+            remaining -= len(data)
+            yield section_text(data)
+        return len(sections) > max_pages
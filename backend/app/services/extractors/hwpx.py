@@ -0,0 +1,48 @@
+"""
+@CODE:reference-extractors-hwpx
+HWPX 추출기 (OWPML zip, 구역 XML 의 문단 텍스트)
+
+HWPX 는 Contents/section{N}.xml 에 본문을 담은 zip 패키지입니다. 구역 XML 을 iterparse 로
+문단(hp:p)이 끝날 때마다 그 문단에 직접 속한 글자(hp:run/hp:t)만 읽고 버리므로 표 안
+문단은 한 번씩만 추출되고 큰 구역도 전체 트리를 만들지 않습니다.
+"""
+
+from typing import BinaryIO, Iterator, List
+import re
+import zipfile
+
+from lxml import etree
+
+HP_NS = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+P_TAG = f"{{{HP_NS}}}p"
+RUN_TEXT = f"{{{HP_NS}}}run/{{{HP_NS}}}t"
+
+SECTION_NAME = re.compile(r"^Contents/section(\d+)\.xml$")
+
+
+def section_text(stream: BinaryIO) -> str:
+    """구역 XML → 문단마다 한 줄"""
+    lines: List[str] = []
+    for _, paragraph in etree.iterparse(stream, events=("end",), tag=P_TAG):
+        lines.append("".join("".join(text.itertext()) for text in paragraph.iterfind(RUN_TEXT)))
+        # 표 안 문단은 바깥 문단보다 먼저 끝나므로 이미 읽은 문단만 비움
+        paragraph.clear(keep_tail=True)
+    return "\n".join(lines)
+
+
+def extract_hwpx(source: BinaryIO, max_pages: int) -> Iterator[str]:
+    """
+    구역 텍스트를 순서대로 내보냄
+
+    Returns:
+        구역 수 제한으로 멈췄으면 True
+    """
+    with zipfile.ZipFile(source) as archive:
+        sections = sorted(
+            (name for name in archive.namelist() if SECTION_NAME.match(name)),
+            key=lambda name: int(SECTION_NAME.match(name).group(1))
+        )
+        for name in sections[:max_pages]:
+            with archive.open(name) as stream:
+                yield section_text(stream)
+        return len(sections) > max_pages
@@ -0,0 +1,36 @@
+"""
+@CODE:reference-extractors-pdf
+PDF 추출기 (pypdf, 페이지 단위)
+
+PdfReader 는 파일 객체에서 교차 참조 표만 먼저 읽고 페이지 내용은 접근할 때 해석하므로
+페이지를 하나씩 추출해 내보내면 문서 전체를 메모리에 펼치지 않습니다. max_pages 를 넘는
+페이지는 해석하지 않습니다.
+"""
+
+from typing import BinaryIO, Iterator
+import logging
+
+from pypdf import PdfReader
+
+from app.services.extractors import UnsupportedFormatError
+
+# 페이지 해석 경고(폰트/인코딩 누락 등)는 추출 결과에 영향이 적어 숨김
+logging.getLogger("pypdf").setLevel(logging.ERROR)
+
+
+def extract_pdf(source: BinaryIO, max_pages: int) -> Iterator[str]:
+    """
+    페이지 텍스트를 순서대로 내보냄
+
+    Returns:
+        페이지 제한으로 멈췄으면 True
+    """
+    reader = PdfReader(source, strict=False)
+    if reader.is_encrypted and not reader.decrypt(""):
+        # 빈 사용자 암호로 열리는 PDF(인쇄/복사 제한만 있는 문서)만 처리
+        raise UnsupportedFormatError("암호가 걸린 PDF 는 읽을 수 없습니다.")
+
+    page_count = len(reader.pages)
+    for page_number in range(min(page_count, max_pages)):
+        yield reader.pages[page_number].extract_text() or ""
+    return page_count > max_pages
@@ -0,0 +1,24 @@
+"""
+@CODE:reference-extractors-text
+텍스트 파일 추출기 (UTF-8, BOM 이 있는 UTF-8/UTF-16, CP949)
+"""
+
+from typing import BinaryIO, Iterator
+import codecs
+
+from app.services.extractors import UnsupportedFormatError
+
+
+def extract_text(source: BinaryIO, max_pages: int) -> Iterator[str]:
+    """파일 전체를 한 페이지로 디코딩"""
+    data = source.read()
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        yield data.decode("utf-16")
+        return False
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            yield data.decode(encoding)
+            return False
+        except UnicodeDecodeError:
+            continue
+    raise UnsupportedFormatError("텍스트 인코딩을 판별할 수 없습니다 (UTF-8, UTF-16, CP949 지원).")
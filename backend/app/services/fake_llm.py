@@ -0,0 +1,388 @@
+"""
+@CODE:fake-llm-backend
+API 키 없이 쓰는 결정적인 로컬 가짜 LLM 백엔드 (부하 테스트, CI, 로컬 개발용)
+
+Related:
+- @SPEC:FEAT-002-REQ-015 - Pluggable LLM Backend
+- @CODE:llm-backend-interface
+- @CODE:ai-generator-service
+- @TEST:fake-llm-unit
+
+응답 본문은 요청 내용(응답 캐시 키)과 시드로, 지연 시간과 오류는 여기에 같은 요청을 받은 횟수를
+더해 난수를 정하므로 같은 순서로 보낸 요청에는 항상 같은 결과를 돌려주고, 같은 요청을 다시
+보내면(재시도) 본문은 같고 지연/오류만 새로 정해집니다. 요청별 횟수는 최근 요청
+max_tracked 개만 기억합니다 (오래전 요청을 다시 보내면 처음 받은 요청으로 취급).
+
+- 지연 시간: 첫 토큰까지 지연 분포 (fixed / uniform / lognormal)
+- 스트리밍: 단어 단위 조각을 초당 출력 토큰 수에 맞춰 내보냄, 마지막 조각에 usage 포함
+- 오류 주입: error_rate 비율로 첫 응답 전에 HTTP 오류(OpenAI SDK 예외), disconnect_rate 비율로
+  스트림 중간에 연결 끊김(APIConnectionError)
+- 응답: 섹션별 시스템 프롬프트로 한국어 사업계획서 예시 본문을 고르고(재무 계획은 합계가 맞는
+  마크다운 표 포함, JSON 모드 요청은 표 JSON), 제목은 프롬프트의 사업 정보에서 가져옴
+"""
+
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    BadRequestError,
+    ConflictError,
+    InternalServerError,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion import Choice as CompletionChoice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.completion_usage import CompletionUsage
+from app.services.ai_generator import (
+    SECTION_CONFIGS,
+    SECTION_MARKET_ANALYSIS,
+    SECTION_COMPETITIVE_ANALYSIS,
+    SECTION_FINANCIAL_PLAN,
+)
+from app.services.llm_backend import LLMBackend, BACKEND_FAKE
+from app.services.response_cache import ResponseCache
+from app.utils.tokens import EstimateTokenizer, Tokenizer
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import asyncio
+import httpx
+import json
+import math
+import random
+import re
+import time
+
+# 지연 분포 종류와 인자 수 (ms): fixed:값, uniform:최소:최대, lognormal:중앙값:sigma
+LATENCY_KINDS = {"fixed": 1, "uniform": 2, "lognormal": 2}
+
+# 오류 주입 시 상태 코드별 SDK 예외 (그 밖의 5xx 는 InternalServerError)
+STATUS_ERRORS = {400: BadRequestError, 409: ConflictError, 429: RateLimitError}
+
+FAKE_API_URL = "http://fake-llm.local/v1/chat/completions"
+
+# 받은 횟수를 기억하는 요청 수 기본값 (최근 사용 순서로 제한)
+MAX_TRACKED_REQUESTS = 10000
+
+_TITLE_LINE = re.compile(r"^- 제목:\s*(.+)$", re.MULTILINE)
+_WORDS = re.compile(r"\S+\s*|\s+")
+
+# 재무 계획 예시 표: (제목, 행 이름 목록)
+FINANCIAL_TABLES = (
+    ("매출 계획", ("플랫폼 이용료", "부가 서비스", "데이터 분석")),
+    ("비용 구조", ("인건비", "서버 및 인프라", "마케팅")),
+)
+YEARS = ("1차년도", "2차년도", "3차년도")
+
+
+class LatencyDistribution:
+    """
+    @CODE:fake-llm-backend-latency
+    첫 토큰까지 지연 시간 분포 (ms 단위 설정, sample 은 초 단위)
+    """
+
+    def __init__(self, kind: str = "fixed", *params: float):
+        if kind not in LATENCY_KINDS or len(params) != LATENCY_KINDS[kind]:
+            raise ValueError(f"지원되지 않는 지연 분포: {kind}:{':'.join(str(p) for p in params)}")
+        if any(param < 0 for param in params):
+            raise ValueError("지연 분포 인자는 0 이상이어야 합니다.")
+        self.kind = kind
+        self.params = tuple(float(param) for param in params)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """"lognormal:400:0.5" 형식의 설정값"""
+        kind, *params = spec.strip().split(":")
+        try:
+            return cls(kind, *(float(param) for param in params))
+        except ValueError:
+            raise ValueError(f"지연 분포 형식이 잘못되었습니다: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            ms = self.params[0]
+        elif self.kind == "uniform":
+            ms = rng.uniform(*self.params)
+        else:
+            median, sigma = self.params
+            ms = rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        return ms / 1000
+
+    def __str__(self) -> str:
+        return ":".join([self.kind, *(f"{param:g}" for param in self.params)])
+
+
+class FakeChunkStream:
+    """ChatCompletionChunk 비동기 스트림 (AsyncStream 처럼 close() 로 중단)"""
+
+    def __init__(self, chunks: AsyncIterator[ChatCompletionChunk]):
+        self._chunks = chunks
+
+    def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        return self._chunks
+
+    async def close(self):
+        await self._chunks.aclose()
+
+
+class FakeLLMBackend(LLMBackend):
+    """
+    @CODE:fake-llm-backend-backend
+    결정적인 가짜 chat completion 백엔드
+
+    Implements: @SPEC:FEAT-002-REQ-015
+    """
+
+    name = BACKEND_FAKE
+
+    def __init__(
+        self,
+        latency: Union[str, LatencyDistribution] = "lognormal:400:0.5",
+        tokens_per_second: float = 40.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        disconnect_rate: float = 0.0,
+        seed: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+        max_tracked: int = MAX_TRACKED_REQUESTS
+    ):
+        """
+        Args:
+            latency: 첫 토큰까지 지연 분포 (LatencyDistribution 또는 "lognormal:400:0.5" 형식)
+            tokens_per_second: 스트리밍 출력 속도 (0 이하면 지연 없이 한 번에)
+            error_rate: 첫 응답 전에 HTTP 오류를 내는 비율 (0~1)
+            error_status: 주입하는 HTTP 오류 코드
+            disconnect_rate: 스트림 중간에 연결이 끊기는 비율 (0~1)
+            seed: 난수 시드
+            tokenizer: 입력/출력 토큰 수 계산기 (기본값: 추정 토크나이저)
+            sleep: 대기 함수 (테스트에서 시간 없이 실행할 때 교체)
+            max_tracked: 받은 횟수를 기억하는 요청 수 (넘으면 가장 오래 쓰지 않은 요청부터 잊음)
+        """
+        self.latency = latency if isinstance(latency, LatencyDistribution) else LatencyDistribution.parse(latency)
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.disconnect_rate = disconnect_rate
+        self.seed = seed
+        self.tokenizer = tokenizer or EstimateTokenizer()
+        self.sleep = sleep
+        self.max_tracked = max(1, max_tracked)
+        self._seen: "OrderedDict[str, int]" = OrderedDict()
+        self._stats = {
+            "requests": 0,
+            "streams": 0,
+            "errors": 0,
+            "disconnects": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
+
+    async def create(self, request: Dict[str, Any], tokens: int = 0, stream: bool = False, **options: Any):
+        key = ResponseCache.key(request)
+        attempt = self._seen.pop(key, 0)
+        self._seen[key] = attempt + 1
+        if len(self._seen) > self.max_tracked:
+            self._seen.popitem(last=False)
+        rng = random.Random(f"{self.seed}:{key}:{attempt}")
+        self._stats["requests"] += 1
+        self._stats["streams"] += bool(stream)
+
+        delay = self.latency.sample(rng)
+        fail = rng.random() < self.error_rate
+        disconnect = rng.random() < self.disconnect_rate
+        content = self._reply(request, random.Random(f"{self.seed}:{key}"))
+
+        await self.sleep(delay)
+        if fail:
+            self._stats["errors"] += 1
+            raise self._status_error(self.error_status)
+
+        finish_reason = "stop"
+        max_tokens = request.get("max_tokens")
+        if max_tokens and self.tokenizer.count(content) > max_tokens:
+            content = self.tokenizer.truncate(content, max_tokens)
+            finish_reason = "length"
+        prompt_tokens = sum(self.tokenizer.count(m.get("content") or "") for m in request["messages"])
+        completion_tokens = self.tokenizer.count(content)
+        usage = CompletionUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens
+        )
+        self._stats["prompt_tokens"] += usage.prompt_tokens
+
+        if not stream:
+            self._stats["completion_tokens"] += usage.completion_tokens
+            return ChatCompletion(
+                id=f"fake-{self._stats['requests']}",
+                object="chat.completion",
+                created=int(time.time()),
+                model=request["model"],
+                choices=[CompletionChoice(
+                    index=0,
+                    message=ChatCompletionMessage(role="assistant", content=content),
+                    finish_reason=finish_reason,
+                    logprobs=None
+                )],
+                usage=usage
+            )
+
+        pieces = _WORDS.findall(content)
+        disconnect_at = rng.randrange(len(pieces)) if disconnect and pieces else None
+        return FakeChunkStream(self._chunks(request["model"], pieces, finish_reason, usage, disconnect_at))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "latency": str(self.latency),
+            "tokens_per_second": self.tokens_per_second,
+            "error_rate": self.error_rate,
+            "disconnect_rate": self.disconnect_rate
+        }
+
+    async def _chunks(
+        self,
+        model: str,
+        pieces: Sequence[str],
+        finish_reason: str,
+        usage: CompletionUsage,
+        disconnect_at: Optional[int]
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        chunk_id = f"fake-{self._stats['requests']}"
+        created = int(time.time())
+
+        def chunk(content: Optional[str], finish: Optional[str] = None, **extra: Any) -> ChatCompletionChunk:
+            choices = [] if extra else [ChunkChoice(index=0, delta=ChoiceDelta(content=content), finish_reason=finish)]
+            return ChatCompletionChunk(
+                id=chunk_id, object="chat.completion.chunk", created=created, model=model, choices=choices, **extra
+            )
+
+        for index, piece in enumerate(pieces):
+            if index == disconnect_at:
+                self._stats["disconnects"] += 1
+                raise APIConnectionError(request=httpx.Request("POST", FAKE_API_URL))
+            if self.tokens_per_second > 0:
+                await self.sleep(self.tokenizer.count(piece) / self.tokens_per_second)
+            self._stats["completion_tokens"] += self.tokenizer.count(piece)
+            yield chunk(piece)
+        yield chunk(None, finish_reason)
+        yield chunk(None, usage=usage)
+
+    @staticmethod
+    def _status_error(status: int) -> APIStatusError:
+        error_class = STATUS_ERRORS.get(status, InternalServerError if status >= 500 else APIStatusError)
+        headers = {"retry-after": "1"} if status == 429 else {}
+        response = httpx.Response(status, headers=headers, request=httpx.Request("POST", FAKE_API_URL))
+        return error_class(f"Error code: {status} - 가짜 LLM 오류 주입", response=response, body=None)
+
+    def _reply(self, request: Dict[str, Any], rng: random.Random) -> str:
+        """요청 종류(섹션 시스템 프롬프트, JSON 모드)에 맞는 예시 응답"""
+        messages = request["messages"]
+        prompt = "\n".join(m.get("content") or "" for m in messages if m.get("role") == "user")
+        match = _TITLE_LINE.search(prompt)
+        title = match.group(1).strip() if match and match.group(1).strip() != "N/A" else "신규 사업"
+
+        if request.get("response_format", {}).get("type") == "json_object":
+            return json.dumps({"tables": [
+                {"title": name, "unit": "단위: 백만원", "headers": ["구분", *YEARS], "rows": rows}
+                for name, rows in _financial_tables(rng)
+            ]}, ensure_ascii=False)
+
+        system = messages[0].get("content") if messages and messages[0].get("role") == "system" else None
+        section = next((name for name, config in SECTION_CONFIGS.items() if config["system"] == system), None)
+        if section == SECTION_MARKET_ANALYSIS:
+            return _market_analysis(title, rng)
+        if section == SECTION_COMPETITIVE_ANALYSIS:
+            return _competitive_analysis(title, rng)
+        if section == SECTION_FINANCIAL_PLAN:
+            return _financial_plan(title, rng)
+        return f"{title} 관련 요청에 대한 예시 응답입니다. 실제 모델 대신 로컬 가짜 백엔드가 생성했습니다."
+
+
+def _market_analysis(title: str, rng: random.Random) -> str:
+    size = rng.randrange(3000, 30000, 500)
+    growth = rng.randint(6, 25)
+    share = rng.randint(10, 40)
+    return f"""## {title} 시장 분석
+
+### 1. 시장 규모 및 성장률
+국내 {title} 관련 시장 규모는 2024년 기준 약 {size:,}억원으로 추정되며, 최근 3년간 연평균 {growth}% 성장했습니다. 향후 5년간에도 디지털 전환 수요에 힘입어 두 자릿수 성장이 예상됩니다.
+
+### 2. 주요 트렌드
+- 데이터 기반 의사결정과 자동화 도입 확대
+- 구독형 과금 모델로의 전환
+- 중소기업 대상 간편 도입형 서비스 수요 증가
+
+### 3. 타겟 고객 분석
+주요 고객은 연 매출 10억~300억원 규모의 중소기업으로, 전체 수요의 약 {share}%를 차지합니다. 도입 비용과 운영 인력 부족이 가장 큰 고민이며, 빠른 도입과 명확한 비용 절감 효과를 중시합니다.
+
+### 4. 시장 진입 기회
+기존 대형 솔루션은 가격과 도입 기간 부담이 커서 중소기업 시장이 충분히 공략되지 않았습니다. 간편 도입과 성과 기반 과금으로 초기 고객을 확보한 뒤 산업별 특화 기능으로 확장할 수 있습니다.
+"""
+
+
+def _competitive_analysis(title: str, rng: random.Random) -> str:
+    shares = sorted((rng.randint(8, 30) for _ in range(3)), reverse=True)
+    competitors = "\n".join(
+        f"- **{name}**: 시장 점유율 약 {share}%, {strength}"
+        for name, share, strength in zip(
+            ("A사", "B사", "C사"),
+            shares,
+            ("대기업 고객 기반이 탄탄하나 도입 비용이 높음", "가격 경쟁력이 있으나 기능 확장성이 낮음", "특정 산업에 특화되어 범용성이 부족함")
+        )
+    )
+    return f"""## {title} 경쟁사 분석 및 차별화 전략
+
+### 1. 주요 경쟁사 분석
+{competitors}
+
+### 2. 경쟁사 대비 강점/약점
+- 강점: 2주 이내 도입, 중소기업 맞춤 요금제, 현장 데이터 연동
+- 약점: 브랜드 인지도와 레퍼런스 고객 수가 아직 적음
+
+### 3. 차별화 전략
+성과 기반 과금으로 도입 부담을 낮추고, 산업별 템플릿을 제공하여 설정 시간을 줄입니다. 파트너사와의 연동으로 고객 데이터 입력 부담을 최소화합니다.
+
+### 4. 경쟁 우위 요소
+축적된 현장 데이터를 기반으로 한 예측 정확도와 빠른 고객 지원이 핵심 경쟁 우위입니다.
+"""
+
+
+def _financial_tables(rng: random.Random) -> List[Tuple[str, List[List[Any]]]]:
+    """합계 행이 맞는 재무 표 (제목, 행 목록), 금액 단위 백만원"""
+    tables = []
+    for name, labels in FINANCIAL_TABLES:
+        rows = []
+        for label in labels:
+            base = rng.randrange(50, 500, 10)
+            growth = 1 + rng.randint(30, 120) / 100
+            rows.append([label, *(round(base * growth ** year) for year in range(len(YEARS)))])
+        rows.append(["합계", *(sum(row[column] for row in rows) for column in range(1, len(YEARS) + 1))])
+        tables.append((name, rows))
+    return tables
+
+
+def _financial_plan(title: str, rng: random.Random) -> str:
+    tables = _financial_tables(rng)
+    blocks = []
+    for name, rows in tables:
+        lines = [f"**{name}** (단위: 백만원)", "", "| 구분 | " + " | ".join(YEARS) + " |", "|---|---|---|---|"]
+        lines += ["| " + " | ".join(f"{cell:,}" if isinstance(cell, int) else cell for cell in row) + " |" for row in rows]
+        blocks.append("\n".join(lines))
+    revenue, cost = tables[0][1][-1][1:], tables[1][1][-1][1:]
+    profit = ", ".join(f"{year} {r - c:,}백만원" for year, r, c in zip(YEARS, revenue, cost))
+    return f"""## {title} 3개년 재무 계획
+
+### 1. 매출 계획
+{blocks[0]}
+
+### 2. 비용 구조
+{blocks[1]}
+
+### 3. 손익 예측
+영업이익은 {profit}으로 예상되며, 2차년도부터 고정비 비중이 낮아지면서 이익률이 개선됩니다.
+
+### 4. 자금 조달 계획
+초기 운영 자금은 정부 지원 사업과 시드 투자로 조달하고, 2차년도에 시리즈 A 투자를 유치하여 영업과 인프라를 확충합니다.
+"""
@@ -0,0 +1,448 @@
+"""
+@CODE:financial-table-extractor
+생성된 재무 계획 텍스트에서 표를 찾아 열 단위 숫자 데이터로 변환
+
+Related:
+- @SPEC:FEAT-002-REQ-009 - Financial Table Extraction
+- @CODE:ai-generator-service
+- @CODE:docx-table-builder-service
+- @TEST:financial-tables-unit
+
+마크다운/파이프 표와 ```json 블록(또는 JSON 모드 응답 전체)을 지원합니다.
+본문은 줄 단위로 한 번만 훑고, 셀 파싱 정규식은 역추적이 없는 단순 패턴만 사용하므로
+출력 길이에 선형으로 동작합니다.
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# 열 종류
+KIND_TEXT = "text"
+KIND_NUMBER = "number"
+KIND_KRW = "krw"
+KIND_PERCENT = "percent"
+
+# 금액 단위 (원 기준 배수)
+KRW_UNITS = {
+    "조": 10 ** 12,
+    "억": 10 ** 8,
+    "천만": 10 ** 7,
+    "백만": 10 ** 6,
+    "만": 10 ** 4,
+    "천": 10 ** 3,
+}
+
+# 합계 검증 허용 오차 (모델이 각 셀을 반올림하므로 상대 오차 0.5% 까지 허용)
+TOTAL_TOLERANCE = 0.005
+
+# 표 제목으로 보는 표 앞 문단의 최대 길이
+TITLE_MAX_CHARS = 80
+
+_SEPARATOR_CELL = re.compile(r":?-{3,}:?")
+_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+_MARKUP = re.compile(r"[*_`]+")
+_HEADING_MARKUP = re.compile(r"^[#>\s]+")
+_AMOUNT_TOKEN = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(조|억|천만|백만|만|천)?")
+_CURRENCY_REST = re.compile(r"^(?:₩|KRW|원|\s)*$", re.IGNORECASE)
+_PERCENT = re.compile(r"^([+-]?\d[\d,]*(?:\.\d+)?)\s*%$")
+_PLAIN_NUMBER = re.compile(r"^[+-]?\d[\d,]*(?:\.\d+)?$")
+_UNIT_NOTE = re.compile(r"단위\s*[:：]?\s*(조|억|천만|백만|만|천)?\s*원")
+_HEADER_UNIT = re.compile(r"[(（\[]\s*(조|억|천만|백만|만|천)?\s*원\s*[)）\]]")
+_HEADER_PERCENT = re.compile(r"[(（\[]\s*%\s*[)）\]]")
+_TOTAL_LABEL = re.compile(r"^(합계|총합계|총계|총합|계|total|sum|grandtotal)$", re.IGNORECASE)
+_SUBTOTAL_LABEL = re.compile(r"^(소계|subtotal)$", re.IGNORECASE)
+_PARENTHESIS = re.compile(r"[(（\[][^)）\]]*[)）\]]")
+_SPACES = re.compile(r"\s+")
+_FENCE = re.compile(r"^\s*```\s*(\w*)\s*$")
+
+
+def parse_amount(text: str, unit: int = 1) -> Tuple[Any, str]:
+    """
+    셀 문자열을 숫자로 변환
+
+    - "1,234" → 1234 (unit 배수 적용, 단위가 있으면 원)
+    - "5억", "3,000만원", "1조 2,000억", "₩1,500,000" → 원 단위 정수
+    - "15%", "12.5 %" → 0.15, 0.125
+    - "(1,000)", "△1,000", "-1,000" → 음수
+    - "", "-", "N/A" → None
+
+    Args:
+        text: 셀 문자열
+        unit: 표/열에 지정된 금액 단위 배수 (예: "단위: 백만원" 이면 10**6, 없으면 1)
+
+    Returns:
+        (값, 종류) - 종류는 KIND_NUMBER / KIND_KRW / KIND_PERCENT / KIND_TEXT (빈 셀은 (None, KIND_TEXT))
+    """
+    text = _MARKUP.sub("", text).strip()
+    if text in ("", "-", "–", "—", "N/A", "n/a", "해당 없음", "해당없음"):
+        return None, KIND_TEXT
+
+    negative = False
+    if text.startswith("(") and text.endswith(")"):
+        negative, text = True, text[1:-1].strip()
+    if text[:1] in ("-", "−", "△", "▽"):
+        negative, text = True, text[1:].strip()
+    elif text[:1] == "+":
+        text = text[1:].strip()
+
+    percent = _PERCENT.match(text)
+    if percent:
+        value = _decimal(percent.group(1))
+        if value is None:
+            return text, KIND_TEXT
+        return _number(-value / 100 if negative else value / 100, as_int=False), KIND_PERCENT
+
+    if _PLAIN_NUMBER.match(text):
+        value = _decimal(text)
+        if value is None:
+            return text, KIND_TEXT
+        value *= unit
+        return _number(-value if negative else value), KIND_KRW if unit > 1 else KIND_NUMBER
+
+    # 한글 단위/통화 기호가 붙은 금액: 숫자+단위 토큰을 더하고, 남은 글자가 통화 표시뿐이어야 함
+    tokens = list(_AMOUNT_TOKEN.finditer(text))
+    if not tokens or not _CURRENCY_REST.match(_AMOUNT_TOKEN.sub("", text)):
+        return text, KIND_TEXT
+    if any(token.group(2) is None for token in tokens[:-1]):
+        # "1,000 2,000" 처럼 단위 없이 이어진 숫자는 금액이 아님
+        return text, KIND_TEXT
+    total = Decimal(0)
+    for token in tokens:
+        value = _decimal(token.group(1))
+        if value is None:
+            return text, KIND_TEXT
+        total += value * KRW_UNITS.get(token.group(2), unit if len(tokens) == 1 else 1)
+    return _number(-total if negative else total), KIND_KRW
+
+
+def extract_financial_tables(content: str) -> List[Dict[str, Any]]:
+    """
+    @CODE:financial-table-extractor-extract
+    재무 계획 텍스트에서 표 추출
+
+    ```json 블록(또는 본문 전체가 JSON)이 있으면 그 표를 사용하고, 아니면 마크다운/파이프 표를
+    찾습니다. 각 표는 DocxTableBuilder.columns_from_table 이 그대로 받을 수 있는 형식입니다.
+
+    Returns:
+        [{"title", "unit", "headers", "columns", "kinds", "formats",
+          "rows": [{"cells": [{"value"}]}], "validation", "source"}]
+    """
+    if not content:
+        return []
+
+    stripped = content.strip()
+    if stripped.startswith("{") or stripped.startswith("["):
+        tables = tables_from_json(stripped)
+        if tables:
+            return tables
+
+    tables: List[Dict[str, Any]] = []
+    json_tables: List[Dict[str, Any]] = []
+    for kind, title, payload in _scan(content):
+        if kind == "json":
+            json_tables.extend(tables_from_json(payload))
+        else:
+            table = _table_from_markdown(title, payload)
+            if table is not None:
+                tables.append(table)
+    return json_tables or tables
+
+
+def tables_from_json(data: Any) -> List[Dict[str, Any]]:
+    """
+    JSON 표 데이터 변환 (JSON 모드 응답 또는 ```json 블록)
+
+    {"tables": [{"title", "unit", "headers", "rows": [[셀, ...], ...]}]} 또는 표 목록을 받습니다.
+    셀은 숫자 또는 문자열(parse_amount 로 변환) 모두 가능합니다.
+    """
+    if isinstance(data, (str, bytes)):
+        try:
+            data = json.loads(data)
+        except ValueError as e:
+            logger.warning(f"재무 표 JSON 파싱 실패: {str(e)}")
+            return []
+    if isinstance(data, dict):
+        data = data.get("tables", [data] if "headers" in data else [])
+    if not isinstance(data, list):
+        return []
+
+    tables = []
+    for item in data:
+        if not isinstance(item, dict) or not item.get("headers"):
+            continue
+        rows = []
+        for row in item.get("rows") or []:
+            if isinstance(row, dict):
+                row = [cell.get("value") if isinstance(cell, dict) else cell for cell in row.get("cells", [])]
+            if isinstance(row, list):
+                rows.append(row)
+        title = item.get("title")
+        unit_note = " ".join(str(part) for part in (title, item.get("unit")) if part)
+        table = _build_table(title, [str(header) for header in item["headers"]], rows, unit_note, "json")
+        if table is not None:
+            tables.append(table)
+    return tables
+
+
+def validate_totals(headers: Sequence[str], columns: Sequence[Sequence[Any]], kinds: Sequence[str]) -> Dict[str, Any]:
+    """
+    합계 행/열 검증
+
+    - 합계 행 (첫 열이 "합계", "총계", "계", "Total" 등): 숫자 열마다 위 데이터 행의 합과 비교
+    - 소계 행 ("소계"): 직전 소계 이후 데이터 행의 합과 비교
+    - 합계 열 (헤더가 합계 이름): 행마다 같은 종류의 다른 숫자 열 합과 비교
+
+    행 합계는 숫자 열 전체를 한 벡터로 누적하여 한 번의 행 순회로 계산합니다.
+    비율(%) 열은 더하지 않습니다.
+
+    Returns:
+        {"valid": True/False (검증할 합계가 없으면 None), "mismatches": [...]}
+    """
+    summable = [col for col, kind in enumerate(kinds) if kind in (KIND_NUMBER, KIND_KRW)]
+    labels = [_label(value) for value in columns[0]] if columns else []
+    mismatches: List[Dict[str, Any]] = []
+    checked = False
+
+    if summable and labels:
+        group = [0] * len(summable)
+        grand = [0] * len(summable)
+        for row, label in enumerate(labels):
+            values = [_or_zero(columns[col][row]) for col in summable]
+            if _SUBTOTAL_LABEL.match(label):
+                expected, group = group, [0] * len(summable)
+            elif _TOTAL_LABEL.match(label):
+                expected = grand
+            else:
+                group = [a + b for a, b in zip(group, values)]
+                grand = [a + b for a, b in zip(grand, values)]
+                continue
+            checked = True
+            for col, actual, total in zip(summable, (columns[col][row] for col in summable), expected):
+                if actual is not None and not _close(total, actual):
+                    mismatches.append({"type": "row_total", "row": row, "column": headers[col],
+                                       "expected": total, "actual": actual})
+
+    total_columns = [col for col in summable if _TOTAL_LABEL.match(_label(headers[col]))]
+    for total_col in total_columns:
+        parts = [col for col in summable if col != total_col and kinds[col] == kinds[total_col]
+                 and col not in total_columns]
+        if not parts:
+            continue
+        checked = True
+        sums = [sum(values) for values in zip(*([_or_zero(v) for v in columns[col]] for col in parts))]
+        for row, (total, actual) in enumerate(zip(sums, columns[total_col])):
+            if actual is not None and not _close(total, actual):
+                mismatches.append({"type": "column_total", "row": row, "column": headers[total_col],
+                                   "expected": total, "actual": actual})
+
+    return {"valid": (not mismatches) if checked else None, "mismatches": mismatches}
+
+
+def _scan(content: str) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """
+    본문을 한 번 훑으며 ("json", None, 텍스트) 또는 ("table", 제목, 행 목록) 을 순서대로 반환
+
+    표 제목은 표 바로 앞의 짧은 문단(마크다운 제목 기호 제거)입니다.
+    """
+    block: List[List[str]] = []
+    fence: Optional[List[str]] = None
+    fence_lang = ""
+    last_text: Optional[str] = None
+    title: Optional[str] = None
+
+    for line in content.splitlines():
+        fence_match = _FENCE.match(line)
+        if fence is not None:
+            if fence_match and not fence_match.group(1):
+                if fence_lang == "json":
+                    yield "json", None, "\n".join(fence)
+                fence = None
+            elif fence_lang == "json":
+                fence.append(line)
+            else:
+                # 코드 블록 안의 마크다운 표도 표로 취급
+                cells = _split_row(line)
+                if cells is not None:
+                    if not block:
+                        title = last_text
+                    block.append(cells)
+                elif block:
+                    yield "table", title, block
+                    block = []
+            continue
+        if fence_match:
+            if block:
+                yield "table", title, block
+                block = []
+            fence, fence_lang = [], fence_match.group(1).lower()
+            continue
+
+        cells = _split_row(line)
+        if cells is not None:
+            if not block:
+                title = last_text
+            block.append(cells)
+            continue
+        if block:
+            yield "table", title, block
+            block = []
+            last_text = None
+        text = _HEADING_MARKUP.sub("", _MARKUP.sub("", line)).strip()
+        if text:
+            last_text = text if len(text) <= TITLE_MAX_CHARS else None
+
+    if fence is not None and fence_lang == "json":
+        yield "json", None, "\n".join(fence)
+    if block:
+        yield "table", title, block
+
+
+def _split_row(line: str) -> Optional[List[str]]:
+    """파이프 표의 한 줄을 셀 목록으로 분리 (표 줄이 아니면 None)"""
+    stripped = line.strip()
+    if "|" not in stripped:
+        return None
+    if stripped.startswith("|"):
+        stripped = stripped[1:]
+    if stripped.endswith("|") and not stripped.endswith("\\|"):
+        stripped = stripped[:-1]
+    cells = [cell.strip().replace("\\|", "|") for cell in _CELL_SPLIT.split(stripped)]
+    if len(cells) < 2:
+        return None
+    return cells
+
+
+def _table_from_markdown(title: Optional[str], lines: List[List[str]]) -> Optional[Dict[str, Any]]:
+    """마크다운/파이프 표 행 목록을 표 데이터로 변환 (구분선 행은 생략)"""
+    rows = [cells for cells in lines if not _is_separator(cells)]
+    if len(rows) < 2:
+        return None
+    headers = [_MARKUP.sub("", cell).strip() for cell in rows[0]]
+    return _build_table(title, headers, rows[1:], title or "", "markdown")
+
+
+def _is_separator(cells: List[str]) -> bool:
+    """헤더 구분선 행 (|---|:---:|) 여부"""
+    filled = [cell for cell in cells if cell]
+    return bool(filled) and all(_SEPARATOR_CELL.fullmatch(cell) for cell in filled)
+
+
+def _build_table(
+    title: Optional[str],
+    headers: List[str],
+    rows: List[List[Any]],
+    unit_note: str,
+    source: str
+) -> Optional[Dict[str, Any]]:
+    """행 목록을 열 단위 숫자 데이터로 변환하고 합계 검증"""
+    if not headers or not rows:
+        return None
+    note_unit = _UNIT_NOTE.search(unit_note or "")
+    table_unit = KRW_UNITS.get(note_unit.group(1), 1) if note_unit else 1
+
+    columns: List[List[Any]] = []
+    kinds: List[str] = []
+    formats: Dict[int, str] = {}
+    texts: List[List[str]] = [[] for _ in rows]
+    for col, header in enumerate(headers):
+        header_unit = _HEADER_UNIT.search(header) or _UNIT_NOTE.search(header)
+        percent_column = bool(_HEADER_PERCENT.search(header))
+        if percent_column:
+            unit, krw_column = 1, False
+        else:
+            unit = KRW_UNITS.get(header_unit.group(1), 1) if header_unit else table_unit
+            krw_column = bool(header_unit or note_unit)
+
+        parsed: List[Any] = []
+        cell_kinds: List[str] = []
+        for row_idx, row in enumerate(rows):
+            cell = row[col] if col < len(row) else None
+            if cell is None or isinstance(cell, bool):
+                text = "" if cell is None else str(cell)
+                value, kind = (None, KIND_TEXT) if cell is None else (text, KIND_TEXT)
+            elif isinstance(cell, (int, float)):
+                text = str(cell)
+                value, kind = _number(Decimal(str(cell)) * unit), KIND_KRW if krw_column else KIND_NUMBER
+            else:
+                text = _MARKUP.sub("", str(cell)).strip()
+                value, kind = parse_amount(text, unit)
+            if percent_column and kind == KIND_NUMBER:
+                # "성장률(%)" 열의 숫자는 백분율
+                value, kind = _number(Decimal(str(value)) / 100, as_int=False), KIND_PERCENT
+            if kind == KIND_NUMBER and krw_column:
+                kind = KIND_KRW
+            texts[row_idx].append(text)
+            parsed.append(value)
+            cell_kinds.append(kind if value is not None else None)
+
+        present = set(cell_kinds) - {None}
+        if present and KIND_TEXT not in present and col > 0:
+            if present == {KIND_PERCENT}:
+                column_kind = KIND_PERCENT
+            elif KIND_KRW in present:
+                column_kind = KIND_KRW
+            else:
+                column_kind = KIND_NUMBER
+        else:
+            column_kind = KIND_TEXT
+
+        if column_kind == KIND_TEXT:
+            parsed = [text_row[col] for text_row in texts]
+        elif column_kind != KIND_PERCENT and KIND_PERCENT in present:
+            # 행 방향 표의 "이익률" 같은 비율 행은 금액 열 안에서 원문 그대로 유지
+            parsed = [text_row[col] if kind == KIND_PERCENT else value
+                      for value, kind, text_row in zip(parsed, cell_kinds, texts)]
+
+        if column_kind == KIND_PERCENT:
+            formats[col] = "percent"
+        elif column_kind == KIND_KRW:
+            formats[col] = "krw"
+        elif any(isinstance(value, float) for value in parsed):
+            formats[col] = "decimal"
+        columns.append(parsed)
+        kinds.append(column_kind)
+
+    return {
+        "title": title,
+        "unit": note_unit.group(0) if note_unit else None,
+        "headers": headers,
+        "columns": columns,
+        "kinds": kinds,
+        "formats": formats,
+        "rows": [{"cells": [{"value": text} for text in text_row]} for text_row in texts],
+        "validation": validate_totals(headers, columns, kinds),
+        "source": source
+    }
+
+
+def _decimal(text: str) -> Optional[Decimal]:
+    """쉼표를 뺀 숫자 문자열을 Decimal 로 변환 ("1,2,3" 같은 형식은 그대로 허용)"""
+    try:
+        return Decimal(text.replace(",", ""))
+    except InvalidOperation:
+        return None
+
+
+def _number(value: Decimal, as_int: bool = True):
+    """정수로 떨어지면 int, 아니면 float"""
+    if as_int and value == value.to_integral_value():
+        return int(value)
+    return float(value)
+
+
+def _label(value: Any) -> str:
+    """합계 행/열 판별용 이름 (공백/마크다운 제거)"""
+    return _SPACES.sub("", _PARENTHESIS.sub("", _MARKUP.sub("", str(value or ""))))
+
+
+def _or_zero(value: Any):
+    return value if isinstance(value, (int, float)) else 0
+
+
+def _close(expected: float, actual: float) -> bool:
+    return abs(expected - actual) <= max(abs(expected), abs(actual)) * TOTAL_TOLERANCE
@@ -0,0 +1,567 @@
+"""
+@CODE:generation-jobs-service
+비동기 생성 작업 큐 (작업 ID 발급, 제한된 asyncio 워커, SQLite 결과 저장, 롱 폴링)
+
+Related:
+- @SPEC:FEAT-002-REQ-011 - Generation Job Queue
+- @CODE:ai-generator-service
+- @TEST:generation-jobs-unit
+
+요청 연결이 GPT 호출 내내 열려 있지 않도록 생성 요청을 작업으로 등록하고 작업 ID 를
+바로 반환합니다. 작업은 우선순위(큰 값 먼저) → 등록 순서로 실행되며, 같은 요청이 이미
+대기/실행 중이면 새 작업을 만들지 않고 기존 작업 ID 를 돌려줍니다. 상태와 결과는 SQLite 에
+저장하므로 클라이언트 연결이 끊겨도 작업 ID 로 다시 조회할 수 있고, 프로세스가 재시작되면
+끝나지 않은 작업을 다시 대기열에 넣어 이어서 실행합니다.
+
+여러 워커 프로세스가 같은 SQLite 파일을 쓸 때는 작업을 실행하는 큐가 소유자(owner)와 임대
+만료 시각(lease_until)을 기록하고 실행하는 동안 주기적으로 임대를 연장합니다. 다시 대기열에
+넣는 작업은 자기 작업과 임대가 끝난(멈춘 프로세스의) 작업뿐이므로 다른 프로세스가 실행 중인
+작업을 두 번 실행하지 않습니다.
+
+저장소 호출은 큐마다 하나인 저장소 스레드에서 차례로 실행하므로, 다른 프로세스가 쓰기 잠금을
+잡고 있어 SQLite 가 기다리는 동안에도 이벤트 루프는 멈추지 않습니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+ACTIVE_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)
+TERMINAL_STATUSES = (JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED, JOB_STATUS_CANCELLED)
+
+# 롱 폴링 중 저장소를 다시 확인하는 간격 (다른 워커 프로세스가 실행한 작업)
+WAIT_POLL_INTERVAL = 1.0
+
+# 실행 중인 작업의 임대를 연장하는 간격 (임대 시간 대비 비율)
+LEASE_RENEW_FRACTION = 1 / 3
+
+# 응답에 넣지 않는 작업 항목
+PRIVATE_JOB_FIELDS = ("payload", "dedup_key", "owner", "lease_until")
+
+# runner(작업 종류, 요청 내용) -> 결과 (JSON 으로 저장 가능한 dict)
+JobRunner = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class JobQueueFullError(RuntimeError):
+    """대기 중인 작업 수가 한도에 도달함"""
+
+
+class JobNotActiveError(RuntimeError):
+    """이미 끝난 작업을 취소하려고 함"""
+
+
+def dedup_key(kind: str, payload: Dict[str, Any]) -> str:
+    """같은 요청을 판별하는 키 (작업 종류 + 요청 내용의 SHA-256)"""
+    normalized = json.dumps({"kind": kind, "payload": payload}, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """
+    @CODE:generation-jobs-service-store
+    작업 상태/결과 SQLite 저장소
+
+    - `jobs` 테이블: id, kind, dedup_key, status, priority, payload, result, error,
+      created_at, started_at, finished_at, owner, lease_until
+    - 여러 워커 프로세스가 같은 파일을 공유할 수 있으며 (실행 중인 작업은 owner/lease_until 로
+      소유 프로세스를 구분), 연결은 첫 사용 시 생성합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def insert(self, job: Dict[str, Any]):
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO jobs (id, kind, dedup_key, status, priority, payload, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job["job_id"], job["kind"], job["dedup_key"], job["status"], job["priority"],
+                    json.dumps(job["payload"], ensure_ascii=False), job["created_at"]
+                )
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def find_active(self, key: str) -> Optional[Dict[str, Any]]:
+        """같은 요청의 대기/실행 중 작업"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT * FROM jobs WHERE dedup_key = ? AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (key, *ACTIVE_STATUSES)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def update(self, job_id: str, expected: Optional[Tuple[str, ...]] = None, **fields: Any) -> bool:
+        """
+        작업 항목 갱신 (expected 가 있으면 현재 상태가 그중 하나일 때만)
+
+        Returns:
+            갱신 여부
+        """
+        if "result" in fields and fields["result"] is not None:
+            fields["result"] = json.dumps(fields["result"], ensure_ascii=False)
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        query = f"UPDATE jobs SET {assignments} WHERE id = ?"
+        params = [*fields.values(), job_id]
+        if expected:
+            query += f" AND status IN ({','.join('?' * len(expected))})"
+            params.extend(expected)
+        with self._lock:
+            return self._connect().execute(query, params).rowcount > 0
+
+    def requeue_running(self, owner: Optional[str], now: float) -> int:
+        """
+        실행 중 작업 중 owner 의 작업과 임대가 끝난 작업(멈춘 프로세스의 작업)을 대기 상태로 되돌림
+
+        소유자가 기록되지 않은 작업(임대 도입 전 파일)도 되돌립니다. 다른 프로세스가 임대를
+        연장하고 있는 작업은 그대로 둡니다.
+        """
+        with self._lock:
+            return self._connect().execute(
+                "UPDATE jobs SET status = ?, started_at = NULL, owner = NULL, lease_until = NULL"
+                " WHERE status = ? AND (owner = ? OR owner IS NULL OR lease_until IS NULL OR lease_until < ?)",
+                (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING, owner, now)
+            ).rowcount
+
+    def renew_leases(self, owner: str, lease_until: float) -> int:
+        """owner 가 실행 중인 작업의 임대 연장"""
+        with self._lock:
+            return self._connect().execute(
+                "UPDATE jobs SET lease_until = ? WHERE owner = ? AND status = ?",
+                (lease_until, owner, JOB_STATUS_RUNNING)
+            ).rowcount
+
+    def queued(self):
+        """대기 중인 작업 (id, priority, created_at) 를 실행 순서로"""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT id, priority, created_at FROM jobs WHERE status = ? ORDER BY priority DESC, created_at",
+                (JOB_STATUS_QUEUED,)
+            ).fetchall()
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+
+    def purge(self, finished_before: float) -> int:
+        """끝난 지 오래된 작업 삭제"""
+        with self._lock:
+            return self._connect().execute(
+                f"DELETE FROM jobs WHERE finished_at < ? AND status IN ({','.join('?' * len(TERMINAL_STATUSES))})",
+                (finished_before, *TERMINAL_STATUSES)
+            ).rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "job_id": row["id"],
+            "kind": row["kind"],
+            "dedup_key": row["dedup_key"],
+            "status": row["status"],
+            "priority": row["priority"],
+            "payload": json.loads(row["payload"]),
+            "result": json.loads(row["result"]) if row["result"] is not None else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+            "owner": row["owner"],
+            "lease_until": row["lease_until"]
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결을 한 번 생성 (잠금 보유 상태에서 호출)"""
+        if self._conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " dedup_key TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " priority INTEGER NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " result TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " started_at REAL,"
+                " finished_at REAL,"
+                " owner TEXT,"
+                " lease_until REAL)"
+            )
+            # 임대 도입 전에 만든 파일에 열 추가
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_dedup ON jobs (dedup_key, status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished_at)")
+        return self._conn
+
+
+class GenerationJobQueue:
+    """
+    @CODE:generation-jobs-service-queue
+    우선순위 작업 큐와 고정 수의 asyncio 워커
+
+    Implements: @SPEC:FEAT-002-REQ-011
+
+    대기열(asyncio.PriorityQueue)과 워커 태스크는 start() 를 호출한 이벤트 루프에서 만들고
+    stop() 에서 정리합니다. 실행 중인 작업은 작업별 태스크로 실행하므로 하나만 취소할 수 있습니다.
+    작업은 대기 상태일 때만 가져오고(compare-and-set) 실행하는 동안 큐의 owner 로 임대를
+    연장하므로, 같은 저장소를 쓰는 다른 큐는 임대가 끝나기 전에는 그 작업을 되돌리지 않습니다.
+    저장소 호출은 스레드 하나에서 차례로 실행하므로 같은 프로세스의 등록(중복 확인 → 추가)은
+    서로 끼어들지 않습니다.
+    """
+
+    def __init__(
+        self,
+        runner: JobRunner,
+        store: JobStore,
+        workers: int = 2,
+        max_queued: int = 100,
+        result_ttl: float = 7 * 24 * 3600,
+        lease: float = 60.0
+    ):
+        """
+        Args:
+            runner: 작업 실행 함수
+            store: 작업 상태/결과 저장소
+            workers: 동시에 실행하는 작업 수
+            max_queued: 대기 중인 작업 수 한도 (넘으면 JobQueueFullError)
+            result_ttl: 끝난 작업 결과 보관 시간(초). 시작할 때와 임대 연장 주기마다 지난 결과를 삭제합니다.
+            lease: 실행 중인 작업의 임대 시간(초). 이 시간 동안 연장되지 않은 작업은 멈춘
+                프로세스의 작업으로 보고 다른 큐가 다시 실행합니다.
+        """
+        self.runner = runner
+        self.store = store
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self.lease = lease
+        # 저장소를 공유하는 큐 사이에서 고유한 소유자 ID
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # 저장소(SQLite) 호출 전용 스레드
+        self._store_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="generation-jobs")
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: list = []
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cancelled: Set[str] = set()
+        # 롱 폴링 중인 작업의 완료 이벤트와 기다리는 요청 수 (기다리는 요청이 없으면 제거)
+        self._done_events: Dict[str, asyncio.Event] = {}
+        self._waiters: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._stats = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "recovered": 0,
+            JOB_STATUS_SUCCEEDED: 0,
+            JOB_STATUS_FAILED: 0,
+            JOB_STATUS_CANCELLED: 0
+        }
+
+    @property
+    def started(self) -> bool:
+        return self._queue is not None
+
+    async def start(self) -> int:
+        """
+        대기열과 워커 시작, 멈춘 프로세스(임대 만료)에서 끝나지 않은 작업을 다시 대기열에 넣음
+
+        Returns:
+            다시 넣은 작업 수
+        """
+        if self.started:
+            return 0
+        self._queue = asyncio.PriorityQueue()
+        await self._call(self.store.purge, time.time() - self.result_ttl)
+        await self._call(self.store.requeue_running, self.owner, time.time())
+        recovered = await self._enqueue_stored()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._heartbeat = asyncio.create_task(self._renew_leases())
+        return recovered
+
+    async def stop(self):
+        """
+        워커 정리. 이 큐가 실행 중이던 작업은 대기 상태로 되돌려 다음 시작 때 다시 실행
+        """
+        if not self.started:
+            return
+        tasks = [*self._workers, self._heartbeat]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._call(self.store.requeue_running, self.owner, time.time())
+        self._workers = []
+        self._heartbeat = None
+        self._running.clear()
+        self._cancelled.clear()
+        self._done_events.clear()
+        self._waiters.clear()
+        self._queue = None
+
+    async def submit(self, kind: str, payload: Dict[str, Any], priority: int = 0) -> Tuple[Dict[str, Any], bool]:
+        """
+        작업 등록 (같은 요청이 대기/실행 중이면 그 작업을 반환)
+
+        기존 작업이 아직 대기 중이고 새 요청의 우선순위가 더 높으면 우선순위를 올립니다.
+
+        Returns:
+            (작업, 기존 작업 재사용 여부)
+
+        Raises:
+            RuntimeError: start() 전에 호출한 경우
+            JobQueueFullError: 대기 중인 작업 수가 한도에 도달한 경우
+        """
+        if not self.started:
+            raise RuntimeError("생성 작업 큐가 시작되지 않았습니다.")
+
+        job, deduplicated, enqueue = await self._call(self._register, kind, payload, priority)
+        if enqueue:
+            # 우선순위를 올린 기존 작업의 이전 항목은 꺼낼 때 상태를 보고 건너뜀
+            self._enqueue(job["job_id"], job["priority"])
+        self._stats["deduplicated" if deduplicated else "submitted"] += 1
+        return self._public(job), deduplicated
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태/결과 (없으면 None)"""
+        job = await self._call(self.store.get, job_id)
+        return self._public(job) if job else None
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        작업이 끝날 때까지 최대 timeout 초 기다린 뒤 상태 반환 (롱 폴링)
+
+        이 프로세스에서 실행하는 작업은 끝나는 즉시 반환하고, 다른 프로세스가 실행하는 작업은
+        WAIT_POLL_INTERVAL 마다 저장소를 다시 확인합니다. 완료 이벤트는 기다리는 요청이 있는
+        동안만 보관합니다.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job["status"] in TERMINAL_STATUSES or remaining <= 0:
+                return job
+            event = self._done_events.setdefault(job_id, asyncio.Event())
+            self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+            try:
+                await asyncio.wait_for(event.wait(), min(remaining, WAIT_POLL_INTERVAL))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                waiters = self._waiters.pop(job_id, 1) - 1
+                if waiters > 0:
+                    self._waiters[job_id] = waiters
+                elif self._done_events.get(job_id) is event:
+                    del self._done_events[job_id]
+
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 취소 (대기 중이면 실행하지 않고, 실행 중이면 작업 태스크를 취소)
+
+        Returns:
+            취소된 작업 (없으면 None)
+
+        Raises:
+            JobNotActiveError: 이미 끝난 작업
+        """
+        job = await self._call(self.store.get, job_id)
+        if job is None:
+            return None
+        if job["status"] in TERMINAL_STATUSES:
+            raise JobNotActiveError(f"이미 끝난 작업입니다: {job['status']}")
+
+        task = self._running.get(job_id)
+        if task is not None:
+            # 워커가 취소를 받아 상태를 기록
+            self._cancelled.add(job_id)
+            task.cancel()
+        await self._finish(job_id, JOB_STATUS_CANCELLED, expected=ACTIVE_STATUSES)
+        return await self.get(job_id)
+
+    async def stats(self) -> Dict[str, Any]:
+        """작업 수 (상태별 누적, 현재 대기/실행 중)"""
+        return {
+            **self._stats,
+            "workers": self.workers,
+            "queued": await self._call(self.store.count, JOB_STATUS_QUEUED),
+            "running": len(self._running),
+            "waiting": len(self._done_events),
+            "started": self.started
+        }
+
+    def _enqueue(self, job_id: str, priority: int):
+        self._queue.put_nowait((-priority, next(self._sequence), job_id))
+
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """저장소 호출을 저장소 스레드에서 실행 (SQLite 잠금 대기가 이벤트 루프를 멈추지 않도록)"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._store_thread, functools.partial(method, *args, **kwargs)
+        )
+
+    def _register(self, kind: str, payload: Dict[str, Any], priority: int) -> Tuple[Dict[str, Any], bool, bool]:
+        """
+        submit() 의 저장소 작업 (저장소 스레드에서 실행)
+
+        Returns:
+            (작업, 기존 작업 재사용 여부, 대기열에 넣을지 여부)
+        """
+        key = dedup_key(kind, payload)
+        existing = self.store.find_active(key)
+        if existing is not None:
+            bumped = priority > existing["priority"] and self.store.update(
+                existing["job_id"], expected=(JOB_STATUS_QUEUED,), priority=priority
+            )
+            if bumped:
+                existing["priority"] = priority
+            return existing, True, bumped
+
+        if self.store.count(JOB_STATUS_QUEUED) >= self.max_queued:
+            raise JobQueueFullError(f"대기 중인 생성 작업이 너무 많습니다 (최대 {self.max_queued}개).")
+
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "dedup_key": key,
+            "status": JOB_STATUS_QUEUED,
+            "priority": priority,
+            "payload": payload,
+            "result": None,
+            "error": None,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None
+        }
+        self.store.insert(job)
+        return job, False, True
+
+    async def _enqueue_stored(self) -> int:
+        """저장소의 대기 작업을 대기열에 넣음 (다른 큐와 겹쳐도 가져올 때 한 곳만 실행)"""
+        recovered = await self._call(self.store.queued)
+        for row in recovered:
+            self._enqueue(row["id"], row["priority"])
+        self._stats["recovered"] += len(recovered)
+        return len(recovered)
+
+    async def _renew_leases(self):
+        """
+        실행 중인 작업의 임대를 연장하고, 보관 시간이 지난 결과를 지우고, 임대가 끝난 다른
+        프로세스의 작업을 가져옴
+        """
+        while True:
+            await asyncio.sleep(self.lease * LEASE_RENEW_FRACTION)
+            now = time.time()
+            try:
+                if self._running:
+                    await self._call(self.store.renew_leases, self.owner, now + self.lease)
+                await self._call(self.store.purge, now - self.result_ttl)
+                if await self._call(self.store.requeue_running, None, now):
+                    await self._enqueue_stored()
+            except sqlite3.Error as e:
+                logger.warning(f"생성 작업 저장소 정리 오류: {str(e)}")
+
+    async def _worker(self):
+        while True:
+            _, _, job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                logger.error(f"생성 작업 처리 오류 ({job_id}): {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        # 취소되었거나 우선순위 변경으로 이미 꺼냈거나 다른 큐가 가져간 작업은 건너뜀
+        now = time.time()
+        if not await self._call(
+            self.store.update,
+            job_id,
+            expected=(JOB_STATUS_QUEUED,),
+            status=JOB_STATUS_RUNNING,
+            started_at=now,
+            owner=self.owner,
+            lease_until=now + self.lease
+        ):
+            return
+        job = await self._call(self.store.get, job_id)
+        if job is None or job["status"] != JOB_STATUS_RUNNING:
+            return  # 가져오는 사이에 취소됨
+        task = asyncio.create_task(self.runner(job["kind"], job["payload"]))
+        self._running[job_id] = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if job_id not in self._cancelled:
+                raise  # 워커 종료: stop() 이 대기 상태로 되돌림
+            return
+        except Exception as e:
+            logger.warning(f"생성 작업 실패 ({job['kind']}, {job_id}): {str(e)}")
+            await self._finish(job_id, JOB_STATUS_FAILED, error=str(e))
+            return
+        finally:
+            self._running.pop(job_id, None)
+            self._cancelled.discard(job_id)
+        await self._finish(job_id, JOB_STATUS_SUCCEEDED, result=result)
+
+    async def _finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        expected: Tuple[str, ...] = (JOB_STATUS_RUNNING,)
+    ):
+        if await self._call(
+            self.store.update,
+            job_id,
+            expected=expected,
+            status=status,
+            result=result,
+            error=error,
+            finished_at=time.time()
+        ):
+            self._stats[status] += 1
+        event = self._done_events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    @staticmethod
+    def _public(job: Dict[str, Any]) -> Dict[str, Any]:
+        """응답용 작업 정보 (요청 내용/중복 키/소유 프로세스 정보 제외)"""
+        return {name: value for name, value in job.items() if name not in PRIVATE_JOB_FIELDS}
@@ -0,0 +1,58 @@
+"""
+@CODE:llm-backend-interface
+생성기가 chat completion 요청을 보내는 LLM 백엔드 인터페이스
+
+Related:
+- @SPEC:FEAT-002-REQ-015 - Pluggable LLM Backend
+- @CODE:ai-generator-service
+- @CODE:llm-transport-service
+- @CODE:fake-llm-backend
+
+응답은 백엔드와 관계없이 OpenAI SDK 형식입니다. 일반 요청은 ChatCompletion, stream=True 요청은
+ChatCompletionChunk 를 내보내고 close() 로 정리하는 비동기 스트림을 반환하므로 생성기는
+백엔드 종류를 구분하지 않습니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+# LLM_BACKEND 설정값
+BACKEND_OPENAI = "openai"
+BACKEND_FAKE = "fake"
+LLM_BACKENDS = (BACKEND_OPENAI, BACKEND_FAKE)
+
+
+class LLMBackend(ABC):
+    """
+    @CODE:llm-backend-interface-base
+    LLM 백엔드 추상 클래스 (create 만 구현하면 나머지는 기본 동작)
+
+    Implements: @SPEC:FEAT-002-REQ-015
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def create(self, request: Dict[str, Any], tokens: int = 0, **options: Any):
+        """
+        chat.completions.create 와 같은 인자로 요청
+
+        Args:
+            request: create 인자 (model, messages, temperature, max_tokens, response_format ...)
+            tokens: 속도 제한에 셀 토큰 수 (입력 토큰 + max_tokens)
+            options: 추가 인자 (stream 등)
+
+        Returns:
+            ChatCompletion, stream=True 이면 ChatCompletionChunk 비동기 스트림
+        """
+
+    async def warmup(self, timeout: float = 5.0) -> bool:
+        """첫 요청 전에 연결 준비 (준비할 것이 없으면 True)"""
+        return True
+
+    async def aclose(self):
+        """연결 등 자원 정리 (종료 시 호출)"""
+
+    def stats(self) -> Dict[str, Any]:
+        """백엔드별 호출 통계"""
+        return {}
@@ -0,0 +1,338 @@
+"""
+@CODE:llm-transport-service
+OpenAI 호출 전송 계층 (연결 풀, 지터를 넣은 지수 백오프 재시도, RPM/TPM 속도 제한)
+
+Related:
+- @SPEC:FEAT-002-REQ-013 - Resilient Transport
+- @CODE:ai-generator-service
+- @CODE:llm-backend-interface
+- @TEST:llm-transport-unit
+
+- 연결 풀: httpx 연결 수/유휴(keep-alive) 연결 수/유휴 유지 시간을 명시한 AsyncClient 하나를 공유
+- 재시도: 429/5xx/연결 오류는 full jitter 지수 백오프로 다시 시도하며, 응답에 Retry-After
+  (retry-after-ms) 가 있으면 그 시간 이상 기다림. SDK 자체 재시도는 끄고 여기서만 재시도
+- 속도 제한: 분당 요청 수(RPM)/토큰 수(TPM) 토큰 버킷으로 요청 전에 기다림. 429 를 받으면
+  허용 속도를 절반으로 줄이고 Retry-After 동안 모든 요청을 멈추며, 성공할 때마다 조금씩 회복 (AIMD)
+"""
+
+from email.utils import parsedate_to_datetime
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError
+from app.services.llm_backend import LLMBackend, BACKEND_OPENAI
+from typing import Any, Callable, Dict, Mapping, Optional
+import asyncio
+import httpx
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# 다시 시도하는 HTTP 상태 코드 (요청 시간 초과, 충돌, 속도 제한, 서버 오류)
+RETRYABLE_STATUS = (408, 409, 429, 500, 502, 503, 504)
+STATUS_RATE_LIMITED = 429
+
+
+def create_http_client(
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0,
+    connect_timeout: float = 5.0,
+    read_timeout: float = 120.0
+) -> httpx.AsyncClient:
+    """연결 풀 한도와 keep-alive 를 명시한 httpx 클라이언트"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+    )
+
+
+def create_openai_client(api_key: str, base_url: Optional[str] = None, **pool_options: Any) -> AsyncOpenAI:
+    """공유 연결 풀을 쓰는 AsyncOpenAI 클라이언트 (재시도는 LLMTransport 에서)"""
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=0,
+        http_client=create_http_client(**pool_options)
+    )
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]], now: Optional[float] = None) -> Optional[float]:
+    """
+    응답 헤더의 재시도 대기 시간(초)
+
+    retry-after-ms (OpenAI), retry-after 의 초 또는 HTTP 날짜 형식을 읽습니다.
+    """
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now if now is not None else time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    @CODE:llm-transport-service-retry
+    재시도 여부와 대기 시간 (full jitter 지수 백오프, Retry-After 우선)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        max_retry_after: float = 60.0,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Args:
+            max_retries: 첫 요청 뒤 다시 시도하는 최대 횟수
+            base_delay: 첫 재시도의 백오프 상한(초), 시도마다 두 배
+            max_delay: 백오프 상한(초)
+            max_retry_after: 따르는 Retry-After 의 상한(초)
+            rng: [0, 1) 난수 (테스트에서 고정)
+        """
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.rng = rng
+
+    @staticmethod
+    def retryable(error: Exception) -> bool:
+        if isinstance(error, APIStatusError):
+            return error.status_code in RETRYABLE_STATUS
+        return isinstance(error, APIConnectionError)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        attempt 번째 재시도(0 부터) 전 대기 시간
+
+        [0, min(max_delay, base_delay * 2^attempt)) 에서 고르며, Retry-After 가 있으면 그보다 짧게 기다리지 않음
+        """
+        backoff = self.rng() * min(self.max_delay, self.base_delay * (2 ** attempt))
+        if retry_after is None:
+            return backoff
+        return max(min(retry_after, self.max_retry_after), backoff)
+
+
+class TokenBucket:
+    """
+    분당 rate_per_minute 만큼 채워지는 버킷 (잔량이 음수이면 그만큼 미리 당겨 쓴 상태)
+
+    버킷 크기는 burst_seconds 동안 채워지는 양이므로 한꺼번에 보내는 요청도 그만큼으로 제한됩니다
+    (분당 한도를 더 짧은 구간으로 나눠 적용하는 서버 대응).
+    """
+
+    def __init__(self, rate_per_minute: float, now: float, burst_seconds: float = 10.0):
+        self.burst_seconds = burst_seconds
+        self.level = self.capacity(rate_per_minute)
+        self.updated = now
+
+    def capacity(self, rate_per_minute: float) -> float:
+        return max(1.0, rate_per_minute * self.burst_seconds / 60)
+
+    def reserve(self, amount: float, rate_per_minute: float, now: float) -> float:
+        """
+        amount 를 꺼내고 잔량이 다시 0 이상이 될 때까지의 대기 시간(초) 반환
+
+        한 번에 버킷 크기보다 많이 꺼내는 요청은 버킷 크기만큼으로 계산합니다.
+        """
+        capacity = self.capacity(rate_per_minute)
+        self.level = min(capacity, self.level + (now - self.updated) * rate_per_minute / 60)
+        self.updated = now
+        self.level -= min(amount, capacity)
+        return max(0.0, -self.level * 60 / rate_per_minute)
+
+    def drain(self, now: float):
+        self.level = min(self.level, 0.0)
+        self.updated = now
+
+
+class AdaptiveRateLimiter:
+    """
+    @CODE:llm-transport-service-limiter
+    RPM/TPM 토큰 버킷 속도 제한 (429 를 받으면 줄이고 성공하면 회복)
+
+    요청은 버킷에서 먼저 예약하고 대기하므로 (잠금 없이) 동시에 들어온 요청도 순서대로 간격이 벌어집니다.
+    rpm/tpm 이 0 이면 해당 한도는 적용하지 않지만, 429 의 Retry-After 동안 멈추는 것은 항상 적용합니다.
+    """
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        burst_seconds: float = 10.0,
+        min_scale: float = 0.1,
+        recovery: float = 0.05,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            rpm: 분당 요청 수 한도 (0 이면 제한 없음)
+            tpm: 분당 토큰 수 한도 (입력 + max_tokens, 0 이면 제한 없음)
+            burst_seconds: 한꺼번에 보낼 수 있는 양 (이 시간 동안 채워지는 양)
+            min_scale: 429 로 줄일 수 있는 최소 비율
+            recovery: 성공 한 번마다 회복하는 비율
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.min_scale = min_scale
+        self.recovery = recovery
+        self.clock = clock
+        self.scale = 1.0
+        self._paused_until = 0.0
+        now = clock()
+        self._requests = TokenBucket(rpm, now, burst_seconds) if rpm > 0 else None
+        self._tokens = TokenBucket(tpm, now, burst_seconds) if tpm > 0 else None
+        self._stats = {"waits": 0, "wait_ms": 0.0, "rate_limited": 0}
+
+    def reserve(self, tokens: int = 0) -> float:
+        """요청 하나를 예약하고 보내기 전에 기다릴 시간(초) 반환"""
+        now = self.clock()
+        wait = max(0.0, self._paused_until - now)
+        if self._requests is not None:
+            wait = max(wait, self._requests.reserve(1, self.rpm * self.scale, now))
+        if self._tokens is not None and tokens:
+            wait = max(wait, self._tokens.reserve(tokens, self.tpm * self.scale, now))
+        if wait > 0:
+            self._stats["waits"] += 1
+            self._stats["wait_ms"] += wait * 1000
+        return wait
+
+    async def acquire(self, tokens: int = 0):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """429: 허용 속도를 절반으로 줄이고 Retry-After 동안 모든 요청을 멈춤"""
+        now = self.clock()
+        self._stats["rate_limited"] += 1
+        self.scale = max(self.min_scale, self.scale / 2)
+        for bucket in (self._requests, self._tokens):
+            if bucket is not None:
+                bucket.drain(now)
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+    def on_success(self):
+        self.scale = min(1.0, self.scale + self.recovery)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "wait_ms": round(self._stats["wait_ms"], 1),
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "scale": round(self.scale, 3)
+        }
+
+
+class LLMTransport(LLMBackend):
+    """
+    @CODE:llm-transport-service-transport
+    속도 제한과 재시도를 거쳐 chat.completions.create 호출 (OpenAI 백엔드)
+
+    Implements: @SPEC:FEAT-002-REQ-013
+
+    스트리밍 요청은 스트림을 여는 단계(첫 응답 헤더)까지만 재시도합니다. 조각을 받기 시작한
+    뒤의 오류는 이미 호출자에게 내보낸 조각이 있으므로 그대로 전달합니다.
+    """
+
+    name = BACKEND_OPENAI
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        sleep: Callable[[float], Any] = asyncio.sleep
+    ):
+        self.client = client.with_options(max_retries=0)
+        self.retry = retry or RetryPolicy()
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.sleep = sleep
+        self._stats = {"requests": 0, "attempts": 0, "retries": 0, "failures": 0, "retry_wait_ms": 0.0}
+
+    async def create(self, request: Dict[str, Any], tokens: int = 0, **options: Any):
+        """
+        chat.completions.create (속도 제한 대기 → 호출 → 실패 시 백오프 후 재시도)
+
+        Args:
+            request: create 인자
+            tokens: TPM 한도에 셀 토큰 수 (입력 토큰 + max_tokens)
+            options: create 에 추가로 넘길 인자 (stream 등)
+
+        Raises:
+            재시도할 수 없는 오류 또는 재시도를 모두 실패한 마지막 오류
+        """
+        self._stats["requests"] += 1
+        attempt = 0
+        while True:
+            await self.limiter.acquire(tokens)
+            self._stats["attempts"] += 1
+            try:
+                response = await self.client.chat.completions.create(**request, **options)
+            except Exception as e:
+                if not self.retry.retryable(e) or attempt >= self.retry.max_retries:
+                    self._stats["failures"] += 1
+                    raise
+                retry_after = parse_retry_after(e.response.headers) if isinstance(e, APIStatusError) else None
+                if isinstance(e, APIStatusError) and e.status_code == STATUS_RATE_LIMITED:
+                    self.limiter.on_rate_limited(retry_after)
+                delay = self.retry.delay(attempt, retry_after)
+                logger.warning(
+                    f"OpenAI 요청 실패, {delay:.2f}초 후 다시 시도 ({attempt + 1}/{self.retry.max_retries}): {str(e)}"
+                )
+                self._stats["retries"] += 1
+                self._stats["retry_wait_ms"] += delay * 1000
+                await self.sleep(delay)
+                attempt += 1
+                continue
+            self.limiter.on_success()
+            return response
+
+    async def warmup(self, timeout: float = 5.0) -> bool:
+        """
+        OpenAI API 연결 미리 열기
+
+        가벼운 GET /models 요청으로 TCP/TLS 연결을 만들어 연결 풀에 남겨 두므로 첫 생성 요청이
+        연결 수립 시간을 기다리지 않습니다. 응답 상태 코드와 관계없이 연결이 열리면 성공으로 봅니다.
+        """
+        try:
+            await self.client.with_options(timeout=timeout).models.list()
+        except APIStatusError:
+            pass
+        except APIConnectionError as e:
+            logger.warning(f"OpenAI 연결 준비 실패: {str(e)}")
+            return False
+        return True
+
+    async def aclose(self):
+        """연결 풀 정리"""
+        await self.client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "retry_wait_ms": round(self._stats["retry_wait_ms"], 1),
+            "limiter": self.limiter.stats()
+        }
@@ -0,0 +1,257 @@
+"""
+@CODE:model-router-service
+섹션/입력 크기별 생성 모델 선택 (라우팅 표) 과 경로별 지연 시간/비용 기록
+
+Related:
+- @SPEC:FEAT-002-REQ-014 - Model Routing
+- @CODE:ai-generator-service
+- @TEST:model-router-unit
+
+라우팅 표는 위에서부터 먼저 일치하는 규칙을 사용합니다. 규칙은 등급(tier), 섹션 목록,
+입력 토큰 범위로 일치 여부를 정하고, 모델 컨텍스트에 입력과 최소 출력 토큰이 들어가지
+않으면 건너뜁니다. 초안(draft) 등급에 일치하는 규칙이 없으면 기본(standard) 등급 규칙을
+사용합니다.
+"""
+
+from app.services.token_budget import context_tokens
+from collections import deque
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
+import json
+
+# 생성 등급: standard 는 섹션별 기본 모델, draft 는 작은 모델로 빠르게 초안 생성
+TIER_STANDARD = "standard"
+TIER_DRAFT = "draft"
+TIERS = (TIER_STANDARD, TIER_DRAFT)
+GenerationTier = Literal["standard", "draft"]
+
+# 재무 계획 본문을 표 JSON 으로 바꾸는 요청의 라우팅 섹션 이름
+ROUTE_SECTION_TABLE_JSON = "financial_tables"
+
+# 기본 라우팅 표: 섹션 본문은 기존 생성 모델, 표 JSON 변환과 초안은 작은 모델
+DEFAULT_ROUTES: List[Dict[str, Any]] = [
+    {
+        "name": "table-json",
+        "sections": [ROUTE_SECTION_TABLE_JSON],
+        "model": "gpt-3.5-turbo-0125",
+        "temperature": 0
+    },
+    {
+        "name": "draft",
+        "tier": TIER_DRAFT,
+        "model": "gpt-3.5-turbo-0125",
+        "temperature": 0.7
+    },
+    {
+        "name": "standard",
+        "model": "gpt-4-turbo-preview",
+        "temperature": 0.7
+    }
+]
+
+# 모델 이름 접두사 → 1K 토큰당 USD (입력, 출력), 앞에서부터 먼저 일치하는 항목 사용
+MODEL_PRICES: Tuple[Tuple[str, float, float], ...] = (
+    ("gpt-4o-mini", 0.00015, 0.0006),
+    ("gpt-4o", 0.005, 0.015),
+    ("gpt-4-turbo", 0.01, 0.03),
+    ("gpt-4-1106", 0.01, 0.03),
+    ("gpt-4-0125", 0.01, 0.03),
+    ("gpt-4-32k", 0.06, 0.12),
+    ("gpt-4", 0.03, 0.06),
+    ("gpt-3.5-turbo", 0.0005, 0.0015),
+)
+
+# 경로별 지연 시간 통계에 유지하는 최근 호출 수
+ROUTE_STATS_WINDOW = 512
+
+ROUTE_FIELDS = {
+    "name", "tier", "sections", "min_prompt_tokens", "max_prompt_tokens", "model", "temperature", "max_tokens"
+}
+
+
+class ModelRouter:
+    """
+    @CODE:model-router-service-router
+    라우팅 표에서 요청의 모델/temperature/max_tokens 를 고르고 경로별 호출 결과를 누적
+
+    Implements: @SPEC:FEAT-002-REQ-014
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Sequence[Mapping[str, Any]]] = None,
+        prices: Optional[Sequence[Tuple[str, float, float]]] = None,
+        min_output_tokens: int = 256
+    ):
+        """
+        Args:
+            routes: 라우팅 규칙 목록 (기본값: DEFAULT_ROUTES)
+                - name: 경로 이름 (통계 키, 표 안에서 고유)
+                - model: 모델 이름 (필수)
+                - tier: "standard"(기본) 또는 "draft"
+                - sections: 적용할 섹션 목록 (없으면 모든 섹션)
+                - min_prompt_tokens / max_prompt_tokens: 적용할 입력 토큰 범위 (포함)
+                - temperature: 기본 0.7
+                - max_tokens: 섹션 설정 대신 쓸 최대 출력 토큰
+            prices: (모델 접두사, 입력 1K 토큰당 USD, 출력 1K 토큰당 USD) 목록 (기본값: MODEL_PRICES)
+            min_output_tokens: 출력에 최소로 남아야 하는 토큰 (모자라면 그 규칙은 건너뜀)
+
+        Raises:
+            ValueError: 규칙 형식이 잘못된 경우
+        """
+        self.routes = [self._validate(route) for route in (routes if routes is not None else DEFAULT_ROUTES)]
+        names = [route["name"] for route in self.routes]
+        if len(set(names)) != len(names):
+            raise ValueError("라우팅 규칙 이름이 중복되었습니다.")
+        self.prices = tuple(prices) if prices is not None else MODEL_PRICES
+        self.min_output_tokens = min_output_tokens
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "ModelRouter":
+        """
+        JSON 파일의 라우팅 표로 생성
+
+        파일 형식: {"routes": [...], "prices": {"모델 접두사": [입력, 출력]}} (prices 는 기본 가격표 앞에 추가)
+        """
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        prices = [
+            (prefix, float(values[0]), float(values[1])) for prefix, values in config.get("prices", {}).items()
+        ]
+        return cls(config["routes"], prices=tuple(prices) + MODEL_PRICES, **kwargs)
+
+    def select(self, section: str, prompt_tokens: int, tier: str = TIER_STANDARD) -> Dict[str, Any]:
+        """
+        요청에 적용할 라우팅 규칙
+
+        Raises:
+            ValueError: 지원하지 않는 등급이거나 일치하는 규칙이 없는 경우
+        """
+        if tier not in TIERS:
+            raise ValueError(f"지원되지 않는 생성 등급: {tier}")
+        for candidate_tier in dict.fromkeys((tier, TIER_STANDARD)):
+            for route in self.routes:
+                if route["tier"] == candidate_tier and self._matches(route, section, prompt_tokens):
+                    return route
+        raise ValueError(f"{section} 섹션 ({prompt_tokens} 토큰) 에 맞는 라우팅 규칙이 없습니다.")
+
+    def apply(self, request: Dict[str, Any], route: Mapping[str, Any], prompt_tokens: int) -> Dict[str, Any]:
+        """요청의 모델/temperature 를 경로 값으로 바꾸고 max_tokens 를 경로 모델 컨텍스트에 맞춤"""
+        requested = route.get("max_tokens") or request["max_tokens"]
+        return {
+            **request,
+            "model": route["model"],
+            "temperature": route["temperature"],
+            "max_tokens": min(requested, context_tokens(route["model"]) - prompt_tokens)
+        }
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """호출 하나의 예상 비용 (USD, 가격표에 없는 모델은 None)"""
+        for prefix, prompt_price, completion_price in self.prices:
+            if model.startswith(prefix):
+                return round((prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000, 6)
+        return None
+
+    def record(
+        self,
+        route: Mapping[str, Any],
+        prompt_tokens: int,
+        completion_tokens: int,
+        ttft_ms: Optional[float],
+        total_ms: float,
+        failed: bool = False
+    ) -> Optional[float]:
+        """
+        경로로 보낸 업스트림 호출 하나의 토큰/지연 시간 누적 (응답 캐시 적중/공유한 호출은 기록하지 않음)
+
+        Returns:
+            호출 비용 (USD)
+        """
+        stats = self._stats.get(route["name"])
+        if stats is None:
+            stats = self._stats[route["name"]] = {
+                "calls": 0,
+                "failed": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cost_usd": 0.0,
+                "ttft_ms": deque(maxlen=ROUTE_STATS_WINDOW),
+                "total_ms": deque(maxlen=ROUTE_STATS_WINDOW)
+            }
+        cost = self.cost(route["model"], prompt_tokens, completion_tokens)
+        stats["calls"] += 1
+        stats["failed"] += failed
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+        stats["cost_usd"] += cost or 0.0
+        if not failed:
+            if ttft_ms is not None:
+                stats["ttft_ms"].append(ttft_ms)
+            stats["total_ms"].append(total_ms)
+        return cost
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """경로별 모델, 호출 수, 토큰, 누적/호출당 비용, 첫 토큰 시간/전체 시간 분포 (라우팅 표 순서)"""
+        result = {}
+        for route in self.routes:
+            stats = self._stats.get(route["name"])
+            if stats is None:
+                continue
+            result[route["name"]] = {
+                "model": route["model"],
+                "tier": route["tier"],
+                "calls": stats["calls"],
+                "failed": stats["failed"],
+                "prompt_tokens": stats["prompt_tokens"],
+                "completion_tokens": stats["completion_tokens"],
+                "cost_usd": round(stats["cost_usd"], 6),
+                "cost_per_call_usd": round(stats["cost_usd"] / stats["calls"], 6),
+                "ttft_ms": _summarize(stats["ttft_ms"]),
+                "total_ms": _summarize(stats["total_ms"])
+            }
+        return result
+
+    def _matches(self, route: Mapping[str, Any], section: str, prompt_tokens: int) -> bool:
+        if route["sections"] is not None and section not in route["sections"]:
+            return False
+        if route["min_prompt_tokens"] is not None and prompt_tokens < route["min_prompt_tokens"]:
+            return False
+        if route["max_prompt_tokens"] is not None and prompt_tokens > route["max_prompt_tokens"]:
+            return False
+        return context_tokens(route["model"]) - prompt_tokens >= self.min_output_tokens
+
+    @staticmethod
+    def _validate(route: Mapping[str, Any]) -> Dict[str, Any]:
+        """규칙 하나를 기본값을 채운 dict 로 (잘못된 형식은 ValueError)"""
+        unknown = set(route) - ROUTE_FIELDS
+        if unknown:
+            raise ValueError(f"알 수 없는 라우팅 규칙 항목: {', '.join(sorted(unknown))}")
+        if not route.get("model"):
+            raise ValueError("라우팅 규칙에 model 이 없습니다.")
+        tier = route.get("tier", TIER_STANDARD)
+        if tier not in TIERS:
+            raise ValueError(f"지원되지 않는 생성 등급: {tier}")
+        sections = route.get("sections")
+        return {
+            "name": route.get("name") or f"{tier}:{route['model']}",
+            "tier": tier,
+            "sections": list(sections) if sections is not None else None,
+            "min_prompt_tokens": route.get("min_prompt_tokens"),
+            "max_prompt_tokens": route.get("max_prompt_tokens"),
+            "model": route["model"],
+            "temperature": float(route.get("temperature", 0.7)),
+            "max_tokens": route.get("max_tokens")
+        }
+
+
+def _summarize(samples: Sequence[float]) -> Dict[str, Optional[float]]:
+    """측정값 목록의 평균/p50/p95 (AIGenerator.stats 와 같은 형식)"""
+    if not samples:
+        return {"count": 0, "avg": None, "p50": None, "p95": None}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "avg": round(sum(ordered) / len(ordered), 1),
+        "p50": ordered[int(0.50 * (len(ordered) - 1))],
+        "p95": ordered[int(0.95 * (len(ordered) - 1))]
+    }
@@ -0,0 +1,248 @@
+"""
+@CODE:parse-cache-service
+업로드 문서 파싱 결과의 콘텐츠 주소 기반 캐시
+
+Related:
+- @CODE:docx-parser-service
+- @TEST:parse-cache-unit
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 파서 출력 구조가 바뀌면 올려서 이전 디스크 캐시를 무효화
+PARSE_CACHE_VERSION = 2
+
+
+class ParseCache:
+    """
+    @CODE:parse-cache-service
+    업로드 바이트의 SHA-256 을 키로 하는 2단계(메모리 LRU + 디스크) 파싱 캐시
+
+    - 메모리 계층: 최근 사용 순서의 OrderedDict, 항목 수 제한
+    - 디스크 계층: `<cache_dir>/<sha[:2]>/<sha>.v<version>.json`, 총 바이트 제한
+      (초과 시 가장 오래 사용하지 않은 파일부터 삭제)
+
+    캐시 적중 시 저장된 구조를 그대로 반환하며 python-docx 는 사용하지 않습니다.
+    반환된 구조는 여러 요청이 공유하므로 호출자는 수정하지 않아야 합니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str],
+        memory_entries: int = 128,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+        enabled: bool = True
+    ):
+        self.cache_dir = cache_dir
+        self.memory_entries = memory_entries
+        self.disk_max_bytes = disk_max_bytes
+        self.enabled = enabled
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._disk_index: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_loaded = False
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "disk_errors": 0
+        }
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """업로드 바이트의 SHA-256 해시"""
+        return hashlib.sha256(content).hexdigest()
+
+    async def get_or_parse_async(
+        self,
+        key: str,
+        parse: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        캐시에서 파싱 결과를 찾고, 없으면 parse() 결과를 저장 후 반환
+
+        키는 업로드를 청크 단위로 해시하며 미리 계산해 둔 SHA-256 (digest 와 같은 값)입니다.
+        parse 는 워커 풀에 파싱을 넘기는 인자 없는 코루틴 함수이며, 디스크 계층 읽기/쓰기도
+        이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+        Args:
+            key: 업로드 바이트의 SHA-256 hex digest
+            parse: 캐시 미스 시 호출할 파싱 코루틴 함수
+
+        Returns:
+            문서 구조
+        """
+        if not self.enabled:
+            return await parse()
+
+        structure = await asyncio.to_thread(self.get, key)
+        if structure is None:
+            structure = await parse()
+            await asyncio.to_thread(self.put, key, structure)
+        return structure
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """키에 해당하는 파싱 결과 반환 (메모리 → 디스크 순으로 조회)"""
+        with self._lock:
+            structure = self._memory.get(key)
+            if structure is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return structure
+
+        structure = self._read_disk(key)
+
+        with self._lock:
+            if structure is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, structure)
+            return structure
+
+    def put(self, key: str, structure: Dict[str, Any]):
+        """파싱 결과를 메모리와 디스크 계층에 저장"""
+        with self._lock:
+            self._remember(key, structure)
+        self._write_disk(key, structure)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 카운터 및 계층별 사용량"""
+        with self._lock:
+            self._ensure_disk_index()
+            lookups = self._stats["memory_hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "hits": hits,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_max_entries": self.memory_entries,
+                "disk_entries": len(self._disk_index),
+                "disk_bytes": self._disk_bytes,
+                "disk_max_bytes": self.disk_max_bytes,
+                "enabled": self.enabled
+            }
+
+    def clear(self):
+        """메모리 계층과 카운터 초기화 (디스크 파일은 유지)"""
+        with self._lock:
+            self._memory.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def _remember(self, key: str, structure: Dict[str, Any]):
+        """메모리 LRU 에 저장 (잠금 보유 상태에서 호출)"""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = structure
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.v{PARSE_CACHE_VERSION}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                structure = json.loads(f.read())
+            os.utime(path)  # LRU 순서 갱신
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"파싱 캐시 읽기 오류 ({key}): {str(e)}")
+            with self._lock:
+                self._stats["disk_errors"] += 1
+            return None
+
+        with self._lock:
+            if key in self._disk_index:
+                self._disk_index.move_to_end(key)
+        return structure
+
+    def _write_disk(self, key: str, structure: Dict[str, Any]):
+        if not self.cache_dir or self.disk_max_bytes <= 0:
+            return
+
+        with self._lock:
+            self._ensure_disk_index()
+
+        path = self._path(key)
+        try:
+            payload = json.dumps(structure, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if len(payload) > self.disk_max_bytes:
+                return
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"파싱 캐시 쓰기 오류 ({key}): {str(e)}")
+            with self._lock:
+                self._stats["disk_errors"] += 1
+            return
+
+        with self._lock:
+            self._disk_bytes += len(payload) - self._disk_index.pop(key, 0)
+            self._disk_index[key] = len(payload)
+            self._evict_disk()
+
+    def _ensure_disk_index(self):
+        """디스크 계층의 파일 목록을 마지막 사용 시각 순으로 한 번 로드 (잠금 보유 상태에서 호출)"""
+        if self._disk_loaded or not self.cache_dir:
+            return
+        self._disk_loaded = True
+
+        suffix = f".v{PARSE_CACHE_VERSION}.json"
+        entries = []
+        if os.path.isdir(self.cache_dir):
+            for shard in os.scandir(self.cache_dir):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.endswith(suffix):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name[:-len(suffix)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._disk_index[key] = size
+            self._disk_bytes += size
+
+    def _evict_disk(self):
+        """총 크기가 제한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (잠금 보유 상태에서 호출)"""
+        while self._disk_bytes > self.disk_max_bytes and self._disk_index:
+            key, size = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            self._stats["disk_evictions"] += 1
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"파싱 캐시 삭제 오류 ({key}): {str(e)}")
@@ -0,0 +1,281 @@
+"""
+@CODE:reference-index-service
+참고 문서 청크 분할 및 BM25 검색 인덱스 (외부 네트워크/라이브러리 없음)
+
+Related:
+- @CODE:ai-generator-service
+- @TEST:reference-index-unit
+"""
+
+from app.config import settings
+from app.utils.tokens import estimate_tokens
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import heapq
+import math
+import re
+import threading
+import unicodedata
+
+_WORD = re.compile(r"[0-9a-z]+|[가-힣]+|[一-鿿]+")
+_HANGUL = re.compile(r"[가-힣]+")
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 분리
+
+    한국어는 형태소 분석기 없이 조사/어미 변화에 대응하도록 어절 전체와
+    음절 bigram 을 함께 색인합니다 (예: "시장규모는" → 시장규모는, 시장, 장규, 규모, 모는).
+    영문은 소문자 단어, 숫자는 그대로 사용합니다.
+    """
+    text = unicodedata.normalize("NFC", text).lower()
+    tokens: List[str] = []
+    for word in _WORD.findall(text):
+        tokens.append(word)
+        if _HANGUL.fullmatch(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _split_units(paragraph: str, max_tokens: int) -> List[Tuple[str, int]]:
+    """긴 문단을 문장 단위로, 그래도 긴 문장은 글자 수 기준으로 나눔"""
+    units = []
+    for sentence in _SENTENCE_END.split(paragraph):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        tokens = estimate_tokens(sentence)
+        if tokens <= max_tokens:
+            units.append((sentence, tokens))
+            continue
+        # 토큰당 평균 글자 수로 창 크기를 정해 자름
+        window = max(1, len(sentence) * max_tokens // tokens)
+        for start in range(0, len(sentence), window):
+            piece = sentence[start:start + window]
+            units.append((piece, estimate_tokens(piece)))
+    return units
+
+
+def chunk_text(text: str, chunk_tokens: int = 300, overlap_tokens: int = 50) -> List[str]:
+    """
+    문단/문장 경계를 따라 텍스트를 약 chunk_tokens 크기의 청크로 분할
+
+    문단을 순서대로 채우고, 한 문단이 청크보다 크면 문장 단위(그래도 크면 글자 수)로 나눕니다.
+    새 청크는 이전 청크 끝 문장을 overlap_tokens 이내로 이어받아 문맥이 끊기지 않게 합니다.
+    """
+    units: List[Tuple[str, int]] = []
+    for paragraph in re.split(r"\n\s*\n|\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        tokens = estimate_tokens(paragraph)
+        if tokens <= chunk_tokens:
+            units.append((paragraph, tokens))
+        else:
+            units.extend(_split_units(paragraph, chunk_tokens))
+
+    chunks: List[str] = []
+    current: List[Tuple[str, int]] = []
+    current_tokens = 0
+    for unit, tokens in units:
+        if current and current_tokens + tokens > chunk_tokens:
+            chunks.append("\n".join(u for u, _ in current))
+            carried: List[Tuple[str, int]] = []
+            carried_tokens = 0
+            for prev, prev_tokens in reversed(current):
+                if carried_tokens + prev_tokens > overlap_tokens:
+                    break
+                carried.insert(0, (prev, prev_tokens))
+                carried_tokens += prev_tokens
+            current, current_tokens = carried, carried_tokens
+        current.append((unit, tokens))
+        current_tokens += tokens
+    if current:
+        chunks.append("\n".join(u for u, _ in current))
+    return chunks
+
+
+class ReferenceIndex:
+    """
+    @CODE:reference-index-service
+    참고 문서 청크의 BM25 역색인
+
+    문서 ID 는 텍스트의 SHA-256 이므로 같은 내용은 한 번만 청크 분할/색인합니다.
+    색인된 문서 수가 max_documents 를 넘으면 가장 오래 사용하지 않은 문서부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = 300,
+        overlap_tokens: int = 50,
+        max_documents: int = 256,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.max_documents = max_documents
+        self.k1 = k1
+        self.b = b
+
+        # doc_id → [chunk, ...] (최근 사용 순서)
+        self._documents: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        # term → {(doc_id, chunk_index): term frequency}
+        self._postings: Dict[str, Dict[Tuple[str, int], int]] = {}
+        self._total_length = 0
+        self._chunk_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def document_id(text: str) -> str:
+        """참고 문서 텍스트의 ID (SHA-256)"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def add(self, text: str, doc_id: Optional[str] = None) -> str:
+        """
+        문서를 청크로 나누어 색인 (이미 색인된 문서는 건너뜀)
+
+        Returns:
+            문서 ID
+        """
+        doc_id = doc_id or self.document_id(text)
+        with self._lock:
+            if doc_id in self._documents:
+                self._documents.move_to_end(doc_id)
+                return doc_id
+
+        chunks = []
+        for chunk_index, chunk in enumerate(chunk_text(text, self.chunk_tokens, self.overlap_tokens)):
+            terms = tokenize(chunk)
+            chunks.append({
+                "doc_id": doc_id,
+                "chunk_index": chunk_index,
+                "text": chunk,
+                "tokens": estimate_tokens(chunk),
+                "length": len(terms),
+                "tf": Counter(terms)
+            })
+
+        with self._lock:
+            if doc_id in self._documents:
+                return doc_id
+            for chunk in chunks:
+                key = (doc_id, chunk["chunk_index"])
+                for term, freq in chunk.pop("tf").items():
+                    self._postings.setdefault(term, {})[key] = freq
+                self._total_length += chunk["length"]
+            self._chunk_count += len(chunks)
+            self._documents[doc_id] = chunks
+            while len(self._documents) > self.max_documents:
+                self._remove_locked(next(iter(self._documents)))
+        return doc_id
+
+    def add_many(self, texts: Iterable[str]) -> List[str]:
+        """여러 문서를 색인하고 문서 ID 목록 반환"""
+        return [self.add(text) for text in texts if text and text.strip()]
+
+    def remove(self, doc_id: str):
+        """문서와 청크를 색인에서 제거"""
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def chunk_count(self, doc_id: str) -> int:
+        with self._lock:
+            return len(self._documents.get(doc_id, []))
+
+    def search(
+        self,
+        query: str,
+        doc_ids: Optional[Sequence[str]] = None,
+        top_k: int = 8,
+        budget_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        BM25 점수 상위 청크 검색
+
+        Args:
+            query: 검색 질의
+            doc_ids: 검색 대상 문서 (None 이면 전체)
+            top_k: 최대 청크 수
+            budget_tokens: 선택한 청크의 토큰 합 상한 (넘치는 청크는 건너뜀)
+
+        Returns:
+            [{"doc_id", "chunk_index", "text", "tokens", "score"}] (점수 내림차순)
+        """
+        terms = set(tokenize(query))
+        allowed = set(doc_ids) if doc_ids is not None else None
+
+        with self._lock:
+            if not self._chunk_count or not terms:
+                return []
+            for doc_id in allowed or ():
+                if doc_id in self._documents:
+                    self._documents.move_to_end(doc_id)
+
+            avg_length = self._total_length / self._chunk_count
+            scores: Dict[Tuple[str, int], float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (self._chunk_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, freq in postings.items():
+                    if allowed is not None and key[0] not in allowed:
+                        continue
+                    length = self._documents[key[0]][key[1]]["length"]
+                    norm = freq * (self.k1 + 1) / (freq + self.k1 * (1 - self.b + self.b * length / avg_length))
+                    scores[key] = scores.get(key, 0.0) + idf * norm
+
+            ranked = heapq.nlargest(len(scores) if budget_tokens else top_k, scores.items(), key=lambda item: item[1])
+            results = []
+            used_tokens = 0
+            for (doc_id, chunk_index), score in ranked:
+                chunk = self._documents[doc_id][chunk_index]
+                if budget_tokens is not None and used_tokens + chunk["tokens"] > budget_tokens:
+                    continue
+                used_tokens += chunk["tokens"]
+                results.append({
+                    "doc_id": doc_id,
+                    "chunk_index": chunk_index,
+                    "text": chunk["text"],
+                    "tokens": chunk["tokens"],
+                    "score": round(score, 4)
+                })
+                if len(results) >= top_k:
+                    break
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """색인된 문서/청크/용어 수"""
+        with self._lock:
+            return {
+                "documents": len(self._documents),
+                "chunks": self._chunk_count,
+                "terms": len(self._postings),
+                "max_documents": self.max_documents
+            }
+
+    def _remove_locked(self, doc_id: str):
+        chunks = self._documents.pop(doc_id, None)
+        if not chunks:
+            return
+        for chunk in chunks:
+            key = (doc_id, chunk["chunk_index"])
+            for term in set(tokenize(chunk["text"])):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(key, None)
+                    if not postings:
+                        del self._postings[term]
+            self._total_length -= chunk["length"]
+        self._chunk_count -= len(chunks)
+
+
+reference_index = ReferenceIndex(
+    chunk_tokens=settings.reference_chunk_tokens,
+    overlap_tokens=settings.reference_chunk_overlap_tokens,
+    max_documents=settings.reference_index_max_documents
+)
@@ -0,0 +1,296 @@
+"""
+@CODE:response-cache-service
+AI 생성 응답 캐시 (정규화된 프롬프트 + 모델 파라미터 기준)
+
+Related:
+- @CODE:ai-generator-service
+- @TEST:response-cache-unit
+"""
+
+from app.utils.tokens import estimate_tokens
+from collections import OrderedDict
+from typing import Any, Dict, Literal, Optional
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# 키 구성(정규화 방식 등)이 바뀌면 올려서 이전 항목을 무효화
+RESPONSE_CACHE_VERSION = 1
+
+RESPONSE_CACHE_BACKEND_MEMORY = "memory"
+RESPONSE_CACHE_BACKEND_SQLITE = "sqlite"
+
+# 요청별 캐시 사용 방식
+CACHE_MODE_USE = "use"          # 캐시 조회 후 없으면 생성하여 저장
+CACHE_MODE_BYPASS = "bypass"    # 조회하지 않고 새로 생성 (결과는 저장하여 이후 요청에 사용)
+CACHE_MODES = (CACHE_MODE_USE, CACHE_MODE_BYPASS)
+CacheMode = Literal["use", "bypass"]
+
+# 키에 포함하는 chat.completions.create 파라미터
+KEY_PARAMS = ("model", "temperature", "max_tokens", "top_p", "presence_penalty", "frequency_penalty", "response_format")
+
+_WHITESPACE = re.compile(r"[ \t\u00a0\u3000]+")
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    캐시 키용 프롬프트 정규화
+
+    - 유니코드 NFC (macOS 입력의 NFD 한글 자모 통합)
+    - 줄 앞뒤 공백 제거, 연속 공백 하나로 축약, 빈 줄 제거
+    """
+    text = unicodedata.normalize("NFC", text or "")
+    lines = (_WHITESPACE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+class MemoryResponseBackend:
+    """
+    @CODE:response-cache-service
+    프로세스 내 dict 백엔드 (최근 사용 순서의 OrderedDict, 항목 수 제한)
+    """
+
+    name = RESPONSE_CACHE_BACKEND_MEMORY
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseBackend:
+    """
+    @CODE:response-cache-service
+    SQLite 파일 백엔드 (재시작 후에도 유지, 여러 워커 프로세스가 공유 가능)
+
+    last_used 가 가장 오래된 항목부터 삭제하여 항목 수를 제한합니다.
+    """
+
+    name = RESPONSE_CACHE_BACKEND_SQLITE
+
+    def __init__(self, path: str, max_entries: int = 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " entry TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+
+    def get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT entry, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        payload = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, entry, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, entry["expires_at"], entry["created_at"])
+            )
+            overflow = self._count() - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN"
+                    " (SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                    (overflow,)
+                )
+                self.evictions += overflow
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+
+def create_backend(kind: str, max_entries: int = 1024, path: Optional[str] = None):
+    """설정값으로 캐시 백엔드 생성"""
+    if kind == RESPONSE_CACHE_BACKEND_MEMORY:
+        return MemoryResponseBackend(max_entries=max_entries)
+    if kind == RESPONSE_CACHE_BACKEND_SQLITE:
+        if not path:
+            raise ValueError("SQLite 응답 캐시에는 파일 경로가 필요합니다.")
+        return SQLiteResponseBackend(path, max_entries=max_entries)
+    raise ValueError(f"지원되지 않는 응답 캐시 백엔드: {kind}")
+
+
+class ResponseCache:
+    """
+    @CODE:response-cache-service
+    AI 생성 응답 캐시
+
+    키는 chat.completions.create 요청의 메시지(정규화된 프롬프트)와 모델 파라미터의
+    SHA-256 입니다. 항목은 ttl 초가 지나면 만료되며, 백엔드가 항목 수를 LRU 로 제한합니다.
+    적중 시 절약한 토큰 수(프롬프트 + 응답, 추정치)를 누적합니다.
+    """
+
+    def __init__(self, backend, ttl: float = 24 * 3600, enabled: bool = True):
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "errors": 0,
+            "saved_prompt_tokens": 0,
+            "saved_completion_tokens": 0
+        }
+
+    @staticmethod
+    def key(request: Dict[str, Any]) -> str:
+        """요청 인자(messages + 모델 파라미터)의 캐시 키"""
+        normalized = {
+            "v": RESPONSE_CACHE_VERSION,
+            "messages": [
+                {"role": m.get("role"), "content": normalize_prompt(m.get("content", ""))}
+                for m in request.get("messages", [])
+            ],
+            "params": {name: request.get(name) for name in KEY_PARAMS if request.get(name) is not None}
+        }
+        payload = json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, request: Dict[str, Any], mode: str = CACHE_MODE_USE) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회
+
+        Returns:
+            {"content", "prompt_tokens", "completion_tokens", "created_at", "expires_at"} 또는 None
+        """
+        if not self.enabled:
+            return None
+        if mode == CACHE_MODE_BYPASS:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return None
+
+        try:
+            entry = self.backend.get(self.key(request), time.time())
+        except Exception as e:
+            logger.warning(f"응답 캐시 조회 오류: {str(e)}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return None
+
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["saved_prompt_tokens"] += entry["prompt_tokens"]
+            self._stats["saved_completion_tokens"] += entry["completion_tokens"]
+        return entry
+
+    def put(self, request: Dict[str, Any], content: str):
+        """생성 완료된 응답 저장"""
+        if not self.enabled or not content:
+            return
+
+        now = time.time()
+        entry = {
+            "content": content,
+            "prompt_tokens": sum(estimate_tokens(m.get("content", "")) for m in request.get("messages", [])),
+            "completion_tokens": estimate_tokens(content),
+            "created_at": now,
+            "expires_at": now + self.ttl
+        }
+        try:
+            self.backend.set(self.key(request), entry)
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 오류: {str(e)}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return
+
+        with self._lock:
+            self._stats["stores"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 및 절약한 토큰 수"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "saved_tokens": self._stats["saved_prompt_tokens"] + self._stats["saved_completion_tokens"],
+                "entries": len(self.backend),
+                "evictions": self.backend.evictions,
+                "backend": self.backend.name,
+                "ttl": self.ttl,
+                "enabled": self.enabled
+            }
+
+    def clear(self):
+        """저장된 항목과 카운터 초기화"""
+        self.backend.clear()
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
@@ -0,0 +1,213 @@
+"""
+@CODE:section-classifier-service
+문단 섹션 타입 분류기 (가중치 키워드 표 + 하나로 합친 정규식)
+
+Related:
+- @SPEC:FEAT-001-REQ-003 - Section Type Identification
+- @CODE:docx-parser-service-section
+- @TEST:section-classifier-unit
+
+키워드 표 전체를 긴 키워드 우선의 정규식 하나로 컴파일해 두고, 문단마다 한 번만 훑어
+섹션별 가중치 합이 가장 큰 섹션을 고릅니다.
+"""
+
+from app.config import settings
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+SECTION_GENERAL = "general"
+
+# 섹션별 키워드 가중치 (영문은 소문자). 순서는 점수가 같을 때의 우선순위입니다.
+# "분석" 처럼 여러 섹션에 쓰이는 말은 가중치를 낮게 두어 구체적인 키워드가 이기도록 합니다.
+DEFAULT_SECTION_KEYWORDS: Dict[str, Dict[str, float]] = {
+    "swot_analysis": {
+        "swot": 3.0,
+        "강점 약점": 2.0,
+    },
+    "competitive_analysis": {
+        "경쟁사": 3.0,
+        "경쟁": 2.5,
+        "차별화": 2.5,
+        "차별": 2.0,
+        "competitor": 3.0,
+        "competitive": 3.0,
+        "competition": 3.0,
+        "differentiation": 2.5,
+    },
+    "financial_plan": {
+        "재무": 3.0,
+        "손익": 2.5,
+        "현금": 2.0,
+        "자금": 2.0,
+        "매출 계획": 2.0,
+        "financial": 3.0,
+        "finance": 3.0,
+        "cash flow": 2.5,
+        "profit": 2.0,
+    },
+    "market_analysis": {
+        "시장": 2.0,
+        "분석": 0.5,
+        "고객": 1.0,
+        "market": 2.0,
+        "analysis": 0.5,
+    },
+    "business_overview": {
+        "사업 개요": 3.0,
+        "개요": 2.0,
+        "사업": 1.0,
+        "요약": 1.5,
+        "summary": 2.0,
+        "overview": 2.0,
+    },
+}
+
+# 이 점수보다 낮으면 general
+MIN_SECTION_SCORE = 1.0
+
+
+class SectionClassifier:
+    """
+    @CODE:section-classifier-service
+    가중치 키워드 표로 문단 섹션 타입 분류
+
+    Implements:
+    - @SPEC:FEAT-001-REQ-003 (Section Type Identification)
+    """
+
+    def __init__(
+        self,
+        keywords: Optional[Mapping[str, Mapping[str, float]]] = None,
+        min_score: float = MIN_SECTION_SCORE
+    ):
+        """
+        Args:
+            keywords: 섹션 → {키워드: 가중치} (기본값: DEFAULT_SECTION_KEYWORDS)
+            min_score: 섹션으로 판정하는 최소 점수
+        """
+        self.keywords = {
+            section: {keyword.lower(): float(weight) for keyword, weight in table.items() if weight > 0}
+            for section, table in (keywords if keywords is not None else DEFAULT_SECTION_KEYWORDS).items()
+        }
+        self.min_score = min_score
+        self.sections = list(self.keywords)
+
+        # 키워드 → [(섹션 순서, 가중치)] (같은 키워드가 여러 섹션에 쓰일 수 있음)
+        self._weights: Dict[str, List[Tuple[int, float]]] = {}
+        for order, section in enumerate(self.sections):
+            for keyword, weight in self.keywords[section].items():
+                self._weights.setdefault(_normalize(keyword), []).append((order, weight))
+        self._pattern = _compile(self._weights) if self._weights else None
+
+    @classmethod
+    def from_file(cls, path: str, min_score: float = MIN_SECTION_SCORE) -> "SectionClassifier":
+        """
+        JSON 키워드 표({"섹션": {"키워드": 가중치}})를 기본 표에 덮어써서 분류기 생성
+
+        파일에 없는 섹션은 기본 표를 그대로 쓰며, 가중치가 0 이하인 키워드는 기본 표에서 제거합니다.
+        """
+        with open(path, encoding="utf-8") as f:
+            overrides = json.load(f)
+        keywords = {section: dict(table) for section, table in DEFAULT_SECTION_KEYWORDS.items()}
+        for section, table in overrides.items():
+            keywords.setdefault(section, {}).update(table)
+        return cls(keywords, min_score=min_score)
+
+    def classify(self, text: str) -> str:
+        """
+        @CODE:section-classifier-service-classify
+        문단 하나의 섹션 타입
+
+        Returns:
+            섹션 타입 (키워드 점수가 min_score 미만이면 "general")
+        """
+        if self._pattern is None or not text:
+            return SECTION_GENERAL
+        scores = [0.0] * len(self.sections)
+        for keyword in self._pattern.findall(text.lower()):
+            for order, weight in self._keyword_weights(keyword):
+                scores[order] += weight
+        return self._best(scores)
+
+    def classify_many(self, texts: Sequence[str]) -> List[str]:
+        """
+        @CODE:section-classifier-service-batch
+        여러 문단을 한 번에 분류
+
+        정규식/가중치 표 조회를 지역 변수로 묶어 문단마다 classify 를 부르는 비용을 줄입니다.
+        키워드가 없는 문단은 점수 목록을 만들지 않습니다.
+
+        Returns:
+            texts 와 같은 순서의 섹션 타입 목록
+        """
+        if self._pattern is None:
+            return [SECTION_GENERAL] * len(texts)
+
+        findall = self._pattern.findall
+        keyword_weights = self._keyword_weights
+        section_count = len(self.sections)
+        result = []
+        for text in texts:
+            keywords = findall(text.lower()) if text else None
+            if not keywords:
+                result.append(SECTION_GENERAL)
+                continue
+            scores = [0.0] * section_count
+            for keyword in keywords:
+                for order, weight in keyword_weights(keyword):
+                    scores[order] += weight
+            result.append(self._best(scores))
+        return result
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """섹션별 점수 (0 이 아닌 섹션만, 디버깅/키워드 표 조정용)"""
+        result: Dict[str, float] = {}
+        if self._pattern is None or not text:
+            return result
+        for keyword in self._pattern.findall(text.lower()):
+            for order, weight in self._keyword_weights(keyword):
+                section = self.sections[order]
+                result[section] = result.get(section, 0.0) + weight
+        return result
+
+    def _keyword_weights(self, keyword: str) -> List[Tuple[int, float]]:
+        """일치한 문자열의 (섹션 순서, 가중치) 목록 (공백이 다르게 일치한 경우만 정규화)"""
+        weights = self._weights.get(keyword)
+        return weights if weights is not None else self._weights[_normalize(keyword)]
+
+    def _best(self, scores: List[float]) -> str:
+        """가장 높은 점수의 섹션 (동점이면 표 순서가 앞선 섹션)"""
+        best = max(scores)
+        return self.sections[scores.index(best)] if best >= self.min_score else SECTION_GENERAL
+
+
+def _normalize(keyword: str) -> str:
+    """키워드/일치 문자열의 공백을 하나로 (정규식은 공백 여러 개와도 일치)"""
+    return " ".join(keyword.split())
+
+
+def _compile(weights: Mapping[str, object]) -> "re.Pattern[str]":
+    """긴 키워드가 먼저 일치하도록 정렬하여 하나의 정규식으로 컴파일"""
+    alternatives = [
+        r"[ \t]+".join(re.escape(part) for part in keyword.split())
+        for keyword in sorted(weights, key=len, reverse=True)
+    ]
+    return re.compile("|".join(alternatives))
+
+
+def _create_classifier() -> SectionClassifier:
+    """설정의 키워드 표 파일이 있으면 사용, 없거나 잘못되었으면 기본 표"""
+    if settings.section_keywords_file:
+        try:
+            return SectionClassifier.from_file(settings.section_keywords_file)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"섹션 키워드 표를 읽지 못해 기본 표를 사용합니다: {str(e)}")
+    return SectionClassifier()
+
+
+# 앱 전체에서 공유하는 분류기
+section_classifier = _create_classifier()
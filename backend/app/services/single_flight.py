@@ -0,0 +1,137 @@
+"""
+@CODE:single-flight-service
+같은 요청을 동시에 여러 번 보낼 때 업스트림 호출 하나를 공유 (single-flight)
+
+Related:
+- @SPEC:FEAT-002-REQ-012 - Request Coalescing
+- @CODE:ai-generator-service
+- @TEST:single-flight-unit
+
+업스트림 호출은 처음 요청한 호출자가 아니라 별도 태스크(flight)에서 실행하고, 같은 키로
+들어온 호출자는 모두 그 결과 조각을 처음부터 받아 갑니다. 따라서 첫 호출자의 연결이 끊겨도
+나머지 호출자는 계속 결과를 받으며, 모든 호출자가 떠난 경우에만 업스트림 호출을 취소합니다.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Flight:
+    """
+    @CODE:single-flight-service-flight
+    진행 중인 업스트림 호출 하나 (생성된 조각과 완료/오류 상태)
+
+    producer 는 publish() 로 조각을 내보내고, 사용량 등 호출 정보는 info 에 기록합니다.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.parts: List[str] = []
+        self.info: Dict[str, Any] = {}
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def publish(self, part: str):
+        """조각 추가 후 기다리는 호출자를 깨움"""
+        self.parts.append(part)
+        self._notify()
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """이미 생성된 조각부터 완료될 때까지 모든 조각 (업스트림 오류는 그대로 발생)"""
+        index = 0
+        while True:
+            changed = self._changed
+            while index < len(self.parts):
+                yield self.parts[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await changed.wait()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+# producer(flight): 업스트림을 호출하여 flight.publish() 로 조각을 내보냄
+Producer = Callable[[Flight], Awaitable[None]]
+
+
+class SingleFlight:
+    """
+    @CODE:single-flight-service-group
+    키별 진행 중인 호출 묶음
+
+    Implements: @SPEC:FEAT-002-REQ-012
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, Flight] = {}
+        self._stats = {"flights": 0, "coalesced": 0, "abandoned": 0}
+
+    @asynccontextmanager
+    async def join(self, key: str, produce: Producer) -> AsyncIterator[Tuple[Flight, bool]]:
+        """
+        키의 진행 중인 호출에 참여 (없으면 produce 로 새 호출 시작)
+
+        블록을 벗어나면(정상 종료, 취소, 연결 끊김) 참여를 해제하고, 마지막 호출자가 끝나기 전에
+        떠나면 업스트림 호출을 취소합니다.
+
+        Yields:
+            (flight, 기존 호출 공유 여부)
+        """
+        flight = self._flights.get(key)
+        coalesced = flight is not None
+        if flight is None:
+            flight = Flight(key)
+            self._flights[key] = flight
+            flight.task = asyncio.create_task(self._run(flight, produce))
+            self._stats["flights"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        flight.subscribers += 1
+        try:
+            yield flight, coalesced
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                self._stats["abandoned"] += 1
+                self._release(flight)
+                flight.task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """업스트림 호출 수, 공유한 호출자 수, 모두 떠나 취소한 호출 수"""
+        return {**self._stats, "in_flight": len(self._flights)}
+
+    async def _run(self, flight: Flight, produce: Producer):
+        try:
+            await produce(flight)
+        except asyncio.CancelledError:
+            flight.finish(asyncio.CancelledError())
+            raise
+        except Exception as e:
+            flight.finish(e)
+        else:
+            flight.finish()
+        finally:
+            self._release(flight)
+
+    def _release(self, flight: Flight):
+        # 취소 후 같은 키로 시작한 새 호출은 남김
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
@@ -0,0 +1,228 @@
+"""
+@CODE:token-budget-service
+생성 요청의 토큰 예산 (입력 토큰 계산, 참고 자료/사업 정보 맞춤, 출력 max_tokens 결정)
+
+Related:
+- @SPEC:FEAT-002-REQ-010 - Token Budget
+- @CODE:ai-generator-service
+- @TEST:token-budget-unit
+
+입력 한도는 min(입력 예산, 컨텍스트 - 최소 출력 토큰) 입니다. 참고 자료 없이 만든 기본
+프롬프트가 한도를 넘으면 긴 사업 정보 항목(설명, 요구사항)을 뒤에서부터 잘라내고, 남은
+토큰 안에 참고 자료를 순서대로 넣습니다 (들어가지 않는 첫 자료는 잘라서 넣고 나머지는 뺌).
+출력 max_tokens 는 섹션 설정값과 컨텍스트에 남은 토큰 중 작은 값입니다.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from app.utils.tokens import Tokenizer, get_tokenizer
+
+# 모델 이름 접두사 → 컨텍스트 토큰 수 (앞에서부터 먼저 일치하는 항목 사용)
+MODEL_CONTEXT_TOKENS = (
+    ("gpt-4o", 128000),
+    ("gpt-4-turbo", 128000),
+    ("gpt-4-1106", 128000),
+    ("gpt-4-0125", 128000),
+    ("gpt-4-32k", 32768),
+    ("gpt-4", 8192),
+    ("gpt-3.5-turbo-instruct", 4096),
+    ("gpt-3.5-turbo", 16385),
+)
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# chat 메시지 형식 토큰: 메시지마다 3, 응답 시작 3 (OpenAI cookbook 기준)
+MESSAGE_OVERHEAD_TOKENS = 3
+REPLY_PRIMING_TOKENS = 3
+
+# 잘라서라도 넣을 참고 자료의 최소 토큰 수 (이보다 적게 남으면 넣지 않음)
+MIN_PARTIAL_REFERENCE_TOKENS = 50
+
+# 한도를 넘을 때 잘라내는 사업 정보 항목 (제목은 유지)
+COMPACT_FIELDS = ("description", "requirements")
+TRUNCATION_MARK = " …(이하 생략)"
+
+REFERENCE_SEPARATOR = "\n\n"
+
+# build(사업 정보, 참고 자료) -> chat 메시지 목록
+MessageBuilder = Callable[[Dict[str, Any], List[str]], List[Dict[str, str]]]
+
+
+class PromptBudgetError(ValueError):
+    """사업 정보를 줄여도 프롬프트가 컨텍스트에 들어가지 않음"""
+
+
+def context_tokens(model: str, override: int = 0) -> int:
+    """모델 컨텍스트 토큰 수 (override 가 양수면 그 값)"""
+    if override > 0:
+        return override
+    for prefix, tokens in MODEL_CONTEXT_TOKENS:
+        if model.startswith(prefix):
+            return tokens
+    return DEFAULT_CONTEXT_TOKENS
+
+
+class TokenBudget:
+    """
+    @CODE:token-budget-service-budget
+    요청 하나의 입력/출력 토큰 배분
+
+    Implements: @SPEC:FEAT-002-REQ-010
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer,
+        context_tokens: int,
+        input_budget_tokens: int = 0,
+        min_output_tokens: int = 256
+    ):
+        """
+        Args:
+            tokenizer: 토큰 수 계산기
+            context_tokens: 모델 컨텍스트 토큰 수
+            input_budget_tokens: 입력(프롬프트) 토큰 상한 (0 이면 컨텍스트 한도만 적용)
+            min_output_tokens: 출력에 최소로 남길 토큰 수
+        """
+        self.tokenizer = tokenizer
+        self.context_tokens = context_tokens
+        self.min_output_tokens = min_output_tokens
+        limit = context_tokens - min_output_tokens
+        self.input_limit = min(input_budget_tokens, limit) if input_budget_tokens > 0 else limit
+
+    @classmethod
+    def for_model(
+        cls,
+        model: str,
+        backend: str = "auto",
+        context_override: int = 0,
+        input_budget_tokens: int = 0,
+        min_output_tokens: int = 256
+    ) -> "TokenBudget":
+        """모델 이름으로 공유 토크나이저와 컨텍스트 크기를 찾아 생성"""
+        return cls(
+            get_tokenizer(backend, model),
+            context_tokens(model, context_override),
+            input_budget_tokens=input_budget_tokens,
+            min_output_tokens=min_output_tokens
+        )
+
+    def count(self, text: str) -> int:
+        return self.tokenizer.count(text)
+
+    def count_messages(self, messages: Sequence[Mapping[str, str]]) -> int:
+        """chat 메시지 목록의 입력 토큰 수 (메시지 형식 토큰 포함)"""
+        return REPLY_PRIMING_TOKENS + sum(
+            MESSAGE_OVERHEAD_TOKENS + self.tokenizer.count(message.get("content") or "")
+            for message in messages
+        )
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """max_tokens 이내로 자르고 생략 표시 (자를 필요가 없으면 그대로)"""
+        if self.tokenizer.count(text) <= max_tokens:
+            return text
+        keep = max_tokens - self.tokenizer.count(TRUNCATION_MARK)
+        return self.tokenizer.truncate(text, keep).rstrip() + TRUNCATION_MARK if keep > 0 else ""
+
+    def fit_texts(self, texts: Sequence[str], budget_tokens: int) -> Tuple[List[str], int]:
+        """
+        텍스트를 순서대로 budget_tokens 안에 맞춤 (구분자 토큰 포함)
+
+        앞의 텍스트일수록 관련도가 높다고 보고, 처음으로 들어가지 않는 텍스트는 남은 토큰이
+        MIN_PARTIAL_REFERENCE_TOKENS 이상이면 잘라서 넣고 그 뒤 텍스트는 모두 뺍니다.
+
+        Returns:
+            (넣은 텍스트 목록, 빼거나 잘라낸 토큰 수)
+        """
+        fitted: List[str] = []
+        used = 0
+        separator = self.tokenizer.count(REFERENCE_SEPARATOR)
+        for position, text in enumerate(texts):
+            tokens = self.tokenizer.count(text)
+            cost = tokens + (separator if fitted else 0)
+            if used + cost <= budget_tokens:
+                fitted.append(text)
+                used += cost
+                continue
+
+            dropped = tokens + sum(self.tokenizer.count(rest) for rest in texts[position + 1:])
+            remaining = budget_tokens - used - (separator if fitted else 0)
+            if remaining >= MIN_PARTIAL_REFERENCE_TOKENS:
+                partial = self.truncate(text, remaining)
+                fitted.append(partial)
+                dropped -= self.tokenizer.count(partial)
+            return fitted, dropped
+        return fitted, 0
+
+    def compact_info(self, build: MessageBuilder, business_info: Dict[str, Any]) -> Tuple[Dict[str, Any], int, List[str]]:
+        """
+        참고 자료 없는 프롬프트가 입력 한도 안에 들어오도록 긴 사업 정보 항목을 잘라냄
+
+        Returns:
+            (사업 정보, 참고 자료 없는 프롬프트 토큰 수, 잘라낸 항목 이름 목록)
+
+        Raises:
+            PromptBudgetError: 항목을 모두 잘라도 한도를 넘는 경우
+        """
+        base = self.count_messages(build(business_info, []))
+        compacted: List[str] = []
+        # 토크나이저 반올림으로 한 번에 줄지 않을 수 있어 항목마다 몇 번까지 다시 자름
+        for _ in range(3 * len(COMPACT_FIELDS)):
+            if base <= self.input_limit:
+                break
+            candidates = [
+                (self.tokenizer.count(str(business_info[field])), field)
+                for field in COMPACT_FIELDS
+                if business_info.get(field)
+            ]
+            if not candidates:
+                break
+            field_tokens, field = max(candidates)
+            business_info = {
+                **business_info,
+                field: self.truncate(str(business_info[field]), max(0, field_tokens - (base - self.input_limit) - 1))
+            }
+            if field not in compacted:
+                compacted.append(field)
+            base = self.count_messages(build(business_info, []))
+        if base > self.input_limit:
+            raise PromptBudgetError(f"프롬프트가 입력 한도({self.input_limit} 토큰)를 넘습니다: {base} 토큰")
+        return business_info, base, compacted
+
+    def fit_prompt(
+        self,
+        build: MessageBuilder,
+        business_info: Dict[str, Any],
+        references: Sequence[str],
+        requested_output_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        사업 정보와 참고 자료를 입력 한도에 맞춘 메시지와 출력 max_tokens
+
+        Returns:
+            {
+                "messages", "max_tokens", "prompt_tokens",
+                "reference_tokens": 넣은 참고 자료 토큰 수,
+                "dropped_reference_tokens": 빼거나 잘라낸 참고 자료 토큰 수,
+                "compacted_fields": 잘라낸 사업 정보 항목
+            }
+        """
+        business_info, base, compacted = self.compact_info(build, business_info)
+        fitted, dropped = self.fit_texts(references, self.input_limit - base)
+        messages = build(business_info, fitted)
+        prompt_tokens = self.count_messages(messages)
+        return {
+            "messages": messages,
+            "max_tokens": self.output_tokens(prompt_tokens, requested_output_tokens),
+            "prompt_tokens": prompt_tokens,
+            "reference_tokens": sum(self.tokenizer.count(text) for text in fitted),
+            "dropped_reference_tokens": dropped,
+            "compacted_fields": compacted
+        }
+
+    def output_tokens(self, prompt_tokens: int, requested: Optional[int]) -> int:
+        """컨텍스트에 남은 토큰 안의 출력 max_tokens (requested 가 없으면 남은 전부)"""
+        remaining = self.context_tokens - prompt_tokens
+        if remaining < self.min_output_tokens:
+            raise PromptBudgetError(
+                f"출력에 남은 토큰({remaining})이 최소 출력 토큰({self.min_output_tokens})보다 적습니다."
+            )
+        return min(requested, remaining) if requested else remaining
@@ -0,0 +1,85 @@
+"""
+@CODE:startup-warmup-service
+앱 시작 시 첫 요청에서 하던 무거운 초기화를 미리 실행
+
+Related:
+- @SPEC:FEAT-003-REQ-005 - Startup Warmup
+- @CODE:docx-generator-service-template
+- @CODE:document-executor-service
+- @TEST:api-integration-startup
+
+단계별 소요 시간을 기록하며, 단계가 실패해도 앱 시작은 막지 않고 경고만 남깁니다.
+"""
+
+from app.services.ai_generator import AIGenerator
+from app.services.docx_generator import default_template, docx_generator
+from app.services.docx_parser import docx_parser
+from app.services.executor import document_executor
+from typing import Any, Awaitable, Dict, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# 문서 생성/파싱 경로를 한 번 실행해 보는 작은 예시 문서
+SAMPLE_CONTENT = {
+    "market_analysis": "시장 분석",
+    "financial_plan": "재무 계획",
+    "financial_tables": [{"headers": ["항목", "금액"], "columns": [["매출"], [1000000]]}]
+}
+SAMPLE_INFO = {"title": "warmup", "description": "사업 개요"}
+
+
+def _document_roundtrip() -> int:
+    """예시 사업계획서를 생성하고 다시 파싱 (워커에서 실행, 파싱한 문단 수 반환)"""
+    stream = docx_generator.create_business_plan({}, SAMPLE_CONTENT, SAMPLE_INFO)
+    return len(docx_parser.parse_document(stream)["paragraphs"])
+
+
+async def _phase(phases: Dict[str, Dict[str, Any]], name: str, work: Awaitable[Any]):
+    """단계 하나를 실행하고 소요 시간(ms)/성공 여부 기록"""
+    started = time.perf_counter()
+    try:
+        ok = (await work) is not False
+    except Exception as e:
+        logger.warning(f"시작 준비 단계 실패 ({name}): {str(e)}")
+        ok = False
+    phases[name] = {"ms": round((time.perf_counter() - started) * 1000, 1), "ok": ok}
+
+
+async def warm_up(
+    ai_generator: Optional[AIGenerator] = None,
+    openai: bool = True,
+    timeout: float = 5.0
+) -> Dict[str, Any]:
+    """
+    @CODE:startup-warmup-service
+    시작 준비 단계 실행
+
+    - document_template: python-docx 기본 템플릿과 스타일 파트 읽기
+    - document_roundtrip: 문서 워커 풀을 시작하고 예시 문서를 생성/파싱
+    - openai_connection: OpenAI API 연결을 열어 연결 풀에 유지 (클라이언트가 있는 경우만)
+
+    Args:
+        ai_generator: 연결을 미리 열 생성기
+        openai: OpenAI 연결 준비 여부
+        timeout: OpenAI 연결 준비 제한 시간(초)
+
+    Returns:
+        {"phases": {단계: {"ms", "ok"}}, "total_ms"}
+    """
+    started = time.perf_counter()
+    phases: Dict[str, Dict[str, Any]] = {}
+
+    await _phase(phases, "document_template", asyncio.to_thread(default_template.load))
+    await _phase(phases, "document_roundtrip", document_executor.run(_document_roundtrip))
+    if openai and ai_generator is not None and ai_generator.client:
+        await _phase(phases, "openai_connection", ai_generator.warmup(timeout))
+
+    total_ms = round((time.perf_counter() - started) * 1000, 1)
+    logger.info(
+        f"시작 준비 완료 ({total_ms}ms): "
+        + ", ".join(f"{name}={phase['ms']}ms{'' if phase['ok'] else ' (실패)'}" for name, phase in phases.items())
+    )
+    return {"phases": phases, "total_ms": total_ms}
@@ -0,0 +1,36 @@
+"""
+문단/표 블록의 내용 해시 유틸리티
+
+문서 안 위치(index, table_index, row_index)는 해시에 넣지 않으므로, 앞에 블록이
+추가되거나 삭제되어도 내용이 같은 블록은 같은 해시를 가집니다.
+"""
+
+from typing import Any, Dict
+import hashlib
+import json
+
+# 해시 길이 (hex 글자 수, 64비트)
+BLOCK_HASH_CHARS = 16
+
+
+def _digest(payload: str) -> str:
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:BLOCK_HASH_CHARS]
+
+
+def paragraph_hash(text: str, style: str) -> str:
+    """문단 텍스트 + 스타일 이름의 해시"""
+    return _digest(f"p\x1f{style}\x1f{text}")
+
+
+def table_hash(table: Dict[str, Any]) -> str:
+    """표 헤더 + 셀 내용/병합 범위의 해시 (DocxTableParser.parse_table 결과)"""
+    rows = [
+        [[cell["col_index"], cell["colspan"], cell["rowspan"], cell["value"]] for cell in row["cells"]]
+        for row in table["rows"]
+    ]
+    payload = json.dumps(
+        [table["header_rows"], table["header_tree"], rows],
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return _digest(f"t\x1f{payload}")
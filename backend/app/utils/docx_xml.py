@@ -0,0 +1,196 @@
+"""
+WordprocessingML(DOCX) XML 공통 유틸리티
+
+python-docx 프록시 객체 없이 lxml 요소를 직접 다루는 파서/생성기에서
+공유하는 네임스페이스, 태그 상수, 텍스트 추출 규칙, 문단 스타일/제목 판별, 패키지 관계 조회 함수.
+"""
+
+from lxml import etree
+from typing import Dict, Optional
+import posixpath
+import re
+import zipfile
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+
+OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+STYLES_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+CORE_PROPERTIES_REL = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+
+
+def qn(tag: str) -> str:
+    """'w:p' 형식의 태그를 Clark 표기법('{namespace}p')으로 변환"""
+    prefix, _, local = tag.rpartition(":")
+    if prefix and prefix != "w":
+        raise ValueError(f"지원되지 않는 네임스페이스 접두사: {prefix}")
+    return f"{{{W_NS}}}{local}"
+
+
+W_BODY = qn("w:body")
+W_P = qn("w:p")
+W_P_PR = qn("w:pPr")
+W_P_STYLE = qn("w:pStyle")
+W_TBL = qn("w:tbl")
+W_TBL_GRID = qn("w:tblGrid")
+W_GRID_COL = qn("w:gridCol")
+W_TR = qn("w:tr")
+W_TR_PR = qn("w:trPr")
+W_TBL_HEADER = qn("w:tblHeader")
+W_GRID_BEFORE = qn("w:gridBefore")
+W_TC = qn("w:tc")
+W_TC_PR = qn("w:tcPr")
+W_GRID_SPAN = qn("w:gridSpan")
+W_V_MERGE = qn("w:vMerge")
+W_R = qn("w:r")
+W_T = qn("w:t")
+W_TAB = qn("w:tab")
+W_PTAB = qn("w:ptab")
+W_BR = qn("w:br")
+W_CR = qn("w:cr")
+W_NO_BREAK_HYPHEN = qn("w:noBreakHyphen")
+W_HYPERLINK = qn("w:hyperlink")
+W_STYLE = qn("w:style")
+W_NAME = qn("w:name")
+W_STYLE_ID = qn("w:styleId")
+W_DEFAULT = qn("w:default")
+W_TYPE = qn("w:type")
+W_VAL = qn("w:val")
+
+ON_VALUES = ("1", "true", "on")
+
+# python-docx 의 styles.BabelFish 와 동일한 내부명 → UI 이름 매핑
+UI_STYLE_NAMES = {
+    "caption": "Caption",
+    "footer": "Footer",
+    "header": "Header",
+    **{f"heading {level}": f"Heading {level}" for level in range(1, 10)},
+}
+
+# 제목 스타일이 아니어도 번호가 붙은 짧은 문단은 제목으로 봄 (예: "2. 시장 분석", "가. 목표 시장", "Ⅱ. 재무")
+HEADING_MAX_CHARS = 40
+_HEADING_STYLE = re.compile(r"^(heading|title|제목)", re.IGNORECASE)
+_NUMBERED_HEADING = re.compile(
+    r"^(\d+(\.\d+)*[.)]|[가-하][.)]|[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+[.)]?|\(\d+\)|[□■◎○●▣◈])\s*\S"
+)
+
+
+def run_text(r) -> str:
+    """런 텍스트 추출 (python-docx CT_R.text 와 동일: w:t, w:tab, w:br, w:cr, w:noBreakHyphen, w:ptab)"""
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or "")
+        elif tag == W_TAB or tag == W_PTAB:
+            parts.append("\t")
+        elif tag == W_BR:
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag == W_CR:
+            parts.append("\n")
+        elif tag == W_NO_BREAK_HYPHEN:
+            parts.append("-")
+    return "".join(parts)
+
+
+def paragraph_text(p) -> str:
+    """문단 텍스트 추출 (python-docx CT_P.text 와 동일: w:r 와 w:hyperlink 내부 런)"""
+    parts = []
+    for child in p.iterchildren(W_R, W_HYPERLINK):
+        if child.tag == W_R:
+            parts.append(run_text(child))
+        else:
+            parts.extend(run_text(r) for r in child.iterchildren(W_R))
+    return "".join(parts)
+
+
+def paragraph_style(p, style_names: Dict[Optional[str], str]) -> str:
+    """문단 스타일 이름 반환 (style_names: 스타일 ID → 이름, None 키는 기본 문단 스타일)"""
+    style_id = None
+    p_pr = p.find(W_P_PR)
+    if p_pr is not None:
+        p_style = p_pr.find(W_P_STYLE)
+        if p_style is not None:
+            style_id = p_style.get(W_VAL)
+
+    if style_id in style_names:
+        return style_names[style_id]
+    return style_names.get(None, "Normal")
+
+
+def is_heading(text: str, style: str) -> bool:
+    """제목 문단 여부 (제목 스타일 또는 번호가 붙은 짧은 문단)"""
+    if not text:
+        return False
+    if _HEADING_STYLE.match(style):
+        return True
+    return len(text) <= HEADING_MAX_CHARS and _NUMBERED_HEADING.match(text) is not None
+
+
+def cell_text(tc) -> str:
+    """셀 직속 문단 텍스트를 줄바꿈으로 연결 (python-docx _Cell.text 와 동일)"""
+    return "\n".join(paragraph_text(p) for p in tc.iterchildren(W_P))
+
+
+def related_part(package: zipfile.ZipFile, source_part: str, rel_type: str) -> Optional[str]:
+    """
+    source_part 의 .rels 에서 rel_type 관계의 대상 파트 경로 반환
+
+    Args:
+        package: DOCX zip 패키지
+        source_part: 관계의 원본 파트 경로 (패키지 루트 관계는 "")
+        rel_type: 관계 타입 URI
+
+    Returns:
+        zip 내부 파트 경로 (관계가 없으면 None)
+    """
+    base_dir, source_name = posixpath.split(source_part)
+    rels_part = posixpath.join(base_dir, "_rels", f"{source_name}.rels")
+
+    try:
+        with package.open(rels_part) as stream:
+            root = etree.parse(stream).getroot()
+    except KeyError:
+        return None
+
+    for rel in root.iterfind(f"{{{REL_NS}}}Relationship"):
+        if rel.get("Type") != rel_type or rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            return target.lstrip("/")
+        return posixpath.normpath(posixpath.join(base_dir, target))
+
+    return None
+
+
+def main_document_part(package: zipfile.ZipFile) -> str:
+    """패키지 관계에서 본문 파트 경로 확인 (기본값: word/document.xml)"""
+    return related_part(package, "", OFFICE_DOCUMENT_REL) or "word/document.xml"
+
+
+def load_style_names(package: zipfile.ZipFile, document_part: str) -> Dict[Optional[str], str]:
+    """styles.xml 에서 문단 스타일 ID → 이름 매핑 생성 (None 키는 기본 스타일)"""
+    styles_part = related_part(package, document_part, STYLES_REL)
+    if styles_part is None:
+        return {}
+
+    style_names: Dict[Optional[str], str] = {}
+    with package.open(styles_part) as stream:
+        for _, style in etree.iterparse(stream, events=("end",), tag=W_STYLE):
+            if style.get(W_TYPE) != "paragraph":
+                style.clear()
+                continue
+
+            name_elem = style.find(W_NAME)
+            name = name_elem.get(W_VAL) if name_elem is not None else None
+            name = UI_STYLE_NAMES.get(name, name) or "Normal"
+
+            style_names[style.get(W_STYLE_ID)] = name
+            if style.get(W_DEFAULT) in ON_VALUES and None not in style_names:
+                style_names[None] = name
+            style.clear()
+
+    return style_names
@@ -0,0 +1,173 @@
+"""
+압축된 zip 항목을 다시 압축하지 않고 복사하는 최소 zip 읽기/쓰기 유틸리티
+
+DOCX 내보내기에서 바뀌지 않은 파트(styles.xml, 이미지 등)는 원본 양식의 압축 바이트를
+그대로 복사하고, 바뀐 파트(document.xml)만 새로 deflate 합니다. 모든 항목의 압축 크기를
+미리 알 수 있으므로 전체 zip 크기도 쓰기 전에 계산할 수 있습니다 (응답 Content-Length).
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator, List, Sequence, Tuple
+import struct
+import zipfile
+import zlib
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_END_SIGNATURE = b"PK\x05\x06"
+_UTF8_FLAG = 0x800
+_ZIP64_LIMIT = 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class RawZipEntry:
+    """압축된 상태의 zip 항목"""
+    name: str
+    method: int
+    crc: int
+    compressed: bytes
+    file_size: int
+    date_time: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
+    external_attr: int = 0
+
+    @property
+    def encoded_name(self) -> bytes:
+        return self.name.encode("utf-8")
+
+    @property
+    def flags(self) -> int:
+        return _UTF8_FLAG if not self.name.isascii() else 0
+
+
+def read_raw_entries(source: BinaryIO) -> List[RawZipEntry]:
+    """
+    zip 의 모든 항목을 압축 해제하지 않고 읽음
+
+    Args:
+        source: seek 가능한 zip 파일 객체
+
+    Returns:
+        원본 순서의 RawZipEntry 목록
+    """
+    entries = []
+    with zipfile.ZipFile(source) as package:
+        for info in package.infolist():
+            source.seek(info.header_offset)
+            header = source.read(_LOCAL_HEADER.size)
+            if len(header) != _LOCAL_HEADER.size or header[:4] != _LOCAL_SIGNATURE:
+                raise zipfile.BadZipFile(f"잘못된 로컬 헤더: {info.filename}")
+            name_length, extra_length = _LOCAL_HEADER.unpack(header)[-2:]
+            source.seek(name_length + extra_length, 1)
+            entries.append(RawZipEntry(
+                name=info.filename,
+                method=info.compress_type,
+                crc=info.CRC,
+                compressed=source.read(info.compress_size),
+                file_size=info.file_size,
+                date_time=info.date_time,
+                external_attr=info.external_attr
+            ))
+    return entries
+
+
+def deflate_entry(name: str, data: bytes, like: RawZipEntry = None, level: int = 6) -> RawZipEntry:
+    """
+    새 내용을 deflate 하여 항목 생성 (like 가 있으면 날짜/속성을 이어받음)
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return RawZipEntry(
+        name=name,
+        method=zipfile.ZIP_DEFLATED,
+        crc=zlib.crc32(data),
+        compressed=compressed,
+        file_size=len(data),
+        date_time=like.date_time if like is not None else (1980, 1, 1, 0, 0, 0),
+        external_attr=like.external_attr if like is not None else 0
+    )
+
+
+def zip_size(entries: Sequence[RawZipEntry]) -> int:
+    """iter_zip 이 만들 zip 의 전체 바이트 수"""
+    total = _END_RECORD.size
+    for entry in entries:
+        name_length = len(entry.encoded_name)
+        total += _LOCAL_HEADER.size + name_length + len(entry.compressed)
+        total += _CENTRAL_HEADER.size + name_length
+    return total
+
+
+def check_zip_size(entries: Sequence[RawZipEntry]) -> int:
+    """
+    zip 크기를 계산하고 ZIP64 없이 쓸 수 있는지 확인
+
+    Raises:
+        ValueError: ZIP64 가 필요한 크기 (4GB 이상 또는 65535개 초과 항목)
+    """
+    size = zip_size(entries)
+    if size > _ZIP64_LIMIT or len(entries) > 0xFFFF:
+        raise ValueError("ZIP64 가 필요한 크기의 문서는 지원하지 않습니다.")
+    return size
+
+
+def iter_zip(entries: Iterable[RawZipEntry]) -> Iterator[bytes]:
+    """
+    항목을 순서대로 zip 형식으로 직렬화 (항목 단위 bytes 조각 생성)
+
+    항목은 한 번만 순회하므로 쓰고 난 항목을 버리는 이터레이터를 넘길 수 있습니다.
+    크기 제한은 미리 check_zip_size 로 확인합니다.
+    """
+    central = []
+    offset = 0
+    count = 0
+    for entry in entries:
+        name = entry.encoded_name
+        dos_time, dos_date = _dos_datetime(entry.date_time)
+        header = _LOCAL_HEADER.pack(
+            _LOCAL_SIGNATURE, 20, entry.flags, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.compressed), entry.file_size, len(name), 0
+        )
+        central.append(_CENTRAL_HEADER.pack(
+            _CENTRAL_SIGNATURE, 20, 20, entry.flags, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.compressed), entry.file_size, len(name), 0, 0, 0, 0,
+            entry.external_attr, offset
+        ) + name)
+        yield header + name
+        yield entry.compressed
+        offset += len(header) + len(name) + len(entry.compressed)
+        count += 1
+
+    directory = b"".join(central)
+    yield directory + _END_RECORD.pack(_END_SIGNATURE, 0, 0, count, count, len(directory), offset, 0)
+
+
+def aiter_zip(entries: Sequence[RawZipEntry], chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """
+    zip 을 chunk_size 이하 조각으로 내보내는 비동기 이터레이터 (StreamingResponse 본문용)
+
+    항목은 쓰는 즉시 내부 큐에서 빼므로, 호출자가 목록을 따로 들고 있지 않으면
+    이미 보낸 항목의 압축 바이트는 응답이 끝나기 전에 해제됩니다.
+    """
+    pending = deque(entries)
+
+    def consume():
+        while pending:
+            yield pending.popleft()
+
+    async def chunks():
+        for piece in iter_zip(consume()):
+            view = memoryview(piece)
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+
+    return chunks()
+
+
+def _dos_datetime(date_time: Tuple[int, int, int, int, int, int]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    year = max(year, 1980)
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
@@ -0,0 +1,123 @@
+"""
+토큰 수 계산 유틸리티
+
+토크나이저 백엔드:
+- "estimate": 글자 종류로 추정 (의존성 없음, ASCII 4자당 1토큰, 그 외 문자는 1자당 1토큰)
+- "tiktoken": OpenAI BPE 인코더 (tiktoken 설치 시, 모델 이름으로 인코딩 선택)
+- "auto": tiktoken 이 설치되어 있으면 tiktoken, 없으면 estimate
+
+BPE 표 로드는 비싸므로 (백엔드, 모델)별 토크나이저를 한 번만 만들어 재사용합니다.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, Protocol
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOKENIZER_AUTO = "auto"
+TOKENIZER_ESTIMATE = "estimate"
+TOKENIZER_TIKTOKEN = "tiktoken"
+
+# 모델 이름으로 인코딩을 찾지 못했을 때 쓰는 tiktoken 인코딩 (GPT-4/3.5 계열)
+TIKTOKEN_FALLBACK_ENCODING = "cl100k_base"
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (ASCII 4자당 1토큰, 그 외 문자는 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+class Tokenizer(Protocol):
+    """토크나이저 백엔드 인터페이스"""
+    name: str
+
+    def count(self, text: str) -> int:
+        """텍스트의 토큰 수"""
+        ...
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """앞에서부터 max_tokens 토큰 이내로 자른 텍스트"""
+        ...
+
+
+class EstimateTokenizer:
+    """글자 종류 기반 추정 토크나이저 (estimate_tokens 와 같은 계산)"""
+    name = TOKENIZER_ESTIMATE
+
+    def count(self, text: str) -> int:
+        return estimate_tokens(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        ascii_chars = other_chars = 0
+        for position, ch in enumerate(text):
+            if ord(ch) < 128:
+                ascii_chars += 1
+            else:
+                other_chars += 1
+            if ascii_chars // 4 + other_chars > max_tokens:
+                return text[:position]
+        return text
+
+
+class TiktokenTokenizer:
+    """tiktoken BPE 토크나이저 (특수 토큰 문자열도 일반 텍스트로 인코딩)"""
+    name = TOKENIZER_TIKTOKEN
+
+    def __init__(self, model: str = ""):
+        import tiktoken
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding(TIKTOKEN_FALLBACK_ENCODING)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # 잘린 멀티바이트 글자는 버림
+        return self._encoding.decode_bytes(tokens[:max_tokens]).decode("utf-8", errors="ignore")
+
+
+# 백엔드 이름 → 토크나이저 생성 함수 (모델 이름을 받음)
+TOKENIZER_BACKENDS: Dict[str, Callable[[str], Tokenizer]] = {
+    TOKENIZER_ESTIMATE: lambda model: EstimateTokenizer(),
+    TOKENIZER_TIKTOKEN: TiktokenTokenizer,
+}
+
+
+def register_tokenizer_backend(name: str, factory: Callable[[str], Tokenizer]) -> None:
+    """토크나이저 백엔드 등록 (같은 이름은 교체, 만들어 둔 토크나이저는 버림)"""
+    TOKENIZER_BACKENDS[name] = factory
+    get_tokenizer.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(backend: str = TOKENIZER_AUTO, model: str = "") -> Tokenizer:
+    """
+    (백엔드, 모델)별 공유 토크나이저
+
+    "auto" 는 tiktoken 을 쓸 수 없으면(미설치, 인코딩 파일을 받을 수 없는 환경) estimate 로 대신합니다.
+
+    Raises:
+        ValueError: 등록되지 않은 백엔드
+        ImportError: "tiktoken" 을 직접 지정했는데 설치되어 있지 않은 경우
+    """
+    if backend == TOKENIZER_AUTO:
+        try:
+            return TOKENIZER_BACKENDS[TOKENIZER_TIKTOKEN](model)
+        except Exception as e:
+            logger.info(f"tiktoken 을 사용할 수 없어 토큰 수를 추정값으로 계산합니다: {str(e)}")
+            return TOKENIZER_BACKENDS[TOKENIZER_ESTIMATE](model)
+    if backend not in TOKENIZER_BACKENDS:
+        raise ValueError(f"지원되지 않는 토크나이저: {backend}")
+    return TOKENIZER_BACKENDS[backend](model)
@@ -0,0 +1,149 @@
+"""
+업로드 파일 처리 유틸리티
+"""
+
+from fastapi import HTTPException, UploadFile
+from typing import BinaryIO, List, Tuple
+import asyncio
+import hashlib
+import os
+import tempfile
+import zipfile
+
+# 이 크기까지는 메모리에 두고, 넘으면 임시 파일로 옮김
+SPOOL_MAX_MEMORY_BYTES = 1024 * 1024
+
+
+def _too_large(max_bytes: int, subject: str = "파일 크기") -> HTTPException:
+    return HTTPException(status_code=413, detail=f"{subject}가 제한({max_bytes // (1024 * 1024)}MB)을 초과했습니다.")
+
+
+async def hash_upload(file: UploadFile, max_bytes: int, chunk_size: int = 1024 * 1024) -> Tuple[str, int]:
+    """
+    업로드 파일을 청크 단위로 읽어 SHA-256 해시와 크기를 계산
+
+    전체 내용을 메모리에 올리지 않으며, 크기 제한을 넘으면 즉시 413 으로 중단합니다.
+    끝나면 파일 위치를 처음으로 되돌리므로 file.file 을 그대로 파서에 넘길 수 있습니다.
+
+    Args:
+        file: 업로드 파일 (내용은 SpooledTemporaryFile 에 보관됨)
+        max_bytes: 허용 최대 크기
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        (SHA-256 hex digest, 바이트 크기)
+    """
+    digest = hashlib.sha256()
+    size = 0
+
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise _too_large(max_bytes)
+        digest.update(chunk)
+
+    await file.seek(0)
+    return digest.hexdigest(), size
+
+
+async def spool_upload(
+    file: UploadFile,
+    max_bytes: int,
+    chunk_size: int = 1024 * 1024
+) -> Tuple[str, int, BinaryIO]:
+    """
+    업로드 파일을 청크 단위로 해시하면서 별도의 스풀 파일로 복사
+
+    FastAPI 는 엔드포인트가 응답 객체를 반환하면 업로드 파일을 닫으므로, 스트리밍 응답을
+    만드는 동안 읽어야 하는 파일은 이 복사본을 사용합니다. 복사본은 호출자가 닫아야 합니다.
+
+    Returns:
+        (SHA-256 hex digest, 바이트 크기, 처음 위치로 되돌린 스풀 파일)
+
+    Raises:
+        HTTPException: 크기 제한 초과 (413)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+            await asyncio.to_thread(spool.write, chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return digest.hexdigest(), size, spool
+
+
+def extract_zip_members(
+    source: BinaryIO,
+    max_member_bytes: int,
+    max_total_bytes: int,
+    used_bytes: int = 0,
+    chunk_size: int = 1024 * 1024
+) -> List[Tuple[str, str, int, BinaryIO]]:
+    """
+    zip 보관 파일의 파일 항목을 각각 스풀 파일로 풀기 (블로킹, 워커 스레드에서 호출)
+
+    디렉터리와 macOS 메타데이터(__MACOSX/, ._*) 는 건너뜁니다. 헤더의 크기를 믿지 않고
+    실제로 풀린 바이트 수로 제한을 검사하므로 압축 폭탄도 제한에서 멈춥니다.
+
+    Args:
+        source: zip 파일 객체
+        max_member_bytes: 항목 하나의 최대 크기
+        max_total_bytes: 풀린 항목 전체의 최대 크기
+        used_bytes: 같은 요청에서 이미 사용한 크기 (max_total_bytes 에 포함)
+
+    Returns:
+        [(보관 파일 안의 이름, SHA-256 hex digest, 바이트 크기, 스풀 파일)]
+
+    Raises:
+        HTTPException: 항목 또는 전체 크기 제한 초과 (413)
+        zipfile.BadZipFile: zip 형식이 아님
+    """
+    members: List[Tuple[str, str, int, BinaryIO]] = []
+    total = used_bytes
+    total_too_large = _too_large(max_total_bytes, "전체 업로드 크기")
+    try:
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                name = info.filename
+                if info.is_dir() or name.startswith("__MACOSX/") or os.path.basename(name).startswith("._"):
+                    continue
+                limit = min(max_member_bytes, max_total_bytes - total)
+                if info.file_size > limit:
+                    raise _too_large(max_member_bytes) if info.file_size > max_member_bytes else total_too_large
+
+                digest = hashlib.sha256()
+                size = 0
+                spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+                members.append((name, "", 0, spool))
+                with archive.open(info) as member:
+                    while True:
+                        chunk = member.read(chunk_size)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        if size > limit:
+                            raise _too_large(max_member_bytes) if size > max_member_bytes else total_too_large
+                        digest.update(chunk)
+                        spool.write(chunk)
+                spool.seek(0)
+                total += size
+                members[-1] = (name, digest.hexdigest(), size, spool)
+    except BaseException:
+        for _, _, _, spool in members:
+            spool.close()
+        raise
+    return members